@@ -16,6 +16,8 @@ import sys
 
 import argparse
 
+from lcps_tool.geometry import cull_obbs, cull_points, sat_intersect, viewer_frustum_planes
+
 
 class OBB:
     def __init__(self, type, position, rotation, size, collision):
@@ -124,15 +126,20 @@ def draw_coordinate_system():
 
 
 def check_collision(obb1, obb2):
-    # Simplified collision check (just checking distance)
-    distance = obb1.position.distance_to(obb2.position)
-    return distance < max(obb1.size.length(), obb2.size.length())
+    # Separating axis test on the oriented boxes
+    # obb.rotation holds the transposed 4x4 rotation (column-major for OpenGL)
+    hit = sat_intersect(
+        np.array([obb1.position]), np.array([obb1.size]) * 0.5, obb1.rotation[None, :3, :3].transpose(0, 2, 1),
+        np.array([obb2.position]), np.array([obb2.size]) * 0.5, obb2.rotation[None, :3, :3].transpose(0, 2, 1))
+    return bool(hit[0])
 
 
 def resize(width, height):
+    global display_size
     print(f"resize to {width} * {height}")
     if height == 0:
         height = 1
+    display_size = (width, height)
     glViewport(0, 0, width, height)
     glMatrixMode(GL_PROJECTION)
     glLoadIdentity()
@@ -296,9 +303,25 @@ def draw_points(points):
     glEnd()
 
 
+def cull_scene(obbs, points, scale, rotation):
+    """视锥裁剪：返回视野内的 OBB 列表和点"""
+    planes = viewer_frustum_planes(scale[0], rotation, *display_size)
+    visible_points = points[cull_points(planes, points)]
+    if not obbs:
+        return obbs, visible_points
+
+    centers = np.array([tuple(obb.position) for obb in obbs])
+    half_extents = np.array([tuple(obb.size) for obb in obbs]) * 0.5
+    # obb.rotation 为 quaternion_to_matrix 的结果（R 的转置）
+    rotations = np.array([obb.rotation[:3, :3].T for obb in obbs])
+    visible = cull_obbs(planes, centers, half_extents, rotations)
+    return [obb for obb, v in zip(obbs, visible) if v], visible_points
+
+
 dragging = False
 last_pos = None
 debug_info = False
+display_size = (800, 600)
 
 
 def main():
@@ -356,7 +379,7 @@ def main():
     print(f"Port: {port}")
 
     pygame.init()
-    display = (800, 600)
+    display = display_size
     pygame.display.set_mode(display, DOUBLEBUF | OPENGL | RESIZABLE)
     gluPerspective(45, (display[0] / display[1]), 0.1, 50.0)
     glTranslatef(0.0, 0.0, -5)
@@ -395,7 +418,9 @@ def main():
 
             draw_coordinate_system()
 
-            for obb in obbs:
+            visible_obbs, visible_points = cull_scene(obbs, points, scale, rotation)
+
+            for obb in visible_obbs:
                 if obb.collision == 1:
                     obb.color = (1, 1, 0, 1)  # Red
                 elif obb.collision == 2:
@@ -404,7 +429,7 @@ def main():
                     obb.color = (1, 1, 1, 1)
                 draw_obb(obb)
 
-            draw_points(points)
+            draw_points(visible_points)
 
             glPopMatrix()
             pygame.display.flip()
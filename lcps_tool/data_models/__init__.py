@@ -4,6 +4,9 @@ Data Models
 Shared data structures for LCPS tool.
 """
 
-from .synced_frame import SyncedFrame
+from .channel_frame import ChannelFrame
+from .channel_records import ChannelRecord, OBBRecord, PointCloudRecord, StatusRecord
+from .synced_frame import SyncedFrame, SyncedFramePool
 
-__all__ = ['SyncedFrame']
+__all__ = ['ChannelFrame', 'ChannelRecord', 'OBBRecord', 'PointCloudRecord', 'StatusRecord',
+           'SyncedFrame', 'SyncedFramePool']
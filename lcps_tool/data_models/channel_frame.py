@@ -0,0 +1,104 @@
+"""
+Channel Frame - Synchronized frame over an arbitrary set of named channels
+
+Generic counterpart of SyncedFrame for ChannelSynchronizer: instead of
+fixed obb/pointcloud/status fields it holds a channel -> data mapping, so
+extra sources (a second LiDAR, cameras, ...) need no model changes.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+from .synced_frame import SyncedFrame
+
+
+@dataclass
+class ChannelFrame:
+    """
+    Synchronized frame holding data from any number of named channels
+
+    Attributes:
+        timestamp: Reference timestamp (in seconds, Unix time)
+        frame_id: Frame sequence number
+        channels: Dict mapping channel names to the matched data dicts
+            (channels without a match within their window are absent)
+        sync_quality: Synchronization quality score (0.0-1.0)
+        sync_offset_ms: Dict mapping channel names to sync offsets in ms
+    """
+
+    timestamp: float
+    frame_id: int
+    channels: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    sync_quality: float = 1.0
+    sync_offset_ms: Dict[str, float] = field(default_factory=dict)
+
+    def has(self, channel: str) -> bool:
+        """Check if frame has data for a channel"""
+        return channel in self.channels
+
+    def get(self, channel: str) -> Optional[Dict[str, Any]]:
+        """Data of a channel (None if not matched)"""
+        return self.channels.get(channel)
+
+    def __getitem__(self, channel: str) -> Dict[str, Any]:
+        return self.channels[channel]
+
+    @property
+    def channel_names(self) -> List[str]:
+        """Names of the matched channels"""
+        return list(self.channels)
+
+    def is_complete(self, channels: Iterable[str]) -> bool:
+        """Check if frame has data from all given channels"""
+        return all(channel in self.channels for channel in channels)
+
+    def get_max_sync_offset(self) -> float:
+        """Get maximum synchronization offset across all channels (in ms)"""
+        if not self.sync_offset_ms:
+            return 0.0
+        return max(abs(offset) for offset in self.sync_offset_ms.values())
+
+    def to_synced_frame(self,
+                        obb_channel: str = 'obb',
+                        pointcloud_channel: str = 'pointcloud',
+                        status_channel: str = 'status') -> SyncedFrame:
+        """
+        Convert to a SyncedFrame (for recorders and analyzers)
+
+        Args:
+            obb_channel: Channel mapped to obb_data
+            pointcloud_channel: Channel mapped to pointcloud_data
+            status_channel: Channel mapped to status_data
+
+        Returns:
+            SyncedFrame with the selected channels
+        """
+        mapping = {obb_channel: 'obb', pointcloud_channel: 'pointcloud', status_channel: 'status'}
+        return SyncedFrame(
+            timestamp=self.timestamp,
+            frame_id=self.frame_id,
+            obb_data=self.channels.get(obb_channel),
+            pointcloud_data=self.channels.get(pointcloud_channel),
+            status_data=self.channels.get(status_channel),
+            sync_quality=self.sync_quality,
+            sync_offset_ms={mapping[name]: offset for name, offset in self.sync_offset_ms.items()
+                            if name in mapping},
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert frame to dictionary (for JSON serialization)"""
+        return {
+            'timestamp': self.timestamp,
+            'frame_id': self.frame_id,
+            'channels': self.channel_names,
+            'sync_quality': self.sync_quality,
+            'sync_offset_ms': self.sync_offset_ms,
+            'max_sync_offset': self.get_max_sync_offset(),
+        }
+
+    def __repr__(self) -> str:
+        return (f"<ChannelFrame "
+                f"t={self.timestamp:.3f} "
+                f"id={self.frame_id} "
+                f"channels=[{', '.join(self.channels)}] "
+                f"quality={self.sync_quality:.2f}>")
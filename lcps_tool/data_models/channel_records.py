@@ -0,0 +1,169 @@
+"""
+Channel Records - Slotted per-message channel data
+
+Receivers used to emit one freshly built dict per message. At 100 Hz with
+long synchronizer buffers that is a lot of allocation and GC churn; these
+records store the known fields in __slots__ instead (no per-instance
+hash table, roughly 30% smaller per sample) and only allocate a dict for
+unexpected extra keys.
+
+Records are MutableMappings with the old dict keys, so existing callers
+keep working: data['timestamp'], data.get('obbs', []), 'trace' in data,
+data['raw_timestamp'] = ..., dict(data), {**data}. Fields that were never
+set are absent (KeyError / not in), exactly as a missing dict key.
+copy() returns a record of the same type; use dict(record) or to_dict()
+for a plain dict (e.g. before json.dumps).
+"""
+
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+
+class ChannelRecord(MutableMapping):
+    """
+    Base class of slotted channel records
+
+    Subclasses list their fields in FIELDS and as __slots__. Fields common
+    to every channel (timestamp, raw_timestamp, trace) live here; keys
+    outside FIELDS go to a lazily created extra dict.
+    """
+
+    COMMON_FIELDS: Tuple[str, ...] = ('timestamp', 'raw_timestamp', 'trace')
+    FIELDS: Tuple[str, ...] = COMMON_FIELDS
+
+    __slots__ = COMMON_FIELDS + ('_extra',)
+
+    _FIELD_SET = frozenset(FIELDS)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._FIELD_SET = frozenset(cls.FIELDS)
+
+    def __init__(self, **values: Any):
+        """
+        Initialize record
+
+        Args:
+            **values: Field values (unknown keys are kept as extra fields)
+        """
+        self._extra: Optional[Dict[str, Any]] = None
+        for key, value in values.items():
+            self[key] = value
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ChannelRecord':
+        """Record with the items of a dict"""
+        return cls(**data)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in self._FIELD_SET:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in self._FIELD_SET:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._FIELD_SET:
+            return hasattr(self, key)
+        return self._extra is not None and key in self._extra
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Value of a key, or default if absent (fast path for slots)"""
+        if key in self._FIELD_SET:
+            return getattr(self, key, default)
+        if self._extra is not None:
+            return self._extra.get(key, default)
+        return default
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self.FIELDS:
+            if hasattr(self, key):
+                yield key
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        count = sum(1 for key in self.FIELDS if hasattr(self, key))
+        return count + (len(self._extra) if self._extra is not None else 0)
+
+    def copy(self) -> 'ChannelRecord':
+        """Shallow copy (same record type)"""
+        record = type(self).__new__(type(self))
+        for key in self.FIELDS:
+            try:
+                setattr(record, key, getattr(self, key))
+            except AttributeError:
+                pass
+        record._extra = dict(self._extra) if self._extra is not None else None
+        return record
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict with all present fields"""
+        return dict(self)
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{key}={self[key]!r}" for key in self if key != 'trace')
+        return f"<{type(self).__name__} {fields}>"
+
+
+class OBBRecord(ChannelRecord):
+    """
+    OBB message (OBBReceiver)
+
+    Fields: timestamp, obbs, seq_id, source; set by the synchronizer:
+    raw_timestamp, interpolated, source_timestamps; pipeline: trace
+    """
+
+    FIELDS = ChannelRecord.COMMON_FIELDS + ('obbs', 'seq_id', 'source',
+                                            'interpolated', 'source_timestamps')
+    __slots__ = FIELDS[len(ChannelRecord.COMMON_FIELDS):]
+
+
+class PointCloudRecord(ChannelRecord):
+    """
+    Point cloud message (PointCloudReceiver)
+
+    Fields: timestamp, frame_id, points (Nx3 float32), original_count,
+    downsampled_count, reduction_rate, voxel_keys, voxel_size;
+    raw_timestamp, trace
+    """
+
+    FIELDS = ChannelRecord.COMMON_FIELDS + ('points', 'frame_id', 'original_count',
+                                            'downsampled_count', 'reduction_rate',
+                                            'voxel_keys', 'voxel_size')
+    __slots__ = FIELDS[len(ChannelRecord.COMMON_FIELDS):]
+
+
+class StatusRecord(ChannelRecord):
+    """
+    Status message (StatusReceiver)
+
+    Fields: timestamp, frame_id, state (LCPSState), state_raw, metrics,
+    detection; raw_timestamp, trace
+    """
+
+    FIELDS = ChannelRecord.COMMON_FIELDS + ('state', 'state_raw', 'frame_id',
+                                            'metrics', 'detection')
+    __slots__ = FIELDS[len(ChannelRecord.COMMON_FIELDS):]
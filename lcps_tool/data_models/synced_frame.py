@@ -3,15 +3,20 @@ Synced Frame - Synchronized multi-source data frame
 
 Contains synchronized data from multiple channels (OBB, PointCloud, Status)
 aligned by timestamp.
+
+SyncedFrame is slotted; SyncedFramePool recycles frames (and their offset
+and trace dicts) for producers that emit frames at a high rate.
 """
 
+import threading
+from collections import deque
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Deque, Dict, Optional
 
 import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncedFrame:
     """
     Synchronized frame containing data from multiple channels
@@ -27,6 +32,8 @@ class SyncedFrame:
         status_data: Status data (from StatusReceiver)
         sync_quality: Synchronization quality score (0.0-1.0)
         sync_offset_ms: Dict mapping channel names to sync offsets in ms
+        trace: Frame-level pipeline stamps (time.perf_counter), e.g.
+            'synchronize' and 'record' (see layer2.latency_tracker)
     """
 
     timestamp: float
@@ -36,11 +43,14 @@ class SyncedFrame:
     status_data: Optional[Dict[str, Any]] = None
     sync_quality: float = 1.0
     sync_offset_ms: Optional[Dict[str, float]] = None
+    trace: Optional[Dict[str, float]] = None
 
     def __post_init__(self):
-        """Initialize sync_offset_ms if not provided"""
+        """Initialize sync_offset_ms and trace if not provided"""
         if self.sync_offset_ms is None:
             self.sync_offset_ms = {}
+        if self.trace is None:
+            self.trace = {}
 
     def has_obb(self) -> bool:
         """Check if frame has OBB data"""
@@ -118,3 +128,119 @@ class SyncedFrame:
                 f"id={self.frame_id} "
                 f"channels=[{', '.join(channels)}] "
                 f"quality={self.sync_quality:.2f}>")
+
+
+class SyncedFramePool:
+    """
+    Free list of SyncedFrame instances
+
+    acquire() reuses a released frame (and its sync_offset_ms / trace dicts)
+    instead of allocating one. release() hands a frame back once its last
+    consumer is done with it; nothing may use the frame afterwards.
+
+    acquire and release may run on different threads (e.g. synchronizer on
+    the main loop, recorder writer thread releasing): the free list is a
+    deque, whose append/pop are atomic.
+
+    A frame handed to several consumers (recorder and plugin workers) is
+    retain()ed once per extra consumer; each consumer releases it and the
+    frame is recycled on the last release.
+
+    Parameters:
+        max_size: Maximum number of idle frames kept
+    """
+
+    def __init__(self, max_size: int = 256):
+        """
+        Initialize pool
+
+        Args:
+            max_size: Maximum number of idle frames kept
+        """
+        self.max_size = max_size
+        self._free: Deque[SyncedFrame] = deque()
+        self.created_count = 0
+        self.reused_count = 0
+        self.released_count = 0
+        # id(frame) -> outstanding references, for frames with more than one
+        self._refs: Dict[int, int] = {}
+        self._refs_lock = threading.Lock()
+
+    def acquire(self,
+                timestamp: float,
+                frame_id: int,
+                obb_data: Optional[Dict[str, Any]] = None,
+                pointcloud_data: Optional[Dict[str, Any]] = None,
+                status_data: Optional[Dict[str, Any]] = None,
+                sync_quality: float = 1.0) -> SyncedFrame:
+        """
+        Get a frame (recycled if available)
+
+        sync_offset_ms and trace are empty dicts owned by the frame; fill
+        them in place.
+
+        Args:
+            timestamp: Reference timestamp
+            frame_id: Frame sequence number
+            obb_data: OBB data
+            pointcloud_data: Point cloud data
+            status_data: Status data
+            sync_quality: Synchronization quality score
+
+        Returns:
+            SyncedFrame
+        """
+        try:
+            frame = self._free.pop()
+        except IndexError:
+            self.created_count += 1
+            return SyncedFrame(timestamp, frame_id, obb_data, pointcloud_data, status_data, sync_quality)
+
+        self.reused_count += 1
+        frame.timestamp = timestamp
+        frame.frame_id = frame_id
+        frame.obb_data = obb_data
+        frame.pointcloud_data = pointcloud_data
+        frame.status_data = status_data
+        frame.sync_quality = sync_quality
+        return frame
+
+    def retain(self, frame: SyncedFrame) -> None:
+        """
+        Add a reference to a frame (one more release() before it is recycled)
+
+        Args:
+            frame: Frame handed to an additional consumer
+        """
+        with self._refs_lock:
+            self._refs[id(frame)] = self._refs.get(id(frame), 1) + 1
+
+    def release(self, frame: SyncedFrame) -> None:
+        """
+        Drop a reference; the last one returns the frame to the pool
+
+        Args:
+            frame: Frame no longer used by the caller
+        """
+        if self._refs:
+            with self._refs_lock:
+                refs = self._refs.pop(id(frame), 1) - 1
+                if refs > 0:
+                    self._refs[id(frame)] = refs
+                    return
+        self.released_count += 1
+        # Drop channel data references right away (point clouds are large)
+        frame.obb_data = frame.pointcloud_data = frame.status_data = None
+        frame.sync_offset_ms.clear()
+        frame.trace.clear()
+        if len(self._free) < self.max_size:
+            self._free.append(frame)
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Pool statistics"""
+        return {
+            'created': self.created_count,
+            'reused': self.reused_count,
+            'released': self.released_count,
+            'idle': len(self._free),
+        }
@@ -0,0 +1,61 @@
+"""
+Geometry
+
+Vectorized geometry kernels shared by receivers, analysis and viewers.
+"""
+
+from .collision import (
+    broad_phase_pairs,
+    compare_collision_status,
+    obb_aabbs,
+    obb_collision_pairs,
+    obbs_in_collision,
+    sat_intersect,
+)
+from .frustum import (
+    cull_obbs,
+    cull_points,
+    extract_frustum_planes,
+    perspective_matrix,
+    viewer_frustum_planes,
+    viewer_modelview_matrix,
+)
+from .lod import PointCloudLOD
+from .obb_batch import OBBBatch, quaternions_to_matrices
+from .obb_statistics import OBBStatistics
+from .point_in_obb import point_obb_pairs, points_in_obbs
+from .spatial_index import PointCloudIndex
+from .voxel import (
+    compute_voxel_keys,
+    pack_voxel_keys,
+    unpack_voxel_keys,
+    voxel_grid_downsample,
+    voxel_grid_reduce,
+)
+
+__all__ = [
+    'OBBBatch',
+    'OBBStatistics',
+    'PointCloudIndex',
+    'PointCloudLOD',
+    'broad_phase_pairs',
+    'compare_collision_status',
+    'compute_voxel_keys',
+    'cull_obbs',
+    'cull_points',
+    'extract_frustum_planes',
+    'obb_aabbs',
+    'obb_collision_pairs',
+    'obbs_in_collision',
+    'pack_voxel_keys',
+    'perspective_matrix',
+    'point_obb_pairs',
+    'points_in_obbs',
+    'quaternions_to_matrices',
+    'sat_intersect',
+    'unpack_voxel_keys',
+    'viewer_frustum_planes',
+    'viewer_modelview_matrix',
+    'voxel_grid_downsample',
+    'voxel_grid_reduce',
+]
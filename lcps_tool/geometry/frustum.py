@@ -0,0 +1,172 @@
+"""
+Frustum Culling - CPU-side view-frustum culling for the viewers
+
+Rebuilds the fixed-function OpenGL matrices of the viewers on the CPU:
+- Projection: gluPerspective(fovy, aspect, near, far)
+- Modelview:  glTranslatef(0, 0, -d) * glScalef(s) * glRotatef(rx, X) * glRotatef(ry, Y)
+
+extracts the six clip planes (Gribb/Hartmann) from projection * modelview
+and tests all points / OBBs of a frame against them in one vectorized pass.
+"""
+
+import math
+from typing import Sequence
+
+import numpy as np
+
+
+def perspective_matrix(fovy_deg: float, aspect: float, near: float, far: float) -> np.ndarray:
+    """
+    Row-major equivalent of gluPerspective
+
+    Args:
+        fovy_deg: Vertical field of view in degrees
+        aspect: Viewport width / height
+        near: Near clip distance
+        far: Far clip distance
+
+    Returns:
+        4x4 projection matrix
+    """
+    f = 1.0 / math.tan(math.radians(fovy_deg) / 2.0)
+    m = np.zeros((4, 4), dtype=np.float64)
+    m[0, 0] = f / aspect
+    m[1, 1] = f
+    m[2, 2] = (far + near) / (near - far)
+    m[2, 3] = 2.0 * far * near / (near - far)
+    m[3, 2] = -1.0
+    return m
+
+
+def _rotation_x(angle_deg: float) -> np.ndarray:
+    c, s = math.cos(math.radians(angle_deg)), math.sin(math.radians(angle_deg))
+    return np.array([[1, 0, 0, 0], [0, c, -s, 0], [0, s, c, 0], [0, 0, 0, 1]], dtype=np.float64)
+
+
+def _rotation_y(angle_deg: float) -> np.ndarray:
+    c, s = math.cos(math.radians(angle_deg)), math.sin(math.radians(angle_deg))
+    return np.array([[c, 0, s, 0], [0, 1, 0, 0], [-s, 0, c, 0], [0, 0, 0, 1]], dtype=np.float64)
+
+
+def viewer_modelview_matrix(scale: float,
+                            rotation: Sequence[float],
+                            camera_distance: float = 5.0) -> np.ndarray:
+    """
+    Row-major modelview matrix of the viewers' orbit camera
+
+    Args:
+        scale: Uniform zoom factor (scale[0] in the viewers)
+        rotation: [rx, ry] rotation angles in degrees
+        camera_distance: Initial glTranslatef(0, 0, -d)
+
+    Returns:
+        4x4 modelview matrix
+    """
+    translate = np.eye(4)
+    translate[2, 3] = -camera_distance
+    scale_m = np.diag([scale, scale, scale, 1.0])
+    return translate @ scale_m @ _rotation_x(rotation[0]) @ _rotation_y(rotation[1])
+
+
+def extract_frustum_planes(mvp: np.ndarray) -> np.ndarray:
+    """
+    Extract normalized clip planes from a projection * modelview matrix
+
+    A point p is inside when planes[:, :3] @ p + planes[:, 3] >= 0 for
+    all six planes (left, right, bottom, top, near, far).
+
+    Args:
+        mvp: Row-major 4x4 matrix
+
+    Returns:
+        6x4 plane array [nx, ny, nz, d]
+    """
+    row3 = mvp[3]
+    planes = np.array([
+        row3 + mvp[0],  # left
+        row3 - mvp[0],  # right
+        row3 + mvp[1],  # bottom
+        row3 - mvp[1],  # top
+        row3 + mvp[2],  # near
+        row3 - mvp[2],  # far
+    ], dtype=np.float64)
+    norms = np.linalg.norm(planes[:, :3], axis=1, keepdims=True)
+    return planes / np.where(norms > 0, norms, 1.0)
+
+
+def viewer_frustum_planes(scale: float,
+                          rotation: Sequence[float],
+                          width: int,
+                          height: int,
+                          fovy_deg: float = 45.0,
+                          near: float = 0.1,
+                          far: float = 50.0,
+                          camera_distance: float = 5.0) -> np.ndarray:
+    """
+    Frustum planes (in scene coordinates) for the viewers' current view
+
+    Defaults match gluPerspective(45, w / h, 0.1, 50.0) and the initial
+    glTranslatef(0, 0, -5) used by recv.py / recvOBB.py.
+
+    Returns:
+        6x4 plane array
+    """
+    aspect = width / height if height > 0 else 1.0
+    projection = perspective_matrix(fovy_deg, aspect, near, far)
+    modelview = viewer_modelview_matrix(scale, rotation, camera_distance)
+    return extract_frustum_planes(projection @ modelview)
+
+
+def cull_points(planes: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """
+    Test points against the frustum
+
+    Args:
+        planes: 6x4 frustum planes
+        points: Nx3 points
+
+    Returns:
+        N boolean mask (True = visible)
+    """
+    points = np.asarray(points)
+    if len(points) == 0:
+        return np.zeros(0, dtype=bool)
+
+    visible = np.ones(len(points), dtype=bool)
+    # One plane at a time keeps the temporaries at N floats
+    for plane in planes:
+        visible &= points @ plane[:3].astype(points.dtype) >= -plane[3]
+    return visible
+
+
+def cull_obbs(planes: np.ndarray,
+              centers: np.ndarray,
+              half_extents: np.ndarray,
+              rotations: np.ndarray) -> np.ndarray:
+    """
+    Test oriented boxes against the frustum (conservative)
+
+    A box is rejected when it lies entirely behind one plane, i.e. the
+    signed center distance is below minus the box's projected radius
+    r = sum_j |n . axis_j| * h_j. Boxes straddling frustum corners may be
+    kept, which is harmless for rendering.
+
+    Args:
+        planes: 6x4 frustum planes
+        centers: Nx3 box centers
+        half_extents: Nx3 half edge lengths
+        rotations: Nx3x3 rotation matrices (columns = box axes)
+
+    Returns:
+        N boolean mask (True = visible)
+    """
+    centers = np.asarray(centers, dtype=np.float64)
+    if len(centers) == 0:
+        return np.zeros(0, dtype=bool)
+
+    normals = planes[:, :3]
+    # |n . axis_j| for every plane/box/axis: (N, 6, 3)
+    axis_dots = np.abs(np.einsum('pk,nkj->npj', normals, rotations))
+    radii = np.einsum('npj,nj->np', axis_dots, half_extents)
+    distances = centers @ normals.T + planes[:, 3]
+    return np.all(distances >= -radii, axis=1)
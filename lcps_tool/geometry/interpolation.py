@@ -0,0 +1,154 @@
+"""
+OBB Interpolation - Vectorized pose interpolation between two OBB samples
+
+Boxes of two consecutive OBB messages are matched by track id (when the
+OBBTracker has assigned them) or by index (same box count, no ids), then:
+- positions and sizes are interpolated linearly
+- rotations are interpolated with quaternion slerp (shortest arc)
+
+All matched boxes are interpolated in one pass over the OBBBatch arrays.
+Categorical fields (type, collision_status, ...) are taken from the
+sample closer in time.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from .obb_batch import OBBBatch
+
+# Above this |dot| the quaternions are nearly identical; normalized lerp
+# avoids dividing by sin(theta) ~ 0
+_SLERP_LINEAR_THRESHOLD = 0.9995
+
+
+def slerp_quaternions(q0: np.ndarray, q1: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    Spherical linear interpolation of unit quaternions
+
+    Args:
+        q0: Nx4 start quaternions [w, x, y, z]
+        q1: Nx4 end quaternions
+        alpha: Interpolation parameter (0 = q0, 1 = q1)
+
+    Returns:
+        Nx4 normalized quaternions
+    """
+    q0 = np.asarray(q0, dtype=np.float64).reshape(-1, 4)
+    q1 = np.asarray(q1, dtype=np.float64).reshape(-1, 4)
+    q0 = q0 / np.linalg.norm(q0, axis=1, keepdims=True)
+    q1 = q1 / np.linalg.norm(q1, axis=1, keepdims=True)
+
+    # q and -q are the same rotation: take the shortest arc
+    dot = np.sum(q0 * q1, axis=1)
+    q1 = np.where(dot[:, None] < 0, -q1, q1)
+    dot = np.abs(dot)
+
+    theta = np.arccos(np.clip(dot, -1.0, 1.0))
+    sin_theta = np.sin(theta)
+    linear = dot > _SLERP_LINEAR_THRESHOLD
+    safe_sin = np.where(linear, 1.0, sin_theta)
+    w0 = np.where(linear, 1.0 - alpha, np.sin((1.0 - alpha) * theta) / safe_sin)
+    w1 = np.where(linear, alpha, np.sin(alpha * theta) / safe_sin)
+
+    result = w0[:, None] * q0 + w1[:, None] * q1
+    return result / np.linalg.norm(result, axis=1, keepdims=True)
+
+
+def match_obb_batches(batch0: OBBBatch, batch1: OBBBatch) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Corresponding boxes of two OBB samples
+
+    Boxes are matched by track id when both samples carry track ids,
+    otherwise by index when both samples have the same number of boxes.
+
+    Args:
+        batch0: Earlier sample
+        batch1: Later sample
+
+    Returns:
+        (indices into batch0, indices into batch1); empty when the samples
+        cannot be matched
+    """
+    empty = (np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp))
+    if len(batch0) == 0 or len(batch1) == 0:
+        return empty
+
+    tracked0 = batch0.track_ids >= 0
+    tracked1 = batch1.track_ids >= 0
+    if tracked0.any() and tracked1.any():
+        _, idx0, idx1 = np.intersect1d(batch0.track_ids[tracked0], batch1.track_ids[tracked1],
+                                       assume_unique=False, return_indices=True)
+        return np.flatnonzero(tracked0)[idx0], np.flatnonzero(tracked1)[idx1]
+
+    if len(batch0) == len(batch1):
+        indices = np.arange(len(batch0))
+        return indices, indices
+    return empty
+
+
+def interpolate_obb_batches(batch0: OBBBatch, batch1: OBBBatch, alpha: float) -> OBBBatch:
+    """
+    Interpolate two already matched batches (box i of batch0 <-> box i of batch1)
+
+    Args:
+        batch0: Earlier sample
+        batch1: Later sample (same length)
+        alpha: Interpolation parameter (0 = batch0, 1 = batch1)
+
+    Returns:
+        Interpolated batch; categorical fields from the closer sample
+    """
+    nearer = batch0 if alpha < 0.5 else batch1
+    return OBBBatch(
+        positions=batch0.positions + alpha * (batch1.positions - batch0.positions),
+        quaternions=slerp_quaternions(batch0.quaternions, batch1.quaternions, alpha),
+        sizes=batch0.sizes + alpha * (batch1.sizes - batch0.sizes),
+        types=list(nearer.types),
+        collision=nearer.collision.copy(),
+        track_ids=nearer.track_ids.copy(),
+    )
+
+
+def interpolate_obb_dicts(obbs0: List[Dict[str, Any]],
+                          obbs1: List[Dict[str, Any]],
+                          alpha: float) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Interpolate two OBB messages (lists of OBB dicts)
+
+    Matched boxes get interpolated position, rotation and size; all other
+    fields are copied from the closer sample. Unmatched boxes of the closer
+    sample are passed through unchanged.
+
+    Args:
+        obbs0: OBB dicts of the earlier sample
+        obbs1: OBB dicts of the later sample
+        alpha: Interpolation parameter (0 = obbs0, 1 = obbs1)
+
+    Returns:
+        (interpolated OBB dicts, number of interpolated boxes)
+    """
+    batch0, batch1 = OBBBatch.from_dicts(obbs0), OBBBatch.from_dicts(obbs1)
+    idx0, idx1 = match_obb_batches(batch0, batch1)
+
+    nearer_obbs, nearer_idx = (obbs0, idx0) if alpha < 0.5 else (obbs1, idx1)
+    if len(idx0) == 0:
+        return [dict(obb) for obb in nearer_obbs], 0
+
+    mid = interpolate_obb_batches(batch0.select(idx0), batch1.select(idx1), alpha)
+    positions = mid.positions.tolist()
+    quaternions = mid.quaternions.tolist()
+    sizes = mid.sizes.tolist()
+
+    result = []
+    for k, i in enumerate(nearer_idx.tolist()):
+        obb = dict(nearer_obbs[i])
+        obb['position'] = positions[k]
+        obb['rotation'] = quaternions[k]
+        obb['size'] = sizes[k]
+        result.append(obb)
+
+    unmatched = np.ones(len(nearer_obbs), dtype=bool)
+    unmatched[nearer_idx] = False
+    result.extend(dict(nearer_obbs[i]) for i in np.flatnonzero(unmatched))
+    return result, len(idx0)
@@ -0,0 +1,177 @@
+"""
+Point Cloud LOD - Level-of-detail hierarchy for point cloud display
+
+Precomputes voxel grid downsamplings of one point cloud at doubling voxel
+sizes and picks, per rendered frame, the finest level that:
+- Fits within the configured point budget
+- Is not finer than what the current zoom can resolve on screen
+
+Levels are built lazily (only down to the level actually selected), each
+from the previous level with count weights so centroids stay exact.
+"""
+
+import math
+from typing import List, Optional
+
+import numpy as np
+
+from .voxel import voxel_grid_reduce
+
+
+class PointCloudLOD:
+    """
+    Voxel downsampling hierarchy for a single point cloud
+
+    Level 0 is the full-resolution cloud; level k (k >= 1) is the voxel
+    grid downsampling at base_voxel_size * 2^(k-1).
+
+    Usage:
+        lod = PointCloudLOD(base_voxel_size=0.05, point_budget=200_000)
+        lod.set_points(points)
+        level = lod.select_level(scale=1.0, viewport_height=600)
+        points_to_draw = lod.get_points(level)
+    """
+
+    def __init__(self,
+                 base_voxel_size: float = 0.05,
+                 num_levels: int = 6,
+                 point_budget: int = 200_000):
+        """
+        Initialize LOD hierarchy
+
+        Args:
+            base_voxel_size: Voxel size of level 1 in meters
+            num_levels: Number of downsampled levels (in addition to level 0)
+            point_budget: Maximum number of points to draw per frame
+        """
+        self.base_voxel_size = base_voxel_size
+        self.num_levels = num_levels
+        self.point_budget = point_budget
+
+        self._levels: List[np.ndarray] = []
+        self._weights: List[np.ndarray] = []
+        self.current_level = 0
+
+    def set_points(self, points: np.ndarray) -> None:
+        """
+        Replace the point cloud (invalidates all downsampled levels)
+
+        Args:
+            points: Nx3 array of 3D points
+        """
+        points = np.ascontiguousarray(points, dtype=np.float32).reshape(-1, 3)
+        self._levels = [points]
+        self._weights = [np.ones(len(points), dtype=np.float64)]
+
+    def voxel_size(self, level: int) -> float:
+        """Voxel size of a level in meters (0.0 for full resolution)"""
+        if level <= 0:
+            return 0.0
+        return self.base_voxel_size * (2 ** (level - 1))
+
+    def get_points(self, level: int) -> np.ndarray:
+        """
+        Get the points of a level, building coarser levels on demand
+
+        Args:
+            level: Level index (0 = full resolution)
+
+        Returns:
+            Mx3 float32 array
+        """
+        if not self._levels:
+            return np.empty((0, 3), dtype=np.float32)
+
+        level = max(0, min(level, self.num_levels))
+        while len(self._levels) <= level:
+            next_level = len(self._levels)
+            centroids, counts, _ = voxel_grid_reduce(
+                self._levels[-1], self.voxel_size(next_level), weights=self._weights[-1])
+            self._levels.append(centroids)
+            self._weights.append(counts)
+        return self._levels[level]
+
+    def get_point_count(self, level: int) -> int:
+        """Number of points in a level (builds it if needed)"""
+        return len(self.get_points(level))
+
+    def min_resolvable_level(self,
+                             scale: float,
+                             viewport_height: int,
+                             fovy_deg: float = 45.0,
+                             camera_distance: float = 5.0,
+                             min_pixel_size: float = 1.0) -> int:
+        """
+        Finest level whose voxels still cover at least min_pixel_size on screen
+
+        Finer levels would put several points into the same pixel.
+
+        Args:
+            scale: Current viewer zoom factor (self.scale[0] in the viewers)
+            viewport_height: Viewport height in pixels
+            fovy_deg: Vertical field of view of gluPerspective
+            camera_distance: Distance from camera to the scene origin
+            min_pixel_size: Minimum projected voxel size in pixels
+
+        Returns:
+            Level index
+        """
+        pixels_per_meter = (viewport_height * scale /
+                            (2.0 * camera_distance * math.tan(math.radians(fovy_deg) / 2.0)))
+        if pixels_per_meter <= 0:
+            return self.num_levels
+
+        # Smallest voxel size that still projects to min_pixel_size
+        min_voxel = min_pixel_size / pixels_per_meter
+        if min_voxel <= self.base_voxel_size:
+            return 0
+        level = 1 + math.ceil(math.log2(min_voxel / self.base_voxel_size))
+        return min(level, self.num_levels)
+
+    def select_level(self,
+                     scale: float,
+                     viewport_height: int,
+                     point_budget: Optional[int] = None,
+                     **projection) -> int:
+        """
+        Select the level to draw for the current view
+
+        Starts at the finest level the zoom can resolve and walks to coarser
+        levels until the point count fits the budget.
+
+        Args:
+            scale: Current viewer zoom factor
+            viewport_height: Viewport height in pixels
+            point_budget: Override the configured point budget
+            **projection: Forwarded to min_resolvable_level
+
+        Returns:
+            Selected level index (also stored in current_level)
+        """
+        budget = self.point_budget if point_budget is None else point_budget
+        level = self.min_resolvable_level(scale, viewport_height, **projection)
+
+        while level < self.num_levels and self.get_point_count(level) > budget:
+            level += 1
+
+        self.current_level = level
+        return level
+
+    def get_statistics(self) -> dict:
+        """Get LOD statistics for the current level"""
+        total = len(self._levels[0]) if self._levels else 0
+        drawn = len(self._levels[self.current_level]) if len(self._levels) > self.current_level else 0
+        return {
+            'level': self.current_level,
+            'voxel_size': self.voxel_size(self.current_level),
+            'levels_built': len(self._levels),
+            'total_points': total,
+            'drawn_points': drawn,
+            'point_budget': self.point_budget,
+        }
+
+    def __repr__(self) -> str:
+        return (f"<PointCloudLOD "
+                f"base_voxel={self.base_voxel_size}m "
+                f"levels={self.num_levels} "
+                f"budget={self.point_budget}>")
@@ -0,0 +1,202 @@
+"""
+OBB Batch - Struct-of-arrays representation of one OBB message
+
+Converts the list of OBB dicts carried by an OBB message into contiguous
+NumPy arrays once, so that rendering, culling, statistics and geometry
+kernels operate on whole batches instead of per-OBB Python objects.
+
+Conventions:
+- position: box center [x, y, z]
+- rotation: unit quaternion [w, x, y, z] (sendOBB.cpp / recv.py format)
+- size: full edge lengths [sx, sy, sz] (half extents = size / 2)
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+
+def quaternions_to_matrices(quaternions: np.ndarray) -> np.ndarray:
+    """
+    Convert unit quaternions [w, x, y, z] to rotation matrices
+
+    Args:
+        quaternions: Nx4 array (normalized internally)
+
+    Returns:
+        Nx3x3 float64 array; column j of matrix i is box axis j
+    """
+    q = np.asarray(quaternions, dtype=np.float64).reshape(-1, 4)
+    norms = np.linalg.norm(q, axis=1, keepdims=True)
+    q = q / np.where(norms > 0, norms, 1.0)
+    w, x, y, z = q[:, 0], q[:, 1], q[:, 2], q[:, 3]
+
+    matrices = np.empty((len(q), 3, 3), dtype=np.float64)
+    matrices[:, 0, 0] = 1 - 2 * (y * y + z * z)
+    matrices[:, 0, 1] = 2 * (x * y - z * w)
+    matrices[:, 0, 2] = 2 * (x * z + y * w)
+    matrices[:, 1, 0] = 2 * (x * y + z * w)
+    matrices[:, 1, 1] = 1 - 2 * (x * x + z * z)
+    matrices[:, 1, 2] = 2 * (y * z - x * w)
+    matrices[:, 2, 0] = 2 * (x * z - y * w)
+    matrices[:, 2, 1] = 2 * (y * z + x * w)
+    matrices[:, 2, 2] = 1 - 2 * (x * x + y * y)
+    return matrices
+
+
+@dataclass
+class OBBBatch:
+    """
+    Struct-of-arrays batch of oriented bounding boxes
+
+    Attributes:
+        positions: Nx3 box centers
+        quaternions: Nx4 rotations [w, x, y, z]
+        sizes: Nx3 full edge lengths
+        types: N type strings
+        collision: N collision_status values (0 = safe, 1/2 = alert)
+        track_ids: N persistent track ids (-1 = untracked), set by OBBTracker
+    """
+
+    positions: np.ndarray
+    quaternions: np.ndarray
+    sizes: np.ndarray
+    types: List[str] = field(default_factory=list)
+    collision: Optional[np.ndarray] = None
+    track_ids: Optional[np.ndarray] = None
+    _rotations: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Normalize array shapes and dtypes"""
+        self.positions = np.asarray(self.positions, dtype=np.float64).reshape(-1, 3)
+        self.quaternions = np.asarray(self.quaternions, dtype=np.float64).reshape(-1, 4)
+        self.sizes = np.asarray(self.sizes, dtype=np.float64).reshape(-1, 3)
+        if self.collision is None:
+            self.collision = np.zeros(len(self.positions), dtype=np.int32)
+        else:
+            self.collision = np.asarray(self.collision, dtype=np.int32).reshape(-1)
+        if self.track_ids is None:
+            self.track_ids = np.full(len(self.positions), -1, dtype=np.int64)
+        else:
+            self.track_ids = np.asarray(self.track_ids, dtype=np.int64).reshape(-1)
+        if not self.types:
+            self.types = ['unknown'] * len(self.positions)
+
+    @classmethod
+    def empty(cls) -> 'OBBBatch':
+        """Create an empty batch"""
+        return cls(np.empty((0, 3)), np.empty((0, 4)), np.empty((0, 3)))
+
+    @classmethod
+    def from_dicts(cls, obb_dicts: Iterable[Dict[str, Any]]) -> 'OBBBatch':
+        """
+        Build a batch from OBB dicts (sendOBB.cpp / LCPS protocol format)
+
+        Missing fields use the same defaults as the viewers: position
+        [0, 0, 0], rotation [1, 0, 0, 0], size [1, 1, 1], type "unknown",
+        collision_status 0, track_id -1.
+
+        Args:
+            obb_dicts: Iterable of OBB dicts
+
+        Returns:
+            OBBBatch
+        """
+        obb_dicts = list(obb_dicts)
+        if not obb_dicts:
+            return cls.empty()
+
+        return cls(
+            positions=[obb.get('position', (0.0, 0.0, 0.0)) for obb in obb_dicts],
+            quaternions=[obb.get('rotation', (1.0, 0.0, 0.0, 0.0)) for obb in obb_dicts],
+            sizes=[obb.get('size', (1.0, 1.0, 1.0)) for obb in obb_dicts],
+            types=[obb.get('type', 'unknown') for obb in obb_dicts],
+            collision=[obb.get('collision_status', 0) for obb in obb_dicts],
+            track_ids=[obb.get('track_id', -1) for obb in obb_dicts],
+        )
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    @property
+    def half_extents(self) -> np.ndarray:
+        """Nx3 half edge lengths"""
+        return self.sizes * 0.5
+
+    @property
+    def rotations(self) -> np.ndarray:
+        """Nx3x3 rotation matrices (computed once, then cached)"""
+        if self._rotations is None:
+            self._rotations = quaternions_to_matrices(self.quaternions)
+        return self._rotations
+
+    def select(self, mask: np.ndarray) -> 'OBBBatch':
+        """
+        Select a subset of boxes
+
+        Args:
+            mask: Boolean mask or index array
+
+        Returns:
+            New OBBBatch containing the selected boxes
+        """
+        indices = np.flatnonzero(mask) if np.asarray(mask).dtype == bool else np.asarray(mask)
+        batch = OBBBatch(
+            positions=self.positions[indices],
+            quaternions=self.quaternions[indices],
+            sizes=self.sizes[indices],
+            types=[self.types[i] for i in indices],
+            collision=self.collision[indices],
+            track_ids=self.track_ids[indices],
+        )
+        if self._rotations is not None:
+            batch._rotations = self._rotations[indices]
+        return batch
+
+    def model_matrices(self) -> np.ndarray:
+        """
+        Column-major 4x4 model matrices (translate * rotate * scale)
+
+        Ready for glMultMatrixf / glLoadMatrixf; drawing a unit cube with
+        each matrix reproduces the box.
+
+        Returns:
+            Nx16 float32 array
+        """
+        n = len(self)
+        matrices = np.zeros((n, 4, 4), dtype=np.float32)
+        # Column-major = transpose of the row-major matrix: rows 0-2 hold
+        # the columns of R * S, row 3 holds the translation.
+        matrices[:, :3, :3] = np.transpose(self.rotations, (0, 2, 1)) * self.sizes[:, :, None]
+        matrices[:, 3, :3] = self.positions
+        matrices[:, 3, 3] = 1.0
+        return matrices.reshape(n, 16)
+
+    def corners(self) -> np.ndarray:
+        """
+        Box corner points
+
+        Returns:
+            Nx8x3 array of world-space corners
+        """
+        signs = np.array([[sx, sy, sz]
+                          for sx in (-1, 1) for sy in (-1, 1) for sz in (-1, 1)], dtype=np.float64)
+        local = signs[None, :, :] * self.half_extents[:, None, :]
+        return np.einsum('nij,nkj->nki', self.rotations, local) + self.positions[:, None, :]
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Convert back to OBB dicts (track_id only for tracked boxes)"""
+        dicts = []
+        for i in range(len(self)):
+            obb = {
+                'type': self.types[i],
+                'position': self.positions[i].tolist(),
+                'rotation': self.quaternions[i].tolist(),
+                'size': self.sizes[i].tolist(),
+                'collision_status': int(self.collision[i]),
+            }
+            if self.track_ids[i] >= 0:
+                obb['track_id'] = int(self.track_ids[i])
+            dicts.append(obb)
+        return dicts
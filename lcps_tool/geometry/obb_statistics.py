@@ -0,0 +1,163 @@
+"""
+OBB Statistics - Vectorized per-type and collision aggregation
+
+Type strings are interned to small integer codes once (the set of OBB
+types in a session is tiny and stable), after which every message is
+aggregated with np.bincount instead of Python loops over OBB dicts.
+
+update() takes an OBBBatch (when the geometry is needed anyway),
+update_dicts() reads only the type and collision fields of the raw OBB
+dicts (statistics-only consumers such as the text viewer).
+"""
+
+from typing import Any, Dict, Iterable, List
+
+import numpy as np
+
+from .obb_batch import OBBBatch
+
+
+class OBBStatistics:
+    """
+    Cumulative OBB type and collision statistics
+
+    Usage:
+        stats = OBBStatistics()
+        counts = stats.update(OBBBatch.from_dicts(message["data"]))
+        stats.format_counts(counts)   # "car:3, person:1"
+        counts = stats.update_dicts(message["data"])   # same, without OBBBatch
+        stats.type_counts             # {"car": 120, "person": 40}
+        stats.collision_rates         # {"car": 0.05, "person": 0.0}
+
+    Collision semantics match the viewers: collision_status == 1 counts as
+    a collision, every other value as safe.
+    """
+
+    def __init__(self):
+        self.type_names: List[str] = []
+        self._type_codes: Dict[str, int] = {}
+        self._counts = np.zeros(0, dtype=np.int64)
+        self._collisions = np.zeros(0, dtype=np.int64)
+        self.messages = 0
+
+    def intern(self, types: Iterable[str]) -> np.ndarray:
+        """
+        Map type strings to integer codes, assigning new codes on first sight
+
+        Args:
+            types: Type strings
+
+        Returns:
+            Integer code per type string
+        """
+        codes = self._type_codes
+        get = codes.get
+        result = []
+        for name in types:
+            code = get(name)
+            if code is None:
+                code = codes[name] = len(self.type_names)
+                self.type_names.append(name)
+            result.append(code)
+        return np.array(result, dtype=np.intp)
+
+    def update(self, batch: OBBBatch) -> np.ndarray:
+        """
+        Aggregate one message
+
+        Args:
+            batch: OBBs of the message
+
+        Returns:
+            Per-type OBB counts of this message, indexed by type code
+        """
+        codes = self.intern(batch.types)
+        num_types = len(self.type_names)
+        counts = np.bincount(codes, minlength=num_types)
+        collisions = np.bincount(codes, weights=(batch.collision == 1), minlength=num_types)
+        return self._accumulate(counts, collisions)
+
+    def update_dicts(self, obbs: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        Aggregate one message from raw OBB dicts (no OBBBatch conversion)
+
+        Field defaults match OBBBatch.from_dicts (type "unknown",
+        collision_status 0).
+
+        Args:
+            obbs: OBB dicts of the message ('type', 'collision_status')
+
+        Returns:
+            Per-type OBB counts of this message, indexed by type code
+        """
+        # One pass over the dicts: type codes, plus the codes of colliding OBBs
+        codes = self._type_codes
+        get = codes.get
+        type_codes: List[int] = []
+        collision_codes: List[int] = []
+        for obb in obbs:
+            name = obb.get('type', 'unknown')
+            code = get(name)
+            if code is None:
+                code = codes[name] = len(self.type_names)
+                self.type_names.append(name)
+            type_codes.append(code)
+            if obb.get('collision_status', 0) == 1:
+                collision_codes.append(code)
+
+        num_types = len(self.type_names)
+        counts = np.bincount(np.array(type_codes, dtype=np.intp), minlength=num_types)
+        collisions = np.bincount(np.array(collision_codes, dtype=np.intp), minlength=num_types)
+        return self._accumulate(counts, collisions)
+
+    def _accumulate(self, counts: np.ndarray, collisions: np.ndarray) -> np.ndarray:
+        """Add one message's per-type counts to the cumulative counters"""
+        self.messages += 1
+        num_types = len(self.type_names)
+
+        if len(self._counts) < num_types:
+            grow = num_types - len(self._counts)
+            self._counts = np.concatenate([self._counts, np.zeros(grow, dtype=np.int64)])
+            self._collisions = np.concatenate([self._collisions, np.zeros(grow, dtype=np.int64)])
+        self._counts += counts
+        self._collisions += collisions.astype(np.int64)
+        return counts
+
+    def format_counts(self, counts: np.ndarray) -> str:
+        """Format per-type counts as "type:count, ..." sorted by type name"""
+        return ", ".join(f"{self.type_names[code]}:{counts[code]}"
+                         for code in self._sorted_codes() if code < len(counts) and counts[code])
+
+    def _sorted_codes(self) -> List[int]:
+        return sorted(range(len(self.type_names)), key=self.type_names.__getitem__)
+
+    @property
+    def total_obbs(self) -> int:
+        return int(self._counts.sum())
+
+    @property
+    def collision_count(self) -> int:
+        return int(self._collisions.sum())
+
+    @property
+    def safe_count(self) -> int:
+        return self.total_obbs - self.collision_count
+
+    @property
+    def type_counts(self) -> Dict[str, int]:
+        """Cumulative OBB count per type"""
+        return {name: int(self._counts[code]) for code, name in enumerate(self.type_names)}
+
+    @property
+    def collision_rates(self) -> Dict[str, float]:
+        """Fraction of OBBs in collision per type"""
+        return {
+            name: float(self._collisions[code] / self._counts[code]) if self._counts[code] else 0.0
+            for code, name in enumerate(self.type_names)
+        }
+
+    def reset(self) -> None:
+        """Clear counters (type codes are kept)"""
+        self._counts[:] = 0
+        self._collisions[:] = 0
+        self.messages = 0
@@ -0,0 +1,143 @@
+"""
+Point-in-OBB - Vectorized point membership for batches of oriented boxes
+
+Pipeline:
+1. Voxel-hash pre-filter: points are sorted by packed voxel key once; each
+   box enumerates the voxels covered by its world AABB and gathers the
+   candidate points of those voxels with np.searchsorted.
+2. Exact test: candidates are transformed into their box's local frame
+   (p - c) @ R and kept when |local| <= half extents (+ margin).
+
+Each (box, point) candidate is tested exactly once, so the cost scales with
+the points near boxes rather than with boxes x points.
+"""
+
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from .obb_batch import OBBBatch
+from .voxel import compute_voxel_indices, pack_voxel_keys
+
+# Upper bound on voxels enumerated per call; beyond it the voxel size is
+# grown so the pre-filter never costs more than the exact test it saves
+_MAX_CANDIDATE_VOXELS = 4_000_000
+
+
+def _default_voxel_size(half_extents: np.ndarray) -> float:
+    """Voxel edge of half a typical box size: tight candidate sets, ~27-64 voxels per box"""
+    return float(max(np.median(half_extents.max(axis=1)), 1e-3))
+
+
+def point_obb_pairs(points: np.ndarray,
+                    batch: OBBBatch,
+                    margin: float = 0.0,
+                    voxel_size: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    All (box, point) pairs where the point lies inside the box
+
+    Args:
+        points: Nx3 point cloud
+        batch: OBB batch
+        margin: Grow every box by this distance on each side (e.g. to count
+            support points around a box)
+        voxel_size: Pre-filter voxel edge (default: half the median box size)
+
+    Returns:
+        (box_indices, point_indices), sorted by box then point index
+    """
+    empty = (np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp))
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    if len(points) == 0 or len(batch) == 0:
+        return empty
+
+    half = batch.half_extents + margin
+    rotations = batch.rotations
+    centers = batch.positions
+
+    # World AABB of every (grown) box
+    extent = np.einsum('nij,nj->ni', np.abs(rotations), half)
+    lo_world, hi_world = centers - extent, centers + extent
+
+    if voxel_size is None:
+        voxel_size = _default_voxel_size(half)
+
+    # Keep the number of enumerated voxels bounded
+    while True:
+        lo = compute_voxel_indices(lo_world, voxel_size)
+        hi = compute_voxel_indices(hi_world, voxel_size)
+        dims = hi - lo + 1
+        cells_per_box = np.prod(dims, axis=1)
+        if cells_per_box.sum() <= _MAX_CANDIDATE_VOXELS:
+            break
+        voxel_size *= 2.0
+
+    # 1. Voxel hash: sort points by key
+    point_keys = pack_voxel_keys(compute_voxel_indices(points, voxel_size))
+    order = np.argsort(point_keys, kind='stable')
+    sorted_keys = point_keys[order]
+
+    # Enumerate voxels covered by each box
+    total_cells = int(cells_per_box.sum())
+    cell_box = np.repeat(np.arange(len(batch)), cells_per_box)
+    cell_rank = np.arange(total_cells) - np.repeat(np.cumsum(cells_per_box) - cells_per_box, cells_per_box)
+    box_dims = dims[cell_box]
+    iz = cell_rank % box_dims[:, 2]
+    iy = (cell_rank // box_dims[:, 2]) % box_dims[:, 1]
+    ix = cell_rank // (box_dims[:, 2] * box_dims[:, 1])
+    cell_keys = pack_voxel_keys(lo[cell_box] + np.stack([ix, iy, iz], axis=1))
+
+    start = np.searchsorted(sorted_keys, cell_keys, side='left')
+    stop = np.searchsorted(sorted_keys, cell_keys, side='right')
+    counts = stop - start
+    occupied = counts > 0
+    cell_box, start, counts = cell_box[occupied], start[occupied], counts[occupied]
+    total = int(counts.sum())
+    if total == 0:
+        return empty
+
+    candidate_box = np.repeat(cell_box, counts)
+    offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    candidate_point = order[np.repeat(start, counts) + offsets]
+
+    # 2. Exact test in each box's local frame. Candidates are grouped by
+    # box, so each group is one BLAS matmul with that box's rotation
+    # (much faster than gathering an Mx3x3 rotation per candidate).
+    local = points[candidate_point] - centers[candidate_box]
+    bounds = np.searchsorted(candidate_box, np.arange(len(batch) + 1))
+    for box in np.flatnonzero(np.diff(bounds)):
+        segment = slice(bounds[box], bounds[box + 1])
+        local[segment] = local[segment] @ rotations[box]
+    inside = np.all(np.abs(local) <= half[candidate_box], axis=1)
+
+    box_indices = candidate_box[inside]
+    point_indices = candidate_point[inside]
+    sort = np.lexsort((point_indices, box_indices))
+    return box_indices[sort], point_indices[sort]
+
+
+def points_in_obbs(points: np.ndarray,
+                   batch: OBBBatch,
+                   margin: float = 0.0,
+                   voxel_size: Optional[float] = None,
+                   return_indices: bool = False
+                   ) -> Union[np.ndarray, Tuple[np.ndarray, List[np.ndarray]]]:
+    """
+    Number of points inside each box
+
+    Args:
+        points: Nx3 point cloud
+        batch: OBB batch
+        margin: Grow every box by this distance on each side
+        voxel_size: Pre-filter voxel edge (default: half the median box size)
+        return_indices: Also return the point indices of each box
+
+    Returns:
+        Per-box counts (int64, len(batch)); with return_indices, a tuple of
+        (counts, list of point index arrays, one per box)
+    """
+    box_indices, point_indices = point_obb_pairs(points, batch, margin, voxel_size)
+    counts = np.bincount(box_indices, minlength=len(batch)).astype(np.int64)
+    if not return_indices:
+        return counts
+    return counts, np.split(point_indices, np.cumsum(counts)[:-1]) if len(batch) else []
@@ -0,0 +1,394 @@
+"""
+Spatial Index - Voxel-hash index for nearest-distance and radius queries
+
+The index is the sorted array of packed voxel keys of a point cloud:
+- PointCloudReceiver already computes these keys (sorted, one per
+  centroid) while downsampling, so rebuilding the index for a new frame
+  costs no extra sort when they are passed along
+- Packed keys put z in the low bits, so the cells of one (x, y) column
+  with z in [z0, z1] form one contiguous key range; a query region is
+  gathered with two np.searchsorted calls per column instead of one per
+  cell
+
+Queries:
+- radius_query: all (query, point) pairs within a radius
+- nearest: nearest point per query, searched in growing shells of cells
+  until the best distance is provably final; queries that stay unresolved
+  move to a coarser grid level (cell size doubled, keys derived from the
+  fine keys by a shift), so empty space costs O(log distance) shells
+  instead of O(distance^3) cells
+- obb_clearance: distance from each OBB surface to its nearest point
+  (0 when points lie inside the box)
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .obb_batch import OBBBatch
+from .voxel import compute_voxel_indices, pack_voxel_keys, unpack_voxel_keys
+
+# Upper bound on key ranges searched per chunk of queries
+_MAX_RANGES_PER_CHUNK = 2_000_000
+
+# Shells searched on one grid level before unresolved queries move to the
+# next coarser level
+_RINGS_PER_LEVEL = 2
+
+
+def _column_offsets(radius: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(dx, dy, dz range) columns covering the cube of Chebyshev radius r"""
+    d = np.arange(-radius, radius + 1, dtype=np.int64)
+    dx, dy = np.meshgrid(d, d, indexing='ij')
+    xy = np.stack([dx.ravel(), dy.ravel()], axis=1)
+    z_lo = np.full(len(xy), -radius, dtype=np.int64)
+    z_hi = np.full(len(xy), radius, dtype=np.int64)
+    return xy, z_lo, z_hi
+
+
+def _shell_offsets(radius: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(dx, dy, dz range) columns covering the shell of Chebyshev radius r"""
+    if radius == 0:
+        return np.zeros((1, 2), dtype=np.int64), np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64)
+
+    xy, _, _ = _column_offsets(radius)
+    on_rim = np.abs(xy).max(axis=1) == radius
+    rim, inner = xy[on_rim], xy[~on_rim]
+
+    # Rim columns span the full z range, inner columns only the top and bottom cells
+    columns = np.concatenate([rim, inner, inner])
+    full, bottom, top = np.full(len(rim), radius), np.full(len(inner), -radius), np.full(len(inner), radius)
+    z_lo = np.concatenate([-full, bottom, top]).astype(np.int64)
+    z_hi = np.concatenate([full, bottom, top]).astype(np.int64)
+    return columns, z_lo, z_hi
+
+
+def _grouped_argmin(groups: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Index of the minimum value of each run of equal group ids
+
+    Candidates are generated owner by owner, so group ids arrive in
+    contiguous runs and np.minimum.reduceat replaces a full sort.
+    """
+    starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+    minima = np.minimum.reduceat(values, starts)
+    sizes = np.diff(np.r_[starts, len(values)])
+    at_min = np.flatnonzero(values == np.repeat(minima, sizes))
+    return at_min[np.r_[True, np.diff(np.searchsorted(starts, at_min, side='right')) > 0]]
+
+
+class PointCloudIndex:
+    """
+    Voxel-hash spatial index over a point cloud
+
+    Usage:
+        index = PointCloudIndex(voxel_size=0.1)
+        index.rebuild(pc_data['points'], pc_data.get('voxel_keys'),
+                      pc_data.get('voxel_size'))                    # per frame
+        dist, idx = index.nearest(query_points, max_distance=5.0)
+        q, p, d = index.radius_query(query_points, radius=1.0)
+        clearance, idx = index.obb_clearance(spreader_batch, max_distance=5.0)
+
+    Parameters:
+        voxel_size: Cell edge length (use the downsampling voxel size to
+            reuse the receiver's keys)
+    """
+
+    def __init__(self,
+                 voxel_size: float = 0.1,
+                 points: Optional[np.ndarray] = None,
+                 keys: Optional[np.ndarray] = None,
+                 keys_voxel_size: Optional[float] = None):
+        """
+        Initialize index
+
+        Args:
+            voxel_size: Cell edge length in meters
+            points: Optional Nx3 points to index right away
+            keys: Optional precomputed voxel keys of the points
+            keys_voxel_size: Voxel size the keys were computed with
+        """
+        self.voxel_size = voxel_size
+        self.points = np.empty((0, 3), dtype=np.float64)
+        # Per grid level: (sorted keys, point order or None if already sorted);
+        # coarser levels are derived lazily from level 0
+        self._levels: List[Tuple[np.ndarray, Optional[np.ndarray]]] = []
+        self._bounds = np.zeros((2, 3))
+
+        # Statistics
+        self.rebuild_count = 0
+        self.reused_keys = 0
+        self.mismatched_keys = 0
+
+        if points is not None:
+            self.rebuild(points, keys, keys_voxel_size)
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def rebuild(self,
+                points: np.ndarray,
+                keys: Optional[np.ndarray] = None,
+                keys_voxel_size: Optional[float] = None) -> None:
+        """
+        Index a new point cloud (e.g. the next frame)
+
+        Args:
+            points: Nx3 points
+            keys: Optional packed voxel keys of the points; sorted keys (as
+                produced by voxel_grid_reduce) skip the sort entirely
+            keys_voxel_size: Voxel size the keys were computed with (e.g. the
+                record's 'voxel_size'). Keys of a different voxel size are
+                ignored and recomputed (counted in mismatched_keys); None
+                means the keys are known to use this index's voxel size
+        """
+        self.points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        self.rebuild_count += 1
+
+        if keys is not None and keys_voxel_size is not None and \
+                not np.isclose(keys_voxel_size, self.voxel_size):
+            self.mismatched_keys += 1
+            keys = None
+
+        if keys is not None and len(keys) == len(self.points):
+            keys = np.asarray(keys, dtype=np.int64)
+            self.reused_keys += 1
+        else:
+            keys = pack_voxel_keys(compute_voxel_indices(self.points, self.voxel_size))
+
+        if len(keys) < 2 or np.all(keys[1:] >= keys[:-1]):
+            self._levels = [(keys, None)]
+        else:
+            order = np.argsort(keys, kind='stable')
+            self._levels = [(keys[order], order)]
+
+        if len(self.points):
+            self._bounds = np.stack([self.points.min(axis=0), self.points.max(axis=0)])
+
+    def _level(self, level: int) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """Sorted keys and point order of a grid level (cell = voxel_size * 2^level)"""
+        while len(self._levels) <= level:
+            fine_keys, fine_order = self._levels[0]
+            shift = len(self._levels)
+            keys = pack_voxel_keys(unpack_voxel_keys(fine_keys) >> shift)
+            order = np.argsort(keys, kind='stable')
+            self._levels.append((keys[order], order if fine_order is None else fine_order[order]))
+        return self._levels[level]
+
+    def _gather(self, owners: np.ndarray, columns: np.ndarray,
+                z_lo: np.ndarray, z_hi: np.ndarray,
+                level: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Points in a set of (x, y) column ranges
+
+        Args:
+            owners: M owner ids (query or box index) per range
+            columns: Mx2 cell (x, y) of each range
+            z_lo, z_hi: M inclusive cell z bounds of each range
+            level: Grid level the cells refer to
+
+        Returns:
+            (owner per candidate, point index per candidate)
+        """
+        sorted_keys, order = self._level(level)
+        lo_keys = pack_voxel_keys(np.column_stack([columns, z_lo]))
+        hi_keys = pack_voxel_keys(np.column_stack([columns, z_hi]))
+        start = np.searchsorted(sorted_keys, lo_keys, side='left')
+        counts = np.searchsorted(sorted_keys, hi_keys, side='right') - start
+        total = int(counts.sum())
+        if total == 0:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+
+        candidate_owner = np.repeat(owners, counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        candidate_point = np.repeat(start, counts) + offsets
+        if order is not None:
+            candidate_point = order[candidate_point]
+        return candidate_owner, candidate_point
+
+    def _gather_around(self, query_ids: np.ndarray, query_cells: np.ndarray,
+                       offsets: Tuple[np.ndarray, np.ndarray, np.ndarray],
+                       level: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+        """Candidates of each query in the given column offsets around its cell"""
+        xy, z_lo, z_hi = offsets
+        n = len(xy)
+        columns = (query_cells[:, None, :2] + xy[None, :, :]).reshape(-1, 2)
+        lo = (query_cells[:, None, 2] + z_lo[None, :]).ravel()
+        hi = (query_cells[:, None, 2] + z_hi[None, :]).ravel()
+        return self._gather(np.repeat(query_ids, n), columns, lo, hi, level)
+
+    def _chunks(self, count: int, ranges_per_query: int) -> Iterator[slice]:
+        step = max(_MAX_RANGES_PER_CHUNK // max(ranges_per_query, 1), 1)
+        for start in range(0, count, step):
+            yield slice(start, min(start + step, count))
+
+    def radius_query(self, queries: np.ndarray,
+                     radius: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        All indexed points within a radius of each query point
+
+        Args:
+            queries: Qx3 query points
+            radius: Search radius in meters
+
+        Returns:
+            (query_indices, point_indices, distances), sorted by query
+            then point index
+        """
+        queries = np.asarray(queries, dtype=np.float64).reshape(-1, 3)
+        empty = (np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp), np.empty(0))
+        if len(queries) == 0 or len(self.points) == 0:
+            return empty
+
+        offsets = _column_offsets(int(np.ceil(radius / self.voxel_size)))
+        query_cells = compute_voxel_indices(queries, self.voxel_size)
+        results_q, results_p, results_d = [], [], []
+        for chunk in self._chunks(len(queries), len(offsets[0])):
+            ids = np.arange(len(queries))[chunk]
+            cand_q, cand_p = self._gather_around(ids, query_cells[chunk], offsets)
+            dist = np.linalg.norm(self.points[cand_p] - queries[cand_q], axis=1)
+            keep = dist <= radius
+            results_q.append(cand_q[keep])
+            results_p.append(cand_p[keep])
+            results_d.append(dist[keep])
+
+        query_idx = np.concatenate(results_q)
+        point_idx = np.concatenate(results_p)
+        dist = np.concatenate(results_d)
+        sort = np.lexsort((point_idx, query_idx))
+        return query_idx[sort], point_idx[sort], dist[sort]
+
+    def nearest(self, queries: np.ndarray,
+                max_distance: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Nearest indexed point of each query point
+
+        Shells of cells (Chebyshev radius r = 0, 1, 2) are searched around
+        each query; a query is final once its best distance is at most
+        r * cell size, since every unsearched point is farther. Unresolved
+        queries repeat the search on the next coarser grid level.
+
+        Args:
+            queries: Qx3 query points
+            max_distance: Stop searching beyond this distance (default:
+                until the whole cloud is covered)
+
+        Returns:
+            (distances, point_indices); inf / -1 where no point lies within
+            max_distance
+        """
+        queries = np.asarray(queries, dtype=np.float64).reshape(-1, 3)
+        best_d2 = np.full(len(queries), np.inf)
+        best_idx = np.full(len(queries), -1, dtype=np.intp)
+        if len(queries) == 0 or len(self.points) == 0:
+            return best_d2, best_idx
+
+        # Chebyshev distance beyond which a query has searched the whole cloud
+        reach = np.max(np.maximum(np.abs(queries - self._bounds[0]),
+                                  np.abs(queries - self._bounds[1])), axis=1)
+        if max_distance is not None:
+            reach = np.minimum(reach, max_distance)
+
+        active = np.arange(len(queries))
+        level = 0
+        while len(active):
+            cell = self.voxel_size * (1 << level)
+            query_cells = compute_voxel_indices(queries, cell)
+            for ring in range(_RINGS_PER_LEVEL + 1):
+                offsets = _shell_offsets(ring)
+                for chunk in self._chunks(len(active), len(offsets[0])):
+                    ids = active[chunk]
+                    cand_q, cand_p = self._gather_around(ids, query_cells[ids], offsets, level)
+                    if len(cand_q) == 0:
+                        continue
+                    d2 = np.sum((self.points[cand_p] - queries[cand_q]) ** 2, axis=1)
+
+                    # Closest candidate per query of this shell
+                    winners = _grouped_argmin(cand_q, d2)
+                    q, d2, p = cand_q[winners], d2[winners], cand_p[winners]
+
+                    better = d2 < best_d2[q]
+                    best_d2[q[better]] = d2[better]
+                    best_idx[q[better]] = p[better]
+
+                searched = ring * cell
+                final = (best_d2[active] <= searched ** 2) | (reach[active] <= searched)
+                active = active[~final]
+                if len(active) == 0:
+                    break
+            level += 1
+
+        best = np.sqrt(best_d2)
+        if max_distance is not None:
+            beyond = best > max_distance
+            best[beyond] = np.inf
+            best_idx[beyond] = -1
+        return best, best_idx
+
+    def obb_clearance(self, batch: OBBBatch,
+                      max_distance: float = 5.0) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Distance from each box surface to its nearest indexed point
+
+        Args:
+            batch: OBB batch (e.g. the spreader boxes of a frame)
+            max_distance: Search distance around each box in meters
+
+        Returns:
+            (clearances, point_indices) per box; 0 when a point lies inside
+            the box, inf / -1 when no point lies within max_distance
+        """
+        clearance = np.full(len(batch), np.inf)
+        nearest = np.full(len(batch), -1, dtype=np.intp)
+        if len(batch) == 0 or len(self.points) == 0:
+            return clearance, nearest
+
+        half = batch.half_extents
+        rotations = batch.rotations
+        centers = batch.positions
+
+        # Columns covered by each box's AABB grown by max_distance
+        extent = np.einsum('nij,nj->ni', np.abs(rotations), half) + max_distance
+        lo = compute_voxel_indices(centers - extent, self.voxel_size)
+        hi = compute_voxel_indices(centers + extent, self.voxel_size)
+        nx, ny = hi[:, 0] - lo[:, 0] + 1, hi[:, 1] - lo[:, 1] + 1
+        per_box = nx * ny
+        box = np.repeat(np.arange(len(batch)), per_box)
+        rank = np.arange(int(per_box.sum())) - np.repeat(np.cumsum(per_box) - per_box, per_box)
+        columns = lo[box, :2] + np.stack([rank // ny[box], rank % ny[box]], axis=1)
+
+        cand_box, cand_point = self._gather(box, columns, lo[box, 2], hi[box, 2])
+        if len(cand_box) == 0:
+            return clearance, nearest
+
+        # Point-to-box distance in each box's local frame (one matmul per box)
+        local = self.points[cand_point] - centers[cand_box]
+        bounds = np.searchsorted(cand_box, np.arange(len(batch) + 1))
+        for b in np.flatnonzero(np.diff(bounds)):
+            segment = slice(bounds[b], bounds[b + 1])
+            local[segment] = local[segment] @ rotations[b]
+        outside = np.maximum(np.abs(local) - half[cand_box], 0.0)
+        dist = np.linalg.norm(outside, axis=1)
+
+        keep = dist <= max_distance
+        cand_box, cand_point, dist = cand_box[keep], cand_point[keep], dist[keep]
+        if len(dist) == 0:
+            return clearance, nearest
+
+        winners = _grouped_argmin(cand_box, dist)
+        clearance[cand_box[winners]] = dist[winners]
+        nearest[cand_box[winners]] = cand_point[winners]
+        return clearance, nearest
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get index statistics"""
+        return {
+            'points': len(self.points),
+            'voxel_size': self.voxel_size,
+            'rebuild_count': self.rebuild_count,
+            'reused_keys': self.reused_keys,
+            'mismatched_keys': self.mismatched_keys,
+        }
+
+    def __repr__(self) -> str:
+        return f"<PointCloudIndex points={len(self.points)} voxel={self.voxel_size}>"
@@ -0,0 +1,149 @@
+"""
+Voxel Grid - Vectorized voxel keys and voxel grid downsampling
+
+Shared by PointCloudReceiver (ADR-003 downsampling) and the point cloud
+LOD hierarchy:
+- Voxel coordinates are packed into a single int64 key per point
+- Points are grouped with np.unique instead of a Python dict
+- Centroids are computed with np.bincount (optionally weighted)
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+# Bits per axis in a packed voxel key (3 x 21 = 63 bits)
+VOXEL_KEY_BITS = 21
+VOXEL_KEY_OFFSET = 1 << (VOXEL_KEY_BITS - 1)
+_VOXEL_KEY_MASK = (1 << VOXEL_KEY_BITS) - 1
+
+
+def compute_voxel_indices(points: np.ndarray, voxel_size: float) -> np.ndarray:
+    """
+    Compute integer voxel coordinates for each point
+
+    Args:
+        points: Nx3 array of 3D points
+        voxel_size: Voxel edge length in meters
+
+    Returns:
+        Nx3 int64 array of voxel coordinates
+    """
+    return np.floor(np.asarray(points) / voxel_size).astype(np.int64)
+
+
+def pack_voxel_keys(voxel_indices: np.ndarray) -> np.ndarray:
+    """
+    Pack Nx3 voxel coordinates into one int64 key per voxel
+
+    Each axis uses 21 bits, so coordinates must lie within ±2^20 voxels
+    (±104 km at 0.1m voxels).
+
+    Args:
+        voxel_indices: Nx3 integer voxel coordinates
+
+    Returns:
+        N int64 keys
+    """
+    shifted = (np.asarray(voxel_indices, dtype=np.int64) + VOXEL_KEY_OFFSET) & _VOXEL_KEY_MASK
+    return (shifted[:, 0] << (2 * VOXEL_KEY_BITS)) | (shifted[:, 1] << VOXEL_KEY_BITS) | shifted[:, 2]
+
+
+def unpack_voxel_keys(keys: np.ndarray) -> np.ndarray:
+    """
+    Inverse of pack_voxel_keys
+
+    Args:
+        keys: N int64 keys
+
+    Returns:
+        Nx3 int64 voxel coordinates
+    """
+    keys = np.asarray(keys, dtype=np.int64)
+    indices = np.empty((len(keys), 3), dtype=np.int64)
+    indices[:, 0] = (keys >> (2 * VOXEL_KEY_BITS)) & _VOXEL_KEY_MASK
+    indices[:, 1] = (keys >> VOXEL_KEY_BITS) & _VOXEL_KEY_MASK
+    indices[:, 2] = keys & _VOXEL_KEY_MASK
+    return indices - VOXEL_KEY_OFFSET
+
+
+def compute_voxel_keys(points: np.ndarray, voxel_size: float) -> np.ndarray:
+    """
+    Compute packed voxel keys for each point
+
+    Args:
+        points: Nx3 array of 3D points
+        voxel_size: Voxel edge length in meters
+
+    Returns:
+        N int64 keys
+    """
+    return pack_voxel_keys(compute_voxel_indices(points, voxel_size))
+
+
+def voxel_grid_reduce(points: np.ndarray,
+                      voxel_size: float,
+                      weights: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Group points by voxel and compute per-voxel centroids
+
+    Passing the counts of a previous reduction as weights yields exact
+    centroids of the original points, which lets a hierarchy of coarser
+    grids be built from the previous level instead of the raw cloud.
+
+    Args:
+        points: Nx3 array of 3D points
+        voxel_size: Voxel edge length in meters
+        weights: Optional N weights (e.g. point counts per input centroid)
+
+    Returns:
+        Tuple of (centroids Mx3 float32, counts M float64, keys M int64),
+        sorted by voxel key
+    """
+    points = np.asarray(points)
+    if len(points) == 0:
+        return (np.empty((0, 3), dtype=np.float32),
+                np.empty(0, dtype=np.float64),
+                np.empty(0, dtype=np.int64))
+
+    keys = compute_voxel_keys(points, voxel_size)
+    unique_keys, inverse = np.unique(keys, return_inverse=True)
+    n_voxels = len(unique_keys)
+
+    if weights is None:
+        counts = np.bincount(inverse, minlength=n_voxels).astype(np.float64)
+        weighted = points
+    else:
+        weights = np.asarray(weights, dtype=np.float64)
+        counts = np.bincount(inverse, weights=weights, minlength=n_voxels)
+        weighted = points * weights[:, None]
+
+    centroids = np.empty((n_voxels, 3), dtype=np.float64)
+    for axis in range(3):
+        centroids[:, axis] = np.bincount(inverse, weights=weighted[:, axis], minlength=n_voxels)
+    centroids /= counts[:, None]
+
+    return centroids.astype(np.float32), counts, unique_keys
+
+
+def voxel_grid_downsample(points: np.ndarray, voxel_size: float) -> np.ndarray:
+    """
+    Voxel grid downsampling (ADR-003)
+
+    Algorithm:
+    1. Divide 3D space into voxel grid (size = voxel_size)
+    2. Assign each point to a voxel based on coordinates
+    3. Compute centroid of points in each voxel
+    4. Keep one centroid per voxel
+
+    Args:
+        points: Nx3 array of 3D points
+        voxel_size: Voxel edge length in meters
+
+    Returns:
+        Mx3 float32 array of downsampled points (M << N)
+    """
+    if len(points) == 0:
+        return points
+    centroids, _, _ = voxel_grid_reduce(points, voxel_size)
+    return centroids
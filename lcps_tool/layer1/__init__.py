@@ -1,9 +1,36 @@
 """
 Layer 1: Data Acquisition
 
-Multi-channel data receivers for OBB, PointCloud, Status, and Image data.
+Multi-channel data receivers for OBB, PointCloud, Status, and Image data,
+and the fan-out relay that republishes them to many viewers.
+
+AsyncReceiver (asyncio backend) and FanoutRelay are imported on first
+access: threaded users never load asyncio / zmq.asyncio, and
+`python -m lcps_tool.layer1.fanout_relay` does not find its module
+already imported by the package.
 """
 
+import importlib
+
 from .multi_channel_receiver import MultiChannelReceiver
 
-__all__ = ['MultiChannelReceiver']
+__all__ = ['AsyncReceiver', 'FanoutRelay', 'MultiChannelReceiver']
+
+# Name -> submodule, imported by __getattr__ (PEP 562)
+_LAZY_IMPORTS = {
+    'AsyncReceiver': '.async_receiver',
+    'FanoutRelay': '.fanout_relay',
+}
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -0,0 +1,193 @@
+"""
+Async Receiver - asyncio backend for the layer 1 receivers
+
+The threaded receivers run one thread and one queue per channel. For
+asyncio services, AsyncReceiver receives on a zmq.asyncio socket instead
+and parses with the wrapped receiver's _parse_message(), so records,
+trace stamps and statistics are the same as in threaded mode; any number
+of channels share one event loop and no threads.
+
+    async with AsyncReceiver(OBBReceiver("tcp://localhost:5555")) as obb:
+        async for data in obb:
+            ...
+
+    async for channel, data in multi_channel_receiver.stream():
+        ...
+
+Parsing runs on the event loop by default. Point cloud parsing and
+downsampling take milliseconds per message; pass parse_in_executor=True to
+run it in the loop's default executor instead.
+
+The wrapped receivers must not be started (their threads would compete
+for the same messages).
+"""
+
+import asyncio
+import time
+from collections.abc import MutableMapping
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+import zmq
+import zmq.asyncio
+
+from .receivers.base_receiver import BaseReceiver
+
+
+class AsyncReceiver:
+    """
+    asyncio receiver of one channel
+
+    Parameters:
+        receiver: Receiver providing address, parsing and statistics
+        context: zmq.asyncio context (default: own context)
+        parse_in_executor: Parse in the default executor, off the event loop
+    """
+
+    def __init__(self,
+                 receiver: BaseReceiver,
+                 context: Optional[zmq.asyncio.Context] = None,
+                 parse_in_executor: bool = False):
+        """
+        Initialize async receiver
+
+        Args:
+            receiver: Receiver (not started) providing parsing and statistics
+            context: zmq.asyncio context shared with other receivers
+            parse_in_executor: Parse in the default executor
+        """
+        self.receiver = receiver
+        self.channel_name = receiver.channel_name
+        self.parse_in_executor = parse_in_executor
+        self.context = context
+        self._own_context = context is None
+        self.socket: Optional[zmq.asyncio.Socket] = None
+        self.closed = False
+
+    def open(self) -> None:
+        """Create and connect the SUB socket (called on first receive)"""
+        if self.socket is not None:
+            return
+        if self.context is None:
+            self.context = zmq.asyncio.Context()
+        self.socket = self.context.socket(zmq.SUB)
+        self.socket.connect(self.receiver.address)
+        self.socket.setsockopt_string(zmq.SUBSCRIBE, "")
+        self.closed = False
+        print(f"  [{self.channel_name}] Async ZMQ socket connected to {self.receiver.address}")
+
+    def close(self) -> None:
+        """Close the socket (and the context if owned)"""
+        self.closed = True
+        if self.socket is not None:
+            self.socket.close(linger=0)
+            self.socket = None
+        if self._own_context and self.context is not None:
+            self.context.term()
+            self.context = None
+
+    async def recv(self) -> Any:
+        """
+        Receive the next message
+
+        Messages that fail to parse are counted as errors and skipped.
+
+        Returns:
+            Parsed data (the receiver's record type)
+        """
+        self.open()
+        while True:
+            message = await self.socket.recv()
+            data = await self.parse(message, time.perf_counter(), time.time())
+            if data is not None:
+                return data
+
+    async def parse(self, message: bytes, received: float, received_wall: float) -> Optional[Any]:
+        """
+        Parse one message and update the receiver statistics
+
+        Args:
+            message: Raw message bytes
+            received: Receive time (time.perf_counter)
+            received_wall: Receive time (time.time)
+
+        Returns:
+            Parsed data, or None on a parsing error
+        """
+        try:
+            if self.parse_in_executor:
+                loop = asyncio.get_running_loop()
+                data = await loop.run_in_executor(None, self.receiver._parse_message, message)
+            else:
+                data = self.receiver._parse_message(message)
+        except Exception as e:
+            self.receiver.error_count += 1
+            print(f"⚠️ [{self.channel_name}] Receiver error: {e}")
+            return None
+
+        self.receiver.msg_count += 1
+        self.receiver.last_receive_time = time.time()
+        if isinstance(data, MutableMapping):
+            # No queue in between: handed to the consumer right after parsing
+            parsed = time.perf_counter()
+            data['trace'] = {'receive': received, 'receive_wall': received_wall,
+                             'parse': parsed, 'dequeue': parsed}
+        return data
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Receiver statistics (is_running: socket open)"""
+        stats = self.receiver.get_statistics()
+        stats['is_running'] = self.socket is not None and not self.closed
+        return stats
+
+    def __aiter__(self) -> 'AsyncReceiver':
+        return self
+
+    async def __anext__(self) -> Any:
+        if self.closed:
+            raise StopAsyncIteration
+        try:
+            return await self.recv()
+        except zmq.error.ZMQError:
+            if self.closed:
+                raise StopAsyncIteration
+            raise
+
+    async def __aenter__(self) -> 'AsyncReceiver':
+        self.open()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return (f"<AsyncReceiver channel={self.channel_name} "
+                f"address={self.receiver.address} open={self.socket is not None}>")
+
+
+async def stream_channels(receivers: Dict[str, AsyncReceiver]) -> AsyncIterator[Tuple[str, Any]]:
+    """
+    Merge several async receivers into one (channel, data) stream
+
+    One poll covers all sockets; every ready channel yields one message per
+    round, so a busy channel cannot starve the others.
+
+    Args:
+        receivers: Channel name -> AsyncReceiver
+
+    Yields:
+        (channel name, parsed data)
+    """
+    poller = zmq.asyncio.Poller()
+    by_socket = {}
+    for name, receiver in receivers.items():
+        receiver.open()
+        poller.register(receiver.socket, zmq.POLLIN)
+        by_socket[receiver.socket] = (name, receiver)
+
+    while True:
+        for socket, _ in await poller.poll():
+            name, receiver = by_socket[socket]
+            message = await socket.recv()
+            data = await receiver.parse(message, time.perf_counter(), time.time())
+            if data is not None:
+                yield name, data
@@ -0,0 +1,451 @@
+"""
+Fan-out Relay - One LCPS subscription, many viewers
+
+Every viewer (recvOBB.py) subscribing to the production publisher costs the
+LCPS one more connection and a full-resolution point cloud per frame. The
+relay subscribes once, with the layer 1 receivers, and republishes on its
+own XPUB sockets:
+
+    stream                 content                              bind (default)
+    obb                    OBB messages, forwarded unchanged    tcp://*:6555
+    pointcloud_full        point clouds, forwarded unchanged    tcp://*:6556
+    pointcloud_decimated   voxel-downsampled point clouds       tcp://*:6557
+
+Viewer tiers are combinations of these streams:
+
+    full       obb + pointcloud_full        recvOBB.py -a relay:6555 --pc tcp://relay:6556
+    decimated  obb + pointcloud_decimated   recvOBB.py -a relay:6555 --pc tcp://relay:6557
+    obb        obb only                     recvOBB.py -a relay:6555
+
+Forwarded streams are never decoded, so their wire format (JSON or
+zlib/BSON OBBs) is whatever the LCPS sends. The decimated stream is decoded
+and downsampled once per frame and encoded once for all its viewers.
+
+XPUB (instead of PUB) makes subscriptions visible to the relay: a stream
+without subscribers is not sent, and point clouds are only decoded while
+the decimated stream has a subscriber. Sends never block; a slow viewer
+loses messages at its high-water mark without affecting the others.
+
+Each upstream channel has its own receive queue, served round-robin by
+the relay thread, so a burst of point clouds (or a relay thread slowed by
+decimation) cannot evict OBB messages; evictions are counted per channel
+('dropped_count' in the upstream statistics).
+
+Usage:
+    python -m lcps_tool.layer1.fanout_relay --obb tcp://lcps:5555 --pc tcp://lcps:5556
+"""
+
+import argparse
+import json
+import queue
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import zmq
+
+from .receivers.obb_receiver import OBBReceiver
+from .receivers.pointcloud_receiver import PointCloudReceiver
+
+# Stream name -> default bind address
+DEFAULT_BINDS = {
+    'obb': 'tcp://*:6555',
+    'pointcloud_full': 'tcp://*:6556',
+    'pointcloud_decimated': 'tcp://*:6557',
+}
+
+# Viewer tier -> streams it subscribes to
+RELAY_TIERS = {
+    'full': ('obb', 'pointcloud_full'),
+    'decimated': ('obb', 'pointcloud_decimated'),
+    'obb': ('obb',),
+}
+
+
+class _SignalingQueue(queue.Queue):
+    """Receive queue that sets a shared event whenever an item is queued"""
+
+    def __init__(self, maxsize: int, ready: threading.Event):
+        super().__init__(maxsize)
+        self.ready = ready
+
+    def _put(self, item: Any) -> None:
+        super()._put(item)
+        self.ready.set()
+
+
+@dataclass
+class RelayMessage:
+    """
+    Upstream message as received by a relay receiver
+
+    Attributes:
+        channel: Upstream channel ("obb" or "pointcloud")
+        raw: Message bytes as received
+        record: Parsed, downsampled point cloud (None unless decimating)
+    """
+
+    channel: str
+    raw: bytes
+    record: Optional[Any] = None
+
+
+class RelayOBBReceiver(OBBReceiver):
+    """OBB receiver that keeps messages raw (the relay forwards them unchanged)"""
+
+    def _receive_data(self) -> Optional[RelayMessage]:
+        """Receive one message without parsing it"""
+        if self.socket is None:
+            raise RuntimeError("ZMQ socket not initialized")
+        return RelayMessage('obb', self._recv_message())
+
+
+class RelayPointCloudReceiver(PointCloudReceiver):
+    """
+    Point cloud receiver that keeps the raw message and parses / downsamples
+    only while `decimate` is set (the decimated stream has subscribers)
+    """
+
+    decimate = False
+
+    def _receive_data(self) -> Optional[RelayMessage]:
+        """Receive one message, parsed and downsampled if decimating"""
+        if self.socket is None:
+            raise RuntimeError("ZMQ socket not initialized")
+        message = self._recv_message()
+        record = self._parse_message(message) if self.decimate else None
+        return RelayMessage('pointcloud', message, record)
+
+
+def encode_decimated(record: Any) -> bytes:
+    """
+    Point cloud message of a downsampled PointCloudRecord
+
+    Same JSON layout as the LCPS point cloud publisher (points at
+    millimetre precision), plus the original point count.
+
+    Args:
+        record: PointCloudRecord from PointCloudReceiver
+
+    Returns:
+        Message bytes
+    """
+    points = np.round(np.asarray(record['points'], dtype=np.float64), 3)
+    return json.dumps({
+        'timestamp': record.get('timestamp', 0.0),
+        'frame_id': record.get('frame_id', 0),
+        'original_count': record.get('original_count', len(points)),
+        'points': points.tolist(),
+    }).encode('utf-8')
+
+
+class FanoutRelay:
+    """
+    Subscribes once to the LCPS and republishes per-tier streams over XPUB
+
+    Parameters:
+        obb_address: Upstream OBB address (None = no OBB stream)
+        pc_address: Upstream point cloud address (None = no point cloud streams)
+        binds: Stream name -> bind address (default: DEFAULT_BINDS)
+        voxel_size: Voxel size of the decimated stream in meters
+        sndhwm: Send high-water mark per viewer (messages)
+        queue_size: Receive queue length per upstream channel (messages)
+    """
+
+    def __init__(self,
+                 obb_address: Optional[str],
+                 pc_address: Optional[str],
+                 binds: Optional[Dict[str, str]] = None,
+                 voxel_size: float = 0.2,
+                 sndhwm: int = 10,
+                 queue_size: int = 20):
+        """
+        Initialize relay
+
+        Args:
+            obb_address: Upstream OBB address
+            pc_address: Upstream point cloud address
+            binds: Stream name -> bind address
+            voxel_size: Voxel size of the decimated stream in meters
+            sndhwm: Send high-water mark per viewer
+            queue_size: Receive queue length per upstream channel
+
+        Raises:
+            ValueError: If no upstream address is given or a stream name is unknown
+        """
+        if obb_address is None and pc_address is None:
+            raise ValueError("At least one of obb_address and pc_address is required")
+        binds = dict(DEFAULT_BINDS if binds is None else binds)
+        unknown = set(binds) - set(DEFAULT_BINDS)
+        if unknown:
+            raise ValueError(f"Unknown relay streams: {sorted(unknown)}. Must be in {list(DEFAULT_BINDS)}")
+
+        # Streams with an upstream channel
+        self.binds = {stream: address for stream, address in binds.items()
+                      if (obb_address if stream == 'obb' else pc_address) is not None}
+        self.sndhwm = sndhwm
+
+        # One queue per receiver (a full point cloud queue must not evict OBB
+        # messages); the relay thread waits on their shared ready event
+        self._data_ready = threading.Event()
+        self.receivers: List[Any] = []
+        self.obb_receiver: Optional[RelayOBBReceiver] = None
+        self.pc_receiver: Optional[RelayPointCloudReceiver] = None
+        if obb_address is not None:
+            self.obb_receiver = RelayOBBReceiver(obb_address)
+            self.receivers.append(self.obb_receiver)
+        if pc_address is not None:
+            self.pc_receiver = RelayPointCloudReceiver(pc_address, voxel_size=voxel_size)
+            self.receivers.append(self.pc_receiver)
+        for receiver in self.receivers:
+            receiver.data_queue = _SignalingQueue(queue_size, self._data_ready)
+
+        # Per-stream statistics (written by the relay thread only)
+        self.subscribers: Dict[str, int] = {stream: 0 for stream in self.binds}
+        self.sent_count: Dict[str, int] = {stream: 0 for stream in self.binds}
+        self.sent_bytes: Dict[str, int] = {stream: 0 for stream in self.binds}
+        self.skipped_count: Dict[str, int] = {stream: 0 for stream in self.binds}
+        self.encode_time_s = 0.0
+
+        self.bound_addresses: Dict[str, str] = {}
+        self._ready = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, timeout: float = 5.0) -> None:
+        """
+        Bind the XPUB sockets and start the receivers
+
+        Args:
+            timeout: Maximum seconds to wait for the sockets to be bound
+
+        Raises:
+            RuntimeError: If the relay sockets could not be bound
+        """
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._relay_thread_func, daemon=True, name="Fanout-Relay")
+        self._thread.start()
+        if not self._ready.wait(timeout) or not self.bound_addresses:
+            self.stop()
+            raise RuntimeError("Fan-out relay failed to bind its sockets")
+        for receiver in self.receivers:
+            receiver.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop receivers and the relay thread"""
+        for receiver in self.receivers:
+            receiver.stop(timeout=timeout)
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _relay_thread_func(self) -> None:
+        """Relay thread: owns the XPUB sockets (sockets are not thread-safe)"""
+        context = zmq.Context()
+        sockets: Dict[str, zmq.Socket] = {}
+        try:
+            for stream, address in self.binds.items():
+                socket = context.socket(zmq.XPUB)
+                socket.setsockopt(zmq.SNDHWM, self.sndhwm)
+                # Report every (un)subscription, not only the first / last per topic
+                socket.setsockopt(zmq.XPUB_VERBOSER, 1)
+                socket.bind(address)
+                sockets[stream] = socket
+                self.bound_addresses[stream] = socket.getsockopt_string(zmq.LAST_ENDPOINT)
+        except zmq.ZMQError as e:
+            print(f"❌ [Relay] Bind failed: {e}")
+            self.bound_addresses.clear()
+        self._ready.set()
+
+        poller = zmq.Poller()
+        for socket in sockets.values():
+            poller.register(socket, zmq.POLLIN)
+        stream_of = {socket: stream for stream, socket in sockets.items()}
+
+        try:
+            while self.bound_addresses and not self._stop_event.is_set():
+                # Subscription changes (non-blocking)
+                for socket, _ in poller.poll(0):
+                    self._handle_subscription(stream_of[socket], socket.recv())
+
+                if not self._forward_queued(sockets):
+                    # Re-check after clearing: an item queued in between set the event
+                    self._data_ready.clear()
+                    if not self._forward_queued(sockets):
+                        self._data_ready.wait(0.05)
+        finally:
+            for socket in sockets.values():
+                socket.close(linger=0)
+            context.term()
+
+    def _forward_queued(self, sockets: Dict[str, zmq.Socket]) -> bool:
+        """Forward at most one queued message per receiver; False if none was queued"""
+        forwarded = False
+        for receiver in self.receivers:
+            try:
+                message = receiver.data_queue.get_nowait()
+            except queue.Empty:
+                continue
+            self._forward(message, sockets)
+            forwarded = True
+        return forwarded
+
+    def _handle_subscription(self, stream: str, event: bytes) -> None:
+        """Track the subscriber count of a stream (XPUB event: 1/0 + topic)"""
+        if not event:
+            return
+        if event[0] == 1:
+            self.subscribers[stream] += 1
+        elif event[0] == 0:
+            self.subscribers[stream] = max(0, self.subscribers[stream] - 1)
+        if self.pc_receiver is not None:
+            self.pc_receiver.decimate = self.subscribers.get('pointcloud_decimated', 0) > 0
+
+    def _forward(self, message: RelayMessage, sockets: Dict[str, zmq.Socket]) -> None:
+        """Send one upstream message to the streams built from it"""
+        if message.channel == 'obb':
+            self._send('obb', message.raw, sockets)
+            return
+
+        self._send('pointcloud_full', message.raw, sockets)
+        if 'pointcloud_decimated' not in sockets:
+            return
+        if message.record is None or self.subscribers['pointcloud_decimated'] == 0:
+            self.skipped_count['pointcloud_decimated'] += 1
+            return
+        start = time.perf_counter()
+        payload = encode_decimated(message.record)
+        self.encode_time_s += time.perf_counter() - start
+        self._send('pointcloud_decimated', payload, sockets)
+
+    def _send(self, stream: str, payload: bytes, sockets: Dict[str, zmq.Socket]) -> None:
+        socket = sockets.get(stream)
+        if socket is None:
+            return
+        if self.subscribers[stream] == 0:
+            self.skipped_count[stream] += 1
+            return
+        try:
+            socket.send(payload, zmq.DONTWAIT)
+        except zmq.Again:
+            self.skipped_count[stream] += 1
+            return
+        self.sent_count[stream] += 1
+        self.sent_bytes[stream] += len(payload)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Relay statistics
+
+        Returns:
+            Dict with 'upstream' (receiver statistics per channel) and
+            'streams' (subscribers, sent messages / bytes, skipped messages
+            and bound address per stream)
+        """
+        upstream = {}
+        for receiver in self.receivers:
+            stats = receiver.get_statistics()
+            if receiver is self.pc_receiver:
+                stats['downsampling'] = receiver.get_downsampling_statistics()
+            upstream[receiver.channel_name] = stats
+        streams = {
+            stream: {
+                'address': self.bound_addresses.get(stream, self.binds[stream]),
+                'subscribers': self.subscribers[stream],
+                'sent': self.sent_count[stream],
+                'sent_mb': self.sent_bytes[stream] / (1024 * 1024),
+                'skipped': self.skipped_count[stream],
+            }
+            for stream in self.binds
+        }
+        return {'upstream': upstream, 'streams': streams, 'encode_time_s': self.encode_time_s}
+
+    def print_statistics(self) -> None:
+        """Print per-stream statistics"""
+        stats = self.get_statistics()
+        for channel, channel_stats in stats['upstream'].items():
+            print(f"  upstream {channel:<12} | Messages: {channel_stats['msg_count']:6} | "
+                  f"Errors: {channel_stats['error_count']:3} | "
+                  f"Dropped: {channel_stats['dropped_count']:5}")
+        for stream, stream_stats in stats['streams'].items():
+            print(f"  {stream:<21} | Viewers: {stream_stats['subscribers']:3} | "
+                  f"Sent: {stream_stats['sent']:6} ({stream_stats['sent_mb']:8.2f} MB) | "
+                  f"Skipped: {stream_stats['skipped']:6}")
+
+
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description='LCPS fan-out relay: one LCPS subscription, per-tier streams for many viewers',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Viewer tiers:
+  full       python recvOBB.py -a relay:6555 -m n --pc tcp://relay:6556 -v
+  decimated  python recvOBB.py -a relay:6555 -m n --pc tcp://relay:6557 -v
+  obb        python recvOBB.py -a relay:6555 -m n
+        """
+    )
+    parser.add_argument('--obb', type=str, default='tcp://localhost:5555',
+                        help='Upstream OBB address (default: tcp://localhost:5555)')
+    parser.add_argument('--pc', type=str, default='tcp://localhost:5556',
+                        help='Upstream point cloud address (default: tcp://localhost:5556)')
+    parser.add_argument('--no-pc', action='store_true', help='Relay OBBs only')
+    parser.add_argument('--obb-bind', type=str, default=DEFAULT_BINDS['obb'],
+                        help=f"OBB stream bind address (default: {DEFAULT_BINDS['obb']})")
+    parser.add_argument('--pc-full-bind', type=str, default=DEFAULT_BINDS['pointcloud_full'],
+                        help=f"Full point cloud bind address (default: {DEFAULT_BINDS['pointcloud_full']})")
+    parser.add_argument('--pc-decimated-bind', type=str, default=DEFAULT_BINDS['pointcloud_decimated'],
+                        help='Decimated point cloud bind address '
+                             f"(default: {DEFAULT_BINDS['pointcloud_decimated']})")
+    parser.add_argument('--voxel-size', type=float, default=0.2,
+                        help='Voxel size of the decimated stream in meters (default: 0.2)')
+    parser.add_argument('--sndhwm', type=int, default=10,
+                        help='Messages queued per viewer before dropping (default: 10)')
+    parser.add_argument('--duration', type=float, default=None,
+                        help='Stop after N seconds (default: run until Ctrl+C)')
+    parser.add_argument('--report-interval', type=float, default=5.0,
+                        help='Print statistics every N seconds, 0 = only at the end (default: 5)')
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_arguments(argv)
+    relay = FanoutRelay(
+        obb_address=args.obb,
+        pc_address=None if args.no_pc else args.pc,
+        binds={'obb': args.obb_bind,
+               'pointcloud_full': args.pc_full_bind,
+               'pointcloud_decimated': args.pc_decimated_bind},
+        voxel_size=args.voxel_size,
+        sndhwm=args.sndhwm,
+    )
+
+    print("🔀 LCPS fan-out relay")
+    relay.start()
+    for stream, address in relay.bound_addresses.items():
+        print(f"   {stream:<21} {address}")
+
+    start = last_report = time.time()
+    try:
+        while args.duration is None or time.time() - start < args.duration:
+            time.sleep(0.1)
+            if args.report_interval > 0 and time.time() - last_report >= args.report_interval:
+                last_report = time.time()
+                print(f"\n⏱️  {last_report - start:.0f}s")
+                relay.print_statistics()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        relay.stop()
+
+    print("\n📊 Final statistics")
+    relay.print_statistics()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,13 +5,14 @@ Manages multiple data channels (OBB, PointCloud, Status, Image) and provides
 a unified interface for data acquisition.
 
 Architecture:
-- Each channel runs in its own thread (BaseReceiver pattern)
+- Each channel runs in its own thread (BaseReceiver pattern), or all
+  channels share one asyncio event loop (stream())
 - Non-blocking data retrieval from all channels
 - Graceful startup and shutdown
 - Comprehensive statistics and monitoring
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from .receivers.base_receiver import BaseReceiver
 from .receivers.obb_receiver import OBBReceiver
@@ -45,6 +46,10 @@ class MultiChannelReceiver:
 
         # Stop all channels
         receiver.stop_all()
+
+        # Or, in asyncio code (channels not started)
+        async for channel, data in receiver.stream():
+            ...
     """
 
     def __init__(self):
@@ -269,6 +274,37 @@ class MultiChannelReceiver:
             data[channel_name] = channel_data
         return data
 
+    async def stream(self, parse_in_executor: bool = False) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Receive all channels in the running event loop (asyncio backend)
+
+        Uses zmq.asyncio sockets instead of the receiver threads (do not
+        call start_all()); parsing and statistics are the receivers' own, so
+        the data and get_statistics() match threaded mode. The sockets are
+        closed when the iteration ends.
+
+        Args:
+            parse_in_executor: Parse in the loop's default executor (keeps
+                point cloud downsampling off the event loop)
+
+        Yields:
+            (channel name, parsed data), e.g. ('obb', OBBRecord)
+        """
+        import zmq.asyncio
+
+        from .async_receiver import AsyncReceiver, stream_channels
+
+        context = zmq.asyncio.Context()
+        receivers = {name: AsyncReceiver(receiver, context, parse_in_executor)
+                     for name, receiver in self.channels.items()}
+        try:
+            async for item in stream_channels(receivers):
+                yield item
+        finally:
+            for receiver in receivers.values():
+                receiver.close()
+            context.term()
+
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get statistics from all channels
@@ -5,13 +5,20 @@ Architecture based on recvOBB.py multi-threading pattern:
 - Threading + Queue architecture
 - Non-blocking operations
 - Graceful shutdown with Event signals
+
+Receivers produce slotted channel records (data_models.channel_records),
+mappings with the dict keys of the message. Every one carries
+data['trace'] with pipeline stamps
+(time.perf_counter): 'receive' (+ 'receive_wall', time.time()), 'parse'
+and 'dequeue' (see layer2.latency_tracker).
 """
 
 import queue
 import threading
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from collections.abc import MutableMapping
+from typing import Any, Dict, Optional, Tuple
 
 import zmq
 
@@ -54,7 +61,10 @@ class BaseReceiver(ABC):
         # Statistics
         self.msg_count = 0
         self.error_count = 0
+        self.dropped_count = 0  # Oldest entries evicted from a full queue
         self.last_receive_time: Optional[float] = None
+        # (perf_counter, time.time()) of the last socket.recv, see _recv_message
+        self._receive_stamp: Optional[Tuple[float, float]] = None
 
     def start(self) -> None:
         """Start the receiver thread"""
@@ -111,20 +121,31 @@ class BaseReceiver(ABC):
         """
         try:
             if block:
-                return self.data_queue.get(timeout=timeout)
+                data = self.data_queue.get(timeout=timeout)
             else:
-                return self.data_queue.get_nowait()
+                data = self.data_queue.get_nowait()
         except queue.Empty:
             return None
 
+        if isinstance(data, MutableMapping) and 'trace' in data:
+            data['trace']['dequeue'] = time.perf_counter()
+        return data
+
     def get_statistics(self) -> Dict[str, Any]:
-        """Get receiver statistics"""
+        """
+        Get receiver statistics
+
+        Lock-free: reads plain counters and the queue length without taking
+        the queue mutex, so polling (e.g. a metrics scrape) never contends
+        with the receiver thread.
+        """
         return {
             'channel': self.channel_name,
             'address': self.address,
             'msg_count': self.msg_count,
             'error_count': self.error_count,
-            'queue_size': self.data_queue.qsize(),
+            'dropped_count': self.dropped_count,
+            'queue_size': len(self.data_queue.queue),
             'is_running': self.receiver_thread is not None and self.receiver_thread.is_alive(),
             'last_receive_time': self.last_receive_time,
         }
@@ -152,6 +173,12 @@ class BaseReceiver(ABC):
                     self.msg_count += 1
                     self.last_receive_time = time.time()
 
+                    # Latency trace: receive and parse-done stamps
+                    if isinstance(data, MutableMapping) and self._receive_stamp is not None:
+                        received, received_wall = self._receive_stamp
+                        data['trace'] = {'receive': received, 'receive_wall': received_wall,
+                                         'parse': time.perf_counter()}
+
                     # Try to put data into queue (non-blocking)
                     try:
                         self.data_queue.put_nowait(data)
@@ -159,6 +186,7 @@ class BaseReceiver(ABC):
                         # Queue full: drop oldest data, keep newest
                         try:
                             self.data_queue.get_nowait()  # Drop oldest
+                            self.dropped_count += 1
                             self.data_queue.put_nowait(data)  # Keep newest
                         except queue.Empty:
                             pass  # Queue already cleared by main thread
@@ -192,6 +220,39 @@ class BaseReceiver(ABC):
             self.context.term()
             self.context = None
 
+    def _recv_message(self) -> bytes:
+        """
+        Receive one raw message and stamp its receive time
+
+        Returns:
+            Raw message bytes
+
+        Raises:
+            zmq.error.Again: Timeout (no data available)
+        """
+        message = self.socket.recv()
+        self._receive_stamp = (time.perf_counter(), time.time())
+        return message
+
+    @abstractmethod
+    def _parse_message(self, message: bytes) -> Any:
+        """
+        Parse one raw message (implemented by subclasses)
+
+        Shared by the receiver thread (_receive_data) and the asyncio
+        backend (layer1.async_receiver), so both produce the same records.
+
+        Args:
+            message: Raw message bytes
+
+        Returns:
+            Parsed data
+
+        Raises:
+            RuntimeError: Parsing error
+        """
+        pass
+
     @abstractmethod
     def _receive_data(self) -> Optional[Any]:
         """
@@ -3,16 +3,19 @@ OBB Receiver - Receives Oriented Bounding Box data
 
 Supports two modes:
 - Normal mode: JSON format
-- Compressed mode: zlib + BSON format
+- Compressed mode: zlib + BSON format, or sender.cpp's size-prefixed
+  zlib + JSON (4-byte big-endian original size, then the zlib stream)
 """
 
 import json
+import struct
 import zlib
 from typing import Any, Dict, Optional
 
 import bson
 import zmq
 
+from ...data_models.channel_records import OBBRecord
 from .base_receiver import BaseReceiver
 
 
@@ -21,7 +24,8 @@ class OBBReceiver(BaseReceiver):
     OBB (Oriented Bounding Box) data receiver
 
     Receives OBB data from LCPS system via ZMQ PUB/SUB.
-    Supports both normal (JSON) and compressed (zlib + BSON) modes.
+    Supports both normal (JSON) and compressed (zlib + BSON, or
+    size-prefixed zlib + JSON) modes.
 
     Data format:
     {
@@ -65,13 +69,24 @@ class OBBReceiver(BaseReceiver):
             raise RuntimeError("ZMQ socket not initialized")
 
         # Receive raw data
-        message = self.socket.recv()
+        return self._parse_message(self._recv_message())
 
-        # Parse based on mode
+    def _parse_message(self, message: bytes) -> Dict[str, Any]:
+        """
+        Parse an OBB message according to the receiver mode
+
+        Args:
+            message: Raw message bytes
+
+        Returns:
+            Parsed OBB data (OBBRecord)
+
+        Raises:
+            RuntimeError: Mode mismatch or parsing error
+        """
         if self.use_compression:
             return self._parse_compressed(message)
-        else:
-            return self._parse_normal(message)
+        return self._parse_normal(message)
 
     def _parse_normal(self, message: bytes) -> Dict[str, Any]:
         """
@@ -101,6 +116,19 @@ class OBBReceiver(BaseReceiver):
         except json.JSONDecodeError as e:
             raise RuntimeError(f"Failed to parse JSON: {e}")
 
+        return self._normalize(raw_data)
+
+    def _normalize(self, raw_data: Any) -> Dict[str, Any]:
+        """
+        Convert a decoded message to the output format
+
+        Args:
+            raw_data: Decoded JSON/BSON message
+
+        Returns:
+            OBBRecord (with 'timestamp' and 'obbs' fields for LCPS protocol
+            messages; the raw dict for unknown formats)
+        """
         # Handle LCPS Protocol format (header + payload)
         if 'header' in raw_data and 'payload' in raw_data:
             timestamp = raw_data['header']['timestamp']
@@ -112,28 +140,32 @@ class OBBReceiver(BaseReceiver):
             else:
                 obbs = []
 
-            return {
-                'timestamp': timestamp,
-                'obbs': obbs,
-                'seq_id': raw_data['header'].get('seq_id', -1),
-                'source': raw_data['header'].get('source', 'unknown'),
-            }
+            record = OBBRecord()
+            record.timestamp = timestamp
+            record.obbs = obbs
+            record.seq_id = raw_data['header'].get('seq_id', -1)
+            record.source = raw_data['header'].get('source', 'unknown')
+            return record
 
         # Handle legacy format (direct array or data field)
         # This is for backward compatibility with old sender.cpp
         if isinstance(raw_data, list):
             # Direct array format
-            return {'obbs': raw_data}
+            return OBBRecord(obbs=raw_data)
         elif 'data' in raw_data:
             # Wrapped array format
-            return {'obbs': raw_data['data']}
+            return OBBRecord(obbs=raw_data['data'])
         else:
             # Unknown format
             return raw_data
 
     def _parse_compressed(self, message: bytes) -> Dict[str, Any]:
         """
-        Parse compressed mode data (zlib + BSON)
+        Parse compressed mode data (zlib + BSON, or size-prefixed zlib + JSON)
+
+        A zlib stream starts with 0x78; sender.cpp prefixes it with the
+        original size (big-endian uint32), whose first byte is 0x00 for any
+        realistic message size.
 
         Args:
             message: Raw compressed message bytes
@@ -144,12 +176,15 @@ class OBBReceiver(BaseReceiver):
         Raises:
             RuntimeError: Decompression or parsing error
         """
+        if message[:1] != b'\x78' and message[4:5] == b'\x78':
+            return self._parse_size_prefixed(message)
+
         try:
             # Decompress
             decompressed_data = zlib.decompress(message)
 
-            # Parse BSON
-            data = bson.loads(decompressed_data)
+            # Parse BSON (pymongo's bson package)
+            data = bson.decode(decompressed_data)
         except zlib.error as e:
             raise RuntimeError(
                 f"Failed to decompress data: {e}. "
@@ -159,7 +194,36 @@ class OBBReceiver(BaseReceiver):
         except bson.errors.BSONError as e:
             raise RuntimeError(f"Failed to parse BSON: {e}")
 
-        return data
+        return self._normalize(data)
+
+    def _parse_size_prefixed(self, message: bytes) -> Dict[str, Any]:
+        """
+        Parse sender.cpp compressed mode data (size prefix + zlib + JSON)
+
+        Args:
+            message: Raw message bytes
+
+        Returns:
+            Parsed data dictionary
+
+        Raises:
+            RuntimeError: Decompression, size mismatch or parsing error
+        """
+        original_size, = struct.unpack('>I', message[:4])
+        try:
+            decompressed_data = zlib.decompress(message[4:])
+        except zlib.error as e:
+            raise RuntimeError(f"Failed to decompress data: {e}")
+
+        if len(decompressed_data) != original_size:
+            raise RuntimeError(f"Decompressed size mismatch: {len(decompressed_data)} bytes, "
+                               f"prefix says {original_size}")
+        try:
+            data = json.loads(decompressed_data)
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise RuntimeError(f"Failed to parse JSON: {e}")
+
+        return self._normalize(data)
 
     def get_latest_obbs(self) -> Optional[list]:
         """
@@ -14,6 +14,8 @@ from typing import Any, Dict, Optional, Tuple
 import numpy as np
 import zmq
 
+from ...geometry.voxel import voxel_grid_reduce
+from ...data_models.channel_records import PointCloudRecord
 from .base_receiver import BaseReceiver
 
 
@@ -31,15 +33,20 @@ class PointCloudReceiver(BaseReceiver):
         "frame_id": int                                # Frame ID
     }
 
-    Data format (output, after downsampling):
+    Data format (output, a PointCloudRecord mapping, after downsampling):
     {
         "points": np.ndarray,      # Mx3 array (M << N)
         "timestamp": float,
         "frame_id": int,
         "original_count": int,     # Original point count (N)
         "downsampled_count": int,  # Downsampled point count (M)
-        "reduction_rate": float    # (N - M) / N
+        "reduction_rate": float,   # (N - M) / N
+        "voxel_keys": np.ndarray,  # M sorted packed voxel keys (downsampling only)
+        "voxel_size": float        # Voxel size of the keys (downsampling only)
     }
+
+    The voxel keys let a PointCloudIndex of the same voxel size be rebuilt
+    per frame without re-hashing or sorting the points.
     """
 
     def __init__(self,
@@ -79,8 +86,21 @@ class PointCloudReceiver(BaseReceiver):
             raise RuntimeError("ZMQ socket not initialized")
 
         # Receive raw data
-        message = self.socket.recv()
+        return self._parse_message(self._recv_message())
+
+    def _parse_message(self, message: bytes) -> Dict[str, Any]:
+        """
+        Parse a point cloud message and apply downsampling
+
+        Args:
+            message: Raw JSON message bytes
 
+        Returns:
+            Parsed point cloud data (PointCloudRecord)
+
+        Raises:
+            RuntimeError: Parsing error
+        """
         # Parse JSON
         try:
             data = json.loads(message.decode('utf-8'))
@@ -102,29 +122,31 @@ class PointCloudReceiver(BaseReceiver):
 
         # Apply downsampling if enabled
         if self.enable_downsampling and original_count > 0:
-            points_downsampled = self._voxel_grid_downsample(points)
+            points_downsampled, voxel_keys = self._voxel_grid_downsample(points)
             downsampled_count = len(points_downsampled)
             self.total_points_after_downsampling += downsampled_count
 
             reduction_rate = (original_count - downsampled_count) / original_count
         else:
-            points_downsampled = points
+            points_downsampled, voxel_keys = points, None
             downsampled_count = original_count
             reduction_rate = 0.0
 
         # Construct output data
-        result = {
-            'points': points_downsampled,
-            'timestamp': data.get('timestamp', 0.0),
-            'frame_id': data.get('frame_id', 0),
-            'original_count': original_count,
-            'downsampled_count': downsampled_count,
-            'reduction_rate': reduction_rate,
-        }
+        result = PointCloudRecord()
+        result.points = points_downsampled
+        result.timestamp = data.get('timestamp', 0.0)
+        result.frame_id = data.get('frame_id', 0)
+        result.original_count = original_count
+        result.downsampled_count = downsampled_count
+        result.reduction_rate = reduction_rate
+        if voxel_keys is not None:
+            result.voxel_keys = voxel_keys
+            result.voxel_size = self.voxel_size
 
         return result
 
-    def _voxel_grid_downsample(self, points: np.ndarray) -> np.ndarray:
+    def _voxel_grid_downsample(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """
         Voxel grid downsampling (ADR-003)
 
@@ -134,34 +156,17 @@ class PointCloudReceiver(BaseReceiver):
         3. Compute centroid of points in each voxel
         4. Keep one centroid per voxel
 
+        Vectorized implementation shared with the viewer LOD hierarchy,
+        see lcps_tool.geometry.voxel.
+
         Args:
             points: Nx3 array of 3D points
 
         Returns:
-            Mx3 array of downsampled points (M << N)
+            (Mx3 array of downsampled points (M << N), M sorted voxel keys)
         """
-        if len(points) == 0:
-            return points
-
-        # Compute voxel indices for each point
-        voxel_indices = np.floor(points / self.voxel_size).astype(np.int32)
-
-        # Use dictionary to group points by voxel
-        voxel_map: Dict[Tuple[int, int, int], list] = {}
-
-        for i, voxel_idx in enumerate(voxel_indices):
-            voxel_key = tuple(voxel_idx)
-            if voxel_key not in voxel_map:
-                voxel_map[voxel_key] = []
-            voxel_map[voxel_key].append(points[i])
-
-        # Compute centroid for each voxel
-        downsampled_points = []
-        for voxel_points in voxel_map.values():
-            centroid = np.mean(voxel_points, axis=0)
-            downsampled_points.append(centroid)
-
-        return np.array(downsampled_points, dtype=np.float32)
+        centroids, _, keys = voxel_grid_reduce(points, self.voxel_size)
+        return centroids, keys
 
     def get_downsampling_statistics(self) -> Dict[str, Any]:
         """Get downsampling statistics"""
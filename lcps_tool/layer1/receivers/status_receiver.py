@@ -13,6 +13,7 @@ from typing import Any, Dict, Optional
 
 import zmq
 
+from ...data_models.channel_records import StatusRecord
 from .base_receiver import BaseReceiver
 
 
@@ -49,7 +50,7 @@ class StatusReceiver(BaseReceiver):
         }
     }
 
-    Data format (output, with parsed state):
+    Data format (output, a StatusRecord mapping with parsed state):
     {
         "state": LCPSState,        # Parsed state enum
         "state_raw": str,          # Raw state string
@@ -78,7 +79,7 @@ class StatusReceiver(BaseReceiver):
         Receive and parse status data
 
         Returns:
-            Parsed status data dictionary
+            Parsed status data (StatusRecord)
 
         Raises:
             zmq.error.Again: Timeout (no data available)
@@ -88,8 +89,21 @@ class StatusReceiver(BaseReceiver):
             raise RuntimeError("ZMQ socket not initialized")
 
         # Receive raw data
-        message = self.socket.recv()
+        return self._parse_message(self._recv_message())
 
+    def _parse_message(self, message: bytes) -> Dict[str, Any]:
+        """
+        Parse a status message and update the state statistics
+
+        Args:
+            message: Raw JSON message bytes
+
+        Returns:
+            Parsed status data (StatusRecord)
+
+        Raises:
+            RuntimeError: Parsing error or missing 'state' field
+        """
         # Parse JSON
         try:
             data = json.loads(message.decode('utf-8'))
@@ -111,14 +125,13 @@ class StatusReceiver(BaseReceiver):
         self.state_counts[state] = self.state_counts.get(state, 0) + 1
 
         # Construct output data
-        result = {
-            'state': state,
-            'state_raw': state_raw,
-            'timestamp': data.get('timestamp', 0.0),
-            'frame_id': data.get('frame_id', 0),
-            'metrics': data.get('metrics', {}),
-            'detection': data.get('detection', {}),
-        }
+        result = StatusRecord()
+        result.state = state
+        result.state_raw = state_raw
+        result.timestamp = data.get('timestamp', 0.0)
+        result.frame_id = data.get('frame_id', 0)
+        result.metrics = data.get('metrics', {})
+        result.detection = data.get('detection', {})
 
         return result
 
@@ -1,10 +1,40 @@
 """
 Layer 2: Data Processing
 
-Data synchronization and HDF5 recording.
+Data synchronization, OBB tracking, HDF5 recording and replay.
+
+DataRecorder and DataReplayer are imported on first access, so receive-only
+users (e.g. lcps_tool.main --no-record) never load h5py.
 """
 
+import importlib
+
+from .async_synchronizer import AsyncSynchronizer
+from .channel_synchronizer import ChannelSpec, ChannelSynchronizer
+from .clock_offset import ClockOffsetEstimator
 from .data_synchronizer import DataSynchronizer
-from .data_recorder import DataRecorder
+from .latency_tracker import LatencyHistogram, LatencyTracker
+from .obb_tracker import OBBTracker
+from .offline_synchronizer import OfflineSynchronizer, SyncIndexTable
+
+__all__ = ['AsyncSynchronizer', 'ChannelSpec', 'ChannelSynchronizer', 'ClockOffsetEstimator', 'DataSynchronizer', 'DataRecorder', 'DataReplayer', 'OBBTracker',
+           'LatencyHistogram', 'LatencyTracker', 'OfflineSynchronizer', 'SyncIndexTable']
+
+# HDF5-backed classes: name -> submodule, imported by __getattr__ (PEP 562)
+_LAZY_IMPORTS = {
+    'DataRecorder': '.data_recorder',
+    'DataReplayer': '.data_replayer',
+}
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = ['DataSynchronizer', 'DataRecorder']
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
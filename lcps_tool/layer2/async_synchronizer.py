@@ -0,0 +1,76 @@
+"""
+Async Synchronizer - DataSynchronizer driven by an asyncio channel stream
+
+Consumes the (channel, data) stream of MultiChannelReceiver.stream() (or
+any async iterable of such pairs) and yields SyncedFrames, so receiving
+and synchronizing all channels runs in one event loop without threads:
+
+    synchronizer = AsyncSynchronizer(DataSynchronizer(), trigger='pointcloud')
+    async for frame in synchronizer.frames(receiver.stream()):
+        ...
+
+Matching is DataSynchronizer's: buffering, sync window, OBB interpolation,
+clock offset correction and frame pooling behave as in the threaded loop.
+"""
+
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Optional, Tuple
+
+from ..data_models.synced_frame import SyncedFrame
+from .data_synchronizer import DataSynchronizer
+
+
+class AsyncSynchronizer:
+    """
+    Async front end of a DataSynchronizer
+
+    A frame is synchronized (at the latest buffered timestamp) whenever a
+    message of the trigger channel arrives, or after every message without
+    a trigger. Triggering on the slowest channel (usually the point cloud)
+    yields one frame per sensor frame instead of one per message.
+
+    Parameters:
+        synchronizer: Synchronizer doing the matching
+        trigger: Channel whose messages trigger synchronization
+            (None = every message)
+    """
+
+    def __init__(self, synchronizer: DataSynchronizer, trigger: Optional[str] = None):
+        """
+        Initialize async synchronizer
+
+        Args:
+            synchronizer: Synchronizer doing the matching
+            trigger: Channel whose messages trigger synchronization
+
+        Raises:
+            ValueError: If trigger is not a synchronizer channel
+        """
+        if trigger is not None and trigger not in synchronizer.buffers:
+            raise ValueError(f"Unknown trigger channel: {trigger}. Must be one of {list(synchronizer.buffers)}")
+        self.synchronizer = synchronizer
+        self.trigger = trigger
+
+    async def frames(self, stream: AsyncIterable[Tuple[str, Any]]) -> AsyncIterator[SyncedFrame]:
+        """
+        Synchronize a channel stream
+
+        Args:
+            stream: Async iterable of (channel name, data)
+
+        Yields:
+            SyncedFrames meeting the synchronizer's minimum quality
+        """
+        async for channel, data in stream:
+            self.synchronizer.add_data(channel, data)
+            if self.trigger is not None and channel != self.trigger:
+                continue
+            frame = self.synchronizer.synchronize()
+            if frame is not None:
+                yield frame
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Statistics of the underlying synchronizer"""
+        return self.synchronizer.get_statistics()
+
+    def __repr__(self) -> str:
+        return f"<AsyncSynchronizer trigger={self.trigger} synchronizer={self.synchronizer!r}>"
@@ -0,0 +1,305 @@
+"""
+Channel Synchronizer - Timestamp synchronization over any set of named channels
+
+Generic counterpart of DataSynchronizer: channels are registered at
+runtime (ChannelSpec) with their own sync window and a required/optional
+flag, and frames are ChannelFrames holding a channel -> data mapping.
+
+Buffers are one timestamp matrix (channels x capacity, NaN = empty slot)
+plus per-channel ring buffers of data dicts, so the nearest sample of
+every channel is found in a single vectorized argmin over the matrix
+(and over targets x channels x capacity for synchronize_batch).
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from ..data_models.channel_frame import ChannelFrame
+from .clock_offset import ClockOffsetEstimator
+
+
+@dataclass
+class ChannelSpec:
+    """
+    Channel registration for ChannelSynchronizer
+
+    Attributes:
+        name: Channel name (e.g. "obb", "lidar_front", "camera_left")
+        window_ms: Synchronization window of this channel in milliseconds
+        required: Frames without a match for this channel are rejected
+        buffer_size: Samples kept for this channel
+    """
+
+    name: str
+    window_ms: float = 50.0
+    required: bool = True
+    buffer_size: int = 100
+
+
+class ChannelSynchronizer:
+    """
+    Synchronizes an arbitrary set of named channels by timestamp
+
+    Usage:
+        sync = ChannelSynchronizer([
+            ChannelSpec('pointcloud', window_ms=50),
+            ChannelSpec('obb', window_ms=50),
+            ChannelSpec('camera', window_ms=20, required=False),
+        ], reference='pointcloud')
+        sync.add_data('camera', {'timestamp': t, 'image': ...})
+        frame = sync.synchronize()          # ChannelFrame or None
+        frame.get('camera')
+
+    Sync quality is 1 - max(|offset| / window) over the matched channels.
+
+    Parameters:
+        channels: Initial channel specs (more can be added with add_channel)
+        reference: Channel whose latest timestamp is the default target
+            (None = latest timestamp of any channel)
+        min_quality: Minimum sync quality to accept a frame
+        clock_reference: Channel for online clock offset correction (None = off)
+    """
+
+    def __init__(self,
+                 channels: Iterable[ChannelSpec] = (),
+                 reference: Optional[str] = None,
+                 min_quality: float = 0.0,
+                 clock_reference: Optional[str] = None):
+        """
+        Initialize channel synchronizer
+
+        Args:
+            channels: Initial channel specs
+            reference: Default target channel (None = latest of all channels)
+            min_quality: Minimum sync quality (0.0-1.0)
+            clock_reference: Channel whose clock the others are mapped onto
+                (None = assume a shared clock)
+        """
+        self.reference = reference
+        self.min_quality = min_quality
+        self.clock_estimator: Optional[ClockOffsetEstimator] = (
+            ClockOffsetEstimator(reference=clock_reference) if clock_reference else None)
+
+        self.specs: Dict[str, ChannelSpec] = {}
+        self._names: List[str] = []
+        self._timestamps = np.empty((0, 0))
+        self._data: List[List[Optional[Dict[str, Any]]]] = []
+        self._written: List[int] = []
+        self._windows_s = np.empty(0)
+        self._required = np.empty(0, dtype=bool)
+
+        # Statistics
+        self.frame_count = 0
+        self.sync_success_count = 0
+        self.sync_fail_count = 0
+        self.total_sync_offset = 0.0
+        self.match_counts: Dict[str, int] = {}
+
+        for spec in channels:
+            self.add_channel(spec)
+
+    def add_channel(self, spec: ChannelSpec) -> None:
+        """
+        Register a channel
+
+        Args:
+            spec: Channel spec
+
+        Raises:
+            ValueError: If a channel with this name already exists
+        """
+        if spec.name in self.specs:
+            raise ValueError(f"Channel already registered: {spec.name}")
+
+        capacity = max(self._timestamps.shape[1], spec.buffer_size)
+        timestamps = np.full((len(self._names) + 1, capacity), np.nan)
+        timestamps[:len(self._names), :self._timestamps.shape[1]] = self._timestamps
+        self._timestamps = timestamps
+
+        self.specs[spec.name] = spec
+        self._names.append(spec.name)
+        # Ring buffer of data dicts, slot i <-> timestamp column i
+        self._data.append([None] * spec.buffer_size)
+        self._written.append(0)
+        self._windows_s = np.append(self._windows_s, spec.window_ms / 1000.0)
+        self._required = np.append(self._required, spec.required)
+        self.match_counts[spec.name] = 0
+
+    @property
+    def channel_names(self) -> List[str]:
+        """Registered channel names"""
+        return list(self._names)
+
+    def add_data(self, channel: str, data: Dict[str, Any]) -> None:
+        """
+        Add data to channel buffer
+
+        Args:
+            channel: Registered channel name
+            data: Data dictionary with 'timestamp' field
+
+        Raises:
+            ValueError: If channel is unknown or data missing timestamp
+        """
+        if channel not in self.specs:
+            raise ValueError(f"Invalid channel: {channel}. Must be one of {self._names}")
+
+        if 'timestamp' not in data:
+            raise ValueError(f"Data missing 'timestamp' field for channel {channel}")
+
+        if self.clock_estimator is not None:
+            raw_timestamp = data['timestamp']
+            self.clock_estimator.observe(channel, raw_timestamp)
+            corrected = self.clock_estimator.correct(channel, raw_timestamp)
+            if corrected != raw_timestamp:
+                data = data.copy()
+                data['raw_timestamp'] = raw_timestamp
+                data['timestamp'] = corrected
+
+        row = self._names.index(channel)
+        slot = self._written[row] % self.specs[channel].buffer_size
+        self._written[row] += 1
+        self._data[row][slot] = data
+        self._timestamps[row, slot] = data['timestamp']
+
+    def _latest_timestamp(self) -> Optional[float]:
+        """Latest timestamp of the reference channel (or of any channel)"""
+        if self.reference is not None and self.reference in self.specs:
+            timestamps = self._timestamps[self._names.index(self.reference)]
+        else:
+            timestamps = self._timestamps
+        if timestamps.size == 0 or np.all(np.isnan(timestamps)):
+            return None
+        return float(np.nanmax(timestamps))
+
+    def _match(self, targets: np.ndarray):
+        """
+        Nearest sample of every channel for every target (one vectorized pass)
+
+        Returns:
+            (slots TxC, offsets TxC in seconds, matched TxC bool, quality T,
+            accepted T bool)
+        """
+        offsets = self._timestamps[None, :, :] - targets[:, None, None]
+        distance = np.where(np.isnan(offsets), np.inf, np.abs(offsets))
+        slots = np.argmin(distance, axis=2)
+        best_offset = np.take_along_axis(offsets, slots[:, :, None], axis=2)[:, :, 0]
+        best_distance = np.take_along_axis(distance, slots[:, :, None], axis=2)[:, :, 0]
+
+        matched = best_distance <= self._windows_s[None, :]
+        normalized = np.where(matched, best_distance / self._windows_s[None, :], 0.0)
+        quality = np.where(matched.any(axis=1), 1.0 - normalized.max(axis=1), 0.0)
+        quality = np.clip(quality, 0.0, 1.0)
+
+        accepted = np.all(matched | ~self._required[None, :], axis=1) & (quality >= self.min_quality)
+        return slots, best_offset, matched, quality, accepted
+
+    def _build_frame(self, target: float, slots: np.ndarray, offsets: np.ndarray,
+                     matched: np.ndarray, quality: float) -> ChannelFrame:
+        self.frame_count += 1
+        self.sync_success_count += 1
+
+        channels, offsets_ms = {}, {}
+        for row in np.flatnonzero(matched):
+            name = self._names[row]
+            channels[name] = self._data[row][slots[row]]
+            offsets_ms[name] = float(offsets[row]) * 1000.0
+            self.match_counts[name] += 1
+        if offsets_ms:
+            self.total_sync_offset += max(abs(o) for o in offsets_ms.values())
+
+        return ChannelFrame(
+            timestamp=target,
+            frame_id=self.frame_count,
+            channels=channels,
+            sync_quality=float(quality),
+            sync_offset_ms=offsets_ms,
+        )
+
+    def synchronize(self, target_timestamp: Optional[float] = None) -> Optional[ChannelFrame]:
+        """
+        Synchronize all channels at a target timestamp
+
+        Args:
+            target_timestamp: Target timestamp (if None, latest reference data)
+
+        Returns:
+            ChannelFrame if synchronization successful, None otherwise
+        """
+        if target_timestamp is None:
+            target_timestamp = self._latest_timestamp()
+            if target_timestamp is None:
+                return None
+        if not self._names:
+            return None
+
+        slots, offsets, matched, quality, accepted = self._match(np.array([target_timestamp]))
+        if not accepted[0]:
+            self.sync_fail_count += 1
+            return None
+        return self._build_frame(target_timestamp, slots[0], offsets[0], matched[0], quality[0])
+
+    def synchronize_batch(self, timestamps: Iterable[float]) -> List[ChannelFrame]:
+        """
+        Synchronize many target timestamps at once
+
+        Args:
+            timestamps: Target timestamps
+
+        Returns:
+            List of successfully synchronized frames
+        """
+        targets = np.asarray(list(timestamps), dtype=np.float64)
+        if len(targets) == 0 or not self._names:
+            return []
+
+        slots, offsets, matched, quality, accepted = self._match(targets)
+        self.sync_fail_count += int(np.sum(~accepted))
+        return [self._build_frame(float(targets[i]), slots[i], offsets[i], matched[i], quality[i])
+                for i in np.flatnonzero(accepted)]
+
+    def get_latest_synced_frame(self) -> Optional[ChannelFrame]:
+        """
+        Get the latest synchronized frame (convenience method)
+
+        Returns:
+            Latest ChannelFrame or None
+        """
+        return self.synchronize()
+
+    def clear_buffers(self) -> None:
+        """Clear all data buffers"""
+        self._timestamps[:] = np.nan
+        for row, name in enumerate(self._names):
+            self._data[row] = [None] * self.specs[name].buffer_size
+            self._written[row] = 0
+
+    def get_buffer_status(self) -> Dict[str, int]:
+        """Get current buffer sizes"""
+        return {name: min(self._written[row], self.specs[name].buffer_size)
+                for row, name in enumerate(self._names)}
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get synchronization statistics"""
+        total_frames = self.sync_success_count + self.sync_fail_count
+        success_rate = (self.sync_success_count / total_frames * 100) if total_frames > 0 else 0.0
+        avg_offset = (self.total_sync_offset / self.sync_success_count) if self.sync_success_count > 0 else 0.0
+
+        return {
+            'frame_count': self.frame_count,
+            'sync_success_count': self.sync_success_count,
+            'sync_fail_count': self.sync_fail_count,
+            'success_rate': success_rate,
+            'avg_sync_offset_ms': avg_offset,
+            'match_counts': dict(self.match_counts),
+            'buffer_status': self.get_buffer_status(),
+            'clock_offsets': self.clock_estimator.get_estimates() if self.clock_estimator else {},
+        }
+
+    def __repr__(self) -> str:
+        return (f"<ChannelSynchronizer "
+                f"channels={self._names} "
+                f"buffers={self.get_buffer_status()} "
+                f"frames={self.frame_count}>")
@@ -0,0 +1,198 @@
+"""
+Clock Offset Estimator - Per-channel clock offset and drift
+
+Every channel is stamped by its own publisher clock. Relative to a
+reference channel, each clock is modelled as
+
+    t_channel = t_reference + offset + drift * (t_reference - t0)
+
+Estimation (online, over a sliding window of raw timestamps):
+1. Matching: each channel timestamp is paired with the nearest reference
+   timestamp (np.searchsorted over the sorted reference window); pairs
+   further apart than max_pair_gap are dropped
+2. Robust regression: Theil-Sen (median of pairwise slopes, median
+   intercept) on (t_reference - t0, t_channel - t_reference), so sampling
+   phase jitter and dropped or late messages do not bias the fit
+
+Corrected timestamps map every channel onto the reference clock before
+DataSynchronizer matches them.
+"""
+
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+import numpy as np
+
+from .timestamp_search import nearest_indices
+
+# Cap on the pairs used for the O(n^2) Theil-Sen slope median
+_MAX_REGRESSION_PAIRS = 256
+
+
+def match_nearest(reference: np.ndarray, times: np.ndarray,
+                  max_gap: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pair each timestamp with the nearest reference timestamp
+
+    Args:
+        reference: Sorted reference timestamps
+        times: Timestamps to match
+        max_gap: Maximum |time - reference| of a pair in seconds
+
+    Returns:
+        (indices into times, indices into reference) of the kept pairs
+    """
+    if len(reference) == 0 or len(times) == 0:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+
+    nearest = nearest_indices(reference, times)
+    keep = np.abs(times - reference[nearest]) <= max_gap
+    return np.flatnonzero(keep), nearest[keep]
+
+
+def theil_sen(x: np.ndarray, y: np.ndarray) -> Tuple[float, float]:
+    """
+    Theil-Sen line fit y = intercept + slope * x
+
+    Args:
+        x: N sample positions
+        y: N sample values
+
+    Returns:
+        (slope, intercept); slope is 0 when x has no spread
+    """
+    i, j = np.triu_indices(len(x), k=1)
+    dx = x[j] - x[i]
+    valid = dx > 1e-9
+    slope = float(np.median((y[j] - y[i])[valid] / dx[valid])) if valid.any() else 0.0
+    intercept = float(np.median(y - slope * x))
+    return slope, intercept
+
+
+class ClockOffsetEstimator:
+    """
+    Online clock offset / drift estimation relative to a reference channel
+
+    Usage:
+        estimator = ClockOffsetEstimator(reference='pointcloud')
+        estimator.observe('obb', obb_timestamp)
+        corrected = estimator.correct('obb', obb_timestamp)
+        estimator.get_estimates()   # {'obb': {'offset_ms': 30.1, 'drift_ppm': 2.0, ...}}
+
+    Parameters:
+        reference: Channel whose clock the others are mapped onto
+        window: Raw timestamps kept per channel
+        max_pair_gap_s: Maximum distance of a matched pair (seconds)
+        min_pairs: Pairs required before a channel is corrected
+        update_interval: Re-fit after this many observations of a channel
+    """
+
+    def __init__(self,
+                 reference: str = 'pointcloud',
+                 window: int = 200,
+                 max_pair_gap_s: float = 0.5,
+                 min_pairs: int = 10,
+                 update_interval: int = 10):
+        """
+        Initialize estimator
+
+        Args:
+            reference: Reference channel name
+            window: Raw timestamps kept per channel
+            max_pair_gap_s: Maximum distance of a matched pair (seconds)
+            min_pairs: Pairs required before a channel is corrected
+            update_interval: Re-fit after this many observations of a channel
+        """
+        self.reference = reference
+        self.window = window
+        self.max_pair_gap_s = max_pair_gap_s
+        self.min_pairs = min_pairs
+        self.update_interval = update_interval
+
+        self._times: Dict[str, Deque[float]] = {}
+        self._pending: Dict[str, int] = {}
+        self._origin: Optional[float] = None
+        # channel -> (offset_s, drift, pairs)
+        self._estimates: Dict[str, Tuple[float, float, int]] = {}
+
+    def observe(self, channel: str, timestamp: float) -> None:
+        """
+        Record a raw timestamp of a channel
+
+        Args:
+            channel: Channel name
+            timestamp: Raw (publisher clock) timestamp in seconds
+        """
+        if channel not in self._times:
+            self._times[channel] = deque(maxlen=self.window)
+            self._pending[channel] = 0
+        self._times[channel].append(timestamp)
+        if channel == self.reference and self._origin is None:
+            self._origin = timestamp
+
+        if channel != self.reference:
+            self._pending[channel] += 1
+            if self._pending[channel] >= self.update_interval:
+                self._pending[channel] = 0
+                self._fit(channel)
+
+    def _fit(self, channel: str) -> None:
+        """Re-estimate offset and drift of one channel"""
+        reference = self._times.get(self.reference)
+        if not reference or self._origin is None:
+            return
+
+        ref = np.sort(np.fromiter(reference, dtype=np.float64))
+        times = np.fromiter(self._times[channel], dtype=np.float64)
+
+        # Match on the currently corrected clock so a large steady offset
+        # still pairs samples of the same instant once it is estimated
+        offset, drift, _ = self._estimates.get(channel, (0.0, 0.0, 0))
+        guess = times - offset - drift * (times - self._origin)
+        time_idx, ref_idx = match_nearest(ref, guess, self.max_pair_gap_s)
+        if len(time_idx) < self.min_pairs:
+            return
+        if len(time_idx) > _MAX_REGRESSION_PAIRS:
+            time_idx, ref_idx = time_idx[-_MAX_REGRESSION_PAIRS:], ref_idx[-_MAX_REGRESSION_PAIRS:]
+
+        x = ref[ref_idx] - self._origin
+        drift, offset = theil_sen(x, times[time_idx] - ref[ref_idx])
+        self._estimates[channel] = (offset, drift, len(time_idx))
+
+    def correct(self, channel: str, timestamp: float) -> float:
+        """
+        Map a channel timestamp onto the reference clock
+
+        Args:
+            channel: Channel name
+            timestamp: Raw timestamp in seconds
+
+        Returns:
+            Corrected timestamp (unchanged for the reference channel and
+            channels without an estimate yet)
+        """
+        estimate = self._estimates.get(channel)
+        if estimate is None or self._origin is None:
+            return timestamp
+        offset, drift, _ = estimate
+        # Invert t_channel = t_ref + offset + drift * (t_ref - t0)
+        return (timestamp - offset + drift * self._origin) / (1.0 + drift)
+
+    def get_estimates(self) -> Dict[str, Dict[str, Any]]:
+        """Current estimates per channel (offset in ms, drift in ppm)"""
+        return {
+            channel: {
+                'reference': self.reference,
+                'offset_ms': offset * 1000.0,
+                'drift_ppm': drift * 1e6,
+                'pairs': pairs,
+            }
+            for channel, (offset, drift, pairs) in sorted(self._estimates.items())
+        }
+
+    def reset(self) -> None:
+        """Drop all timestamps and estimates"""
+        self._times.clear()
+        self._pending.clear()
+        self._origin = None
+        self._estimates.clear()
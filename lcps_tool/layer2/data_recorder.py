@@ -3,7 +3,7 @@ Data Recorder - Records synchronized data to HDF5 format
 
 Implements HDF5 recording with:
 - Asynchronous writing (queue-based)
-- Stream compression (gzip/zstd)
+- Stream compression (gzip/lzf)
 - Periodic flush (every 100 frames)
 - Metadata recording
 """
@@ -19,7 +19,11 @@ from typing import Any, Dict, List, Optional
 import h5py
 import numpy as np
 
-from ..data_models.synced_frame import SyncedFrame
+from ..data_models.synced_frame import SyncedFrame, SyncedFramePool
+from .latency_tracker import LATENCY_COLUMNS, LatencyTracker, frame_latencies
+
+# Column order of the recorded channel_timestamps dataset
+CHANNEL_TIMESTAMP_COLUMNS = ('obb', 'pointcloud', 'status')
 
 
 class DataRecorder:
@@ -35,6 +39,8 @@ class DataRecorder:
     │   └── ...
     ├── timestamps (dataset)
     ├── frame_ids (dataset)
+    ├── latency_ms (dataset, frames x columns, attrs: columns)
+    ├── channel_timestamps (dataset, frames x channels, attrs: columns)
     ├── obb_data/
     │   ├── frame_0000 (group)
     │   ├── frame_0001 (group)
@@ -48,43 +54,66 @@ class DataRecorder:
         ├── frame_0001 (group)
         └── ...
 
+    Every frame member of the channel groups carries a 'timestamp'
+    attribute (source sample time). channel_timestamps repeats these per
+    frame (CHANNEL_TIMESTAMP_COLUMNS, NaN where the frame has no sample of
+    a channel), so OfflineSynchronizer loads them with one read to
+    re-synchronize recordings with other windows (/sync_index/<name>).
+
+    latency_ms holds the per-stage pipeline latencies of every frame
+    (LATENCY_COLUMNS, NaN where a stage was not stamped); the record
+    column is the synchronize -> HDF5 write latency.
+
     Parameters:
         output_path: Output HDF5 file path
-        compression: Compression algorithm ("gzip" or "zstd")
-        compression_level: Compression level (1-9 for gzip)
+        compression: Compression algorithm ("gzip", "lzf" or None)
+        compression_level: Compression level (1-9 for gzip, ignored otherwise)
         flush_interval: Flush every N frames (default: 100)
         async_write: Enable asynchronous writing (default: True)
+        latency_tracker: Tracker receiving the record stage latency
+        frame_pool: Pool that recorded frames are released to once written
+            (or dropped); the recorder then owns every frame passed to
+            record_frame
     """
 
     def __init__(self,
                  output_path: str,
-                 compression: str = "gzip",
+                 compression: Optional[str] = "gzip",
                  compression_level: int = 6,
                  flush_interval: int = 100,
-                 async_write: bool = True):
+                 async_write: bool = True,
+                 latency_tracker: Optional[LatencyTracker] = None,
+                 frame_pool: Optional[SyncedFramePool] = None):
         """
         Initialize data recorder
 
         Args:
             output_path: Output HDF5 file path
-            compression: Compression algorithm ("gzip")
-            compression_level: Compression level (1-9)
+            compression: Compression algorithm ("gzip", "lzf" or None)
+            compression_level: Compression level (1-9, gzip only)
             flush_interval: Flush every N frames
             async_write: Enable asynchronous writing
+            latency_tracker: Tracker receiving the record stage latency
+            frame_pool: Pool to release written frames to
         """
         self.output_path = Path(output_path)
         self.compression = compression
         self.compression_level = compression_level
         self.flush_interval = flush_interval
         self.async_write = async_write
+        self.latency_tracker = latency_tracker
+        self.frame_pool = frame_pool
 
         # HDF5 file and datasets
         self.h5file: Optional[h5py.File] = None
         self.timestamps_ds: Optional[h5py.Dataset] = None
         self.frame_ids_ds: Optional[h5py.Dataset] = None
+        self.latency_ds: Optional[h5py.Dataset] = None
+        self.channel_timestamps_ds: Optional[h5py.Dataset] = None
 
         # Frame counter
         self.frame_count = 0
+        self.dropped_count = 0
         self.bytes_written = 0
 
         # Async writing
@@ -137,12 +166,15 @@ class DataRecorder:
         self.start_time = time.time()
         print(f"🎬 Recording started: {self.output_path}")
 
-    def stop_recording(self, timeout: float = 5.0) -> None:
+    def stop_recording(self, timeout: float = 5.0,
+                       metadata: Optional[Dict[str, Any]] = None) -> None:
         """
         Stop recording and close file
 
         Args:
             timeout: Maximum wait time for async writer to finish
+            metadata: Optional metadata only known at the end of the
+                recording (e.g. estimated clock offsets)
         """
         if not self.is_recording:
             return
@@ -162,6 +194,7 @@ class DataRecorder:
             self.h5file.attrs['frame_count'] = self.frame_count
             self.h5file.attrs['duration_seconds'] = duration
             self.h5file.attrs['bytes_written'] = self.bytes_written
+            self._write_user_metadata(metadata)
 
             # Close file
             self.h5file.close()
@@ -190,10 +223,20 @@ class DataRecorder:
             try:
                 self.write_queue.put_nowait(frame)
             except queue.Full:
+                self.dropped_count += 1
                 print("⚠️ Write queue full, dropping frame")
+                self._release(frame)
         else:
             # Write synchronously
-            self._write_frame(frame)
+            try:
+                self._write_frame(frame)
+            finally:
+                self._release(frame)
+
+    def _release(self, frame: SyncedFrame) -> None:
+        """Hand a frame back to the frame pool (if any)"""
+        if self.frame_pool is not None:
+            self.frame_pool.release(frame)
 
     def _writer_thread_func(self) -> None:
         """Async writer thread main function"""
@@ -201,19 +244,25 @@ class DataRecorder:
             try:
                 # Get frame from queue with timeout
                 frame = self.write_queue.get(timeout=0.1)
-                self._write_frame(frame)
             except queue.Empty:
                 continue
+            try:
+                self._write_frame(frame)
             except Exception as e:
                 print(f"⚠️ Writer thread error: {e}")
+            finally:
+                self._release(frame)
 
         # Drain remaining frames
         while not self.write_queue.empty():
             try:
                 frame = self.write_queue.get_nowait()
-                self._write_frame(frame)
             except queue.Empty:
                 break
+            try:
+                self._write_frame(frame)
+            finally:
+                self._release(frame)
 
     def _write_frame(self, frame: SyncedFrame) -> None:
         """
@@ -234,17 +283,33 @@ class DataRecorder:
         self.timestamps_ds[self.frame_count] = frame.timestamp
         self.frame_ids_ds[self.frame_count] = frame.frame_id
 
+        # Per-channel sample timestamps (NaN = channel not written)
+        channel_timestamps = dict.fromkeys(CHANNEL_TIMESTAMP_COLUMNS, np.nan)
+
         # Write OBB data
         if frame.has_obb():
-            self._write_obb_data(frame.obb_data, self.frame_count)
+            channel_timestamps['obb'] = self._write_obb_data(frame.obb_data, self.frame_count)
 
         # Write point cloud data
         if frame.has_pointcloud():
-            self._write_pointcloud_data(frame.pointcloud_data, self.frame_count)
+            channel_timestamps['pointcloud'] = self._write_pointcloud_data(
+                frame.pointcloud_data, self.frame_count)
 
         # Write status data
         if frame.has_status():
-            self._write_status_data(frame.status_data, self.frame_count)
+            channel_timestamps['status'] = self._write_status_data(frame.status_data, self.frame_count)
+
+        self.channel_timestamps_ds.resize((new_size, len(CHANNEL_TIMESTAMP_COLUMNS)))
+        self.channel_timestamps_ds[self.frame_count] = [channel_timestamps[column]
+                                                        for column in CHANNEL_TIMESTAMP_COLUMNS]
+
+        # Latency columns (record = synchronize -> written)
+        frame.trace['record'] = time.perf_counter()
+        latencies = frame_latencies(frame)
+        self.latency_ds.resize((new_size, len(LATENCY_COLUMNS)))
+        self.latency_ds[self.frame_count] = [latencies.get(column, np.nan) for column in LATENCY_COLUMNS]
+        if self.latency_tracker is not None and 'record' in latencies:
+            self.latency_tracker.observe('record', latencies['record'])
 
         self.frame_count += 1
 
@@ -260,16 +325,30 @@ class DataRecorder:
         # Standard metadata
         self.h5file.attrs['recording_date'] = datetime.now().isoformat()
         self.h5file.attrs['version'] = '1.0.0'
-        self.h5file.attrs['compression'] = self.compression
+        self.h5file.attrs['compression'] = self.compression or 'none'
         self.h5file.attrs['compression_level'] = self.compression_level
 
         # User metadata
-        if metadata:
-            for key, value in metadata.items():
-                # Convert to JSON for complex types
-                if isinstance(value, (dict, list)):
-                    value = json.dumps(value)
-                self.h5file.attrs[f'user_{key}'] = value
+        self._write_user_metadata(metadata)
+
+    def _write_user_metadata(self, metadata: Optional[Dict[str, Any]]) -> None:
+        """Store user metadata as 'user_<key>' attributes"""
+        if self.h5file is None or not metadata:
+            return
+
+        for key, value in metadata.items():
+            # Convert to JSON for complex types
+            if isinstance(value, (dict, list)):
+                value = json.dumps(value)
+            self.h5file.attrs[f'user_{key}'] = value
+
+    def _compression_kwargs(self) -> Dict[str, Any]:
+        """h5py dataset compression arguments (only gzip takes a level)"""
+        if not self.compression:
+            return {}
+        if self.compression == 'gzip':
+            return {'compression': 'gzip', 'compression_opts': self.compression_level}
+        return {'compression': self.compression}
 
     def _init_datasets(self) -> None:
         """Initialize HDF5 datasets"""
@@ -282,8 +361,7 @@ class DataRecorder:
             shape=(0,),
             maxshape=(None,),
             dtype='f8',
-            compression=self.compression,
-            compression_opts=self.compression_level
+            **self._compression_kwargs()
         )
 
         self.frame_ids_ds = self.h5file.create_dataset(
@@ -291,30 +369,51 @@ class DataRecorder:
             shape=(0,),
             maxshape=(None,),
             dtype='i4',
-            compression=self.compression,
-            compression_opts=self.compression_level
+            **self._compression_kwargs()
+        )
+
+        self.latency_ds = self.h5file.create_dataset(
+            'latency_ms',
+            shape=(0, len(LATENCY_COLUMNS)),
+            maxshape=(None, len(LATENCY_COLUMNS)),
+            chunks=(256, len(LATENCY_COLUMNS)),
+            dtype='f4',
+            **self._compression_kwargs()
         )
+        self.latency_ds.attrs['columns'] = json.dumps(list(LATENCY_COLUMNS))
+
+        self.channel_timestamps_ds = self.h5file.create_dataset(
+            'channel_timestamps',
+            shape=(0, len(CHANNEL_TIMESTAMP_COLUMNS)),
+            maxshape=(None, len(CHANNEL_TIMESTAMP_COLUMNS)),
+            chunks=(256, len(CHANNEL_TIMESTAMP_COLUMNS)),
+            dtype='f8',
+            **self._compression_kwargs()
+        )
+        self.channel_timestamps_ds.attrs['columns'] = json.dumps(list(CHANNEL_TIMESTAMP_COLUMNS))
 
         # Create groups for data channels
         self.h5file.create_group('obb_data')
         self.h5file.create_group('pointcloud_data')
         self.h5file.create_group('status_data')
 
-    def _write_obb_data(self, obb_data: Dict[str, Any], frame_idx: int) -> None:
-        """Write OBB data to HDF5"""
+    def _write_obb_data(self, obb_data: Dict[str, Any], frame_idx: int) -> float:
+        """Write OBB data to HDF5, returns the recorded sample timestamp"""
         if self.h5file is None:
-            return
+            return np.nan
 
         group = self.h5file['obb_data'].create_group(f'frame_{frame_idx:06d}')
+        group.attrs['timestamp'] = timestamp = obb_data.get('timestamp', 0.0)
 
         # Store OBBs as JSON (simple approach)
         obbs_json = json.dumps(obb_data.get('obbs', []))
         group.attrs['obbs'] = obbs_json
+        return timestamp
 
-    def _write_pointcloud_data(self, pc_data: Dict[str, Any], frame_idx: int) -> None:
-        """Write point cloud data to HDF5"""
+    def _write_pointcloud_data(self, pc_data: Dict[str, Any], frame_idx: int) -> float:
+        """Write point cloud data to HDF5, returns the recorded sample timestamp (NaN if none)"""
         if self.h5file is None:
-            return
+            return np.nan
 
         points = pc_data.get('points')
         if isinstance(points, np.ndarray):
@@ -322,30 +421,35 @@ class DataRecorder:
             ds = self.h5file['pointcloud_data'].create_dataset(
                 f'frame_{frame_idx:06d}',
                 data=points,
-                compression=self.compression,
-                compression_opts=self.compression_level
+                **self._compression_kwargs()
             )
 
             # Store metadata
+            ds.attrs['timestamp'] = timestamp = pc_data.get('timestamp', 0.0)
             ds.attrs['original_count'] = pc_data.get('original_count', 0)
             ds.attrs['downsampled_count'] = pc_data.get('downsampled_count', 0)
             ds.attrs['reduction_rate'] = pc_data.get('reduction_rate', 0.0)
+            return timestamp
+        return np.nan
 
-    def _write_status_data(self, status_data: Dict[str, Any], frame_idx: int) -> None:
-        """Write status data to HDF5"""
+    def _write_status_data(self, status_data: Dict[str, Any], frame_idx: int) -> float:
+        """Write status data to HDF5, returns the recorded sample timestamp"""
         if self.h5file is None:
-            return
+            return np.nan
 
         group = self.h5file['status_data'].create_group(f'frame_{frame_idx:06d}')
+        group.attrs['timestamp'] = timestamp = status_data.get('timestamp', 0.0)
 
         # Store status as JSON
         # Convert LCPSState enum to string
-        status_copy = status_data.copy()
+        status_copy = dict(status_data)  # plain dict (channel records are not JSON-serializable)
+        status_copy.pop('trace', None)  # stored in latency_ms
         if 'state' in status_copy and hasattr(status_copy['state'], 'value'):
             status_copy['state'] = status_copy['state'].value
 
         status_json = json.dumps(status_copy)
         group.attrs['status'] = status_json
+        return timestamp
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get recording statistics"""
@@ -354,13 +458,14 @@ class DataRecorder:
         stats = {
             'is_recording': self.is_recording,
             'frame_count': self.frame_count,
+            'dropped_count': self.dropped_count,
             'duration_seconds': duration,
             'fps': self.frame_count / duration if duration > 0 else 0,
             'output_path': str(self.output_path),
         }
 
         if self.async_write and self.is_recording:
-            stats['queue_size'] = self.write_queue.qsize()
+            stats['queue_size'] = len(self.write_queue.queue)
 
         if self.output_path.exists():
             stats['file_size_mb'] = self.output_path.stat().st_size / (1024 * 1024)
@@ -0,0 +1,173 @@
+"""
+Data Replayer - Replays recordings as SyncedFrame sequences
+
+Supports the two recording formats produced by this repository:
+- HDF5 recordings written by DataRecorder (ADR-002 layout)
+- JSONL session recordings written by recvOBB.py's RecorderManager (F2)
+
+Frames are read lazily, one at a time, so hours of data can be replayed
+without loading the whole file.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+import h5py
+import numpy as np
+
+from ..data_models.synced_frame import SyncedFrame
+
+
+class DataReplayer:
+    """
+    Recording replayer
+
+    Usage:
+        replayer = DataReplayer("data/lcps_recording.h5")
+        for frame in replayer:
+            print(frame)
+
+    Parameters:
+        input_path: Recording path (.h5/.hdf5 or .jsonl)
+        start_frame: Index of the first frame to replay
+        max_frames: Maximum number of frames to replay (None = all)
+    """
+
+    def __init__(self,
+                 input_path: str,
+                 start_frame: int = 0,
+                 max_frames: Optional[int] = None):
+        """
+        Initialize data replayer
+
+        Args:
+            input_path: Recording path (.h5/.hdf5 or .jsonl)
+            start_frame: Index of the first frame to replay
+            max_frames: Maximum number of frames to replay (None = all)
+
+        Raises:
+            FileNotFoundError: If the recording does not exist
+            ValueError: If the file format is not supported
+        """
+        self.input_path = Path(input_path)
+        self.start_frame = start_frame
+        self.max_frames = max_frames
+
+        if not self.input_path.exists():
+            raise FileNotFoundError(f"Recording not found: {self.input_path}")
+
+        suffix = self.input_path.suffix.lower()
+        if suffix in ('.h5', '.hdf5'):
+            self.format = 'hdf5'
+        elif suffix == '.jsonl':
+            self.format = 'jsonl'
+        else:
+            raise ValueError(f"Unsupported recording format: {suffix}. Expected .h5/.hdf5 or .jsonl")
+
+        self.frames_replayed = 0
+
+    def __iter__(self) -> Iterator[SyncedFrame]:
+        """Iterate over recorded frames"""
+        frames = self._iter_hdf5() if self.format == 'hdf5' else self._iter_jsonl()
+        for frame in frames:
+            self.frames_replayed += 1
+            yield frame
+
+    def get_frame_count(self) -> int:
+        """Number of frames in the recording (before start/max limits)"""
+        if self.format == 'hdf5':
+            with h5py.File(self.input_path, 'r') as h5file:
+                return len(h5file['timestamps'])
+        with open(self.input_path, 'r', encoding='utf-8') as f:
+            return sum(1 for line in f if line.strip())
+
+    def _frame_range(self, total: int) -> range:
+        """Frame indices selected by start_frame/max_frames"""
+        stop = total if self.max_frames is None else min(total, self.start_frame + self.max_frames)
+        return range(self.start_frame, stop)
+
+    def _iter_hdf5(self) -> Iterator[SyncedFrame]:
+        """Read frames from a DataRecorder HDF5 file"""
+        with h5py.File(self.input_path, 'r') as h5file:
+            timestamps = h5file['timestamps'][:]
+            frame_ids = h5file['frame_ids'][:]
+            obb_group = h5file.get('obb_data')
+            pc_group = h5file.get('pointcloud_data')
+            status_group = h5file.get('status_data')
+
+            for idx in self._frame_range(len(timestamps)):
+                name = f'frame_{idx:06d}'
+                timestamp = float(timestamps[idx])
+
+                obb_data = None
+                if obb_group is not None and name in obb_group:
+                    obb_data = {
+                        'timestamp': timestamp,
+                        'obbs': json.loads(obb_group[name].attrs['obbs']),
+                    }
+
+                pointcloud_data = None
+                if pc_group is not None and name in pc_group:
+                    ds = pc_group[name]
+                    pointcloud_data = {
+                        'timestamp': timestamp,
+                        'points': ds[:],
+                        'original_count': int(ds.attrs.get('original_count', 0)),
+                        'downsampled_count': int(ds.attrs.get('downsampled_count', 0)),
+                        'reduction_rate': float(ds.attrs.get('reduction_rate', 0.0)),
+                    }
+
+                status_data = None
+                if status_group is not None and name in status_group:
+                    status_data = json.loads(status_group[name].attrs['status'])
+
+                yield SyncedFrame(
+                    timestamp=timestamp,
+                    frame_id=int(frame_ids[idx]),
+                    obb_data=obb_data,
+                    pointcloud_data=pointcloud_data,
+                    status_data=status_data,
+                )
+
+    def _iter_jsonl(self) -> Iterator[SyncedFrame]:
+        """Read frames from a recvOBB.py JSONL session recording"""
+        with open(self.input_path, 'r', encoding='utf-8') as f:
+            idx = -1
+            for line in f:
+                if not line.strip():
+                    continue
+                idx += 1
+                if idx < self.start_frame:
+                    continue
+                if self.max_frames is not None and idx >= self.start_frame + self.max_frames:
+                    break
+
+                record = json.loads(line)
+                yield self._frame_from_message(record.get('data', {}),
+                                               record.get('timestamp', 0.0),
+                                               record.get('metadata', {}).get('frame', idx))
+
+    @staticmethod
+    def _frame_from_message(message: Dict[str, Any], timestamp: float, frame_id: int) -> SyncedFrame:
+        """Convert one raw OBB message (sendOBB.cpp / recv.py format) to a SyncedFrame"""
+        obbs = message.get('data', message.get('obbs', []))
+        obb_data = {'timestamp': message.get('timestamp', timestamp), 'obbs': obbs}
+
+        pointcloud_data = None
+        if 'points' in message:
+            points = np.asarray(message['points'], dtype=np.float32).reshape(-1, 3)
+            pointcloud_data = {'timestamp': obb_data['timestamp'], 'points': points}
+
+        return SyncedFrame(
+            timestamp=obb_data['timestamp'],
+            frame_id=frame_id,
+            obb_data=obb_data,
+            pointcloud_data=pointcloud_data,
+        )
+
+    def __repr__(self) -> str:
+        return (f"<DataReplayer "
+                f"path={self.input_path.name} "
+                f"format={self.format} "
+                f"replayed={self.frames_replayed}>")
@@ -5,13 +5,18 @@ Implements timestamp-based synchronization algorithm:
 - Threshold matching (±50ms window)
 - Generates SyncedFrame with aligned data
 - Handles missing data gracefully
+- Optional OBB pose interpolation to the target timestamp
+- Optional per-channel clock offset / drift correction
 """
 
 import time
 from collections import deque
 from typing import Any, Dict, List, Optional
 
-from ..data_models.synced_frame import SyncedFrame
+from ..data_models.synced_frame import SyncedFrame, SyncedFramePool
+from ..geometry.interpolation import interpolate_obb_dicts
+from .clock_offset import ClockOffsetEstimator
+from .obb_tracker import OBBTracker
 
 
 class DataSynchronizer:
@@ -24,16 +29,42 @@ class DataSynchronizer:
     3. Generate SyncedFrame with synchronized data
     4. Calculate sync quality based on time offsets
 
+    With interpolate_obbs, the OBB sample is not just the closest one:
+    when the target lies between two OBB samples, box poses are
+    interpolated to the target timestamp (lerp positions/sizes, slerp
+    rotations, boxes matched by track id or index), so the OBBs of a
+    frame line up with its point cloud. Pass an obb_tracker to give every
+    buffered OBB sample track ids; otherwise boxes are matched by index,
+    which pairs the wrong boxes when the publisher reorders its list.
+
+    With clock_reference, publisher clock offsets and drift relative to
+    the reference channel are estimated online (ClockOffsetEstimator) and
+    removed from incoming timestamps before matching; the raw timestamp
+    is kept as 'raw_timestamp'.
+
+    With frame_pool, frames are taken from a SyncedFramePool; whoever
+    consumes a frame last must release it back to the pool.
+
     Parameters:
         sync_window_ms: Synchronization window in milliseconds (default: 50ms)
         buffer_size: Maximum buffer size per channel (default: 100)
         min_quality: Minimum sync quality to accept frame (default: 0.5)
+        interpolate_obbs: Interpolate OBB poses to the target timestamp
+        clock_reference: Reference channel for clock offset correction
+            (None = assume a shared clock)
+        frame_pool: Pool to take SyncedFrames from (None = allocate)
+        obb_tracker: Tracker assigning track ids to OBB samples as they are
+            buffered (None = no tracking)
     """
 
     def __init__(self,
                  sync_window_ms: float = 50.0,
                  buffer_size: int = 100,
-                 min_quality: float = 0.5):
+                 min_quality: float = 0.5,
+                 interpolate_obbs: bool = False,
+                 clock_reference: Optional[str] = None,
+                 frame_pool: Optional[SyncedFramePool] = None,
+                 obb_tracker: Optional[OBBTracker] = None):
         """
         Initialize data synchronizer
 
@@ -41,11 +72,24 @@ class DataSynchronizer:
             sync_window_ms: Synchronization window in milliseconds (±50ms)
             buffer_size: Maximum buffer size per channel
             min_quality: Minimum sync quality (0.0-1.0)
+            interpolate_obbs: Interpolate OBB poses between the two OBB
+                samples bracketing the target timestamp (samples at most
+                two sync windows apart)
+            clock_reference: Channel whose clock the other channels are
+                mapped onto (None = no clock correction)
+            frame_pool: Pool to take SyncedFrames from (None = allocate)
+            obb_tracker: Tracker run on every OBB sample in add_data()
+                (writes 'track_id' into its OBB dicts)
         """
         self.sync_window_ms = sync_window_ms
         self.sync_window_s = sync_window_ms / 1000.0  # Convert to seconds
         self.buffer_size = buffer_size
         self.min_quality = min_quality
+        self.interpolate_obbs = interpolate_obbs
+        self.clock_estimator: Optional[ClockOffsetEstimator] = (
+            ClockOffsetEstimator(reference=clock_reference) if clock_reference else None)
+        self.frame_pool = frame_pool
+        self.obb_tracker = obb_tracker
 
         # Data buffers for each channel
         self.buffers: Dict[str, deque] = {
@@ -53,12 +97,16 @@ class DataSynchronizer:
             'pointcloud': deque(maxlen=buffer_size),
             'status': deque(maxlen=buffer_size),
         }
+        # Timestamps of the buffered samples (parallel deques), so matching
+        # never indexes into the samples (dicts or channel records)
+        self.timestamps: Dict[str, deque] = {channel: deque(maxlen=buffer_size) for channel in self.buffers}
 
         # Statistics
         self.frame_count = 0
         self.sync_success_count = 0
         self.sync_fail_count = 0
         self.total_sync_offset = 0.0
+        self.interpolated_count = 0
 
     def add_data(self, channel: str, data: Dict[str, Any]) -> None:
         """
@@ -77,7 +125,21 @@ class DataSynchronizer:
         if 'timestamp' not in data:
             raise ValueError(f"Data missing 'timestamp' field for channel {channel}")
 
+        if self.clock_estimator is not None:
+            raw_timestamp = data['timestamp']
+            self.clock_estimator.observe(channel, raw_timestamp)
+            corrected = self.clock_estimator.correct(channel, raw_timestamp)
+            if corrected != raw_timestamp:
+                data = data.copy()
+                data['raw_timestamp'] = raw_timestamp
+                data['timestamp'] = corrected
+
+        # Track ids before buffering, so interpolation matches boxes by track
+        if channel == 'obb' and self.obb_tracker is not None:
+            self.obb_tracker.track_obbs(data.get('obbs', []), data['timestamp'])
+
         self.buffers[channel].append(data)
+        self.timestamps[channel].append(data['timestamp'])
 
     def synchronize(self, target_timestamp: Optional[float] = None) -> Optional[SyncedFrame]:
         """
@@ -100,6 +162,14 @@ class DataSynchronizer:
         pc_data, pc_offset = self._find_closest_data('pointcloud', target_timestamp)
         status_data, status_offset = self._find_closest_data('status', target_timestamp)
 
+        # Interpolated OBB poses are exact at the target timestamp
+        interpolated = False
+        if self.interpolate_obbs and obb_offset != 0.0:
+            interpolated_data = self._interpolate_obb_data(target_timestamp)
+            if interpolated_data is not None:
+                obb_data, obb_offset = interpolated_data, 0.0
+                interpolated = True
+
         # Calculate sync quality
         offsets = {}
         if obb_offset is not None:
@@ -125,9 +195,18 @@ class DataSynchronizer:
         # Create synced frame
         self.frame_count += 1
         self.sync_success_count += 1
+        if interpolated:
+            self.interpolated_count += 1
         if offsets:
             self.total_sync_offset += max(abs(o) for o in offsets.values())
 
+        if self.frame_pool is not None:
+            frame = self.frame_pool.acquire(target_timestamp, self.frame_count, obb_data,
+                                            pc_data, status_data, sync_quality)
+            frame.sync_offset_ms.update(offsets)
+            frame.trace['synchronize'] = time.perf_counter()
+            return frame
+
         frame = SyncedFrame(
             timestamp=target_timestamp,
             frame_id=self.frame_count,
@@ -135,7 +214,8 @@ class DataSynchronizer:
             pointcloud_data=pc_data,
             status_data=status_data,
             sync_quality=sync_quality,
-            sync_offset_ms=offsets
+            sync_offset_ms=offsets,
+            trace={'synchronize': time.perf_counter()},
         )
 
         return frame
@@ -170,6 +250,8 @@ class DataSynchronizer:
         """Clear all data buffers"""
         for buffer in self.buffers.values():
             buffer.clear()
+        for timestamps in self.timestamps.values():
+            timestamps.clear()
 
     def get_buffer_status(self) -> Dict[str, int]:
         """Get current buffer sizes"""
@@ -190,17 +272,15 @@ class DataSynchronizer:
             'sync_fail_count': self.sync_fail_count,
             'success_rate': success_rate,
             'avg_sync_offset_ms': avg_offset,
+            'interpolated_count': self.interpolated_count,
+            'clock_offsets': self.clock_estimator.get_estimates() if self.clock_estimator else {},
             'buffer_status': self.get_buffer_status(),
         }
 
     def _get_latest_timestamp(self) -> Optional[float]:
         """Get the latest timestamp from all buffers"""
-        timestamps = []
-        for buffer in self.buffers.values():
-            if buffer:
-                timestamps.append(buffer[-1]['timestamp'])
-
-        return max(timestamps) if timestamps else None
+        latest = [timestamps[-1] for timestamps in self.timestamps.values() if timestamps]
+        return max(latest) if latest else None
 
     def _find_closest_data(self,
                           channel: str,
@@ -223,8 +303,8 @@ class DataSynchronizer:
         closest_data = None
         closest_offset = None
 
-        for data in buffer:
-            offset = data['timestamp'] - target_timestamp
+        for timestamp, data in zip(self.timestamps[channel], buffer):
+            offset = timestamp - target_timestamp
             abs_offset = abs(offset)
 
             # Check if within window
@@ -236,6 +316,41 @@ class DataSynchronizer:
 
         return closest_data, closest_offset
 
+    def _interpolate_obb_data(self, target_timestamp: float) -> Optional[Dict[str, Any]]:
+        """
+        Interpolate OBB poses to the target timestamp
+
+        Args:
+            target_timestamp: Target timestamp
+
+        Returns:
+            OBB data at the target timestamp (with 'interpolated' and
+            'source_timestamps' fields), or None if no bracketing pair of
+            samples lies within two sync windows
+        """
+        before = after = None
+        for timestamp, data in zip(self.timestamps['obb'], self.buffers['obb']):
+            if timestamp <= target_timestamp and (before is None or timestamp > before['timestamp']):
+                before = data
+            if timestamp >= target_timestamp and (after is None or timestamp < after['timestamp']):
+                after = data
+
+        if before is None or after is None or before is after:
+            return None
+        t0, t1 = before['timestamp'], after['timestamp']
+        if t1 - t0 > 2 * self.sync_window_s:
+            return None
+
+        alpha = (target_timestamp - t0) / (t1 - t0)
+        obbs, _ = interpolate_obb_dicts(before.get('obbs', []), after.get('obbs', []), alpha)
+
+        result = (before if alpha < 0.5 else after).copy()
+        result['timestamp'] = target_timestamp
+        result['obbs'] = obbs
+        result['interpolated'] = True
+        result['source_timestamps'] = [t0, t1]
+        return result
+
     def __repr__(self) -> str:
         return (f"<DataSynchronizer "
                 f"window={self.sync_window_ms}ms "
@@ -0,0 +1,230 @@
+"""
+Latency Tracker - Per-stage pipeline latency histograms
+
+Every message is stamped along the pipeline (time.perf_counter, plus the
+wall clock at receive):
+
+    receive      BaseReceiver: socket.recv returned
+    parse        BaseReceiver: message decoded (and downsampled)
+    dequeue      BaseReceiver.get_data: taken off the receiver queue
+    synchronize  DataSynchronizer: synced frame built   (SyncedFrame.trace)
+    record       DataRecorder: frame written to HDF5    (SyncedFrame.trace)
+
+Channel stamps live in data['trace'], frame stamps in SyncedFrame.trace.
+The stage latencies derived from them are:
+
+    network  receive wall clock - message timestamp (publisher clock, so
+             only meaningful when publisher and receiver clocks agree)
+    parse    receive -> parse
+    queue    parse -> dequeue
+    sync     dequeue -> synchronize (time in the sync buffer + matching)
+    record   synchronize -> record (per frame, not per channel)
+"""
+
+import bisect
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..data_models.synced_frame import SyncedFrame
+
+LATENCY_CHANNELS = ('obb', 'pointcloud', 'status')
+CHANNEL_STAGES = ('network', 'parse', 'queue', 'sync')
+
+# Column order of the recorded latency_ms dataset
+LATENCY_COLUMNS = tuple(f"{channel}_{stage}" for channel in LATENCY_CHANNELS
+                        for stage in CHANNEL_STAGES) + ('record',)
+
+# Histogram bucket upper bounds in ms (plus an overflow bucket)
+LATENCY_BUCKETS_MS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0,
+                      100.0, 250.0, 500.0, 1000.0, 2500.0, 5000.0)
+
+
+def frame_latencies(frame: SyncedFrame) -> Dict[str, float]:
+    """
+    Stage latencies of a synced frame
+
+    Args:
+        frame: Synced frame (channel dicts with 'trace', frame.trace)
+
+    Returns:
+        Dict mapping LATENCY_COLUMNS names ("<channel>_<stage>", "record")
+        to latencies in ms; stages without both stamps are absent
+    """
+    latencies: Dict[str, float] = {}
+    frame_trace = frame.trace or {}
+    synchronized = frame_trace.get('synchronize')
+
+    for channel, data in (('obb', frame.obb_data),
+                          ('pointcloud', frame.pointcloud_data),
+                          ('status', frame.status_data)):
+        trace = data.get('trace') if data else None
+        if not trace:
+            continue
+        source_time = data.get('raw_timestamp', data.get('timestamp'))
+        if source_time and 'receive_wall' in trace:
+            latencies[f'{channel}_network'] = (trace['receive_wall'] - source_time) * 1000.0
+        if 'parse' in trace and 'receive' in trace:
+            latencies[f'{channel}_parse'] = (trace['parse'] - trace['receive']) * 1000.0
+        if 'dequeue' in trace and 'parse' in trace:
+            latencies[f'{channel}_queue'] = (trace['dequeue'] - trace['parse']) * 1000.0
+        if synchronized is not None and 'dequeue' in trace:
+            latencies[f'{channel}_sync'] = (synchronized - trace['dequeue']) * 1000.0
+
+    if synchronized is not None and 'record' in frame_trace:
+        latencies['record'] = (frame_trace['record'] - synchronized) * 1000.0
+    return latencies
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram (Prometheus "le" bucket semantics)
+
+    Parameters:
+        buckets_ms: Sorted bucket upper bounds in ms
+    """
+
+    def __init__(self, buckets_ms: Sequence[float] = LATENCY_BUCKETS_MS):
+        """
+        Initialize histogram
+
+        Args:
+            buckets_ms: Sorted bucket upper bounds in ms
+        """
+        self.buckets_ms: List[float] = list(buckets_ms)
+        self.counts: List[int] = [0] * (len(self.buckets_ms) + 1)  # last = overflow
+        self.count = 0
+        self.sum_ms = 0.0
+        self.min_ms = math.inf
+        self.max_ms = -math.inf
+
+    def observe(self, value_ms: float) -> None:
+        """Add one latency sample (ms)"""
+        self.counts[bisect.bisect_left(self.buckets_ms, value_ms)] += 1
+        self.count += 1
+        self.sum_ms += value_ms
+        self.min_ms = min(self.min_ms, value_ms)
+        self.max_ms = max(self.max_ms, value_ms)
+
+    def percentile(self, q: float) -> float:
+        """
+        Approximate percentile (linear within the bucket)
+
+        Args:
+            q: Percentile (0-100)
+
+        Returns:
+            Latency in ms (NaN if empty)
+        """
+        if self.count == 0:
+            return math.nan
+        rank = q / 100.0 * self.count
+        cumulative = 0
+        for i, bucket_count in enumerate(self.counts):
+            if bucket_count and cumulative + bucket_count >= rank:
+                lower = self.buckets_ms[i - 1] if i > 0 else self.min_ms
+                upper = self.buckets_ms[i] if i < len(self.buckets_ms) else self.max_ms
+                lower, upper = max(lower, self.min_ms), min(upper, self.max_ms)
+                fraction = (rank - cumulative) / bucket_count
+                return lower + (upper - lower) * fraction
+            cumulative += bucket_count
+        return self.max_ms
+
+    def cumulative_buckets(self) -> List[Tuple[float, int]]:
+        """(upper bound ms, cumulative count) pairs, ending with (inf, count)"""
+        result, cumulative = [], 0
+        for bound, bucket_count in zip(self.buckets_ms + [math.inf], list(self.counts)):
+            cumulative += bucket_count
+            result.append((bound, cumulative))
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary statistics"""
+        empty = self.count == 0
+        return {
+            'count': self.count,
+            'mean_ms': self.sum_ms / self.count if not empty else 0.0,
+            'min_ms': self.min_ms if not empty else 0.0,
+            'max_ms': self.max_ms if not empty else 0.0,
+            'p50_ms': self.percentile(50) if not empty else 0.0,
+            'p95_ms': self.percentile(95) if not empty else 0.0,
+            'p99_ms': self.percentile(99) if not empty else 0.0,
+        }
+
+
+class LatencyTracker:
+    """
+    Aggregates stage latencies of synced frames into histograms
+
+    Lock-free: histograms for LATENCY_COLUMNS are created up front and each
+    column has a single writer (the main loop observes the channel stages,
+    the recorder writer thread the record stage), so observing is a few
+    plain increments. Readers (statistics, metrics scrapes) never block the
+    writers; a snapshot taken mid-update may be one sample apart between
+    its fields.
+
+    Usage:
+        tracker = LatencyTracker()
+        tracker.observe_frame(synced_frame)        # network/parse/queue/sync
+        tracker.observe('record', 3.2)            # done by DataRecorder
+        tracker.get_statistics()['pointcloud_parse']['p95_ms']
+    """
+
+    def __init__(self, buckets_ms: Sequence[float] = LATENCY_BUCKETS_MS):
+        """
+        Initialize tracker
+
+        Args:
+            buckets_ms: Histogram bucket upper bounds in ms
+        """
+        self.buckets_ms = tuple(buckets_ms)
+        self.histograms: Dict[str, LatencyHistogram] = {
+            name: LatencyHistogram(self.buckets_ms) for name in LATENCY_COLUMNS
+        }
+
+    def observe(self, name: str, value_ms: float) -> None:
+        """
+        Add one latency sample
+
+        Args:
+            name: Column name (see LATENCY_COLUMNS)
+            value_ms: Latency in ms
+        """
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            # Column outside LATENCY_COLUMNS (setdefault keeps it atomic)
+            histogram = self.histograms.setdefault(name, LatencyHistogram(self.buckets_ms))
+        histogram.observe(value_ms)
+
+    def observe_frame(self, frame: SyncedFrame, include_record: bool = False) -> Dict[str, float]:
+        """
+        Add the stage latencies of a synced frame
+
+        Args:
+            frame: Synced frame
+            include_record: Also add the record stage (if stamped)
+
+        Returns:
+            The frame's stage latencies in ms
+        """
+        latencies = frame_latencies(frame)
+        for name, value_ms in latencies.items():
+            if name != 'record' or include_record:
+                self.observe(name, value_ms)
+        return latencies
+
+    def get_histogram(self, name: str) -> Optional[LatencyHistogram]:
+        """Histogram of a column (None if never observed)"""
+        histogram = self.histograms.get(name)
+        return histogram if histogram is not None and histogram.count else None
+
+    def get_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """Summary per observed column, in LATENCY_COLUMNS order"""
+        order = {name: i for i, name in enumerate(LATENCY_COLUMNS)}
+        histograms = dict(self.histograms)
+        names = sorted((name for name, histogram in histograms.items() if histogram.count),
+                       key=lambda name: (order.get(name, len(order)), name))
+        return {name: histograms[name].to_dict() for name in names}
+
+    def reset(self) -> None:
+        """Drop all samples"""
+        self.histograms = {name: LatencyHistogram(self.buckets_ms) for name in LATENCY_COLUMNS}
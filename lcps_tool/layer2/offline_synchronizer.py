@@ -0,0 +1,342 @@
+"""
+Offline Synchronizer - Vectorized re-synchronization of recordings
+
+Re-synchronizes recorded channels after the fact with any windows:
+1. Per-channel timestamp arrays are loaded from the HDF5 recording
+2. Every reference timestamp is matched at once against each channel
+   with np.searchsorted (nearest neighbour on the sorted channel array)
+3. The result is a synced index table - per channel the matched sample
+   index and offset - written back into the recording under
+   /sync_index/<name>
+
+Matching is O((N + M) log M) per channel with no Python loop over frames,
+so millions of frames are re-synchronized in seconds.
+
+Supported channel layouts:
+- Raw channel recordings: any group holding a 'timestamps' dataset
+  (sample i <-> timestamps[i]), e.g. /channels/lidar_front/timestamps
+- DataRecorder recordings (ADR-002): the channel_timestamps dataset
+  (frames x channels, read in one slice; sample index = recorded frame
+  index). Older recordings without it fall back to the per-frame
+  'timestamp' attributes of obb_data, pointcloud_data and status_data
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .timestamp_search import nearest_indices
+
+# DataRecorder channel groups -> channel names
+_RECORDER_CHANNELS = {
+    'obb_data': 'obb',
+    'pointcloud_data': 'pointcloud',
+    'status_data': 'status',
+}
+
+
+def match_timestamps(reference: np.ndarray,
+                     timestamps: np.ndarray,
+                     window_s: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Match every reference timestamp to the nearest channel sample
+
+    Args:
+        reference: N reference timestamps (any order)
+        timestamps: M channel timestamps (any order)
+        window_s: Maximum |offset| of a match in seconds
+
+    Returns:
+        (indices, offsets): N sample indices into timestamps (-1 = no
+        sample within the window) and N offsets in seconds
+        (channel - reference, NaN where unmatched)
+    """
+    reference = np.asarray(reference, dtype=np.float64)
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    indices = np.full(len(reference), -1, dtype=np.int64)
+    offsets = np.full(len(reference), np.nan)
+    if len(reference) == 0 or len(timestamps) == 0:
+        return indices, offsets
+
+    order = np.argsort(timestamps, kind='stable')
+    sorted_timestamps = timestamps[order]
+    nearest = nearest_indices(sorted_timestamps, reference)
+    nearest_offsets = sorted_timestamps[nearest] - reference
+
+    matched = np.abs(nearest_offsets) <= window_s
+    indices[matched] = order[nearest[matched]]
+    offsets[matched] = nearest_offsets[matched]
+    return indices, offsets
+
+
+@dataclass
+class SyncIndexTable:
+    """
+    Result of an offline re-synchronization
+
+    Attributes:
+        reference: Reference channel name
+        timestamps: N reference timestamps
+        indices: Per channel, N matched sample indices (-1 = unmatched)
+        offsets_ms: Per channel, N offsets in ms (NaN = unmatched)
+        quality: N sync quality scores (1 - max |offset| / window)
+        valid: N flags, True where every required channel matched
+        windows_ms: Per channel sync window in ms
+    """
+
+    reference: str
+    timestamps: np.ndarray
+    indices: Dict[str, np.ndarray] = field(default_factory=dict)
+    offsets_ms: Dict[str, np.ndarray] = field(default_factory=dict)
+    quality: np.ndarray = field(default_factory=lambda: np.empty(0))
+    valid: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=bool))
+    windows_ms: Dict[str, float] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @property
+    def valid_count(self) -> int:
+        return int(self.valid.sum())
+
+    def match_rates(self) -> Dict[str, float]:
+        """Fraction of reference timestamps matched per channel"""
+        return {channel: float(np.mean(idx >= 0)) if len(idx) else 0.0
+                for channel, idx in self.indices.items()}
+
+
+class OfflineSynchronizer:
+    """
+    Vectorized offline re-synchronization
+
+    Usage:
+        sync = OfflineSynchronizer(reference='pointcloud',
+                                   windows_ms={'obb': 30, 'status': 100})
+        table = sync.resync_recording("data/lcps_recording.h5", name="w30")
+        table.valid_count
+
+    Parameters:
+        reference: Channel whose timestamps define the synced frames
+        windows_ms: Sync window per channel in ms (others use default_window_ms)
+        default_window_ms: Window for channels not listed in windows_ms
+        required: Channels that must match for a frame to be valid
+            (default: all loaded channels)
+    """
+
+    def __init__(self,
+                 reference: str = 'pointcloud',
+                 windows_ms: Optional[Dict[str, float]] = None,
+                 default_window_ms: float = 50.0,
+                 required: Optional[Iterable[str]] = None):
+        """
+        Initialize offline synchronizer
+
+        Args:
+            reference: Reference channel name
+            windows_ms: Sync window per channel in ms
+            default_window_ms: Window for channels not in windows_ms
+            required: Channels that must match (default: all channels)
+        """
+        self.reference = reference
+        self.windows_ms = dict(windows_ms or {})
+        self.default_window_ms = default_window_ms
+        self.required = list(required) if required is not None else None
+
+    def window_ms(self, channel: str) -> float:
+        """Sync window of a channel in ms"""
+        return self.windows_ms.get(channel, self.default_window_ms)
+
+    def synchronize(self, channel_timestamps: Dict[str, np.ndarray],
+                    reference_timestamps: Optional[np.ndarray] = None) -> SyncIndexTable:
+        """
+        Match all reference timestamps against every channel
+
+        Args:
+            channel_timestamps: Per channel timestamp arrays (sample order)
+            reference_timestamps: Target timestamps (default: the reference
+                channel's timestamps)
+
+        Returns:
+            SyncIndexTable
+
+        Raises:
+            ValueError: If neither reference timestamps nor the reference
+                channel are available
+        """
+        if reference_timestamps is None:
+            if self.reference not in channel_timestamps:
+                raise ValueError(f"Reference channel not found: {self.reference}. "
+                                 f"Available: {sorted(channel_timestamps)}")
+            reference_timestamps = channel_timestamps[self.reference]
+        reference_timestamps = np.asarray(reference_timestamps, dtype=np.float64)
+
+        n = len(reference_timestamps)
+        table = SyncIndexTable(reference=self.reference, timestamps=reference_timestamps)
+        required = self.required if self.required is not None else list(channel_timestamps)
+        valid = np.ones(n, dtype=bool)
+        worst = np.zeros(n)
+
+        for channel, timestamps in channel_timestamps.items():
+            window_ms = self.window_ms(channel)
+            indices, offsets = match_timestamps(reference_timestamps, timestamps, window_ms / 1000.0)
+            table.indices[channel] = indices
+            table.offsets_ms[channel] = offsets * 1000.0
+            table.windows_ms[channel] = window_ms
+
+            matched = indices >= 0
+            if channel in required:
+                valid &= matched
+            normalized = np.where(matched, np.abs(table.offsets_ms[channel]) / window_ms, 0.0)
+            worst = np.maximum(worst, normalized)
+
+        for channel in required:
+            if channel not in channel_timestamps:
+                valid[:] = False
+
+        table.quality = np.clip(1.0 - worst, 0.0, 1.0)
+        table.valid = valid
+        return table
+
+    def resync_recording(self, path: Union[str, Path], name: str = 'default',
+                         write: bool = True) -> SyncIndexTable:
+        """
+        Load channel timestamps, re-synchronize and store the index table
+
+        Args:
+            path: HDF5 recording
+            name: Table name (stored under /sync_index/<name>)
+            write: Write the table back into the recording
+
+        Returns:
+            SyncIndexTable
+        """
+        channel_timestamps = load_channel_timestamps(path)
+        table = self.synchronize(channel_timestamps)
+        if write:
+            write_sync_index(path, table, name)
+        return table
+
+
+def load_channel_timestamps(path: Union[str, Path]) -> Dict[str, np.ndarray]:
+    """
+    Per-channel timestamp arrays of an HDF5 recording
+
+    Args:
+        path: HDF5 recording
+
+    Returns:
+        Dict mapping channel names to timestamp arrays; for DataRecorder
+        groups, array index i is recorded frame i (NaN where the frame has
+        no sample of that channel)
+    """
+    import h5py  # Deferred: keeps `import lcps_tool.layer2` free of h5py
+    channels: Dict[str, np.ndarray] = {}
+    with h5py.File(path, 'r') as h5file:
+        # Raw channel recordings: any group with a 'timestamps' dataset
+        def visit(name: str, obj) -> None:
+            if isinstance(obj, h5py.Dataset) and name.endswith('/timestamps') \
+                    and not name.startswith('sync_index/'):
+                channel = name[:-len('/timestamps')].split('/')[-1]
+                channels[channel] = obj[()].astype(np.float64)
+        h5file.visititems(visit)
+
+        # DataRecorder recordings: one frames x channels dataset
+        if 'channel_timestamps' in h5file:
+            dataset = h5file['channel_timestamps']
+            recorded = dataset[()].astype(np.float64)
+            for column, channel in enumerate(json.loads(dataset.attrs['columns'])):
+                if channel not in channels and np.isfinite(recorded[:, column]).any():
+                    channels[channel] = recorded[:, column]
+        else:
+            # Older DataRecorder recordings: per-frame 'timestamp' attributes
+            frame_count = len(h5file['timestamps']) if 'timestamps' in h5file else 0
+            for group_name, channel in _RECORDER_CHANNELS.items():
+                if group_name not in h5file or channel in channels:
+                    continue
+                group = h5file[group_name]
+                timestamps = np.full(frame_count, np.nan)
+                found = False
+                for member, obj in group.items():
+                    if 'timestamp' not in obj.attrs or not member.startswith('frame_'):
+                        continue
+                    index = int(member[len('frame_'):])
+                    if index >= len(timestamps):
+                        timestamps = np.concatenate([timestamps, np.full(index + 1 - len(timestamps), np.nan)])
+                    timestamps[index] = obj.attrs['timestamp']
+                    found = True
+                if found:
+                    channels[channel] = timestamps
+
+    # Missing samples can never match
+    return {channel: np.where(np.isnan(ts), np.inf, ts) for channel, ts in channels.items()}
+
+
+def write_sync_index(path: Union[str, Path], table: SyncIndexTable, name: str = 'default') -> None:
+    """
+    Store a sync index table in an HDF5 recording
+
+    Layout (/sync_index/<name>, replaced if present):
+        timestamps, quality, valid          (N datasets)
+        <channel>/index, <channel>/offset_ms (N datasets per channel)
+        attrs: reference, windows_ms (JSON), valid_count
+
+    Args:
+        path: HDF5 recording
+        table: Table to store
+        name: Table name
+    """
+    import h5py
+    with h5py.File(path, 'a') as h5file:
+        root = h5file.require_group('sync_index')
+        if name in root:
+            del root[name]
+        group = root.create_group(name)
+        group.attrs['reference'] = table.reference
+        group.attrs['windows_ms'] = json.dumps(table.windows_ms)
+        group.attrs['valid_count'] = table.valid_count
+
+        group.create_dataset('timestamps', data=table.timestamps, compression='gzip')
+        group.create_dataset('quality', data=table.quality.astype(np.float32), compression='gzip')
+        group.create_dataset('valid', data=table.valid, compression='gzip')
+        for channel in table.indices:
+            channel_group = group.create_group(channel)
+            channel_group.create_dataset('index', data=table.indices[channel], compression='gzip')
+            channel_group.create_dataset('offset_ms', data=table.offsets_ms[channel].astype(np.float32),
+                                         compression='gzip')
+
+
+def read_sync_index(path: Union[str, Path], name: str = 'default') -> SyncIndexTable:
+    """
+    Load a sync index table written by write_sync_index
+
+    Args:
+        path: HDF5 recording
+        name: Table name
+
+    Returns:
+        SyncIndexTable
+    """
+    import h5py
+    with h5py.File(path, 'r') as h5file:
+        group = h5file['sync_index'][name]
+        table = SyncIndexTable(
+            reference=str(group.attrs['reference']),
+            timestamps=group['timestamps'][()],
+            quality=group['quality'][()].astype(np.float64),
+            valid=group['valid'][()],
+            windows_ms=json.loads(group.attrs['windows_ms']),
+        )
+        for channel in table.windows_ms:
+            table.indices[channel] = group[channel]['index'][()]
+            table.offsets_ms[channel] = group[channel]['offset_ms'][()].astype(np.float64)
+    return table
+
+
+def list_sync_indexes(path: Union[str, Path]) -> List[str]:
+    """Names of the sync index tables stored in a recording"""
+    import h5py
+    with h5py.File(path, 'r') as h5file:
+        return sorted(h5file['sync_index']) if 'sync_index' in h5file else []
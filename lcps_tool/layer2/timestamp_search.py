@@ -0,0 +1,25 @@
+"""
+Timestamp Search - Nearest-neighbour lookup on sorted timestamps
+
+Shared by the online clock offset estimation (ClockOffsetEstimator) and
+the offline re-synchronization (OfflineSynchronizer).
+"""
+
+import numpy as np
+
+
+def nearest_indices(sorted_timestamps: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """
+    Index of the nearest sorted timestamp for every target
+
+    Args:
+        sorted_timestamps: M sorted timestamps (M > 0)
+        targets: N target timestamps
+
+    Returns:
+        N indices into sorted_timestamps (ties go to the earlier sample)
+    """
+    right = np.minimum(np.searchsorted(sorted_timestamps, targets), len(sorted_timestamps) - 1)
+    left = np.maximum(right - 1, 0)
+    closer_left = np.abs(targets - sorted_timestamps[left]) <= np.abs(sorted_timestamps[right] - targets)
+    return np.where(closer_left, left, right)
@@ -0,0 +1,33 @@
+"""
+Layer 3: Analysis
+
+Incremental SyncedFrame analyzers, usable live or over recordings.
+"""
+
+from .anomaly_detectors import (
+    Anomaly,
+    AnomalyDetector,
+    DangerZone,
+    FalseAlarmDetector,
+    MissedAlertDetector,
+    create_anomaly_detectors,
+    detect_anomalies,
+)
+from .base_analyzer import FrameAnalyzer
+from .clearance import ClearanceAnalyzer, ClearanceResult
+from .point_membership import PointMembershipAnalyzer, PointMembershipResult
+
+__all__ = [
+    'Anomaly',
+    'AnomalyDetector',
+    'ClearanceAnalyzer',
+    'ClearanceResult',
+    'DangerZone',
+    'FalseAlarmDetector',
+    'FrameAnalyzer',
+    'MissedAlertDetector',
+    'PointMembershipAnalyzer',
+    'PointMembershipResult',
+    'create_anomaly_detectors',
+    'detect_anomalies',
+]
@@ -0,0 +1,491 @@
+"""
+Anomaly Detectors - Missed-alert and false-alarm detection
+
+Implements MissedAlertDetector and FalseAlarmDetector from
+docs/design/LCPS_CLIENT_ANOMALY_DETECTION.md as incremental FrameAnalyzers:
+- Per-frame checks are vectorized (zone masks, point-in-OBB counts)
+- Temporal state (consecutive-frame counters, alert onset window) is
+  O(1) amortized per frame
+- The same detector runs live on DataSynchronizer output or in batch
+  mode over a DataReplayer (see detect_anomalies)
+"""
+
+from abc import abstractmethod
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from ..data_models.synced_frame import SyncedFrame
+from ..geometry.obb_batch import OBBBatch
+from ..geometry.point_in_obb import points_in_obbs
+from .base_analyzer import FrameAnalyzer, frame_obb_batch, frame_points
+
+# LCPS states in which the system is running detection (see LCPSState)
+ACTIVE_STATES = ('detecting', 'alerting')
+
+
+@dataclass
+class Anomaly:
+    """
+    Detected anomaly
+
+    Attributes:
+        type: Anomaly type (e.g. "missed_alert", "false_alarm")
+        severity: "critical", "high", "medium" or "low"
+        timestamp: Frame timestamp
+        frame_id: Frame sequence number
+        message: Human-readable description
+        zone_id: Danger zone id (zone-related anomalies)
+        obb_index: Index of the OBB in the frame (OBB-related anomalies)
+        details: Additional measured values
+    """
+
+    type: str
+    severity: str
+    timestamp: float
+    frame_id: int
+    message: str
+    zone_id: Optional[str] = None
+    obb_index: Optional[int] = None
+    details: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary (for JSON serialization)"""
+        return {
+            'type': self.type,
+            'severity': self.severity,
+            'timestamp': self.timestamp,
+            'frame_id': self.frame_id,
+            'message': self.message,
+            'zone_id': self.zone_id,
+            'obb_index': self.obb_index,
+            'details': self.details,
+        }
+
+
+@dataclass
+class DangerZone:
+    """
+    Axis-aligned box danger zone (config type "box")
+
+    Attributes:
+        id: Zone id
+        name: Display name
+        min_bound: [min_x, min_y, min_z]
+        max_bound: [max_x, max_y, max_z]
+    """
+
+    id: str
+    name: str
+    min_bound: np.ndarray
+    max_bound: np.ndarray
+
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> 'DangerZone':
+        """
+        Create from a config dict (min_x ... max_z keys)
+
+        Raises:
+            ValueError: If the zone type is not "box"
+        """
+        zone_type = config.get('type', 'box')
+        if zone_type != 'box':
+            raise ValueError(f"Unsupported danger zone type: {zone_type}. Only 'box' is supported")
+        return cls(
+            id=str(config['id']),
+            name=config.get('name', str(config['id'])),
+            min_bound=np.array([config['min_x'], config['min_y'], config['min_z']], dtype=np.float64),
+            max_bound=np.array([config['max_x'], config['max_y'], config['max_z']], dtype=np.float64),
+        )
+
+    def contains(self, points: np.ndarray) -> np.ndarray:
+        """Mask of points inside the zone"""
+        return np.all((points >= self.min_bound) & (points <= self.max_bound), axis=1)
+
+
+class AnomalyDetector(FrameAnalyzer):
+    """
+    Base class for anomaly detectors
+
+    Subclasses implement detect(); analyze_frame() returns its anomalies and
+    keeps per-type counts.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.anomaly_counts: Dict[str, int] = {}
+
+    @abstractmethod
+    def detect(self, frame: SyncedFrame) -> List[Anomaly]:
+        """
+        Detect anomalies in one frame (implemented by subclasses)
+
+        Args:
+            frame: Synchronized frame
+
+        Returns:
+            Detected anomalies (empty list if none)
+        """
+        pass
+
+    def analyze_frame(self, frame: SyncedFrame) -> List[Anomaly]:
+        """Run detect() and count anomalies by type"""
+        anomalies = self.detect(frame)
+        for anomaly in anomalies:
+            self.anomaly_counts[anomaly.type] = self.anomaly_counts.get(anomaly.type, 0) + 1
+        return anomalies
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get detector statistics"""
+        stats = super().get_statistics()
+        stats['anomaly_counts'] = dict(self.anomaly_counts)
+        stats['total_anomalies'] = sum(self.anomaly_counts.values())
+        return stats
+
+    def reset(self) -> None:
+        """Reset statistics and temporal state"""
+        super().reset()
+        self.anomaly_counts = {}
+
+
+class MissedAlertDetector(AnomalyDetector):
+    """
+    Missed-alert detector (should have alerted, but did not)
+
+    Checks per frame:
+    1. Zone coverage: a danger zone holds >= min_points points, but no OBB
+       (with confidence >= min_confidence) is centered in it -> "missed_alert"
+       (critical). If OBBs exist in the zone but none is flagged as a
+       collision and LCPS is not alerting -> "missed_alarm" (high).
+    2. Lifecycle: obstacles are present but LCPS is not in an active
+       state -> "lifecycle_error" (critical).
+
+    A condition must hold for min_consecutive_frames frames in a row before
+    it is reported (debounces single-frame point cloud noise); it is then
+    reported once per episode.
+
+    Config keys (design doc section 2.3):
+        danger_zones: List of box zone dicts
+        min_points: Points in a zone that indicate an obstacle (default 50)
+        min_confidence: Minimum OBB confidence (default 0.7; OBBs without a
+            confidence field count as 1.0)
+        min_consecutive_frames: Debounce length (default 1)
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Initialize detector
+
+        Args:
+            config: Detector config (see class docstring)
+        """
+        super().__init__("MissedAlert")
+        self.danger_zones = [DangerZone.from_dict(z) for z in config.get('danger_zones', [])]
+        self.min_points = config.get('min_points', 50)
+        self.min_confidence = config.get('min_confidence', 0.7)
+        self.min_consecutive_frames = max(1, config.get('min_consecutive_frames', 1))
+
+        # Zone bounds stacked for one vectorized pass over all zones
+        if self.danger_zones:
+            self._zone_min = np.stack([z.min_bound for z in self.danger_zones])
+            self._zone_max = np.stack([z.max_bound for z in self.danger_zones])
+        else:
+            self._zone_min = self._zone_max = np.empty((0, 3))
+
+        # Consecutive-frame counters per condition key
+        self._streaks: Dict[Any, int] = {}
+
+    def _zone_masks(self, points: np.ndarray) -> np.ndarray:
+        """Z x N mask of points inside each zone"""
+        return np.all((points[None, :, :] >= self._zone_min[:, None, :]) &
+                      (points[None, :, :] <= self._zone_max[:, None, :]), axis=2)
+
+    def _debounce(self, key: Any, active: bool) -> bool:
+        """Update the streak for key; True exactly when it reaches the threshold"""
+        if not active:
+            self._streaks.pop(key, None)
+            return False
+        streak = self._streaks.get(key, 0) + 1
+        self._streaks[key] = streak
+        return streak == self.min_consecutive_frames
+
+    def detect(self, frame: SyncedFrame) -> List[Anomaly]:
+        """Run zone coverage and lifecycle checks"""
+        anomalies: List[Anomaly] = []
+        points = frame_points(frame)
+        batch = frame_obb_batch(frame)
+        state = frame.get_status_state()
+
+        zone_point_counts = np.zeros(len(self.danger_zones), dtype=np.int64)
+        if points is not None and len(points) and self.danger_zones:
+            zone_point_counts = self._zone_masks(points).sum(axis=1)
+
+        obb_in_zone = np.zeros((len(self.danger_zones), 0), dtype=bool)
+        alerting_obb = np.zeros(0, dtype=bool)
+        if batch is not None and len(batch) and self.danger_zones:
+            confidence = np.array([obb.get('confidence', 1.0) for obb in frame.obb_data.get('obbs', [])],
+                                  dtype=np.float64)
+            obb_in_zone = self._zone_masks(batch.positions) & (confidence >= self.min_confidence)[None, :]
+            alerting_obb = batch.collision != 0
+
+        # 1. Zone coverage
+        for z, zone in enumerate(self.danger_zones):
+            occupied = zone_point_counts[z] >= self.min_points
+            zone_obbs = obb_in_zone[z]
+            has_obb = bool(zone_obbs.any())
+
+            if self._debounce(('missed_alert', zone.id), occupied and not has_obb):
+                anomalies.append(Anomaly(
+                    type='missed_alert',
+                    severity='critical',
+                    timestamp=frame.timestamp,
+                    frame_id=frame.frame_id,
+                    zone_id=zone.id,
+                    message=f"危险区域 {zone.name} 有 {zone_point_counts[z]} 个点，但未生成OBB",
+                    details={'point_count': int(zone_point_counts[z]), 'obb_count': 0},
+                ))
+
+            no_alarm = (occupied and has_obb and not bool(alerting_obb[zone_obbs].any())
+                        and state is not None and state != 'alerting')
+            if self._debounce(('missed_alarm', zone.id), no_alarm):
+                anomalies.append(Anomaly(
+                    type='missed_alarm',
+                    severity='high',
+                    timestamp=frame.timestamp,
+                    frame_id=frame.frame_id,
+                    zone_id=zone.id,
+                    message=f"危险区域 {zone.name} 有障碍物OBB，但LCPS未报警 (状态 {state})",
+                    details={'point_count': int(zone_point_counts[z]),
+                             'obb_count': int(zone_obbs.sum()), 'state': state},
+                ))
+
+        # 2. Lifecycle: obstacles present but LCPS not running detection
+        should_be_active = ((batch is not None and len(batch) > 0) or
+                            bool(np.any(zone_point_counts > self.min_points)))
+        inactive = should_be_active and state is not None and state not in ACTIVE_STATES
+        if self._debounce('lifecycle_error', inactive):
+            anomalies.append(Anomaly(
+                type='lifecycle_error',
+                severity='critical',
+                timestamp=frame.timestamp,
+                frame_id=frame.frame_id,
+                message=f"LCPS应激活但当前状态为 {state}",
+                details={'expected_state': 'detecting/alerting', 'actual_state': state},
+            ))
+
+        return anomalies
+
+    def reset(self) -> None:
+        """Reset statistics and streaks"""
+        super().reset()
+        self._streaks = {}
+
+
+class FalseAlarmDetector(AnomalyDetector):
+    """
+    False-alarm detector (alerted, but should not have)
+
+    Checks per frame:
+    1. Point cloud support: points inside each alerting OBB
+       (collision_status != 0) grown by support_margin (vectorized
+       point-in-OBB); fewer than min_support_points -> "false_alarm"
+       (medium); enough points but density below min_density points/m^3
+       over the grown box -> "false_alarm_suspect" (low). Reported once per
+       episode: an OBB is reported again only after it was supported (or
+       gone) in between. OBBs are identified by track_id when tracked
+       (OBBTracker), otherwise by their index in the frame.
+    2. Alert frequency: alert onsets (frames switching from no alert to
+       alert) within the last frequency_window_s seconds; above
+       max_alert_frequency Hz -> "false_alarm_high_frequency" (medium),
+       reported once per episode. The onset window is a deque, O(1)
+       amortized per frame.
+
+    Config keys (design doc section 3, adapted):
+        min_support_points: Default 20
+        support_margin: Box growth in meters (default 0.5; replaces the
+            doc's center radius so elongated boxes are judged fairly)
+        min_density: Points per m^3 (default 0.1)
+        max_alert_frequency: Alert onsets per second (default 2.0)
+        frequency_window_s: Onset window length (default 5.0)
+        only_alerting: Check support only for OBBs with collision_status != 0
+            (default True; False also checks OBBs that never alerted, e.g.
+            to audit detection quality)
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize detector
+
+        Args:
+            config: Detector config (see class docstring)
+        """
+        super().__init__("FalseAlarm")
+        config = config or {}
+        self.min_support_points = config.get('min_support_points', 20)
+        self.support_margin = config.get('support_margin', 0.5)
+        self.min_density = config.get('min_density', 0.1)
+        self.max_alert_frequency = config.get('max_alert_frequency', 2.0)
+        self.frequency_window_s = config.get('frequency_window_s', 5.0)
+        self.only_alerting = config.get('only_alerting', True)
+
+        # OBB keys of the ongoing support episodes, per anomaly type
+        self._support_episodes: Dict[str, set] = {'false_alarm': set(), 'false_alarm_suspect': set()}
+
+        self._alert_onsets: deque = deque()
+        self._was_alerting = False
+        self._high_frequency = False
+
+    def detect(self, frame: SyncedFrame) -> List[Anomaly]:
+        """Run support and alert frequency checks"""
+        anomalies = self._check_support(frame)
+        frequency_anomaly = self._check_alert_frequency(frame)
+        if frequency_anomaly:
+            anomalies.append(frequency_anomaly)
+        return anomalies
+
+    def _check_support(self, frame: SyncedFrame) -> List[Anomaly]:
+        """OBB / point cloud consistency"""
+        batch = frame_obb_batch(frame)
+        points = frame_points(frame)
+        if batch is None or points is None:
+            return []  # Cannot judge: ongoing episodes continue
+        if len(batch) == 0:
+            for keys in self._support_episodes.values():
+                keys.clear()
+            return []
+
+        counts = points_in_obbs(points, batch, margin=self.support_margin)
+        volumes = np.prod(batch.sizes + 2.0 * self.support_margin, axis=1)
+        density = counts / np.maximum(volumes, 1e-9)
+
+        checked = batch.collision != 0 if self.only_alerting else np.ones(len(batch), dtype=bool)
+        unsupported = checked & (counts < self.min_support_points)
+        sparse = checked & ~unsupported & (density < self.min_density)
+
+        anomalies = []
+        for i in self._episode_onsets('false_alarm', batch, unsupported):
+            anomalies.append(Anomaly(
+                type='false_alarm',
+                severity='medium',
+                timestamp=frame.timestamp,
+                frame_id=frame.frame_id,
+                obb_index=int(i),
+                message=f"OBB {i} ({batch.types[i]}) 仅有 {counts[i]} 个支持点",
+                details={'support_points': int(counts[i]),
+                         'required_points': self.min_support_points},
+            ))
+        for i in self._episode_onsets('false_alarm_suspect', batch, sparse):
+            anomalies.append(Anomaly(
+                type='false_alarm_suspect',
+                severity='low',
+                timestamp=frame.timestamp,
+                frame_id=frame.frame_id,
+                obb_index=int(i),
+                message=f"OBB {i} ({batch.types[i]}) 周围点云密度过低 ({density[i]:.3f})",
+                details={'density': float(density[i]), 'support_points': int(counts[i])},
+            ))
+        return anomalies
+
+    def _episode_onsets(self, anomaly_type: str, batch: OBBBatch, mask: np.ndarray) -> List[int]:
+        """Indices of masked OBBs whose episode starts in this frame"""
+        keys = {}
+        for i in np.flatnonzero(mask):
+            track_id = int(batch.track_ids[i])
+            keys[track_id if track_id >= 0 else ('index', int(i))] = int(i)
+        ongoing = self._support_episodes[anomaly_type]
+        self._support_episodes[anomaly_type] = set(keys)
+        return [i for key, i in keys.items() if key not in ongoing]
+
+    def _is_alerting(self, frame: SyncedFrame) -> bool:
+        """Frame carries an alert (LCPS alerting state or a colliding OBB)"""
+        if frame.get_status_state() == 'alerting':
+            return True
+        if frame.has_obb():
+            return any(obb.get('collision_status', 0) != 0 for obb in frame.obb_data.get('obbs', []))
+        return False
+
+    def _check_alert_frequency(self, frame: SyncedFrame) -> Optional[Anomaly]:
+        """Alert onset rate over a sliding window"""
+        alerting = self._is_alerting(frame)
+        if alerting and not self._was_alerting:
+            self._alert_onsets.append(frame.timestamp)
+        self._was_alerting = alerting
+
+        # Drop onsets that left the window
+        horizon = frame.timestamp - self.frequency_window_s
+        while self._alert_onsets and self._alert_onsets[0] < horizon:
+            self._alert_onsets.popleft()
+
+        frequency = len(self._alert_onsets) / self.frequency_window_s
+        too_frequent = frequency > self.max_alert_frequency
+        report = too_frequent and not self._high_frequency
+        self._high_frequency = too_frequent
+        if not report:
+            return None
+
+        return Anomaly(
+            type='false_alarm_high_frequency',
+            severity='medium',
+            timestamp=frame.timestamp,
+            frame_id=frame.frame_id,
+            message=f"报警频率过高: {frequency:.1f} Hz (阈值 {self.max_alert_frequency} Hz)",
+            details={'alert_onsets': len(self._alert_onsets), 'frequency_hz': frequency,
+                     'threshold_hz': self.max_alert_frequency},
+        )
+
+    def reset(self) -> None:
+        """Reset statistics, support episodes and alert window"""
+        super().reset()
+        for keys in self._support_episodes.values():
+            keys.clear()
+        self._alert_onsets.clear()
+        self._was_alerting = False
+        self._high_frequency = False
+
+
+def create_anomaly_detectors(config: Dict[str, Any]) -> List[AnomalyDetector]:
+    """
+    Create detectors from a config dict (design doc section 6 layout)
+
+    Accepts either the full document ({"anomaly_detection": {...}}) or its
+    content; sections with "enabled": false are skipped.
+
+    Args:
+        config: Config dict with "missed_alert" / "false_alarm" sections
+
+    Returns:
+        Enabled detectors
+    """
+    config = config.get('anomaly_detection', config)
+    if not config.get('enabled', True):
+        return []
+
+    detectors: List[AnomalyDetector] = []
+    missed = config.get('missed_alert')
+    if missed is not None and missed.get('enabled', True):
+        detectors.append(MissedAlertDetector(missed))
+    false_alarm = config.get('false_alarm')
+    if false_alarm is not None and false_alarm.get('enabled', True):
+        detectors.append(FalseAlarmDetector(false_alarm))
+    return detectors
+
+
+def detect_anomalies(frames: Iterable[SyncedFrame],
+                     detectors: List[AnomalyDetector]) -> List[Anomaly]:
+    """
+    Run detectors over a frame sequence (batch mode, e.g. a DataReplayer)
+
+    Args:
+        frames: Frames in timestamp order
+        detectors: Detectors to run on every frame
+
+    Returns:
+        All anomalies in frame order
+    """
+    anomalies: List[Anomaly] = []
+    for frame in frames:
+        for detector in detectors:
+            anomalies.extend(detector.process_frame(frame))
+    return anomalies
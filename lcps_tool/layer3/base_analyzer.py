@@ -0,0 +1,119 @@
+"""
+Base Analyzer - Abstract base class for frame analyzers
+
+Analyzers consume SyncedFrames one at a time, so the same analyzer runs:
+- Live, fed from DataSynchronizer in the main loop (alongside recording)
+- Offline, fed from DataReplayer over a recording (batch mode)
+"""
+
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+import numpy as np
+
+from ..data_models.synced_frame import SyncedFrame
+from ..geometry.obb_batch import OBBBatch
+
+
+class FrameAnalyzer(ABC):
+    """
+    Abstract base class for SyncedFrame analyzers
+
+    Subclasses implement analyze_frame(); process_frame() wraps it with
+    timing statistics. analyze() runs the analyzer over any iterable of
+    frames (e.g. a DataReplayer) and yields the per-frame results.
+    """
+
+    def __init__(self, name: str):
+        """
+        Initialize analyzer
+
+        Args:
+            name: Analyzer name for logging and statistics
+        """
+        self.name = name
+        self.frames_processed = 0
+        self.total_time_s = 0.0
+        self.max_time_s = 0.0
+
+    @abstractmethod
+    def analyze_frame(self, frame: SyncedFrame) -> Any:
+        """
+        Analyze one frame (implemented by subclasses)
+
+        Args:
+            frame: Synchronized frame
+
+        Returns:
+            Analyzer-specific result (None if the frame lacks required data)
+        """
+        pass
+
+    def process_frame(self, frame: SyncedFrame) -> Any:
+        """
+        Analyze one frame and update timing statistics
+
+        Args:
+            frame: Synchronized frame
+
+        Returns:
+            Result of analyze_frame()
+        """
+        start = time.perf_counter()
+        result = self.analyze_frame(frame)
+        elapsed = time.perf_counter() - start
+
+        self.frames_processed += 1
+        self.total_time_s += elapsed
+        self.max_time_s = max(self.max_time_s, elapsed)
+        return result
+
+    def analyze(self, frames: Iterable[SyncedFrame]) -> Iterator[Any]:
+        """
+        Run over a frame sequence (batch mode)
+
+        Args:
+            frames: Frames, e.g. a DataReplayer
+
+        Yields:
+            Per-frame results
+        """
+        for frame in frames:
+            yield self.process_frame(frame)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get analyzer statistics"""
+        return {
+            'name': self.name,
+            'frames_processed': self.frames_processed,
+            'avg_time_ms': (self.total_time_s / self.frames_processed * 1000.0)
+                           if self.frames_processed > 0 else 0.0,
+            'max_time_ms': self.max_time_s * 1000.0,
+        }
+
+    def reset(self) -> None:
+        """Reset statistics and internal state"""
+        self.frames_processed = 0
+        self.total_time_s = 0.0
+        self.max_time_s = 0.0
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} name={self.name} frames={self.frames_processed}>"
+
+
+def frame_obb_batch(frame: SyncedFrame) -> Optional[OBBBatch]:
+    """OBBs of a frame as an OBBBatch (None if the frame has no OBB data)"""
+    if not frame.has_obb():
+        return None
+    return OBBBatch.from_dicts(frame.obb_data.get('obbs', []))
+
+
+def frame_points(frame: SyncedFrame) -> Optional[np.ndarray]:
+    """Point cloud of a frame as an Nx3 array (None if the frame has no points)"""
+    if not frame.has_pointcloud():
+        return None
+    points = frame.pointcloud_data.get('points')
+    if points is None:
+        return None
+    return np.asarray(points, dtype=np.float64).reshape(-1, 3)
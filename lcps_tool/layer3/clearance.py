@@ -0,0 +1,136 @@
+"""
+Clearance Analyzer - Minimum distance between selected OBBs and the point cloud
+
+For every synchronized frame, rebuilds a voxel-hash PointCloudIndex over
+the (downsampled) point cloud, reusing the voxel keys computed by
+PointCloudReceiver, and measures the distance from each selected box
+(by default the spreader) to its nearest point.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional
+
+import numpy as np
+
+from ..data_models.synced_frame import SyncedFrame
+from ..geometry.spatial_index import PointCloudIndex
+from .base_analyzer import FrameAnalyzer, frame_obb_batch, frame_points
+
+
+@dataclass
+class ClearanceResult:
+    """
+    Clearance of one frame
+
+    Attributes:
+        timestamp: Frame timestamp
+        frame_id: Frame sequence number
+        box_indices: Indices (into the frame's OBB list) of the measured boxes
+        clearances: Distance from each measured box to its nearest point
+            (0 = points inside the box, inf = nothing within max_distance)
+        nearest_points: Index of the nearest point per measured box (-1 if none)
+    """
+
+    timestamp: float
+    frame_id: int
+    box_indices: np.ndarray
+    clearances: np.ndarray
+    nearest_points: np.ndarray
+
+    @property
+    def min_clearance(self) -> float:
+        """Smallest clearance of the frame (inf if no box or no point in range)"""
+        return float(self.clearances.min()) if len(self.clearances) else float('inf')
+
+
+class ClearanceAnalyzer(FrameAnalyzer):
+    """
+    Per-frame minimum clearance between OBBs and the point cloud
+
+    Usage:
+        analyzer = ClearanceAnalyzer(obb_types=('spreader',), voxel_size=0.1)
+        result = analyzer.process_frame(synced_frame)
+        result.min_clearance
+
+    Parameters:
+        obb_types: OBB types to measure (None = all boxes)
+        max_distance: Search distance around each box (meters)
+        voxel_size: Index cell size; matching the receiver's downsampling
+            voxel size reuses its voxel keys (other sizes recompute them)
+    """
+
+    def __init__(self,
+                 obb_types: Optional[Iterable[str]] = ('spreader',),
+                 max_distance: float = 5.0,
+                 voxel_size: float = 0.1):
+        """
+        Initialize analyzer
+
+        Args:
+            obb_types: OBB types to measure (None = all boxes)
+            max_distance: Search distance around each box (meters)
+            voxel_size: Index cell size (meters)
+        """
+        super().__init__("Clearance")
+        self.obb_types = set(obb_types) if obb_types is not None else None
+        self.max_distance = max_distance
+        self.index = PointCloudIndex(voxel_size)
+
+        self.frames_with_clearance = 0
+        self.min_clearance = float('inf')
+        self._sum_min_clearance = 0.0
+        self._frames_in_range = 0
+
+    def analyze_frame(self, frame: SyncedFrame) -> Optional[ClearanceResult]:
+        """
+        Measure the clearance of the selected boxes
+
+        Args:
+            frame: Synchronized frame
+
+        Returns:
+            ClearanceResult, or None if the frame lacks OBBs or points
+        """
+        batch = frame_obb_batch(frame)
+        points = frame_points(frame)
+        if batch is None or points is None:
+            return None
+
+        if self.obb_types is None:
+            box_indices = np.arange(len(batch))
+        else:
+            box_indices = np.array([i for i, t in enumerate(batch.types) if t in self.obb_types],
+                                   dtype=np.intp)
+
+        pointcloud_data = frame.pointcloud_data
+        self.index.rebuild(points, pointcloud_data.get('voxel_keys'), pointcloud_data.get('voxel_size'))
+        clearances, nearest = self.index.obb_clearance(batch.select(box_indices), self.max_distance)
+
+        result = ClearanceResult(frame.timestamp, frame.frame_id, box_indices, clearances, nearest)
+        self.frames_with_clearance += 1
+        frame_min = result.min_clearance
+        if np.isfinite(frame_min):
+            self.min_clearance = min(self.min_clearance, frame_min)
+            self._sum_min_clearance += frame_min
+            self._frames_in_range += 1
+        return result
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get analyzer statistics"""
+        stats = super().get_statistics()
+        stats.update({
+            'frames_with_clearance': self.frames_with_clearance,
+            'frames_in_range': self._frames_in_range,
+            'min_clearance': self.min_clearance,
+            'avg_min_clearance': (self._sum_min_clearance / self._frames_in_range)
+                                 if self._frames_in_range > 0 else float('inf'),
+        })
+        return stats
+
+    def reset(self) -> None:
+        """Reset statistics"""
+        super().reset()
+        self.frames_with_clearance = 0
+        self.min_clearance = float('inf')
+        self._sum_min_clearance = 0.0
+        self._frames_in_range = 0
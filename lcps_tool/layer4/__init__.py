@@ -0,0 +1,9 @@
+"""
+Layer 4: Visualization
+
+Offscreen rendering of the OBB/point view for display-less environments.
+"""
+
+from .headless_renderer import FrameWriter, SoftwareRasterizer, encode_png, render_sequence
+
+__all__ = ['FrameWriter', 'SoftwareRasterizer', 'encode_png', 'render_sequence']
@@ -0,0 +1,403 @@
+"""
+Headless Renderer - Offscreen OBB/point rendering without a display
+
+Pure NumPy software rasterizer reproducing the viewers' OpenGL view
+(gluPerspective(45, w/h, 0.1, 50), orbit camera at distance 5, wireframe
+boxes colored by collision status, point cloud, coordinate axes), plus a
+background-process frame writer:
+- PNG image sequence (stdlib zlib encoder, no PIL needed)
+- MP4/MKV/AVI video (frames piped to an ffmpeg subprocess)
+
+Designed for CI and display-less servers: no pygame, PyOpenGL, OSMesa or
+EGL is required.
+"""
+
+import multiprocessing as mp
+import queue
+import shutil
+import struct
+import subprocess
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..geometry.frustum import perspective_matrix, viewer_modelview_matrix
+from ..geometry.obb_batch import OBBBatch
+
+# Unit cube edges as corner index pairs (corner i = bits (x, y, z) of i)
+_CUBE_EDGES = np.array([
+    (0, 1), (2, 3), (4, 5), (6, 7),  # z edges
+    (0, 2), (1, 3), (4, 6), (5, 7),  # y edges
+    (0, 4), (1, 5), (2, 6), (3, 7),  # x edges
+], dtype=np.intp)
+
+_VIDEO_SUFFIXES = ('.mp4', '.mkv', '.avi', '.mov')
+
+Color = Tuple[int, int, int]
+
+
+def encode_png(image: np.ndarray) -> bytes:
+    """
+    Encode an HxWx3 uint8 RGB image as PNG
+
+    Args:
+        image: HxWx3 uint8 array
+
+    Returns:
+        PNG file bytes
+    """
+    height, width = image.shape[:2]
+    # Filter type 0 (None) byte in front of every scanline
+    raw = np.zeros((height, width * 3 + 1), dtype=np.uint8)
+    raw[:, 1:] = image.reshape(height, width * 3)
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return (struct.pack('>I', len(data)) + tag + data +
+                struct.pack('>I', zlib.crc32(tag + data) & 0xFFFFFFFF))
+
+    header = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)
+    return (b'\x89PNG\r\n\x1a\n' +
+            chunk(b'IHDR', header) +
+            chunk(b'IDAT', zlib.compress(raw.tobytes(), 6)) +
+            chunk(b'IEND', b''))
+
+
+class SoftwareRasterizer:
+    """
+    NumPy rasterizer for the viewers' wireframe OBB / point scene
+
+    Parameters:
+        width: Image width in pixels
+        height: Image height in pixels
+        fovy_deg: Vertical field of view (gluPerspective)
+        near: Near clip distance
+        far: Far clip distance
+        camera_distance: Orbit camera distance (glTranslatef(0, 0, -d))
+    """
+
+    COLLISION_COLOR: Color = (255, 0, 0)
+    SAFE_COLOR: Color = (0, 255, 0)
+    POINT_COLOR: Color = (178, 178, 178)
+    BACKGROUND: Color = (0, 0, 0)
+
+    def __init__(self,
+                 width: int = 800,
+                 height: int = 600,
+                 fovy_deg: float = 45.0,
+                 near: float = 0.1,
+                 far: float = 50.0,
+                 camera_distance: float = 5.0):
+        self.width = width
+        self.height = height
+        self.projection = perspective_matrix(fovy_deg, width / height, near, far)
+        self.camera_distance = camera_distance
+        self._image = np.empty((height, width, 3), dtype=np.uint8)
+
+    def render(self,
+               obb_batch: Optional[OBBBatch] = None,
+               points: Optional[np.ndarray] = None,
+               scale: float = 1.0,
+               rotation: Sequence[float] = (0.0, 0.0)) -> np.ndarray:
+        """
+        Render one frame
+
+        Args:
+            obb_batch: Boxes to draw (colored by collision status)
+            points: Nx3 point cloud
+            scale: Zoom factor (viewer scale[0])
+            rotation: [rx, ry] in degrees (viewer rotation)
+
+        Returns:
+            HxWx3 uint8 RGB image (a new array per call)
+        """
+        mvp = self.projection @ viewer_modelview_matrix(scale, rotation, self.camera_distance)
+        image = self._image
+        image[:] = self.BACKGROUND
+
+        # Coordinate axes (unit length, red/green/blue)
+        origin = np.zeros((3, 3))
+        self._draw_segments(image, mvp, origin, np.eye(3),
+                            np.array([(255, 0, 0), (0, 255, 0), (0, 0, 255)], dtype=np.uint8))
+
+        if obb_batch is not None and len(obb_batch) > 0:
+            corners = obb_batch.corners()
+            starts = corners[:, _CUBE_EDGES[:, 0], :].reshape(-1, 3)
+            ends = corners[:, _CUBE_EDGES[:, 1], :].reshape(-1, 3)
+            box_colors = np.where((obb_batch.collision == 1)[:, None],
+                                  np.array(self.COLLISION_COLOR, dtype=np.uint8),
+                                  np.array(self.SAFE_COLOR, dtype=np.uint8))
+            self._draw_segments(image, mvp, starts, ends, np.repeat(box_colors, 12, axis=0))
+
+        if points is not None and len(points) > 0:
+            self._draw_points(image, mvp, np.asarray(points, dtype=np.float64).reshape(-1, 3))
+
+        return image.copy()
+
+    def _to_pixels(self, clip: np.ndarray) -> np.ndarray:
+        """Clip-space coordinates (w > 0) to floating pixel coordinates"""
+        ndc = clip[:, :2] / clip[:, 3:4]
+        px = (ndc[:, 0] + 1.0) * 0.5 * self.width
+        py = (1.0 - ndc[:, 1]) * 0.5 * self.height  # image rows grow downwards
+        return np.stack([px, py], axis=1)
+
+    def _draw_points(self, image: np.ndarray, mvp: np.ndarray, points: np.ndarray) -> None:
+        """Project and splat points (1 pixel each)"""
+        clip = np.c_[points, np.ones(len(points))] @ mvp.T
+        w = clip[:, 3]
+        inside = (w > 0) & np.all(np.abs(clip[:, :3]) <= w[:, None], axis=1)
+        if not inside.any():
+            return
+        pixels = self._to_pixels(clip[inside]).astype(np.intp)
+        x = np.clip(pixels[:, 0], 0, self.width - 1)
+        y = np.clip(pixels[:, 1], 0, self.height - 1)
+        image[y, x] = self.POINT_COLOR
+
+    def _draw_segments(self,
+                       image: np.ndarray,
+                       mvp: np.ndarray,
+                       starts: np.ndarray,
+                       ends: np.ndarray,
+                       colors: np.ndarray) -> None:
+        """
+        Rasterize 3D line segments
+
+        Segments are clipped against the near plane in clip space, then
+        sampled at one sample per pixel along their longer screen axis;
+        all samples of all segments are generated in one vectorized pass.
+        """
+        ones = np.ones((len(starts), 1))
+        c0 = np.hstack([starts, ones]) @ mvp.T
+        c1 = np.hstack([ends, ones]) @ mvp.T
+
+        # Near plane clipping: z_clip >= -w_clip
+        d0 = c0[:, 2] + c0[:, 3]
+        d1 = c1[:, 2] + c1[:, 3]
+        keep = (d0 >= 0) | (d1 >= 0)
+        c0, c1, d0, d1, colors = c0[keep], c1[keep], d0[keep], d1[keep], colors[keep]
+        if len(c0) == 0:
+            return
+
+        # At most one endpoint is behind the near plane, so d0 != d1 wherever clipping applies
+        denom = np.where(d0 == d1, 1.0, d0 - d1)
+        t0 = np.where(d0 < 0, d0 / denom, 0.0)
+        t1 = np.where(d1 < 0, -d1 / denom, 0.0)
+        c0, c1 = c0 + (c1 - c0) * t0[:, None], c1 + (c0 - c1) * t1[:, None]
+
+        p0 = self._to_pixels(c0)
+        p1 = self._to_pixels(c1)
+
+        # Samples per segment, capped so segments crossing the near plane
+        # cannot explode the sample count
+        length = np.max(np.abs(p1 - p0), axis=1)
+        max_samples = 2 * (self.width + self.height)
+        counts = np.minimum(np.ceil(length).astype(np.intp) + 1, max_samples)
+
+        segment = np.repeat(np.arange(len(counts)), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        frac = offsets / np.maximum(counts[segment] - 1, 1)
+        samples = p0[segment] + (p1[segment] - p0[segment]) * frac[:, None]
+
+        x = samples[:, 0].astype(np.intp)
+        y = samples[:, 1].astype(np.intp)
+        on_screen = (x >= 0) & (x < self.width) & (y >= 0) & (y < self.height)
+        image[y[on_screen], x[on_screen]] = colors[segment[on_screen]]
+
+
+def _frame_writer_process(frame_queue: mp.Queue,
+                          output: str,
+                          fps: float,
+                          result_queue: mp.Queue) -> None:
+    """Background process: consume frames and write PNGs or pipe to ffmpeg"""
+    output_path = Path(output)
+    is_video = output_path.suffix.lower() in _VIDEO_SUFFIXES
+    ffmpeg = None
+    frames_written = 0
+    start_time = time.perf_counter()
+    error = None
+
+    try:
+        if not is_video:
+            output_path.mkdir(parents=True, exist_ok=True)
+
+        while True:
+            frame = frame_queue.get()
+            if frame is None:
+                break
+
+            if is_video:
+                if ffmpeg is None:
+                    height, width = frame.shape[:2]
+                    ffmpeg = subprocess.Popen(
+                        ['ffmpeg', '-loglevel', 'error', '-y',
+                         '-f', 'rawvideo', '-pix_fmt', 'rgb24',
+                         '-s', f'{width}x{height}', '-r', str(fps), '-i', '-',
+                         '-pix_fmt', 'yuv420p', str(output_path)],
+                        stdin=subprocess.PIPE)
+                ffmpeg.stdin.write(frame.tobytes())
+            else:
+                (output_path / f'frame_{frames_written:06d}.png').write_bytes(encode_png(frame))
+
+            frames_written += 1
+    except Exception as e:
+        error = str(e)
+    finally:
+        if ffmpeg is not None:
+            ffmpeg.stdin.close()
+            ffmpeg.wait()
+
+    elapsed = time.perf_counter() - start_time
+    result_queue.put({
+        'frames_written': frames_written,
+        'elapsed_seconds': elapsed,
+        'fps': frames_written / elapsed if elapsed > 0 else 0.0,
+        'error': error,
+    })
+
+
+class FrameWriter:
+    """
+    Writes rendered frames from a background process
+
+    The output type is chosen by the path:
+    - *.mp4 / *.mkv / *.avi / *.mov: video encoded by ffmpeg
+    - anything else: directory of frame_000000.png, frame_000001.png, ...
+
+    The frame queue is bounded, so rendering is throttled to the encoder
+    rate instead of buffering unboundedly in memory. If the writer process
+    fails (ffmpeg error, disk full, ...), write() raises its error instead
+    of blocking on the full queue.
+
+    Parameters:
+        output: Output video path or PNG directory
+        fps: Video frame rate
+        queue_size: Maximum frames in flight to the writer process
+    """
+
+    def __init__(self, output: str, fps: float = 20.0, queue_size: int = 32):
+        if Path(output).suffix.lower() in _VIDEO_SUFFIXES and shutil.which('ffmpeg') is None:
+            raise RuntimeError("ffmpeg not found in PATH (required for video output). "
+                               "Use a directory path to write a PNG sequence instead.")
+
+        self.output = output
+        self.fps = fps
+        self._frame_queue: mp.Queue = mp.Queue(maxsize=queue_size)
+        self._result_queue: mp.Queue = mp.Queue()
+        self._process = mp.Process(
+            target=_frame_writer_process,
+            args=(self._frame_queue, output, fps, self._result_queue),
+            daemon=True,
+            name="Frame-Writer",
+        )
+        self._process.start()
+        self._result: Optional[Dict[str, Any]] = None
+        self.frames_submitted = 0
+
+    def write(self, frame: np.ndarray) -> None:
+        """
+        Submit one HxWx3 uint8 frame (blocks while the queue is full)
+
+        Raises:
+            RuntimeError: If the writer process stopped (e.g. ffmpeg failed)
+        """
+        self._put(frame)
+        self.frames_submitted += 1
+
+    def _put(self, item: Optional[np.ndarray], poll_interval: float = 0.5) -> None:
+        """Queue an item, checking the writer process while the queue is full"""
+        while True:
+            self._check_writer()
+            try:
+                self._frame_queue.put(item, timeout=poll_interval)
+                return
+            except queue.Full:
+                pass
+
+    def _check_writer(self) -> None:
+        """Raise if the writer process has stopped consuming frames"""
+        if self._result is None:
+            alive = self._process.is_alive()
+            try:
+                # A dead process may still have its result in the pipe
+                self._result = (self._result_queue.get_nowait() if alive
+                                else self._result_queue.get(timeout=1.0))
+            except queue.Empty:
+                if alive:
+                    return
+                self._result = {'frames_written': 0, 'elapsed_seconds': 0.0, 'fps': 0.0,
+                                'error': f'writer process exited with code {self._process.exitcode}'}
+        # Frames still buffered for the dead process must not block interpreter exit
+        self._frame_queue.cancel_join_thread()
+        raise RuntimeError(f"Frame writer stopped: {self._result['error'] or 'finished early'}")
+
+    def close(self, timeout: float = 60.0) -> Dict[str, Any]:
+        """
+        Flush remaining frames and stop the writer process
+
+        Returns:
+            Writer statistics (frames_written, elapsed_seconds, fps, error)
+        """
+        try:
+            self._put(None)
+        except RuntimeError:
+            # Writer already stopped: return its statistics (with the error)
+            self._process.join(timeout=1.0)
+            return self._result
+        try:
+            self._result = self._result_queue.get(timeout=timeout)
+        except queue.Empty:
+            self._result = {'frames_written': 0, 'elapsed_seconds': 0.0, 'fps': 0.0,
+                            'error': 'writer process did not finish in time'}
+        self._process.join(timeout=1.0)
+        return self._result
+
+
+def render_sequence(frames: Iterable[Tuple[Optional[OBBBatch], Optional[np.ndarray]]],
+                    output: str,
+                    width: int = 800,
+                    height: int = 600,
+                    fps: float = 20.0,
+                    scale: float = 1.0,
+                    rotation: Sequence[float] = (0.0, 0.0)) -> Dict[str, Any]:
+    """
+    Render a sequence of (OBBBatch, points) frames to images or video
+
+    Args:
+        frames: Iterable of (obb_batch, points) tuples (either may be None)
+        output: Output video path or PNG directory (see FrameWriter)
+        width: Image width
+        height: Image height
+        fps: Video frame rate
+        scale: Zoom factor
+        rotation: [rx, ry] in degrees
+
+    Returns:
+        Statistics: frames, render_fps (rasterization only), total_fps
+        (end-to-end including encoding) and writer statistics
+    """
+    rasterizer = SoftwareRasterizer(width, height)
+    writer = FrameWriter(output, fps=fps)
+
+    frame_count = 0
+    render_time = 0.0
+    start_time = time.perf_counter()
+    try:
+        for obb_batch, points in frames:
+            t0 = time.perf_counter()
+            image = rasterizer.render(obb_batch, points, scale, rotation)
+            render_time += time.perf_counter() - t0
+            writer.write(image)
+            frame_count += 1
+    finally:
+        writer_stats = writer.close()
+
+    total_time = time.perf_counter() - start_time
+    return {
+        'frames': frame_count,
+        'render_fps': frame_count / render_time if render_time > 0 else 0.0,
+        'total_fps': frame_count / total_time if total_time > 0 else 0.0,
+        'elapsed_seconds': total_time,
+        'writer': writer_stats,
+    }
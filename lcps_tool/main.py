@@ -10,21 +10,39 @@ Usage:
 
 Architecture (4-Layer):
     Layer 1: MultiChannelReceiver (OBB, PointCloud, Status channels)
-    Layer 2: DataSynchronizer + DataRecorder
-    Layer 3: Analysis (future - plugins)
+    Layer 2: DataSynchronizer + OBBTracker (optional) + DataRecorder
+    Layer 3: Frame analyzers (optional: --point-counts, --clearance, --anomaly-config)
+             and plugins (--plugins), on their own workers fed by the PluginHost
     Layer 4: Visualization (future - OpenGL/ImGui)
 """
 
 import argparse
+import json
 import signal
 import sys
 import time
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+from .data_models.synced_frame import SyncedFramePool
 from .layer1.multi_channel_receiver import MultiChannelReceiver
-from .layer2.data_recorder import DataRecorder
 from .layer2.data_synchronizer import DataSynchronizer
+from .layer2.latency_tracker import CHANNEL_STAGES, LATENCY_CHANNELS, LatencyTracker
+from .layer2.obb_tracker import OBBTracker
+from .layer3.anomaly_detectors import Anomaly, AnomalyDetector, create_anomaly_detectors
+from .layer3.base_analyzer import FrameAnalyzer
+from .layer3.clearance import ClearanceAnalyzer
+from .layer3.point_membership import PointMembershipAnalyzer
+from .perf.sampling_profiler import LatencySpikeProfiler, SamplingProfiler
+from .perf.startup import StartupTimer
+from .plugins import ANOMALY_EVENT, EventBus, FrameAnalyzerPlugin, PluginHost
+
+if TYPE_CHECKING:
+    # Imported where used: h5py (recorder) and http.server (metrics) load
+    # only when recording / the metrics endpoint are enabled
+    from .layer2.data_recorder import DataRecorder
+    from .perf.metrics_server import MetricsServer
 
 
 class LCPSObservationTool:
@@ -41,7 +59,21 @@ class LCPSObservationTool:
                  output_path: str,
                  enable_recording: bool = True,
                  sync_window_ms: float = 50.0,
-                 voxel_size: float = 0.1):
+                 voxel_size: float = 0.1,
+                 track_obbs: bool = False,
+                 interpolate_obbs: bool = False,
+                 clock_reference: Optional[str] = None,
+                 point_counts: bool = False,
+                 clearance: bool = False,
+                 anomaly_config: Optional[Dict[str, Any]] = None,
+                 plugin_config: Optional[Dict[str, Any]] = None,
+                 metrics_port: Optional[int] = None,
+                 metrics_host: str = '127.0.0.1',
+                 profile_path: Optional[str] = None,
+                 profile_dir: str = 'profiles',
+                 profile_interval_ms: float = 10.0,
+                 profile_spike_ms: Optional[float] = None,
+                 profile_spike_window_s: float = 2.0):
         """
         Initialize LCPS Observation Tool
 
@@ -53,6 +85,22 @@ class LCPSObservationTool:
             enable_recording: Whether to enable HDF5 recording
             sync_window_ms: Synchronization window in milliseconds
             voxel_size: Point cloud downsampling voxel size
+            track_obbs: Assign persistent track ids to OBBs (recorded as 'track_id')
+            interpolate_obbs: Interpolate OBB poses to the synced frame timestamp
+            clock_reference: Estimate and remove clock offsets relative to this channel
+            point_counts: Count point cloud points inside each OBB per frame
+            clearance: Measure spreader-to-point-cloud clearance per frame
+            anomaly_config: Anomaly detection config (missed alert / false alarm)
+            plugin_config: Plugin configuration (PluginHost.load_config layout)
+            metrics_port: Serve Prometheus metrics on this port (None = disabled)
+            metrics_host: Bind address of the metrics endpoint
+            profile_path: Sample all thread stacks for the whole run and write
+                collapsed stacks here on stop (None = only on SIGUSR1)
+            profile_dir: Output directory of SIGUSR1 and latency spike profiles
+            profile_interval_ms: Stack sampling interval in milliseconds
+            profile_spike_ms: Profile a window around stage latencies above
+                this threshold (None = disabled)
+            profile_spike_window_s: Length of a latency spike profile window
         """
         self.enable_recording = enable_recording
 
@@ -62,18 +110,86 @@ class LCPSObservationTool:
         self.receiver.add_pointcloud_channel(pc_address, voxel_size=voxel_size, queue_size=10)
         self.receiver.add_status_channel(status_address, queue_size=10)
 
+        # Synced frames are recycled: released by the recorder once written,
+        # or by the run loop when not recording
+        self.frame_pool = SyncedFramePool()
+
+        # Layer 2: OBB tracker (run by the synchronizer on every buffered OBB
+        # message, so interpolation can match boxes by track id)
+        self.tracker: Optional[OBBTracker] = OBBTracker() if track_obbs else None
+
         # Layer 2: Data synchronizer
-        self.synchronizer = DataSynchronizer(sync_window_ms=sync_window_ms, buffer_size=100)
+        self.synchronizer = DataSynchronizer(sync_window_ms=sync_window_ms, buffer_size=100,
+                                             interpolate_obbs=interpolate_obbs,
+                                             clock_reference=clock_reference,
+                                             frame_pool=self.frame_pool,
+                                             obb_tracker=self.tracker)
+
+        # Per-stage pipeline latency (receive -> parse -> dequeue -> sync -> record)
+        self.latency_tracker = LatencyTracker()
 
         # Layer 2: Data recorder
-        self.recorder: Optional[DataRecorder] = None
+        self.recorder: Optional['DataRecorder'] = None
         if self.enable_recording:
+            from .layer2.data_recorder import DataRecorder
             self.recorder = DataRecorder(
                 output_path=output_path,
                 compression="gzip",
                 compression_level=6,
                 flush_interval=100,
-                async_write=True
+                async_write=True,
+                latency_tracker=self.latency_tracker,
+                frame_pool=self.frame_pool
+            )
+
+        # Layer 3: Frame analyzers (run on every synced frame)
+        self.analyzers: List[FrameAnalyzer] = []
+        if point_counts:
+            self.analyzers.append(PointMembershipAnalyzer())
+        if clearance:
+            self.analyzers.append(ClearanceAnalyzer(voxel_size=voxel_size))
+        if anomaly_config:
+            self.analyzers.extend(create_anomaly_detectors(anomaly_config))
+
+        # Analyzers and plugins run on their own workers, fed with each synced
+        # frame by reference: a slow analyzer drops its own frames instead of
+        # stalling synchronization and recording
+        self.event_bus = EventBus()
+        self.event_bus.subscribe(ANOMALY_EVENT, self._on_anomaly)
+        self.plugin_host = PluginHost(self.event_bus, frame_pool=self.frame_pool)
+        for analyzer in self.analyzers:
+            self.plugin_host.add_plugin(FrameAnalyzerPlugin(analyzer))
+        if plugin_config:
+            self.plugin_host.load_config(plugin_config)
+
+        # Prometheus /metrics endpoint (scraped from a background thread)
+        self.metrics_server: Optional['MetricsServer'] = None
+        if metrics_port is not None:
+            from .perf.metrics_server import LCPSMetricsCollector, MetricsServer
+            collector = LCPSMetricsCollector(
+                receiver=self.receiver,
+                synchronizer=self.synchronizer,
+                recorder=self.recorder,
+                latency_tracker=self.latency_tracker,
+                frame_counter=lambda: self.frame_count,
+                plugin_host=self.plugin_host,
+            )
+            self.metrics_server = MetricsServer(collector.render, host=metrics_host, port=metrics_port)
+
+        # Stack sampling profiler (whole run, or toggled with SIGUSR1)
+        self.profile_path = profile_path
+        self.profile_dir = profile_dir
+        self.profile_interval_s = profile_interval_ms / 1000.0
+        self.profiler: Optional[SamplingProfiler] = None
+        self.spike_profiler: Optional[LatencySpikeProfiler] = None
+        if profile_spike_ms is not None:
+            self.spike_profiler = LatencySpikeProfiler(
+                self.latency_tracker,
+                output_dir=profile_dir,
+                threshold_ms=profile_spike_ms,
+                pre_s=profile_spike_window_s / 2,
+                post_s=profile_spike_window_s / 2,
+                interval_s=self.profile_interval_s,
             )
 
         # Runtime state
@@ -108,6 +224,21 @@ class LCPSObservationTool:
             }
             self.recorder.start_recording(metadata)
 
+        if self.plugin_host.workers:
+            print("\n[Layer 3] Starting analyzer plugins...")
+            self.plugin_host.start()
+
+        if self.metrics_server:
+            print("\n[Metrics] Starting metrics endpoint...")
+            self.metrics_server.start()
+
+        if self.profile_path:
+            self.toggle_profiler()
+        if self.spike_profiler:
+            self.spike_profiler.start()
+            print(f"🔥 [Profiler] Profiling {self.spike_profiler.pre_s + self.spike_profiler.post_s:g}s "
+                  f"windows around latencies > {self.spike_profiler.threshold_ms:g} ms")
+
         self.running = True
         self.start_time = time.time()
         self.last_stats_time = self.start_time
@@ -127,14 +258,32 @@ class LCPSObservationTool:
 
         self.running = False
 
+        if self.metrics_server:
+            self.metrics_server.stop()
+
+        if self.profiler:
+            self.toggle_profiler()
+        if self.spike_profiler:
+            self.spike_profiler.stop()
+
         # Stop Layer 1 receivers
         print("\n[Layer 1] Stopping receivers...")
         self.receiver.stop_all()
 
+        # Stop plugins (queued frames are analyzed first)
+        if self.plugin_host.running:
+            print("\n[Layer 3] Stopping plugins...")
+            self.plugin_host.stop(timeout=5.0)
+
         # Stop Layer 2 recorder
         if self.enable_recording and self.recorder:
             print("\n[Layer 2] Stopping recorder...")
-            self.recorder.stop_recording(timeout=5.0)
+            final_metadata = {}
+            clock_offsets = self.synchronizer.get_statistics()['clock_offsets']
+            if clock_offsets:
+                final_metadata['clock_offsets'] = clock_offsets
+            final_metadata['latency'] = self.latency_tracker.get_statistics()
+            self.recorder.stop_recording(timeout=5.0, metadata=final_metadata)
 
         # Print final statistics
         self._print_final_statistics()
@@ -159,10 +308,18 @@ class LCPSObservationTool:
 
                 if synced_frame is not None:
                     self.frame_count += 1
+                    self.latency_tracker.observe_frame(synced_frame)
+
+                    # Layer 3 analysis: enqueue for the plugin workers (each
+                    # retains the frame until processed)
+                    self.plugin_host.publish_frame(synced_frame)
 
-                    # Record to HDF5
+                    # Record to HDF5 last: the recorder takes ownership of the
+                    # frame and releases it to the pool once written
                     if self.enable_recording and self.recorder:
                         self.recorder.record_frame(synced_frame)
+                    else:
+                        self.frame_pool.release(synced_frame)
 
                     # Print periodic statistics
                     current_time = time.time()
@@ -182,6 +339,36 @@ class LCPSObservationTool:
                 traceback.print_exc()
                 break
 
+    def _on_anomaly(self, anomaly: Anomaly) -> None:
+        """Print critical / high anomalies (plugin worker thread)"""
+        if anomaly.severity in ('critical', 'high'):
+            print(f"🚨 [{anomaly.severity.upper()}] {anomaly.type}: {anomaly.message}")
+
+    def toggle_profiler(self) -> Optional[str]:
+        """
+        Start the stack sampling profiler, or stop it and write its profile
+
+        Returns:
+            Path of the written collapsed stack file (None when starting)
+        """
+        if self.profiler is None:
+            self.profiler = SamplingProfiler(interval_s=self.profile_interval_s)
+            self.profiler.start()
+            print(f"🔥 [Profiler] Sampling all threads every {self.profile_interval_s * 1000:g} ms")
+            return None
+
+        self.profiler.stop()
+        path = self.profile_path or str(
+            Path(self.profile_dir) / f"profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.folded")
+        stacks = self.profiler.write_collapsed(path)
+        stats = self.profiler.get_statistics()
+        print(f"🔥 [Profiler] {stats['sample_count']} samples ({stats['elapsed_s']:.1f}s, "
+              f"{stacks} unique stacks) written to {path}")
+        self.profiler = None
+        # A whole-run profile is written once; later toggles go to profile_dir
+        self.profile_path = None
+        return path
+
     def _print_runtime_statistics(self) -> None:
         """Print runtime statistics"""
         elapsed = time.time() - self.start_time if self.start_time else 0
@@ -196,6 +383,9 @@ class LCPSObservationTool:
         # Layer 2 recorder statistics
         recorder_stats = self.recorder.get_statistics() if self.recorder else {}
 
+        # Layer 2 tracker statistics
+        tracker_stats = self.tracker.get_statistics() if self.tracker else {}
+
         print("\n" + "-" * 70)
         print(f"⏱️  Runtime: {elapsed:.1f}s | Synced Frames: {self.frame_count} | FPS: {fps:.1f}")
         print("-" * 70)
@@ -213,6 +403,14 @@ class LCPSObservationTool:
               f"Avg Offset: {sync_stats['avg_sync_offset_ms']:.2f}ms | "
               f"Buffers: {sync_stats['buffer_status']}")
 
+        # Print tracker stats
+        if tracker_stats:
+            print(f"\n🎯 Tracker:")
+            print(f"  Active Tracks: {tracker_stats['active_tracks']} | "
+                  f"Created: {tracker_stats['tracks_created']} | "
+                  f"Match Rate: {tracker_stats['match_rate']:.1f}% | "
+                  f"Avg: {tracker_stats['avg_time_ms']:.2f}ms")
+
         # Print recorder stats
         if recorder_stats:
             print(f"\n💾 Recorder:")
@@ -222,8 +420,60 @@ class LCPSObservationTool:
             if 'queue_size' in recorder_stats:
                 print(f"  Write Queue: {recorder_stats['queue_size']}")
 
+        # Print pipeline latency
+        self._print_latency_statistics()
+
+        # Print analyzer / plugin stats
+        if self.plugin_host.workers:
+            self._print_plugin_statistics()
+
         print("-" * 70)
 
+    def _print_latency_statistics(self) -> None:
+        """Print per-stage latency (p50 / p95 / max in ms)"""
+        latency_stats = self.latency_tracker.get_statistics()
+        if not latency_stats:
+            return
+
+        print(f"\n⏳ Latency (p50 / p95 / max ms):")
+        print(f"  {'':12} | " + " | ".join(f"{stage:^24}" for stage in CHANNEL_STAGES))
+        for channel in LATENCY_CHANNELS:
+            cells = []
+            for stage in CHANNEL_STAGES:
+                stats = latency_stats.get(f'{channel}_{stage}')
+                cells.append(f"{stats['p50_ms']:6.2f} /{stats['p95_ms']:7.2f} /{stats['max_ms']:7.1f}"
+                             if stats else f"{'-':^24}")
+            print(f"  {channel:12} | " + " | ".join(cells))
+        record = latency_stats.get('record')
+        if record:
+            print(f"  {'record':12} | {record['p50_ms']:6.2f} /{record['p95_ms']:7.2f} /{record['max_ms']:7.1f} "
+                  f"({record['count']} frames)")
+
+    def _print_plugin_statistics(self) -> None:
+        """Print Layer 3 analyzer and plugin statistics"""
+        print(f"\n🔬 Analyzers / Plugins:")
+        for worker in self.plugin_host.workers.values():
+            stats = worker.get_statistics()
+            print(f"  {stats['name']:16} | Frames: {stats['processed']:6} | "
+                  f"Dropped: {stats['dropped']:5} | Queue: {stats['queue_size']:3} | "
+                  f"Avg: {stats['avg_time_ms']:.2f}ms | p95: {stats['p95_time_ms']:.2f}ms | "
+                  f"Max: {stats['max_time_ms']:.2f}ms")
+            if not isinstance(worker.plugin, FrameAnalyzerPlugin):
+                continue
+            analyzer = worker.plugin.analyzer
+            stats = analyzer.get_statistics()
+            if isinstance(analyzer, PointMembershipAnalyzer):
+                print(f"  {'':16} | Boxes: {stats['total_boxes']} | "
+                      f"Empty: {stats['empty_boxes']} | "
+                      f"Avg Points/Box: {stats['avg_points_per_box']:.1f}")
+            elif isinstance(analyzer, ClearanceAnalyzer):
+                print(f"  {'':16} | Frames In Range: {stats['frames_in_range']} | "
+                      f"Min Clearance: {stats['min_clearance']:.2f}m | "
+                      f"Avg Min: {stats['avg_min_clearance']:.2f}m")
+            elif isinstance(analyzer, AnomalyDetector) and stats['anomaly_counts']:
+                counts = ", ".join(f"{t}: {c}" for t, c in sorted(stats['anomaly_counts'].items()))
+                print(f"  {'':16} | Anomalies: {counts}")
+
     def _print_final_statistics(self) -> None:
         """Print final statistics"""
         elapsed = time.time() - self.start_time if self.start_time else 0
@@ -250,6 +500,13 @@ class LCPSObservationTool:
               f"Failed: {sync_stats['sync_fail_count']} | "
               f"Success Rate: {sync_stats['success_rate']:.1f}%")
         print(f"  Average Sync Offset: {sync_stats['avg_sync_offset_ms']:.2f}ms")
+        if self.synchronizer.interpolate_obbs:
+            print(f"  Interpolated OBB Frames: {sync_stats['interpolated_count']}")
+        for channel, estimate in sync_stats['clock_offsets'].items():
+            print(f"  Clock {channel} vs {estimate['reference']}: "
+                  f"offset {estimate['offset_ms']:+.2f}ms | "
+                  f"drift {estimate['drift_ppm']:+.1f}ppm | "
+                  f"pairs {estimate['pairs']}")
 
         # Layer 2 recorder final stats
         if self.recorder:
@@ -259,6 +516,13 @@ class LCPSObservationTool:
             print(f"  Frames: {recorder_stats['frame_count']}")
             print(f"  File Size: {recorder_stats.get('file_size_mb', 0):.2f} MB")
 
+        # Pipeline latency final stats
+        self._print_latency_statistics()
+
+        # Layer 3 analyzer / plugin final stats
+        if self.plugin_host.workers:
+            self._print_plugin_statistics()
+
         print("=" * 70)
 
 
@@ -284,6 +548,43 @@ Examples:
 
   # Disable recording (observation only)
   python -m lcps_tool.main --no-record
+
+  # Assign persistent track ids to OBBs
+  python -m lcps_tool.main --track
+
+  # Interpolate OBB poses to each synced frame timestamp
+  python -m lcps_tool.main --track --interpolate-obbs
+
+  # Estimate and remove publisher clock offsets relative to the point cloud
+  python -m lcps_tool.main --clock-reference pointcloud
+
+  # Count LiDAR points inside each OBB (per synced frame)
+  python -m lcps_tool.main --point-counts
+
+  # Minimum clearance between the spreader OBBs and the point cloud
+  python -m lcps_tool.main --clearance
+
+  # Missed-alert / false-alarm detection (JSON config, design doc section 6 layout)
+  python -m lcps_tool.main --anomaly-config config/anomaly_detection.json
+
+  # Analyzer / exporter plugins on their own threads or processes (JSON config)
+  python -m lcps_tool.main --plugins config/plugins.json
+
+  # Prometheus metrics on http://127.0.0.1:9108/metrics
+  python -m lcps_tool.main --metrics-port 9108
+
+  # Measure startup time (process start to receivers running) and exit
+  python -m lcps_tool.main --no-record --startup-time
+
+  # Profile all threads for the whole run (collapsed stacks for flame graphs)
+  python -m lcps_tool.main --profile profiles/run.folded
+  flamegraph.pl profiles/run.folded > run.svg
+
+  # Profile on demand: first SIGUSR1 starts, second writes profiles/profile_<time>.folded
+  kill -USR1 <pid>
+
+  # Profile 2s windows around stage latencies above 200 ms
+  python -m lcps_tool.main --profile-spikes 200
         """
     )
 
@@ -335,11 +636,116 @@ Examples:
         help='Point cloud downsampling voxel size in meters (default: 0.1)'
     )
 
+    parser.add_argument(
+        '--track',
+        action='store_true',
+        help='Assign persistent track ids to OBBs across frames (stored as track_id)'
+    )
+
+    parser.add_argument(
+        '--interpolate-obbs',
+        action='store_true',
+        help='Interpolate OBB poses between bracketing samples to the synced frame timestamp'
+    )
+
+    parser.add_argument(
+        '--clock-reference',
+        type=str,
+        choices=['obb', 'pointcloud', 'status'],
+        default=None,
+        help='Estimate clock offset/drift of the other channels relative to this one'
+    )
+
+    parser.add_argument(
+        '--point-counts',
+        action='store_true',
+        help='Count point cloud points inside each OBB for every synced frame'
+    )
+
+    parser.add_argument(
+        '--clearance',
+        action='store_true',
+        help='Measure minimum clearance between spreader OBBs and the point cloud per frame'
+    )
+
+    parser.add_argument(
+        '--anomaly-config',
+        type=str,
+        default=None,
+        help='Anomaly detection config (JSON) enabling missed-alert / false-alarm detectors'
+    )
+
+    parser.add_argument(
+        '--plugins',
+        type=str,
+        default=None,
+        metavar='CONFIG',
+        help='Plugin configuration (JSON) of analyzer / exporter plugins to run'
+    )
+
+    parser.add_argument(
+        '--metrics-port',
+        type=int,
+        default=None,
+        help='Serve Prometheus metrics on this port at /metrics (default: disabled)'
+    )
+
+    parser.add_argument(
+        '--metrics-host',
+        type=str,
+        default='127.0.0.1',
+        help='Bind address of the metrics endpoint (default: 127.0.0.1)'
+    )
+
+    parser.add_argument(
+        '--startup-time',
+        action='store_true',
+        help='Report the time from process start to ready (receivers started), then exit'
+    )
+
+    parser.add_argument(
+        '--profile',
+        type=str,
+        default=None,
+        metavar='PATH',
+        help='Sample all thread stacks for the whole run, write collapsed stacks to PATH'
+    )
+
+    parser.add_argument(
+        '--profile-dir',
+        type=str,
+        default='profiles',
+        help='Output directory of SIGUSR1 and latency spike profiles (default: profiles)'
+    )
+
+    parser.add_argument(
+        '--profile-interval',
+        type=float,
+        default=10.0,
+        help='Stack sampling interval in milliseconds (default: 10.0)'
+    )
+
+    parser.add_argument(
+        '--profile-spikes',
+        type=float,
+        default=None,
+        metavar='MS',
+        help='Profile a window around any stage latency above MS milliseconds'
+    )
+
+    parser.add_argument(
+        '--profile-spike-window',
+        type=float,
+        default=2.0,
+        help='Latency spike profile window in seconds, centred on the spike (default: 2.0)'
+    )
+
     return parser.parse_args()
 
 
 def main():
     """Main entry point"""
+    startup_timer = StartupTimer()
     args = parse_arguments()
 
     # Create output directory
@@ -347,6 +753,16 @@ def main():
         output_path = Path(args.output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
+    anomaly_config = None
+    if args.anomaly_config:
+        with open(args.anomaly_config, 'r', encoding='utf-8') as f:
+            anomaly_config = json.load(f)
+
+    plugin_config = None
+    if args.plugins:
+        with open(args.plugins, 'r', encoding='utf-8') as f:
+            plugin_config = json.load(f)
+
     # Create tool instance
     tool = LCPSObservationTool(
         obb_address=args.obb,
@@ -355,8 +771,23 @@ def main():
         output_path=args.output,
         enable_recording=not args.no_record,
         sync_window_ms=args.sync_window,
-        voxel_size=args.voxel_size
+        voxel_size=args.voxel_size,
+        track_obbs=args.track,
+        interpolate_obbs=args.interpolate_obbs,
+        clock_reference=args.clock_reference,
+        point_counts=args.point_counts,
+        clearance=args.clearance,
+        anomaly_config=anomaly_config,
+        plugin_config=plugin_config,
+        metrics_port=args.metrics_port,
+        metrics_host=args.metrics_host,
+        profile_path=args.profile,
+        profile_dir=args.profile_dir,
+        profile_interval_ms=args.profile_interval,
+        profile_spike_ms=args.profile_spikes,
+        profile_spike_window_s=args.profile_spike_window
     )
+    startup_timer.mark('construct')
 
     # Setup signal handler for graceful shutdown
     def signal_handler(sig, frame):
@@ -367,8 +798,17 @@ def main():
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
+    # On-demand profiling: SIGUSR1 toggles the stack sampling profiler
+    if hasattr(signal, 'SIGUSR1'):
+        signal.signal(signal.SIGUSR1, lambda sig, frame: tool.toggle_profiler())
+
     # Start and run
     tool.start()
+    startup_timer.mark('start')
+    if args.startup_time:
+        startup_timer.print_report()
+        tool.stop()
+        return
     tool.run()
     tool.stop()
 
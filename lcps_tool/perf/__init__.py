@@ -0,0 +1,14 @@
+"""
+Performance Tooling
+
+Modules (run as scripts, so nothing is imported eagerly here):
+- benchmarks: Hot path benchmark suite with baseline comparison
+  (python -m lcps_tool.perf.benchmarks)
+- load_generator: Synthetic multi-channel LCPS publisher
+  (python -m lcps_tool.perf.load_generator)
+- metrics_server: Prometheus /metrics endpoint (lcps_tool.main --metrics-port)
+- sampling_profiler: All-thread stack sampler with collapsed-stack output
+  (lcps_tool.main --profile, SIGUSR1, --profile-spikes)
+- synthetic: Seeded OBB / point cloud / status message builders
+- startup: Process start to ready phase timer (--startup-time)
+"""
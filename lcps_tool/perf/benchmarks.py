@@ -0,0 +1,586 @@
+#!/usr/bin/env python3
+"""
+Hot Path Benchmarks - Reproducible layer-1/layer-2 benchmark suite
+
+Suites:
+- obb_decode: OBBReceiver decoding of JSON (LCPS protocol), zlib + BSON and
+  size-prefixed zlib JSON messages across OBB counts
+- pointcloud_parse: PointCloudReceiver message parsing (JSON -> Nx3 array)
+  across point counts
+- voxel_downsample: PointCloudReceiver._voxel_grid_downsample across point
+  counts and voxel sizes
+- synchronize: DataSynchronizer.synchronize across buffer sizes
+- recorder: DataRecorder write throughput per compression setting
+- allocations: Channel samples as dicts vs slotted records (+ SyncedFrame
+  pool) in full synchronizer buffers; reports tracemalloc retained bytes
+  per sample, peak bytes while synchronizing and frames allocated
+
+Inputs are generated from a fixed seed (per suite, so selecting suites
+does not change the data), every case runs warmup + repeat timed calls
+(time.perf_counter) and reports median/mean/min/p95 and throughput.
+
+Results are written as JSON. Any earlier result file serves as baseline
+for --compare, which flags cases whose metric (median by default) grew by
+more than --threshold and exits with status 1.
+
+Usage:
+    python -m lcps_tool.perf.benchmarks --output bench/current.json
+    python -m lcps_tool.perf.benchmarks --quick --suite obb_decode synchronize
+    python -m lcps_tool.perf.benchmarks --compare bench/baseline.json --threshold 0.15
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import h5py
+import numpy as np
+import zmq
+
+from ..data_models.channel_records import OBBRecord, PointCloudRecord, StatusRecord
+from ..data_models.synced_frame import SyncedFrame, SyncedFramePool
+from ..layer1.receivers.obb_receiver import OBBReceiver
+from ..layer1.receivers.pointcloud_receiver import PointCloudReceiver
+from ..layer2.data_recorder import DataRecorder
+from ..layer2.data_synchronizer import DataSynchronizer
+from .synthetic import (
+    OBB_FORMATS,
+    encode_obb_message,
+    make_obb_message,
+    make_obbs,
+    make_pointcloud_message,
+    make_points,
+)
+
+RESULT_VERSION = 1
+DEFAULT_SEED = 42
+
+# Receivers are never started, the address is only used for logging
+_UNUSED_ADDRESS = "tcp://localhost:0"
+
+# Compression settings of the recorder suite: name -> (compression, level)
+RECORDER_COMPRESSION = {
+    'none': (None, 0),
+    'lzf': ('lzf', 0),
+    'gzip-1': ('gzip', 1),
+    'gzip-6': ('gzip', 6),
+    'gzip-9': ('gzip', 9),
+}
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    Timings of one benchmark case
+
+    Attributes:
+        suite: Suite name (e.g. "obb_decode")
+        params: Case parameters (e.g. {'format': 'json', 'obbs': 100})
+        items: Items processed per timed call
+        unit: Item unit (e.g. "msg", "point", "frame")
+        times_s: Duration of every timed call in seconds
+        extra: Additional case measurements (sizes, output counts, ...)
+    """
+
+    suite: str
+    params: Dict[str, Any]
+    items: int
+    unit: str
+    times_s: List[float]
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        """Stable case identifier used to match baseline results"""
+        params = ','.join(f"{name}={value}" for name, value in self.params.items())
+        return f"{self.suite}[{params}]"
+
+    @property
+    def median_s(self) -> float:
+        return float(np.median(self.times_s))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert result to dictionary (for JSON serialization)"""
+        times_ms = np.asarray(self.times_s) * 1000.0
+        median_ms = float(np.median(times_ms))
+        return {
+            'key': self.key,
+            'suite': self.suite,
+            'params': self.params,
+            'items': self.items,
+            'unit': self.unit,
+            'repeat': len(times_ms),
+            'median_ms': median_ms,
+            'mean_ms': float(np.mean(times_ms)),
+            'min_ms': float(np.min(times_ms)),
+            'p95_ms': float(np.percentile(times_ms, 95)),
+            'stdev_ms': float(np.std(times_ms)),
+            'throughput_per_s': self.items / (median_ms / 1000.0) if median_ms > 0 else 0.0,
+            **self.extra,
+        }
+
+
+def time_calls(func: Callable[..., Any], repeat: int, warmup: int = 1,
+               setup: Optional[Callable[[], Any]] = None) -> List[float]:
+    """
+    Time repeated calls of a function
+
+    Args:
+        func: Function to time; called with the setup result if setup is given
+        repeat: Timed calls
+        warmup: Untimed calls before timing
+        setup: Untimed preparation run before every call
+
+    Returns:
+        Duration of every timed call in seconds
+    """
+    times = []
+    for i in range(warmup + repeat):
+        args = (setup(),) if setup is not None else ()
+        start = time.perf_counter()
+        func(*args)
+        elapsed = time.perf_counter() - start
+        if i >= warmup:
+            times.append(elapsed)
+    return times
+
+
+# ----------------------------------------------------------------------
+# Suites
+# ----------------------------------------------------------------------
+
+def bench_obb_decode(rng: np.random.Generator, quick: bool, repeat: int,
+                     warmup: int) -> Iterable[BenchmarkResult]:
+    """OBBReceiver decoding of every OBB wire format across OBB counts"""
+    receiver = OBBReceiver(_UNUSED_ADDRESS)
+    parsers = {fmt: receiver._parse_normal if fmt == 'json' else receiver._parse_compressed
+               for fmt in OBB_FORMATS}
+    messages_per_call = 50
+
+    for count in ((10, 100) if quick else (10, 100, 1000)):
+        messages = [make_obb_message(count, rng, timestamp=float(i), seq_id=i)
+                    for i in range(messages_per_call)]
+        for fmt, parse in parsers.items():
+            encoded = [encode_obb_message(message, fmt) for message in messages]
+
+            def decode_all(encoded=encoded, parse=parse):
+                for message in encoded:
+                    parse(message)
+
+            yield BenchmarkResult(
+                suite='obb_decode',
+                params={'format': fmt, 'obbs': count},
+                items=messages_per_call,
+                unit='msg',
+                times_s=time_calls(decode_all, repeat, warmup),
+                extra={'message_bytes': int(np.mean([len(m) for m in encoded]))},
+            )
+
+
+def bench_pointcloud_parse(rng: np.random.Generator, quick: bool, repeat: int,
+                           warmup: int) -> Iterable[BenchmarkResult]:
+    """PointCloudReceiver message parsing (without downsampling) across point counts"""
+    receiver = PointCloudReceiver(_UNUSED_ADDRESS, enable_downsampling=False)
+
+    for count in ((1_000, 10_000) if quick else (1_000, 10_000, 100_000)):
+        message = make_pointcloud_message(make_points(count, rng))
+        yield BenchmarkResult(
+            suite='pointcloud_parse',
+            params={'points': count},
+            items=count,
+            unit='point',
+            times_s=time_calls(lambda: receiver._parse_message(message), repeat, warmup),
+            extra={'message_bytes': len(message)},
+        )
+
+
+def bench_voxel_downsample(rng: np.random.Generator, quick: bool, repeat: int,
+                           warmup: int) -> Iterable[BenchmarkResult]:
+    """PointCloudReceiver._voxel_grid_downsample across point counts and voxel sizes"""
+    for count in ((10_000, 100_000) if quick else (10_000, 100_000, 1_000_000)):
+        points = make_points(count, rng)
+        for voxel_size in (0.05, 0.1, 0.2):
+            receiver = PointCloudReceiver(_UNUSED_ADDRESS, voxel_size=voxel_size)
+            downsampled, _ = receiver._voxel_grid_downsample(points)
+            yield BenchmarkResult(
+                suite='voxel_downsample',
+                params={'points': count, 'voxel_size': voxel_size},
+                items=count,
+                unit='point',
+                times_s=time_calls(lambda: receiver._voxel_grid_downsample(points), repeat, warmup),
+                extra={'output_points': len(downsampled)},
+            )
+
+
+def bench_synchronize(rng: np.random.Generator, quick: bool, repeat: int,
+                      warmup: int) -> Iterable[BenchmarkResult]:
+    """DataSynchronizer.synchronize across buffer sizes (full buffers, 10 Hz channels)"""
+    targets_per_call = 100
+
+    for buffer_size in ((10, 100) if quick else (10, 100, 1000)):
+        synchronizer = DataSynchronizer(buffer_size=buffer_size, min_quality=0.0)
+        base = np.arange(buffer_size) * 0.1
+        for channel, offset in (('pointcloud', 0.0), ('obb', 0.005), ('status', 0.012)):
+            timestamps = base + offset + rng.normal(scale=0.002, size=buffer_size)
+            for i, timestamp in enumerate(timestamps):
+                synchronizer.add_data(channel, {'timestamp': float(timestamp), 'frame_id': i})
+        targets = rng.choice(base, targets_per_call).tolist()
+
+        def synchronize_all(synchronizer=synchronizer, targets=targets):
+            for target in targets:
+                synchronizer.synchronize(target)
+
+        yield BenchmarkResult(
+            suite='synchronize',
+            params={'buffer_size': buffer_size},
+            items=targets_per_call,
+            unit='sync',
+            times_s=time_calls(synchronize_all, repeat, warmup),
+        )
+
+
+def bench_recorder(rng: np.random.Generator, quick: bool, repeat: int,
+                   warmup: int) -> Iterable[BenchmarkResult]:
+    """DataRecorder synchronous write throughput per compression setting"""
+    frame_count = 20 if quick else 100
+    point_count = 5_000 if quick else 20_000
+    settings = ('none', 'gzip-1', 'gzip-6') if quick else tuple(RECORDER_COMPRESSION)
+
+    frames = []
+    for i in range(frame_count):
+        timestamp = i * 0.1
+        points = make_points(point_count, rng)
+        frames.append(SyncedFrame(
+            timestamp=timestamp,
+            frame_id=i,
+            obb_data={'timestamp': timestamp, 'obbs': make_obbs(20, rng)},
+            pointcloud_data={'timestamp': timestamp, 'points': points,
+                             'original_count': point_count, 'downsampled_count': point_count,
+                             'reduction_rate': 0.0},
+            status_data={'timestamp': timestamp, 'state': 'normal', 'frame_id': i},
+        ))
+    payload_mb = sum(frame.pointcloud_data['points'].nbytes for frame in frames) / 1024 / 1024
+
+    with tempfile.TemporaryDirectory(prefix='lcps_bench_') as tmpdir:
+        for setting in settings:
+            compression, level = RECORDER_COMPRESSION[setting]
+            path = Path(tmpdir) / f"{setting}.h5"
+
+            def open_recorder(path=path, compression=compression, level=level):
+                path.unlink(missing_ok=True)
+                recorder = DataRecorder(str(path), compression=compression,
+                                        compression_level=level, async_write=False)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    recorder.start_recording()
+                return recorder
+
+            def write_all(recorder):
+                for frame in frames:
+                    recorder.record_frame(frame)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    recorder.stop_recording()
+
+            times = time_calls(write_all, repeat, warmup, setup=open_recorder)
+            file_mb = path.stat().st_size / 1024 / 1024
+            yield BenchmarkResult(
+                suite='recorder',
+                params={'compression': setting, 'points': point_count},
+                items=frame_count,
+                unit='frame',
+                times_s=times,
+                extra={
+                    'file_mb': file_mb,
+                    'compression_ratio': payload_mb / file_mb if file_mb > 0 else 0.0,
+                    'payload_mb_per_s': payload_mb / float(np.median(times)),
+                },
+            )
+
+
+def _channel_samples(variant: str, timestamp: float, index: int,
+                     payload: Dict[str, Any]) -> List[tuple]:
+    """(channel, sample) pairs as the receivers emit them (dicts or records)"""
+    trace = {'receive': timestamp, 'receive_wall': timestamp, 'parse': timestamp}
+    obb = {'timestamp': timestamp, 'obbs': payload['obbs'], 'seq_id': index, 'source': 'synthetic'}
+    pointcloud = {'points': payload['points'], 'timestamp': timestamp, 'frame_id': index,
+                  'original_count': 1000, 'downsampled_count': 1000, 'reduction_rate': 0.0}
+    status = {'state': 'normal', 'state_raw': 'normal', 'timestamp': timestamp, 'frame_id': index,
+              'metrics': payload['metrics'], 'detection': payload['detection']}
+    samples = [('obb', obb), ('pointcloud', pointcloud), ('status', status)]
+    if variant == 'record':
+        types = {'obb': OBBRecord, 'pointcloud': PointCloudRecord, 'status': StatusRecord}
+        samples = [(channel, types[channel].from_dict(sample)) for channel, sample in samples]
+    for _, sample in samples:
+        sample['trace'] = dict(trace)
+    return samples
+
+
+def bench_allocations(rng: np.random.Generator, quick: bool, repeat: int,
+                      warmup: int) -> Iterable[BenchmarkResult]:
+    """Memory of buffered channel samples and synced frames: dicts vs records + frame pool"""
+    buffer_size = 100 if quick else 1000
+    syncs_per_call = 200
+    # Shared payload objects: only the per-sample containers are measured
+    payload = {'obbs': make_obbs(10, rng), 'points': make_points(1000, rng),
+               'metrics': {'fps': 10.0}, 'detection': {'obb_count': 10}}
+    targets = (rng.integers(0, buffer_size, syncs_per_call) * 0.1).tolist()
+
+    for variant in ('dict', 'record'):
+        def fill(variant=variant):
+            pool = SyncedFramePool() if variant == 'record' else None
+            synchronizer = DataSynchronizer(buffer_size=buffer_size, min_quality=0.0, frame_pool=pool)
+            for i in range(buffer_size):
+                for channel, sample in _channel_samples(variant, i * 0.1, i, payload):
+                    synchronizer.add_data(channel, sample)
+            return synchronizer
+
+        def synchronize_all(synchronizer):
+            for target in targets:
+                frame = synchronizer.synchronize(target)
+                if synchronizer.frame_pool is not None:
+                    synchronizer.frame_pool.release(frame)
+
+        times = time_calls(synchronize_all, repeat, warmup, setup=fill)
+
+        # Memory pass (untimed: tracing slows allocation down)
+        tracemalloc.start()
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+            synchronizer = fill()
+            retained, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            synchronize_all(synchronizer)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        pool = synchronizer.frame_pool
+        yield BenchmarkResult(
+            suite='allocations',
+            params={'variant': variant, 'buffer_size': buffer_size},
+            items=syncs_per_call,
+            unit='sync',
+            times_s=times,
+            extra={
+                'sample_bytes': (retained - before) / (3 * buffer_size),
+                'sync_peak_bytes': peak - retained,
+                'frames_allocated': pool.created_count if pool is not None else syncs_per_call,
+            },
+        )
+
+
+SUITES: Dict[str, Callable[..., Iterable[BenchmarkResult]]] = {
+    'obb_decode': bench_obb_decode,
+    'pointcloud_parse': bench_pointcloud_parse,
+    'voxel_downsample': bench_voxel_downsample,
+    'synchronize': bench_synchronize,
+    'recorder': bench_recorder,
+    'allocations': bench_allocations,
+}
+
+
+# ----------------------------------------------------------------------
+# Running and comparing
+# ----------------------------------------------------------------------
+
+def environment_info() -> Dict[str, Any]:
+    """Interpreter, library and machine information stored with the results"""
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'h5py': h5py.__version__,
+        'pyzmq': zmq.__version__,
+    }
+
+
+def run_benchmarks(suites: Optional[Iterable[str]] = None,
+                   quick: bool = False,
+                   repeat: int = 5,
+                   warmup: int = 1,
+                   seed: int = DEFAULT_SEED,
+                   progress: Optional[Callable[[BenchmarkResult], None]] = None) -> Dict[str, Any]:
+    """
+    Run benchmark suites
+
+    Args:
+        suites: Suite names (default: all)
+        quick: Use the small case set
+        repeat: Timed calls per case
+        warmup: Untimed calls per case
+        seed: Random seed of the generated inputs
+        progress: Called with every finished result
+
+    Returns:
+        Result document: {'version', 'created', 'environment', 'config', 'results'}
+
+    Raises:
+        ValueError: If a suite is unknown
+    """
+    suites = list(suites) if suites else list(SUITES)
+    unknown = [name for name in suites if name not in SUITES]
+    if unknown:
+        raise ValueError(f"Unknown suites: {unknown}. Available: {list(SUITES)}")
+
+    results = []
+    for name in suites:
+        # Per-suite seed: inputs do not depend on which suites are selected
+        rng = np.random.default_rng([seed, zlib.crc32(name.encode('utf-8'))])
+        for result in SUITES[name](rng, quick, repeat, warmup):
+            results.append(result.to_dict())
+            if progress is not None:
+                progress(result)
+
+    return {
+        'version': RESULT_VERSION,
+        'created': datetime.now().isoformat(),
+        'environment': environment_info(),
+        'config': {'suites': suites, 'quick': quick, 'repeat': repeat,
+                   'warmup': warmup, 'seed': seed},
+        'results': results,
+    }
+
+
+def compare_results(current: Dict[str, Any],
+                    baseline: Dict[str, Any],
+                    threshold: float = 0.10,
+                    metric: str = 'median_ms') -> List[Dict[str, Any]]:
+    """
+    Compare a result document against a baseline document
+
+    Args:
+        current: Result document of this run
+        baseline: Stored result document
+        threshold: Relative change above which a case counts as
+            regression (slower) or improvement (faster)
+        metric: Timing field to compare ("median_ms", "min_ms", ...)
+
+    Returns:
+        One entry per case: {'key', 'status', 'baseline', 'current', 'change'};
+        status is "regression", "improvement", "ok", "new" (not in baseline)
+        or "missing" (case of a suite that ran, but not in this run)
+    """
+    baseline_by_key = {result['key']: result for result in baseline.get('results', [])}
+    current_suites = {result['suite'] for result in current.get('results', [])}
+    current_keys = set()
+    comparisons = []
+
+    for result in current.get('results', []):
+        key = result['key']
+        current_keys.add(key)
+        reference = baseline_by_key.get(key)
+        if reference is None or not reference.get(metric):
+            comparisons.append({'key': key, 'status': 'new', 'baseline': None,
+                                'current': result[metric], 'change': None})
+            continue
+
+        change = result[metric] / reference[metric] - 1.0
+        if change > threshold:
+            status = 'regression'
+        elif change < -threshold:
+            status = 'improvement'
+        else:
+            status = 'ok'
+        comparisons.append({'key': key, 'status': status, 'baseline': reference[metric],
+                            'current': result[metric], 'change': change})
+
+    for key, reference in baseline_by_key.items():
+        if key not in current_keys and reference['suite'] in current_suites:
+            comparisons.append({'key': key, 'status': 'missing', 'baseline': reference.get(metric),
+                                'current': None, 'change': None})
+    return comparisons
+
+
+def _format_rate(value: float) -> str:
+    for factor, suffix in ((1e6, 'M'), (1e3, 'k')):
+        if value >= factor:
+            return f"{value / factor:.2f}{suffix}"
+    return f"{value:.1f}"
+
+
+def _print_result(result: BenchmarkResult) -> None:
+    summary = result.to_dict()
+    print(f"  {result.key:<55} {summary['median_ms']:>10.3f} ms  "
+          f"(p95 {summary['p95_ms']:.3f})  {_format_rate(summary['throughput_per_s'])} {result.unit}/s")
+
+
+def _print_comparison(comparisons: List[Dict[str, Any]], metric: str) -> None:
+    print(f"\n📊 Comparison against baseline ({metric})")
+    markers = {'regression': '❌', 'improvement': '✅', 'ok': '  ', 'new': '🆕', 'missing': '❔'}
+    for entry in comparisons:
+        if entry['change'] is None:
+            detail = entry['status']
+        else:
+            detail = (f"{entry['baseline']:.3f} -> {entry['current']:.3f} ms "
+                      f"({entry['change'] * 100:+.1f}%)")
+        print(f"  {markers[entry['status']]} {entry['key']:<55} {detail}")
+
+
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description='LCPS layer-1/layer-2 hot path benchmarks',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--suite', nargs='+', choices=list(SUITES), default=None,
+                        help='Suites to run (default: all)')
+    parser.add_argument('--quick', action='store_true',
+                        help='Small case set (smoke test / CI)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Timed calls per case (default: 5)')
+    parser.add_argument('--warmup', type=int, default=1,
+                        help='Untimed calls per case (default: 1)')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED,
+                        help=f'Input generation seed (default: {DEFAULT_SEED})')
+    parser.add_argument('--output', type=str, default=None,
+                        help='Write results as JSON to this file')
+    parser.add_argument('--compare', type=str, default=None, metavar='BASELINE',
+                        help='Compare against a stored result file')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='Relative slowdown flagged as regression (default: 0.10)')
+    parser.add_argument('--metric', choices=['median_ms', 'mean_ms', 'min_ms', 'p95_ms'],
+                        default='median_ms', help='Timing compared against the baseline')
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_arguments(argv)
+
+    print("⏱️  LCPS hot path benchmarks"
+          f" ({'quick' if args.quick else 'full'}, repeat={args.repeat}, seed={args.seed})")
+    document = run_benchmarks(suites=args.suite, quick=args.quick, repeat=args.repeat,
+                              warmup=args.warmup, seed=args.seed, progress=_print_result)
+
+    if args.output:
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(json.dumps(document, indent=2))
+        print(f"\n💾 Results written to {output_path}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        comparisons = compare_results(document, baseline, args.threshold, args.metric)
+        _print_comparison(comparisons, args.metric)
+        regressions = [entry for entry in comparisons if entry['status'] == 'regression']
+        if regressions:
+            print(f"\n⚠️  {len(regressions)} regression(s) above {args.threshold * 100:.0f}%")
+            return 1
+        print("\n✅ No regressions")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+"""
+Load Generator - Synthetic multi-channel LCPS publisher
+
+Python replacement for sendOBB.cpp / sender.cpp in performance tests:
+one ZMQ PUB socket per channel, each fed by its own thread.
+
+- OBB: LCPS protocol messages as JSON (normal mode), zlib + BSON, or
+  sender.cpp's size-prefixed zlib JSON
+- Point cloud: JSON point lists (clustered points, configurable count)
+- Status: JSON status messages
+
+Every message carries its wall-clock send time as 'timestamp' (header
+timestamp for OBB), so receivers can measure end-to-end latency as
+time.time() - timestamp on the same host.
+
+Payloads are generated up front from a seeded random generator (a small
+pool of distinct payloads per channel), so the send loop only stamps,
+encodes and sends. A rate of 0 sends as fast as possible to find the
+throughput ceiling of a local receiver.
+
+Usage:
+    python -m lcps_tool.perf.load_generator
+    python -m lcps_tool.perf.load_generator --obb-format zlib_json --objects 100 --seed 7
+    python -m lcps_tool.perf.load_generator --rate 0 --points 100000 --duration 10
+"""
+
+import argparse
+import json
+import struct
+import sys
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import bson
+import numpy as np
+import zmq
+
+from .synthetic import (
+    OBB_FORMATS,
+    encode_points,
+    make_obbs,
+    make_points,
+    make_status_message,
+    pointcloud_message_from_encoded,
+)
+
+CHANNELS = ('obb', 'pointcloud', 'status')
+
+DEFAULT_ADDRESSES = {
+    'obb': 'tcp://*:5555',
+    'pointcloud': 'tcp://*:5556',
+    'status': 'tcp://*:5557',
+}
+
+
+@dataclass
+class StreamConfig:
+    """
+    Configuration of one published channel
+
+    Attributes:
+        channel: Channel name ("obb", "pointcloud" or "status")
+        address: ZMQ bind address (e.g. "tcp://*:5555")
+        rate_hz: Messages per second (0 = as fast as possible)
+        count: Messages to send (0 = until stopped)
+        jitter_ms: Standard deviation of the send time jitter
+        obb_format: OBB wire format ("json", "zlib_bson" or "zlib_json")
+        objects: OBBs per OBB message (also reported in status messages)
+        points: Points per point cloud message
+        pool_size: Distinct pre-generated payloads cycled through
+    """
+
+    channel: str
+    address: str
+    rate_hz: float = 10.0
+    count: int = 0
+    jitter_ms: float = 0.0
+    obb_format: str = 'json'
+    objects: int = 10
+    points: int = 10_000
+    pool_size: int = 8
+
+
+class SyntheticStream:
+    """
+    Message source of one channel
+
+    Builds the payload pool at construction; message() only stamps the
+    timestamp / sequence number and encodes.
+    """
+
+    def __init__(self, config: StreamConfig, rng: np.random.Generator):
+        """
+        Initialize stream
+
+        Args:
+            config: Stream configuration
+            rng: Random generator (payload pool and status values)
+
+        Raises:
+            ValueError: If channel or OBB format is unknown
+        """
+        if config.channel not in CHANNELS:
+            raise ValueError(f"Invalid channel: {config.channel}. Must be one of {list(CHANNELS)}")
+        if config.channel == 'obb' and config.obb_format not in OBB_FORMATS:
+            raise ValueError(f"Unknown OBB format: {config.obb_format}. Must be one of {OBB_FORMATS}")
+
+        self.config = config
+        self.rng = rng
+        pool_size = max(1, config.pool_size)
+
+        if config.channel == 'obb':
+            self._payloads = [{'type': 'obb_list', 'count': config.objects,
+                               'obbs': make_obbs(config.objects, rng)} for _ in range(pool_size)]
+            self._encoded = [json.dumps(payload).encode('utf-8') for payload in self._payloads]
+        elif config.channel == 'pointcloud':
+            self._encoded = [encode_points(make_points(config.points, rng)) for _ in range(pool_size)]
+
+    def message(self, index: int, timestamp: float) -> bytes:
+        """
+        Encode message number index
+
+        Args:
+            index: Sequence number (seq_id / frame_id)
+            timestamp: Timestamp embedded in the message (seconds, Unix time)
+
+        Returns:
+            Message bytes
+        """
+        channel = self.config.channel
+        slot = index % max(1, self.config.pool_size)
+
+        if channel == 'pointcloud':
+            return pointcloud_message_from_encoded(self._encoded[slot], timestamp, index)
+        if channel == 'status':
+            return make_status_message(self.rng, timestamp, index, obb_count=self.config.objects)
+
+        header = {'version': '1.0', 'timestamp': timestamp, 'seq_id': index, 'source': 'load_generator'}
+        if self.config.obb_format == 'zlib_bson':
+            return zlib.compress(bson.encode({'header': header, 'payload': self._payloads[slot]}))
+
+        raw = (b'{"header": ' + json.dumps(header).encode('utf-8')
+               + b', "payload": ' + self._encoded[slot] + b'}')
+        if self.config.obb_format == 'zlib_json':
+            return struct.pack('>I', len(raw)) + zlib.compress(raw)
+        return raw
+
+
+class LoadGenerator:
+    """
+    Multi-channel synthetic publisher
+
+    Usage:
+        generator = LoadGenerator([
+            StreamConfig('obb', 'tcp://*:5555', rate_hz=10, objects=50),
+            StreamConfig('pointcloud', 'tcp://*:5556', rate_hz=10, points=100_000),
+        ], seed=1)
+        generator.run(duration=30)
+        generator.get_statistics()
+
+    Parameters:
+        streams: Channel configurations
+        seed: Seed of the payload generators (None = non-deterministic)
+        warmup_s: Delay between bind and the first message, so subscribers
+            can connect (ZMQ slow joiner)
+        sndhwm: Send high water mark per socket (PUB drops beyond it)
+    """
+
+    def __init__(self,
+                 streams: List[StreamConfig],
+                 seed: Optional[int] = None,
+                 warmup_s: float = 0.5,
+                 sndhwm: int = 1000):
+        """
+        Initialize load generator
+
+        Args:
+            streams: Channel configurations
+            seed: Payload generator seed (None = random)
+            warmup_s: Delay before the first message in seconds
+            sndhwm: ZMQ send high water mark
+        """
+        self.configs = list(streams)
+        self.seed = seed
+        self.warmup_s = warmup_s
+        self.sndhwm = sndhwm
+
+        self.streams = [
+            SyntheticStream(config, np.random.default_rng(
+                [seed, index] if seed is not None else None))
+            for index, config in enumerate(self.configs)
+        ]
+
+        self.context: Optional[zmq.Context] = None
+        self.stop_event = threading.Event()
+        self.threads: List[threading.Thread] = []
+
+        # Statistics (per stream, written by its publisher thread)
+        self._stats: List[Dict[str, Any]] = [self._empty_stats() for _ in self.streams]
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, Any]:
+        return {'sent': 0, 'bytes': 0, 'start_time': None, 'end_time': None, 'max_lag_ms': 0.0}
+
+    def start(self) -> None:
+        """Bind the sockets and start one publisher thread per stream"""
+        if any(thread.is_alive() for thread in self.threads):
+            print("⚠️ [LoadGenerator] Already running")
+            return
+
+        self.stop_event.clear()
+        self.context = zmq.Context()
+        self._stats = [self._empty_stats() for _ in self.streams]
+        self.threads = [
+            threading.Thread(target=self._publisher_thread_func, args=(index,), daemon=True,
+                             name=f"{stream.config.channel}-Publisher")
+            for index, stream in enumerate(self.streams)
+        ]
+        for thread in self.threads:
+            thread.start()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for all streams to send their configured count
+
+        Args:
+            timeout: Maximum wait time in seconds (None = forever)
+
+        Returns:
+            True if all publisher threads finished
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for thread in self.threads:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            thread.join(remaining)
+        return not any(thread.is_alive() for thread in self.threads)
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """
+        Stop all publisher threads and release the sockets
+
+        Args:
+            timeout: Maximum wait time per thread in seconds
+        """
+        self.stop_event.set()
+        for thread in self.threads:
+            thread.join(timeout=timeout)
+        if self.context is not None:
+            self.context.term()
+            self.context = None
+
+    def run(self, duration: Optional[float] = None, report_interval: float = 0.0) -> Dict[str, Dict[str, Any]]:
+        """
+        Publish until every stream is done, duration elapses or Ctrl+C
+
+        Args:
+            duration: Maximum run time in seconds (None = until done)
+            report_interval: Print statistics every N seconds (0 = never)
+
+        Returns:
+            Final statistics (see get_statistics)
+        """
+        self.start()
+        start = time.monotonic()
+        next_report = start + report_interval
+        try:
+            while any(thread.is_alive() for thread in self.threads):
+                if duration is not None and time.monotonic() - start >= duration:
+                    break
+                time.sleep(0.05)
+                if report_interval > 0 and time.monotonic() >= next_report:
+                    next_report += report_interval
+                    self.print_statistics()
+        except KeyboardInterrupt:
+            print("\n🛑 Interrupted")
+        finally:
+            self.stop()
+        return self.get_statistics()
+
+    def _publisher_thread_func(self, index: int) -> None:
+        """Publisher thread: bind, wait for subscribers, send on schedule"""
+        stream = self.streams[index]
+        config = stream.config
+        stats = self._stats[index]
+
+        socket = self.context.socket(zmq.PUB)
+        socket.setsockopt(zmq.SNDHWM, self.sndhwm)
+        try:
+            socket.bind(config.address)
+            if self.stop_event.wait(self.warmup_s):
+                return
+
+            interval = 1.0 / config.rate_hz if config.rate_hz > 0 else 0.0
+            jitter_s = config.jitter_ms / 1000.0
+            start = time.perf_counter()
+            stats['start_time'] = start
+            sequence = 0
+
+            while not self.stop_event.is_set() and (config.count <= 0 or sequence < config.count):
+                if interval > 0:
+                    due = start + sequence * interval
+                    if jitter_s > 0:
+                        due += stream.rng.normal(0.0, jitter_s)
+                    delay = due - time.perf_counter()
+                    if delay > 0:
+                        if self.stop_event.wait(delay):
+                            break
+                    else:
+                        # Behind schedule: the channel cannot sustain its rate
+                        stats['max_lag_ms'] = max(stats['max_lag_ms'], -delay * 1000.0)
+
+                message = stream.message(sequence, time.time())
+                socket.send(message, copy=False)
+                stats['sent'] += 1
+                stats['bytes'] += len(message)
+                sequence += 1
+                stats['end_time'] = time.perf_counter()
+        finally:
+            # Flush queued messages after a completed count, drop them on stop
+            socket.close(linger=0 if self.stop_event.is_set() else 1000)
+
+    def get_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-stream publishing statistics
+
+        Returns:
+            Dict mapping '<channel>@<address>' to sent, bytes, elapsed_s,
+            rate_hz (achieved), mb_per_s and max_lag_ms (worst delay
+            behind schedule)
+        """
+        result = {}
+        for stream, stats in zip(self.streams, self._stats):
+            if stats['start_time'] is not None and stats['end_time'] is not None:
+                elapsed = stats['end_time'] - stats['start_time']
+            else:
+                elapsed = 0.0
+            result[f"{stream.config.channel}@{stream.config.address}"] = {
+                'sent': stats['sent'],
+                'bytes': stats['bytes'],
+                'elapsed_s': elapsed,
+                'rate_hz': (stats['sent'] - 1) / elapsed if elapsed > 0 else 0.0,
+                'mb_per_s': stats['bytes'] / 1024 / 1024 / elapsed if elapsed > 0 else 0.0,
+                'max_lag_ms': stats['max_lag_ms'],
+            }
+        return result
+
+    def print_statistics(self) -> None:
+        """Print per-stream statistics"""
+        for name, stats in self.get_statistics().items():
+            print(f"  📤 {name:<32} sent={stats['sent']:<8} {stats['rate_hz']:>9.1f} Hz "
+                  f"{stats['mb_per_s']:>8.2f} MB/s  max lag {stats['max_lag_ms']:.1f} ms")
+
+
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description='LCPS synthetic load generator (OBB / point cloud / status publisher)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--channels', nargs='+', choices=list(CHANNELS), default=list(CHANNELS),
+                        help='Channels to publish (default: all)')
+    parser.add_argument('--obb', type=str, default=DEFAULT_ADDRESSES['obb'],
+                        help=f"OBB bind address (default: {DEFAULT_ADDRESSES['obb']})")
+    parser.add_argument('--pc', type=str, default=DEFAULT_ADDRESSES['pointcloud'],
+                        help=f"Point cloud bind address (default: {DEFAULT_ADDRESSES['pointcloud']})")
+    parser.add_argument('--status', type=str, default=DEFAULT_ADDRESSES['status'],
+                        help=f"Status bind address (default: {DEFAULT_ADDRESSES['status']})")
+
+    parser.add_argument('--rate', type=float, default=10.0,
+                        help='Messages per second per channel, 0 = saturate (default: 10)')
+    parser.add_argument('--obb-rate', type=float, default=None, help='OBB rate (overrides --rate)')
+    parser.add_argument('--pc-rate', type=float, default=None, help='Point cloud rate (overrides --rate)')
+    parser.add_argument('--status-rate', type=float, default=None, help='Status rate (overrides --rate)')
+    parser.add_argument('--count', type=int, default=0,
+                        help='Messages per channel, 0 = unlimited (default: 0)')
+    parser.add_argument('--duration', type=float, default=None,
+                        help='Stop after N seconds (default: run until --count or Ctrl+C)')
+    parser.add_argument('--jitter-ms', type=float, default=0.0,
+                        help='Send time jitter (std dev, ms) (default: 0)')
+
+    parser.add_argument('--obb-format', choices=list(OBB_FORMATS), default='json',
+                        help='OBB wire format (default: json)')
+    parser.add_argument('--objects', type=int, default=10, help='OBBs per message (default: 10)')
+    parser.add_argument('--points', type=int, default=10_000,
+                        help='Points per point cloud message (default: 10000)')
+    parser.add_argument('--pool-size', type=int, default=8,
+                        help='Distinct pre-generated payloads per channel (default: 8)')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Payload generator seed (default: random)')
+    parser.add_argument('--warmup', type=float, default=0.5,
+                        help='Delay before the first message in seconds (default: 0.5)')
+    parser.add_argument('--report-interval', type=float, default=1.0,
+                        help='Print statistics every N seconds, 0 = only at the end (default: 1)')
+    return parser.parse_args(argv)
+
+
+def build_stream_configs(args: argparse.Namespace) -> List[StreamConfig]:
+    """Stream configurations from parsed command line arguments"""
+    addresses = {'obb': args.obb, 'pointcloud': args.pc, 'status': args.status}
+    rates = {'obb': args.obb_rate, 'pointcloud': args.pc_rate, 'status': args.status_rate}
+    return [
+        StreamConfig(
+            channel=channel,
+            address=addresses[channel],
+            rate_hz=rates[channel] if rates[channel] is not None else args.rate,
+            count=args.count,
+            jitter_ms=args.jitter_ms,
+            obb_format=args.obb_format,
+            objects=args.objects,
+            points=args.points,
+            pool_size=args.pool_size,
+        )
+        for channel in args.channels
+    ]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_arguments(argv)
+    configs = build_stream_configs(args)
+
+    print("🚀 LCPS load generator")
+    for config in configs:
+        rate = f"{config.rate_hz:g} Hz" if config.rate_hz > 0 else "saturate"
+        detail = {'obb': f"{config.objects} OBBs, {config.obb_format}",
+                  'pointcloud': f"{config.points} points",
+                  'status': "status"}[config.channel]
+        print(f"   {config.channel:<10} {config.address:<16} {rate:<10} {detail}")
+
+    generator = LoadGenerator(configs, seed=args.seed, warmup_s=args.warmup)
+    generator.run(duration=args.duration, report_interval=args.report_interval)
+
+    print("\n📊 Final statistics")
+    generator.print_statistics()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
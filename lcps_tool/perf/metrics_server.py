@@ -0,0 +1,341 @@
+"""
+Metrics Server - Prometheus text endpoint for the observation tool
+
+A stdlib-only HTTP server (http.server on a daemon thread) answering
+GET /metrics with the Prometheus text exposition format (version 0.0.4).
+
+Metrics are pulled at scrape time from the components' get_statistics()
+(receivers, DataSynchronizer, DataRecorder) and from the LatencyTracker
+histograms. The hot path only does what it already did - plain integer
+increments on its own threads - and takes no lock a scrape could hold,
+so scraping never blocks receiving, synchronizing or recording. Values of
+one scrape may be a few increments apart from each other, which counters
+and histograms tolerate.
+
+Usage:
+    collector = LCPSMetricsCollector(receiver, synchronizer, recorder, latency_tracker)
+    server = MetricsServer(collector.render, port=9108)
+    server.start()          # curl http://127.0.0.1:9108/metrics
+    server.stop()
+"""
+
+import math
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..layer2.latency_tracker import CHANNEL_STAGES, LatencyTracker
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+Labels = Dict[str, str]
+
+
+@dataclass
+class MetricFamily:
+    """
+    One Prometheus metric family
+
+    Attributes:
+        name: Metric name (e.g. "lcps_receiver_messages_total")
+        type: "counter", "gauge" or "histogram"
+        help: Help text
+        samples: (suffix, labels, value) tuples; suffix is appended to the
+            name ("" for counters/gauges, "_bucket"/"_sum"/"_count" for
+            histograms)
+    """
+
+    name: str
+    type: str
+    help: str
+    samples: List[Tuple[str, Labels, float]] = field(default_factory=list)
+
+    def add(self, value: float, suffix: str = '', **labels: str) -> None:
+        """Add a sample"""
+        self.samples.append((suffix, labels, value))
+
+
+def _format_value(value: float) -> str:
+    if value is None:
+        return 'NaN'
+    value = float(value)
+    if math.isnan(value):
+        return 'NaN'
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    return repr(value)
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def render_metrics(families: List[MetricFamily]) -> str:
+    """
+    Render metric families in the Prometheus text format
+
+    Args:
+        families: Metric families (families without samples are skipped)
+
+    Returns:
+        Exposition text
+    """
+    lines = []
+    for family in families:
+        if not family.samples:
+            continue
+        lines.append(f"# HELP {family.name} {_escape(family.help)}")
+        lines.append(f"# TYPE {family.name} {family.type}")
+        for suffix, labels, value in family.samples:
+            label_text = ','.join(f'{key}="{_escape(val)}"' for key, val in labels.items())
+            label_text = f"{{{label_text}}}" if label_text else ''
+            lines.append(f"{family.name}{suffix}{label_text} {_format_value(value)}")
+    return '\n'.join(lines) + '\n'
+
+
+class LCPSMetricsCollector:
+    """
+    Collects the observation tool's statistics as Prometheus metrics
+
+    Any component may be None (e.g. no recorder with --no-record).
+
+    Parameters:
+        receiver: MultiChannelReceiver
+        synchronizer: DataSynchronizer
+        recorder: DataRecorder
+        latency_tracker: LatencyTracker
+        frame_counter: Callable returning the tool's synced frame count
+        plugin_host: PluginHost
+    """
+
+    def __init__(self,
+                 receiver: Any = None,
+                 synchronizer: Any = None,
+                 recorder: Any = None,
+                 latency_tracker: Optional[LatencyTracker] = None,
+                 frame_counter: Optional[Callable[[], int]] = None,
+                 plugin_host: Any = None):
+        """
+        Initialize collector
+
+        Args:
+            receiver: MultiChannelReceiver
+            synchronizer: DataSynchronizer
+            recorder: DataRecorder
+            latency_tracker: LatencyTracker
+            frame_counter: Callable returning the synced frame count
+            plugin_host: PluginHost
+        """
+        self.receiver = receiver
+        self.synchronizer = synchronizer
+        self.recorder = recorder
+        self.latency_tracker = latency_tracker
+        self.frame_counter = frame_counter
+        self.plugin_host = plugin_host
+        self.start_time = time.time()
+
+    def collect(self) -> List[MetricFamily]:
+        """Metric families of the current statistics"""
+        families = [
+            MetricFamily('lcps_uptime_seconds', 'gauge', 'Seconds since the collector was created'),
+        ]
+        families[0].add(time.time() - self.start_time)
+
+        if self.frame_counter is not None:
+            frames = MetricFamily('lcps_synced_frames_total', 'counter', 'Synced frames processed by the main loop')
+            frames.add(self.frame_counter())
+            families.append(frames)
+
+        if self.receiver is not None:
+            families.extend(self._receiver_metrics(self.receiver.get_statistics()))
+        if self.synchronizer is not None:
+            families.extend(self._synchronizer_metrics(self.synchronizer.get_statistics()))
+        if self.recorder is not None:
+            families.extend(self._recorder_metrics(self.recorder.get_statistics()))
+        if self.latency_tracker is not None:
+            families.append(self._latency_metrics(self.latency_tracker))
+        if self.plugin_host is not None and self.plugin_host.workers:
+            families.extend(self._plugin_metrics(self.plugin_host.get_statistics()))
+        return families
+
+    def render(self) -> str:
+        """Exposition text of the current statistics"""
+        return render_metrics(self.collect())
+
+    @staticmethod
+    def _receiver_metrics(stats: Dict[str, Dict[str, Any]]) -> List[MetricFamily]:
+        messages = MetricFamily('lcps_receiver_messages_total', 'counter', 'Messages received per channel')
+        errors = MetricFamily('lcps_receiver_errors_total', 'counter', 'Receive or parse errors per channel')
+        dropped = MetricFamily('lcps_receiver_dropped_total', 'counter',
+                               'Messages evicted from a full receiver queue per channel')
+        queue = MetricFamily('lcps_receiver_queue_size', 'gauge', 'Messages waiting in the receiver queue')
+        running = MetricFamily('lcps_receiver_running', 'gauge', '1 if the receiver thread is alive')
+        last = MetricFamily('lcps_receiver_last_receive_timestamp_seconds', 'gauge',
+                            'Unix time of the last received message')
+        points = MetricFamily('lcps_pointcloud_points_total', 'counter',
+                              'Point cloud points before (stage="received") and after downsampling')
+        states = MetricFamily('lcps_status_states_total', 'counter', 'Status messages per LCPS state')
+
+        for channel, channel_stats in stats.items():
+            messages.add(channel_stats['msg_count'], channel=channel)
+            errors.add(channel_stats['error_count'], channel=channel)
+            dropped.add(channel_stats.get('dropped_count', 0), channel=channel)
+            queue.add(channel_stats['queue_size'], channel=channel)
+            running.add(int(channel_stats['is_running']), channel=channel)
+            if channel_stats.get('last_receive_time') is not None:
+                last.add(channel_stats['last_receive_time'], channel=channel)
+            downsampling = channel_stats.get('downsampling')
+            if downsampling:
+                points.add(downsampling['total_points_received'], channel=channel, stage='received')
+                points.add(downsampling['total_points_after_downsampling'], channel=channel,
+                           stage='downsampled')
+            for state, state_stats in channel_stats.get('states', {}).get('state_distribution', {}).items():
+                states.add(state_stats['count'], channel=channel, state=state)
+        return [messages, errors, dropped, queue, running, last, points, states]
+
+    @staticmethod
+    def _synchronizer_metrics(stats: Dict[str, Any]) -> List[MetricFamily]:
+        success = MetricFamily('lcps_sync_success_total', 'counter', 'Successfully synchronized frames')
+        success.add(stats['sync_success_count'])
+        fail = MetricFamily('lcps_sync_fail_total', 'counter', 'Synchronization attempts below min quality')
+        fail.add(stats['sync_fail_count'])
+        offset = MetricFamily('lcps_sync_avg_offset_ms', 'gauge', 'Average max channel offset of synced frames')
+        offset.add(stats['avg_sync_offset_ms'])
+        interpolated = MetricFamily('lcps_sync_interpolated_total', 'counter', 'Frames with interpolated OBB poses')
+        interpolated.add(stats.get('interpolated_count', 0))
+        buffers = MetricFamily('lcps_sync_buffer_size', 'gauge', 'Samples buffered per channel')
+        for channel, size in stats['buffer_status'].items():
+            buffers.add(size, channel=channel)
+        clock_offset = MetricFamily('lcps_clock_offset_ms', 'gauge', 'Estimated clock offset vs the reference channel')
+        clock_drift = MetricFamily('lcps_clock_drift_ppm', 'gauge', 'Estimated clock drift vs the reference channel')
+        for channel, estimate in stats.get('clock_offsets', {}).items():
+            clock_offset.add(estimate['offset_ms'], channel=channel, reference=estimate['reference'])
+            clock_drift.add(estimate['drift_ppm'], channel=channel, reference=estimate['reference'])
+        return [success, fail, offset, interpolated, buffers, clock_offset, clock_drift]
+
+    @staticmethod
+    def _recorder_metrics(stats: Dict[str, Any]) -> List[MetricFamily]:
+        recording = MetricFamily('lcps_recorder_recording', 'gauge', '1 while recording')
+        recording.add(int(stats['is_recording']))
+        frames = MetricFamily('lcps_recorder_frames_total', 'counter', 'Frames written to HDF5')
+        frames.add(stats['frame_count'])
+        dropped = MetricFamily('lcps_recorder_dropped_frames_total', 'counter', 'Frames dropped on a full write queue')
+        dropped.add(stats.get('dropped_count', 0))
+        queue = MetricFamily('lcps_recorder_queue_size', 'gauge', 'Frames waiting in the write queue')
+        if 'queue_size' in stats:
+            queue.add(stats['queue_size'])
+        size = MetricFamily('lcps_recorder_file_size_bytes', 'gauge', 'Size of the recording file')
+        if 'file_size_mb' in stats:
+            size.add(stats['file_size_mb'] * 1024 * 1024)
+        return [recording, frames, dropped, queue, size]
+
+    @staticmethod
+    def _plugin_metrics(stats: Dict[str, Dict[str, Any]]) -> List[MetricFamily]:
+        frames = MetricFamily('lcps_plugin_frames_total', 'counter',
+                              'Frames per plugin by outcome (processed, dropped, error)')
+        queue = MetricFamily('lcps_plugin_queue_size', 'gauge', 'Frames waiting in the plugin queue')
+        time_ms = MetricFamily('lcps_plugin_process_time_ms', 'gauge',
+                               'Plugin processing time per frame (stat="avg", "p95", "max")')
+        for name, plugin_stats in stats.items():
+            frames.add(plugin_stats['processed'], plugin=name, outcome='processed')
+            frames.add(plugin_stats['dropped'], plugin=name, outcome='dropped')
+            frames.add(plugin_stats['errors'], plugin=name, outcome='error')
+            queue.add(plugin_stats['queue_size'], plugin=name)
+            for stat in ('avg', 'p95', 'max'):
+                time_ms.add(plugin_stats[f'{stat}_time_ms'], plugin=name, stat=stat)
+        return [frames, queue, time_ms]
+
+    @staticmethod
+    def _latency_metrics(tracker: LatencyTracker) -> MetricFamily:
+        family = MetricFamily('lcps_stage_latency_seconds', 'histogram',
+                              'Pipeline stage latency (network, parse, queue, sync per channel; record per frame)')
+        for name, histogram in list(tracker.histograms.items()):
+            buckets = histogram.cumulative_buckets()
+            if buckets[-1][1] == 0:
+                continue
+            channel, _, stage = name.rpartition('_')
+            if stage not in CHANNEL_STAGES:
+                channel, stage = 'frame', name
+            for bound_ms, cumulative in buckets:
+                le = '+Inf' if math.isinf(bound_ms) else repr(bound_ms / 1000.0)
+                family.add(cumulative, '_bucket', channel=channel, stage=stage, le=le)
+            family.add(histogram.sum_ms / 1000.0, '_sum', channel=channel, stage=stage)
+            # Count from the same bucket snapshot, so _count == +Inf bucket
+            family.add(buckets[-1][1], '_count', channel=channel, stage=stage)
+        return family
+
+
+class MetricsServer:
+    """
+    Background HTTP server exposing /metrics
+
+    Parameters:
+        render: Callable returning the exposition text
+        host: Bind address (default: localhost only)
+        port: TCP port (0 = pick a free port, see .port after start)
+    """
+
+    def __init__(self, render: Callable[[], str], host: str = '127.0.0.1', port: int = 9108):
+        """
+        Initialize metrics server
+
+        Args:
+            render: Callable returning the exposition text
+            host: Bind address
+            port: TCP port (0 = any free port)
+        """
+        self.render = render
+        self.host = host
+        self.port = port
+        self.httpd: Optional[ThreadingHTTPServer] = None
+        self.server_thread: Optional[threading.Thread] = None
+        self.scrape_count = 0
+
+    def start(self) -> None:
+        """Bind and serve on a daemon thread"""
+        if self.server_thread is not None and self.server_thread.is_alive():
+            print("⚠️ [Metrics] Server already running")
+            return
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] != '/metrics':
+                    self.send_error(404, "Only /metrics is served")
+                    return
+                try:
+                    body = server.render().encode('utf-8')
+                except Exception as e:
+                    self.send_error(500, f"Failed to collect metrics: {e}")
+                    return
+                server.scrape_count += 1
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # No per-request logging on stdout
+
+        self.httpd = ThreadingHTTPServer((self.host, self.port), Handler)
+        self.httpd.daemon_threads = True
+        self.port = self.httpd.server_address[1]
+        self.server_thread = threading.Thread(target=self.httpd.serve_forever, daemon=True,
+                                              name="Metrics-Server")
+        self.server_thread.start()
+        print(f"✅ [Metrics] Serving http://{self.host}:{self.port}/metrics")
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Shut the server down"""
+        if self.httpd is None:
+            return
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self.server_thread is not None:
+            self.server_thread.join(timeout=timeout)
+        self.httpd = None
+        self.server_thread = None
@@ -0,0 +1,323 @@
+"""
+Sampling Profiler - Wall-clock stack sampling of all threads
+
+A background thread snapshots every thread's stack (sys._current_frames)
+at a fixed interval: receiver threads, HDF5-Writer, the main loop, ...
+Nothing is instrumented, so the profiled threads pay only for the GIL the
+sampler briefly holds; at the default 100 Hz that is well below 1% CPU.
+
+Samples are aggregated as collapsed stacks, one line per unique stack:
+
+    HDF5-Writer;_writer_thread_func (data_recorder.py:217);... 42
+
+which flamegraph.pl, speedscope or inferno render directly. The first
+frame is the thread name, so one flame graph shows all threads side by
+side. Sampling is wall-clock: threads blocked in zmq polls or queue waits
+show up too, which is what is needed to find where a thread is waiting.
+
+LatencySpikeProfiler samples continuously into a short ring buffer and,
+when the LatencyTracker reports a stage latency above a threshold, writes
+the samples of a fixed window around the spike.
+
+Usage:
+    profiler = SamplingProfiler(interval_s=0.01)
+    profiler.start()
+    ...
+    profiler.stop()
+    profiler.write_collapsed('profiles/run.folded')
+"""
+
+import bisect
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from datetime import datetime
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+from ..layer2.latency_tracker import LATENCY_COLUMNS, LatencyTracker
+
+
+class SamplingProfiler:
+    """
+    Periodic stack sampler for all Python threads
+
+    Parameters:
+        interval_s: Sampling interval in seconds (default: 10 ms = 100 Hz)
+        history_s: Keep (time, stack) samples of the last N seconds for
+            window() (0 = aggregate counts only)
+    """
+
+    THREAD_NAME = "Sampling-Profiler"
+
+    def __init__(self, interval_s: float = 0.01, history_s: float = 0.0):
+        """
+        Initialize profiler
+
+        Args:
+            interval_s: Sampling interval in seconds
+            history_s: Seconds of individual samples kept for window()
+
+        Raises:
+            ValueError: If interval_s is not positive
+        """
+        if interval_s <= 0:
+            raise ValueError(f"interval_s must be positive, got {interval_s}")
+        self.interval_s = interval_s
+        self.history_s = history_s
+
+        # Collapsed stack -> sample count
+        self.counts: Counter = Counter()
+        self.history: Deque[Tuple[float, str]] = deque()
+        self.sample_count = 0
+        self.start_time: Optional[float] = None
+        self.elapsed_s = 0.0
+
+        self._labels: Dict[object, str] = {}  # code object -> frame label
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the sampler thread is alive"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start sampling on a daemon thread"""
+        if self.is_running:
+            print("⚠️ [Profiler] Already running")
+            return
+        self._stop_event.clear()
+        self.start_time = time.perf_counter()
+        self._thread = threading.Thread(target=self._sampler_thread_func, daemon=True,
+                                        name=self.THREAD_NAME)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop sampling (collected samples are kept)"""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join(timeout=timeout)
+        self._thread = None
+        if self.start_time is not None:
+            self.elapsed_s += time.perf_counter() - self.start_time
+            self.start_time = None
+
+    def reset(self) -> None:
+        """Drop all samples"""
+        self.counts = Counter()
+        self.history.clear()
+        self.sample_count = 0
+        self.elapsed_s = 0.0
+
+    def window(self, start: float, end: float) -> Counter:
+        """
+        Collapsed stack counts of the samples taken in [start, end]
+
+        Args:
+            start: Window start (time.perf_counter)
+            end: Window end (time.perf_counter)
+
+        Returns:
+            Counter of collapsed stacks (empty without history_s)
+        """
+        return Counter(stack for sample_time, stack in list(self.history)
+                       if start <= sample_time <= end)
+
+    def write_collapsed(self, path: str, counts: Optional[Counter] = None) -> int:
+        """
+        Write collapsed stacks ("frame;frame;... count" per line)
+
+        Args:
+            path: Output file (parent directories are created)
+            counts: Stack counts to write (default: all samples)
+
+        Returns:
+            Number of unique stacks written
+        """
+        counts = self.counts if counts is None else counts
+        output = Path(path)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        lines = [f"{stack} {count}\n" for stack, count in sorted(counts.items())]
+        with open(output, 'w', encoding='utf-8') as f:
+            f.writelines(lines)
+        return len(lines)
+
+    def get_statistics(self) -> Dict[str, float]:
+        """Sampling statistics"""
+        elapsed = self.elapsed_s
+        if self.start_time is not None:
+            elapsed += time.perf_counter() - self.start_time
+        return {
+            'sample_count': self.sample_count,
+            'unique_stacks': len(self.counts),
+            'elapsed_s': elapsed,
+            'rate_hz': self.sample_count / elapsed if elapsed > 0 else 0.0,
+        }
+
+    def _sampler_thread_func(self) -> None:
+        """Sampler thread main function"""
+        own_ident = threading.get_ident()
+        next_time = time.perf_counter()
+        while not self._stop_event.is_set():
+            now = time.perf_counter()
+            self._sample(now, own_ident)
+            self._after_sample(now)
+
+            next_time += self.interval_s
+            delay = next_time - time.perf_counter()
+            if delay < 0:
+                # Fell behind (GIL held by a long C call): skip, don't burst
+                next_time = time.perf_counter()
+                delay = 0.0
+            self._stop_event.wait(delay)
+
+    def _sample(self, now: float, own_ident: int) -> None:
+        """Take one snapshot of all thread stacks"""
+        frames = sys._current_frames()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in frames.items():
+            if ident == own_ident:
+                continue
+            stack = f"{names.get(ident, f'thread-{ident}')};{self._collapse(frame)}"
+            self.counts[stack] += 1
+            if self.history_s > 0:
+                self.history.append((now, stack))
+        self.sample_count += 1
+
+        if self.history_s > 0:
+            horizon = now - self.history_s
+            while self.history and self.history[0][0] < horizon:
+                self.history.popleft()
+
+    def _after_sample(self, now: float) -> None:
+        """Hook run on the sampler thread after every sample"""
+
+    def _collapse(self, frame) -> str:
+        """Collapsed stack of a frame, root first"""
+        labels: List[str] = []
+        while frame is not None:
+            code = frame.f_code
+            label = self._labels.get(code)
+            if label is None:
+                # Aggregate per function (first line), not per current line
+                filename = os.path.basename(code.co_filename)
+                label = f"{code.co_name} ({filename}:{code.co_firstlineno})".replace(';', ':')
+                self._labels[code] = label
+            labels.append(label)
+            frame = frame.f_back
+        return ';'.join(reversed(labels))
+
+
+class LatencySpikeProfiler(SamplingProfiler):
+    """
+    Profiles a fixed window around latency spikes
+
+    Samples continuously into a ring buffer of pre_s + post_s seconds and
+    watches the LatencyTracker histograms from the sampler thread (no hot
+    path cost). When a watched column gets a sample above threshold_ms,
+    the samples from pre_s before to post_s after the detection are
+    written to output_dir/spike_<n>_<column>_<time>.folded.
+
+    The threshold is rounded up to the next histogram bucket bound (the
+    tracker keeps bucket counts, not individual samples).
+
+    Parameters:
+        tracker: LatencyTracker fed by the pipeline
+        output_dir: Directory for the collapsed stack files
+        threshold_ms: Latency that counts as a spike
+        pre_s: Seconds profiled before the detection
+        post_s: Seconds profiled after the detection
+        cooldown_s: Minimum seconds between two captures
+        max_captures: Stop capturing after this many files
+        columns: Watched LATENCY_COLUMNS (default: all)
+        interval_s: Sampling interval in seconds
+    """
+
+    CHECK_INTERVAL_S = 0.05
+
+    def __init__(self,
+                 tracker: LatencyTracker,
+                 output_dir: str,
+                 threshold_ms: float = 100.0,
+                 pre_s: float = 1.0,
+                 post_s: float = 1.0,
+                 cooldown_s: float = 10.0,
+                 max_captures: int = 20,
+                 columns: Optional[Sequence[str]] = None,
+                 interval_s: float = 0.01):
+        """
+        Initialize spike profiler
+
+        Args:
+            tracker: LatencyTracker fed by the pipeline
+            output_dir: Directory for the collapsed stack files
+            threshold_ms: Latency that counts as a spike
+            pre_s: Seconds profiled before the detection
+            post_s: Seconds profiled after the detection
+            cooldown_s: Minimum seconds between two captures
+            max_captures: Maximum number of capture files
+            columns: Watched latency columns (default: LATENCY_COLUMNS)
+            interval_s: Sampling interval in seconds
+        """
+        super().__init__(interval_s=interval_s, history_s=pre_s + post_s)
+        self.tracker = tracker
+        self.output_dir = Path(output_dir)
+        self.threshold_ms = threshold_ms
+        self.pre_s = pre_s
+        self.post_s = post_s
+        self.cooldown_s = cooldown_s
+        self.max_captures = max_captures
+        self.columns = tuple(columns) if columns else LATENCY_COLUMNS
+
+        # Spikes = samples in the buckets above the threshold bucket
+        self._first_spike_bucket = bisect.bisect_left(tracker.buckets_ms, threshold_ms) + 1
+        self._spike_counts: Dict[str, int] = {column: self._count_spikes(column) for column in self.columns}
+        self._pending: Optional[Tuple[float, str]] = None  # (detection time, column)
+        self._last_capture = -float('inf')
+        self._last_check = 0.0
+        self.captures: List[str] = []
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop sampling, writing a capture still waiting for its post window"""
+        super().stop(timeout)
+        if self._pending is not None:
+            self._write_capture(*self._pending)
+            self._pending = None
+
+    def _count_spikes(self, column: str) -> int:
+        histogram = self.tracker.histograms.get(column)
+        return sum(histogram.counts[self._first_spike_bucket:]) if histogram else 0
+
+    def _after_sample(self, now: float) -> None:
+        """Detect spikes and write due captures (sampler thread)"""
+        if self._pending is not None and now - self._pending[0] >= self.post_s:
+            self._write_capture(*self._pending)
+            self._pending = None
+
+        if now - self._last_check < self.CHECK_INTERVAL_S:
+            return
+        self._last_check = now
+
+        for column in self.columns:
+            spikes = self._count_spikes(column)
+            if spikes < self._spike_counts[column]:
+                self._spike_counts[column] = spikes  # Tracker was reset
+            elif spikes > self._spike_counts[column]:
+                self._spike_counts[column] = spikes
+                if (self._pending is None and len(self.captures) < self.max_captures
+                        and now - self._last_capture >= self.cooldown_s):
+                    self._pending = (now, column)
+                    self._last_capture = now
+
+    def _write_capture(self, detected: float, column: str) -> None:
+        counts = self.window(detected - self.pre_s, detected + self.post_s)
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        path = self.output_dir / f"spike_{len(self.captures):03d}_{column}_{stamp}.folded"
+        self.write_collapsed(str(path), counts)
+        self.captures.append(str(path))
+        print(f"🔥 [Profiler] {column} latency > {self.threshold_ms:g} ms, "
+              f"wrote {sum(counts.values())} samples to {path}")
@@ -0,0 +1,101 @@
+"""
+Startup Timing - Where the time until a process is ready goes
+
+StartupTimer measures from process start (taken from /proc on Linux, so the
+interpreter start-up and module imports are included) through named phases
+to "ready", and reports which heavy optional modules got loaded on the way.
+Used by --startup-time of lcps_tool.main and recvOBB.py.
+
+Usage:
+    timer = StartupTimer()          # first thing in main()
+    ...
+    timer.mark('receivers started')
+    timer.print_report()
+"""
+
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# Modules that should only be loaded by the features that need them
+HEAVY_MODULES = ('h5py', 'pygame', 'OpenGL', 'imgui', 'http.server', 'multiprocessing', 'scipy')
+
+
+def process_start_time() -> Optional[float]:
+    """
+    Wall clock time the current process started
+
+    Returns:
+        Unix time (10 ms resolution), or None where /proc is unavailable
+    """
+    try:
+        with open('/proc/self/stat', 'rb') as f:
+            # Field 22 (starttime, clock ticks after boot); comm may contain spaces
+            fields = f.read().rsplit(b')', 1)[1].split()
+        with open('/proc/uptime', 'rb') as f:
+            uptime = float(f.read().split()[0])
+        ticks = os.sysconf('SC_CLK_TCK')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+    age = uptime - int(fields[19]) / ticks
+    return time.time() - max(age, 0.0)
+
+
+class StartupTimer:
+    """
+    Phase timer from process start to ready
+
+    The first phase ("interpreter + imports") runs from process start to the
+    creation of the timer; without /proc it is omitted and timing starts at
+    the timer.
+    """
+
+    def __init__(self):
+        """Initialize timer (create it first thing in main())"""
+        now = time.time()
+        self.process_start = process_start_time()
+        self.origin = self.process_start if self.process_start is not None else now
+        self.marks: List[Tuple[str, float]] = []
+        if self.process_start is not None:
+            self.marks.append(('interpreter + imports', now))
+
+    def mark(self, phase: str) -> None:
+        """
+        End a phase
+
+        Args:
+            phase: Name of the phase that just finished
+        """
+        self.marks.append((phase, time.time()))
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Phase durations and loaded heavy modules
+
+        Returns:
+            Dict with 'phases' [(name, ms)], 'total_ms', 'from_process_start',
+            'module_count' and 'heavy_modules' (loaded HEAVY_MODULES)
+        """
+        phases, previous = [], self.origin
+        for phase, stamp in self.marks:
+            phases.append((phase, (stamp - previous) * 1000.0))
+            previous = stamp
+        return {
+            'phases': phases,
+            'total_ms': (previous - self.origin) * 1000.0,
+            'from_process_start': self.process_start is not None,
+            'module_count': len(sys.modules),
+            'heavy_modules': [name for name in HEAVY_MODULES if name in sys.modules],
+        }
+
+    def print_report(self) -> None:
+        """Print the startup report"""
+        report = self.report()
+        print("\n⏱️  Startup time:")
+        for phase, ms in report['phases']:
+            print(f"  {phase:28} {ms:8.1f} ms")
+        origin = "process start" if report['from_process_start'] else "timer creation"
+        print(f"  {'total (from ' + origin + ')':28} {report['total_ms']:8.1f} ms")
+        heavy = ', '.join(report['heavy_modules']) or 'none'
+        print(f"  Modules loaded: {report['module_count']} | Heavy: {heavy}")
@@ -0,0 +1,146 @@
+"""
+Synthetic LCPS Data - Seeded OBB, point cloud and status messages
+
+Message builders shared by the benchmark suite and the load generator.
+Messages follow the publisher formats the receivers accept:
+- OBB: LCPS protocol (header + payload) as JSON (sendOBB/sender.cpp normal
+  mode), zlib + BSON, or sender.cpp compressed mode (4-byte big-endian
+  original size followed by zlib-compressed JSON)
+- Point cloud: JSON {"timestamp", "frame_id", "points": [[x, y, z], ...]}
+- Status: JSON {"state", "timestamp", "frame_id", "metrics", "detection"}
+"""
+
+import json
+import struct
+import zlib
+from typing import Any, Dict, List
+
+import bson
+import numpy as np
+
+OBB_FORMATS = ('json', 'zlib_bson', 'zlib_json')
+
+_STATES = ('idle', 'detecting', 'alerting')
+
+
+def make_obbs(count: int, rng: np.random.Generator) -> List[Dict[str, Any]]:
+    """
+    Random OBB dicts in the receiver format
+
+    Args:
+        count: Number of OBBs
+        rng: Random generator
+
+    Returns:
+        List of OBB dicts (position, quaternion rotation, size, type, collision)
+    """
+    positions = rng.uniform(-50.0, 50.0, (count, 3))
+    quaternions = rng.normal(size=(count, 4))
+    quaternions /= np.linalg.norm(quaternions, axis=1, keepdims=True)
+    sizes = rng.uniform(0.5, 12.0, (count, 3))
+    collision = rng.random(count) < 0.1
+    return [
+        {
+            'type': 'spreader' if i == 0 else 'container',
+            'position': positions[i].tolist(),
+            'rotation': quaternions[i].tolist(),
+            'size': sizes[i].tolist(),
+            'collision': bool(collision[i]),
+        }
+        for i in range(count)
+    ]
+
+
+def make_obb_message(count: int, rng: np.random.Generator,
+                     timestamp: float = 0.0, seq_id: int = 0) -> Dict[str, Any]:
+    """OBB message in the LCPS protocol format (header + payload)"""
+    return {
+        'header': {'timestamp': timestamp, 'seq_id': seq_id, 'source': 'synthetic'},
+        'payload': {'obbs': make_obbs(count, rng)},
+    }
+
+
+def encode_obb_message(message: Dict[str, Any], fmt: str) -> bytes:
+    """
+    Encode an OBB message for the wire
+
+    Args:
+        message: OBB message
+        fmt: "json" (normal mode), "zlib_bson" or "zlib_json"
+            (sender.cpp compressed mode: size prefix + zlib JSON)
+
+    Returns:
+        Message bytes
+
+    Raises:
+        ValueError: If format is unknown
+    """
+    if fmt == 'json':
+        return json.dumps(message).encode('utf-8')
+    if fmt == 'zlib_bson':
+        return zlib.compress(bson.encode(message))
+    if fmt == 'zlib_json':
+        raw = json.dumps(message).encode('utf-8')
+        return struct.pack('>I', len(raw)) + zlib.compress(raw)
+    raise ValueError(f"Unknown OBB format: {fmt}. Must be one of {OBB_FORMATS}")
+
+
+def make_points(count: int, rng: np.random.Generator, clusters: int = 32) -> np.ndarray:
+    """
+    Clustered point cloud (objects on a yard-sized area)
+
+    Args:
+        count: Number of points
+        rng: Random generator
+        clusters: Number of point clusters
+
+    Returns:
+        Nx3 float32 points
+    """
+    centers = rng.uniform([-40.0, -40.0, 0.0], [40.0, 40.0, 10.0], (clusters, 3))
+    labels = rng.integers(0, clusters, count)
+    points = centers[labels] + rng.normal(scale=1.5, size=(count, 3))
+    return points.astype(np.float32)
+
+
+def encode_points(points: np.ndarray) -> bytes:
+    """JSON encoding of a point array (millimetre precision)"""
+    return json.dumps(np.round(points.astype(np.float64), 3).tolist()).encode('utf-8')
+
+
+def make_pointcloud_message(points: np.ndarray, timestamp: float = 0.0, frame_id: int = 0) -> bytes:
+    """Point cloud message as sent by the LCPS point cloud publisher (JSON)"""
+    return pointcloud_message_from_encoded(encode_points(points), timestamp, frame_id)
+
+
+def pointcloud_message_from_encoded(encoded_points: bytes, timestamp: float, frame_id: int) -> bytes:
+    """
+    Point cloud message around pre-encoded points
+
+    Lets publishers stamp the send time without re-encoding the points.
+    """
+    return (b'{"timestamp": ' + repr(float(timestamp)).encode('ascii')
+            + b', "frame_id": ' + str(int(frame_id)).encode('ascii')
+            + b', "points": ' + encoded_points + b'}')
+
+
+def make_status_message(rng: np.random.Generator, timestamp: float = 0.0, frame_id: int = 0,
+                        obb_count: int = 0) -> bytes:
+    """Status message as sent by the LCPS status publisher (JSON)"""
+    state = _STATES[int(rng.integers(len(_STATES)))]
+    return json.dumps({
+        'state': state,
+        'timestamp': timestamp,
+        'frame_id': frame_id,
+        'metrics': {
+            'fps': float(rng.normal(10.0, 0.2)),
+            'latency_ms': float(rng.gamma(4.0, 5.0)),
+            'cpu_usage': float(rng.uniform(20.0, 60.0)),
+            'memory_mb': float(rng.uniform(400.0, 600.0)),
+        },
+        'detection': {
+            'obb_count': obb_count,
+            'collision_count': int(state == 'alerting'),
+            'safe': state != 'alerting',
+        },
+    }).encode('utf-8')
@@ -0,0 +1,25 @@
+"""
+Plugins: EventBus and plugin host
+
+Runs analyzer and exporter plugins (docs/design/LCPS_CLIENT_PLUGIN_ARCHITECTURE.md)
+on per-plugin worker threads or processes, fed with synced frames by reference.
+"""
+
+from .event_bus import ANOMALY_EVENT, FRAME_EVENT, EventBus
+from .interfaces import FrameAnalyzerPlugin, IAnalyzerPlugin, IExporterPlugin, IPlugin
+from .plugin_host import DROP_POLICIES, EXECUTORS, PluginHost, PluginWorker, load_plugin_class
+
+__all__ = [
+    'ANOMALY_EVENT',
+    'DROP_POLICIES',
+    'EXECUTORS',
+    'EventBus',
+    'FRAME_EVENT',
+    'FrameAnalyzerPlugin',
+    'IAnalyzerPlugin',
+    'IExporterPlugin',
+    'IPlugin',
+    'PluginHost',
+    'PluginWorker',
+    'load_plugin_class',
+]
@@ -0,0 +1,106 @@
+"""
+Event Bus - Synchronous publish/subscribe between pipeline and plugins
+
+Events are delivered by reference to every subscriber, in subscription
+order, on the publishing thread. Subscribers must therefore be cheap: the
+PluginHost subscribes each plugin's queue, not the plugin itself, so the
+publisher only pays for an enqueue per plugin.
+
+A failing subscriber is counted and reported, and never stops delivery to
+the others.
+
+Usage:
+    bus = EventBus()
+    bus.subscribe(ANOMALY_EVENT, lambda anomaly: print(anomaly.message))
+    bus.publish(ANOMALY_EVENT, anomaly)
+"""
+
+import threading
+from typing import Any, Callable, Dict, List
+
+# Event names used by the observation tool
+FRAME_EVENT = 'synced_frame'          # data: SyncedFrame
+ANOMALY_EVENT = 'anomaly_detected'    # data: layer3 Anomaly
+
+
+class EventBus:
+    """
+    Thread-safe event bus
+
+    Subscribing and unsubscribing may happen on any thread; publish()
+    iterates over a snapshot of the subscriber list, so delivery takes no
+    lock. The counters are updated under the lock, since events are
+    published from several threads (pipeline, plugin workers).
+    """
+
+    def __init__(self):
+        """Initialize event bus"""
+        self.subscribers: Dict[str, List[Callable[[Any], None]]] = {}
+        self._lock = threading.Lock()
+        self.published_count: Dict[str, int] = {}
+        self.error_count = 0
+
+    def subscribe(self, event: str, callback: Callable[[Any], None]) -> None:
+        """
+        Subscribe to an event
+
+        Args:
+            event: Event name (e.g. FRAME_EVENT, ANOMALY_EVENT)
+            callback: Called with the event data
+        """
+        with self._lock:
+            # Copy on write: publish() may be iterating the old list
+            self.subscribers[event] = self.subscribers.get(event, []) + [callback]
+
+    def unsubscribe(self, event: str, callback: Callable[[Any], None]) -> None:
+        """
+        Remove a subscription (no-op if not subscribed)
+
+        Args:
+            event: Event name
+            callback: Previously subscribed callback
+        """
+        with self._lock:
+            callbacks = [cb for cb in self.subscribers.get(event, []) if cb != callback]
+            if callbacks:
+                self.subscribers[event] = callbacks
+            else:
+                self.subscribers.pop(event, None)
+
+    def subscriber_count(self, event: str) -> int:
+        """Number of subscribers of an event"""
+        return len(self.subscribers.get(event, ()))
+
+    def publish(self, event: str, data: Any) -> int:
+        """
+        Deliver an event to all subscribers
+
+        Args:
+            event: Event name
+            data: Event data (passed by reference, not copied)
+
+        Returns:
+            Number of subscribers that handled the event without error
+        """
+        callbacks = self.subscribers.get(event, ())
+        with self._lock:
+            self.published_count[event] = self.published_count.get(event, 0) + 1
+        delivered = 0
+        for callback in callbacks:
+            try:
+                callback(data)
+                delivered += 1
+            except Exception as e:
+                with self._lock:
+                    self.error_count += 1
+                print(f"❌ [EventBus] Error handling '{event}': {e}")
+        return delivered
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get event bus statistics"""
+        with self._lock:
+            return {
+                'subscribers': {event: len(callbacks) for event, callbacks in self.subscribers.items()},
+                'published': dict(self.published_count),
+                'error_count': self.error_count,
+            }
@@ -0,0 +1,168 @@
+"""
+Plugin Interfaces - IPlugin, IAnalyzerPlugin, IExporterPlugin
+
+Interfaces of docs/design/LCPS_CLIENT_PLUGIN_ARCHITECTURE.md (section 2)
+for plugins fed with live SyncedFrames by the PluginHost.
+
+Every plugin runs on its own worker (thread or process), so its methods
+are never called concurrently; on_frame() sees the frames in order, minus
+the ones its drop policy discarded. Frames are shared with the recorder
+and the other plugins by reference: plugins must not modify them.
+
+Lifecycle:
+    on_init(config) -> on_enable()        PluginHost.start()
+    on_frame(frame)...                    worker, per queued frame
+    on_disable() -> on_destroy()          worker, after the queue is drained
+Process plugins go through the whole lifecycle in their worker process.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List
+
+from ..data_models.synced_frame import SyncedFrame
+from ..layer3.anomaly_detectors import Anomaly, AnomalyDetector
+from ..layer3.base_analyzer import FrameAnalyzer
+
+
+class IPlugin(ABC):
+    """
+    Plugin base class
+
+    Subclasses implement get_metadata() and on_frame(); the lifecycle hooks
+    default to no-ops.
+    """
+
+    @abstractmethod
+    def get_metadata(self) -> Dict[str, Any]:
+        """
+        Plugin metadata
+
+        Returns:
+            Dict with at least 'name'; optionally 'version', 'author',
+            'description'
+        """
+        pass
+
+    def on_init(self, config: Dict[str, Any]) -> None:
+        """
+        Initialize plugin
+
+        Args:
+            config: Plugin 'config' section of the plugin configuration
+        """
+
+    def on_enable(self) -> None:
+        """Called before the first frame"""
+
+    def on_disable(self) -> None:
+        """Called after the last frame"""
+
+    def on_destroy(self) -> None:
+        """Release resources (threads, file handles, ...)"""
+
+    @abstractmethod
+    def on_frame(self, frame: SyncedFrame) -> Any:
+        """
+        Process one synced frame (read-only)
+
+        Args:
+            frame: Synchronized frame, shared by reference
+
+        Returns:
+            Plugin-specific result (anomalies for analyzer plugins)
+        """
+        pass
+
+
+class IAnalyzerPlugin(IPlugin):
+    """
+    Analysis / detection plugin
+
+    Anomalies returned by analyze() are passed to on_anomaly_detected() on
+    the plugin's worker and published as ANOMALY_EVENT by the host.
+    """
+
+    @abstractmethod
+    def analyze(self, frame: SyncedFrame) -> List[Anomaly]:
+        """
+        Analyze one frame
+
+        Args:
+            frame: Synchronized frame
+
+        Returns:
+            Detected anomalies (empty list if none)
+        """
+        pass
+
+    def on_anomaly_detected(self, anomaly: Anomaly) -> None:
+        """Called for every anomaly returned by analyze()"""
+
+    def on_frame(self, frame: SyncedFrame) -> List[Anomaly]:
+        """Run analyze() and the anomaly callback"""
+        anomalies = self.analyze(frame)
+        for anomaly in anomalies:
+            self.on_anomaly_detected(anomaly)
+        return anomalies
+
+
+class IExporterPlugin(IPlugin):
+    """
+    Data export plugin (streams frames to an external format or service)
+    """
+
+    @abstractmethod
+    def export_frame(self, frame: SyncedFrame) -> None:
+        """
+        Export one frame
+
+        Args:
+            frame: Synchronized frame
+        """
+        pass
+
+    @abstractmethod
+    def get_supported_formats(self) -> List[str]:
+        """Supported export formats"""
+        pass
+
+    def on_frame(self, frame: SyncedFrame) -> None:
+        """Export the frame"""
+        self.export_frame(frame)
+
+
+class FrameAnalyzerPlugin(IAnalyzerPlugin):
+    """
+    Runs a layer 3 FrameAnalyzer as an analyzer plugin
+
+    Anomaly detectors report their anomalies; other analyzers (point
+    membership, clearance) only keep their statistics.
+
+    Parameters:
+        analyzer: Wrapped analyzer
+    """
+
+    def __init__(self, analyzer: FrameAnalyzer):
+        """
+        Initialize plugin
+
+        Args:
+            analyzer: Wrapped analyzer
+        """
+        self.analyzer = analyzer
+
+    def get_metadata(self) -> Dict[str, Any]:
+        """Metadata (named after the analyzer)"""
+        return {
+            'name': self.analyzer.name,
+            'description': f"{type(self.analyzer).__name__} (layer 3 analyzer)",
+        }
+
+    def analyze(self, frame: SyncedFrame) -> List[Anomaly]:
+        """Run the analyzer on one frame"""
+        result = self.analyzer.process_frame(frame)
+        return result if isinstance(self.analyzer, AnomalyDetector) else []
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Statistics of the wrapped analyzer"""
+        return self.analyzer.get_statistics()
@@ -0,0 +1,512 @@
+"""
+Plugin Host - Fans synced frames out to plugins on their own workers
+
+The main loop publishes every SyncedFrame once on the EventBus; each plugin
+is subscribed through a PluginWorker that only enqueues the frame (by
+reference) and returns. The plugin runs on the worker's thread, or in a
+worker process, so a slow analyzer delays nothing but its own queue: the
+recorder and the other plugins keep their pace.
+
+Each worker has a bounded queue and a drop policy for when the plugin
+falls behind:
+    drop_oldest: Evict the oldest queued frame (plugin sees the latest data)
+    drop_newest: Discard the incoming frame (plugin sees a contiguous prefix)
+    block:       Wait for room (backpressure: stalls the publisher, use only
+                 for plugins that must see every frame)
+
+With a SyncedFramePool, the worker retains every frame it accepts and
+releases it once processed or dropped, so pooled frames are recycled only
+after the recorder and all plugins are done with them.
+
+Process workers ("executor": "process") run the plugin in a dedicated
+spawned process, for CPU-bound pure-Python plugins that would otherwise
+compete for the GIL. Frames are pickled there (not shared), and the plugin
+instance lives in the child: its own statistics are not visible to the
+host.
+
+Usage:
+    host = PluginHost(frame_pool=pool)
+    host.add_plugin(FrameAnalyzerPlugin(ClearanceAnalyzer()))
+    host.start()
+    host.publish_frame(frame)   # per synced frame
+    host.stop()
+"""
+
+import importlib
+import pickle
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from ..data_models.synced_frame import SyncedFrame, SyncedFramePool
+from ..layer2.latency_tracker import LatencyHistogram
+from .event_bus import ANOMALY_EVENT, FRAME_EVENT, EventBus
+from .interfaces import IAnalyzerPlugin, IExporterPlugin, IPlugin
+
+DROP_POLICIES = ('drop_oldest', 'drop_newest', 'block')
+EXECUTORS = ('thread', 'process')
+
+# Plugin categories of the configuration file -> required interface
+PLUGIN_CATEGORIES = {
+    'analyzers': IAnalyzerPlugin,
+    'exporters': IExporterPlugin,
+}
+
+_STOP = object()  # Worker queue sentinel
+
+# Plugin instance of a process worker (set in the child by _init_process_plugin)
+_process_plugin: Optional[IPlugin] = None
+
+
+def _init_process_plugin(payload: bytes) -> None:
+    """Process worker initializer: unpickle, init and enable the plugin"""
+    global _process_plugin
+    plugin, config = pickle.loads(payload)
+    plugin.on_init(config)
+    plugin.on_enable()
+    _process_plugin = plugin
+
+
+def _call_process_plugin(payload: bytes) -> Any:
+    """Process one pickled frame in the worker process"""
+    return _process_plugin.on_frame(pickle.loads(payload))
+
+
+def _stop_process_plugin() -> None:
+    """Disable and destroy the plugin in the worker process"""
+    _process_plugin.on_disable()
+    _process_plugin.on_destroy()
+
+
+def load_plugin_class(module: str, class_name: str) -> type:
+    """
+    Import a plugin class
+
+    Args:
+        module: Module path (e.g. "my_plugins.thermal")
+        class_name: Class name in the module
+
+    Returns:
+        Plugin class
+
+    Raises:
+        ImportError: If the module cannot be imported
+        AttributeError: If the module has no such class
+    """
+    return getattr(importlib.import_module(module), class_name)
+
+
+class PluginWorker:
+    """
+    Bounded queue and worker (thread or process) of one plugin
+
+    Parameters:
+        plugin: Plugin instance
+        name: Worker name (statistics, thread name)
+        config: Passed to plugin.on_init()
+        executor: "thread" or "process"
+        queue_size: Maximum number of queued frames
+        drop_policy: "drop_oldest", "drop_newest" or "block"
+        on_result: Called on the worker thread with (worker, result) for
+            every non-empty plugin result
+        frame_pool: Pool of the published frames (None = frames not pooled)
+    """
+
+    def __init__(self,
+                 plugin: IPlugin,
+                 name: str,
+                 config: Optional[Dict[str, Any]] = None,
+                 executor: str = 'thread',
+                 queue_size: int = 16,
+                 drop_policy: str = 'drop_oldest',
+                 on_result: Optional[Callable[['PluginWorker', Any], None]] = None,
+                 frame_pool: Optional[SyncedFramePool] = None):
+        """
+        Initialize worker
+
+        Args:
+            plugin: Plugin instance
+            name: Worker name
+            config: Plugin configuration
+            executor: "thread" or "process"
+            queue_size: Maximum number of queued frames
+            drop_policy: Policy when the queue is full
+            on_result: Result callback (worker thread)
+            frame_pool: Pool of the published frames
+
+        Raises:
+            ValueError: If executor, drop_policy or queue_size is invalid
+        """
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor '{executor}', expected one of {EXECUTORS}")
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(f"Unknown drop policy '{drop_policy}', expected one of {DROP_POLICIES}")
+        if queue_size < 1:
+            raise ValueError(f"queue_size must be at least 1, got {queue_size}")
+
+        self.plugin = plugin
+        self.name = name
+        self.config = config or {}
+        self.executor = executor
+        self.drop_policy = drop_policy
+        self.on_result = on_result
+        self.frame_pool = frame_pool
+
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._process_executor = None
+
+        # Statistics (each counter has a single writer)
+        self.received_count = 0   # publisher
+        self.dropped_count = 0    # publisher
+        self.processed_count = 0  # worker
+        self.error_count = 0      # worker
+        self.process_time = LatencyHistogram()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the worker thread is alive"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """
+        Initialize and enable the plugin, then start the worker
+
+        Raises:
+            RuntimeError: If a process worker fails to initialize its plugin
+        """
+        if self.executor == 'process':
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            # spawn, not fork: the parent runs zmq and recorder threads
+            self._process_executor = ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_process_plugin,
+                initargs=(pickle.dumps((self.plugin, self.config)),),
+            )
+            try:
+                self._process_executor.submit(time.time).result()
+            except Exception as e:
+                self._process_executor.shutdown(wait=False, cancel_futures=True)
+                self._process_executor = None
+                raise RuntimeError(f"Plugin '{self.name}' failed to start its worker process: {e}") from e
+        else:
+            self.plugin.on_init(self.config)
+            self.plugin.on_enable()
+
+        self._thread = threading.Thread(target=self._worker_thread_func, daemon=True,
+                                        name=f"Plugin-{self.name}")
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Process the queued frames, then disable and destroy the plugin
+
+        Args:
+            timeout: Maximum seconds to wait for the worker
+        """
+        if self._thread is None:
+            return
+        try:
+            self.queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            print(f"⚠️ [Plugin {self.name}] Queue still full, stopping without draining")
+        self._thread.join(timeout=timeout)
+        if self._thread.is_alive():
+            print(f"⚠️ [Plugin {self.name}] Worker did not stop within {timeout}s")
+        self._thread = None
+
+    def offer(self, frame: SyncedFrame) -> bool:
+        """
+        Enqueue a frame for the plugin (FRAME_EVENT subscriber)
+
+        Args:
+            frame: Synced frame (by reference)
+
+        Returns:
+            True if the frame was queued, False if it was dropped
+        """
+        self.received_count += 1
+        if self.frame_pool is not None:
+            self.frame_pool.retain(frame)
+
+        if self.drop_policy == 'block':
+            self.queue.put(frame)
+            return True
+        try:
+            self.queue.put_nowait(frame)
+            return True
+        except queue.Full:
+            pass
+
+        if self.drop_policy == 'drop_oldest':
+            try:
+                oldest = self.queue.get_nowait()
+            except queue.Empty:
+                oldest = None
+            if oldest is not None and oldest is not _STOP:
+                self.dropped_count += 1
+                self._release(oldest)
+            try:
+                self.queue.put_nowait(frame)
+                return True
+            except queue.Full:
+                pass
+
+        self.dropped_count += 1
+        self._release(frame)
+        return False
+
+    def _release(self, frame: SyncedFrame) -> None:
+        if self.frame_pool is not None:
+            self.frame_pool.release(frame)
+
+    def _worker_thread_func(self) -> None:
+        """Worker thread main function"""
+        while True:
+            frame = self.queue.get()
+            if frame is _STOP:
+                break
+            self._process(frame)
+
+        try:
+            if self._process_executor is not None:
+                self._process_executor.submit(_stop_process_plugin).result()
+                self._process_executor.shutdown(wait=True)
+                self._process_executor = None
+            else:
+                self.plugin.on_disable()
+                self.plugin.on_destroy()
+        except Exception as e:
+            print(f"⚠️ [Plugin {self.name}] Error during shutdown: {e}")
+
+    def _process(self, frame: SyncedFrame) -> None:
+        """Run the plugin on one frame and release it"""
+        start = time.perf_counter()
+        try:
+            if self._process_executor is not None:
+                payload = pickle.dumps(frame, protocol=pickle.HIGHEST_PROTOCOL)
+                # The pickle is the plugin's copy: recycle the frame right away
+                self._release(frame)
+                frame = None
+                result = self._process_executor.submit(_call_process_plugin, payload).result()
+            else:
+                result = self.plugin.on_frame(frame)
+        except Exception as e:
+            self.error_count += 1
+            if self.error_count == 1 or self.error_count % 100 == 0:
+                print(f"❌ [Plugin {self.name}] Error processing frame ({self.error_count} errors): {e}")
+            return
+        finally:
+            if frame is not None:
+                self._release(frame)
+
+        self.processed_count += 1
+        self.process_time.observe((time.perf_counter() - start) * 1000.0)
+        if result and self.on_result is not None:
+            self.on_result(self, result)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Worker statistics
+
+        Returns:
+            Dict with received/processed/dropped/error counts, current queue
+            size, processing time (mean/p95/max ms, including the pickling
+            round trip for process workers) and, for thread workers, the
+            plugin's own get_statistics() under 'plugin'
+        """
+        timing = self.process_time.to_dict()
+        stats = {
+            'name': self.name,
+            'executor': self.executor,
+            'drop_policy': self.drop_policy,
+            'received': self.received_count,
+            'processed': self.processed_count,
+            'dropped': self.dropped_count,
+            'errors': self.error_count,
+            'queue_size': len(self.queue.queue),
+            'avg_time_ms': timing['mean_ms'],
+            'p95_time_ms': timing['p95_ms'],
+            'max_time_ms': timing['max_ms'],
+        }
+        if self.executor == 'thread' and hasattr(self.plugin, 'get_statistics'):
+            stats['plugin'] = self.plugin.get_statistics()
+        return stats
+
+    def __repr__(self) -> str:
+        return (f"<PluginWorker name={self.name} executor={self.executor} "
+                f"processed={self.processed_count} dropped={self.dropped_count}>")
+
+
+class PluginHost:
+    """
+    Runs plugins on per-plugin workers, fed from the EventBus
+
+    Parameters:
+        event_bus: Bus to publish frames and anomalies on (default: new bus)
+        frame_pool: Pool of the published frames (None = frames not pooled)
+    """
+
+    def __init__(self,
+                 event_bus: Optional[EventBus] = None,
+                 frame_pool: Optional[SyncedFramePool] = None):
+        """
+        Initialize plugin host
+
+        Args:
+            event_bus: Event bus (default: new EventBus)
+            frame_pool: Pool the published frames come from
+        """
+        self.event_bus = event_bus if event_bus is not None else EventBus()
+        self.frame_pool = frame_pool
+        self.workers: Dict[str, PluginWorker] = {}
+        self.running = False
+
+    def add_plugin(self,
+                   plugin: IPlugin,
+                   config: Optional[Dict[str, Any]] = None,
+                   executor: str = 'thread',
+                   queue_size: int = 16,
+                   drop_policy: str = 'drop_oldest',
+                   name: Optional[str] = None) -> PluginWorker:
+        """
+        Register a plugin (before start())
+
+        Args:
+            plugin: Plugin instance
+            config: Passed to plugin.on_init()
+            executor: "thread" or "process"
+            queue_size: Maximum number of queued frames
+            drop_policy: "drop_oldest", "drop_newest" or "block"
+            name: Worker name (default: metadata 'name'; made unique)
+
+        Returns:
+            The plugin's worker
+
+        Raises:
+            RuntimeError: If the host is already running
+            ValueError: If executor, drop_policy or queue_size is invalid
+        """
+        if self.running:
+            raise RuntimeError("Cannot add plugins while the host is running")
+
+        base_name = name or plugin.get_metadata().get('name') or type(plugin).__name__
+        name, suffix = base_name, 2
+        while name in self.workers:
+            name, suffix = f"{base_name}-{suffix}", suffix + 1
+
+        worker = PluginWorker(plugin, name, config=config, executor=executor,
+                              queue_size=queue_size, drop_policy=drop_policy,
+                              on_result=self._on_result, frame_pool=self.frame_pool)
+        self.workers[name] = worker
+        return worker
+
+    def load_config(self, config: Dict[str, Any]) -> List[PluginWorker]:
+        """
+        Register the enabled plugins of a configuration
+
+        Layout (design doc section 4, JSON):
+            {"plugins": {"analyzers": [{"name": ..., "module": ..., "class": ...,
+                                        "enabled": true, "config": {...},
+                                        "executor": "thread", "queue_size": 16,
+                                        "drop_policy": "drop_oldest"}],
+                         "exporters": [...]}}
+
+        "class" defaults to "name"; other categories of the design doc
+        (data_channels, monitors) are not hosted here and are skipped.
+
+        Args:
+            config: Parsed configuration
+
+        Returns:
+            Workers of the registered plugins
+
+        Raises:
+            ValueError: If the 'plugins' section is missing or a plugin does
+                not implement its category's interface
+        """
+        if 'plugins' not in config:
+            raise ValueError("Plugin config is missing the 'plugins' section")
+
+        workers = []
+        for category, plugin_configs in config['plugins'].items():
+            interface = PLUGIN_CATEGORIES.get(category)
+            if interface is None:
+                print(f"⚠️ [PluginHost] Skipping unsupported plugin category '{category}'")
+                continue
+            for plugin_config in plugin_configs:
+                if not plugin_config.get('enabled', False):
+                    continue
+                plugin_class = load_plugin_class(plugin_config['module'],
+                                                 plugin_config.get('class', plugin_config['name']))
+                plugin = plugin_class()
+                if not isinstance(plugin, interface):
+                    raise ValueError(f"Plugin '{plugin_config['name']}' in '{category}' "
+                                     f"must implement {interface.__name__}")
+                workers.append(self.add_plugin(
+                    plugin,
+                    config=plugin_config.get('config', {}),
+                    executor=plugin_config.get('executor', 'thread'),
+                    queue_size=plugin_config.get('queue_size', 16),
+                    drop_policy=plugin_config.get('drop_policy', 'drop_oldest'),
+                    name=plugin_config['name'],
+                ))
+        return workers
+
+    def start(self) -> None:
+        """Start all workers and subscribe them to FRAME_EVENT"""
+        if self.running:
+            return
+        for worker in self.workers.values():
+            worker.start()
+            self.event_bus.subscribe(FRAME_EVENT, worker.offer)
+        self.running = True
+        if self.workers:
+            print(f"✅ [PluginHost] Started {len(self.workers)} plugin(s): {', '.join(self.workers)}")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Unsubscribe and stop all workers (queued frames are processed)
+
+        Args:
+            timeout: Maximum seconds to wait per worker
+        """
+        if not self.running:
+            return
+        self.running = False
+        for worker in self.workers.values():
+            self.event_bus.unsubscribe(FRAME_EVENT, worker.offer)
+        for worker in self.workers.values():
+            worker.stop(timeout=timeout)
+
+    def publish_frame(self, frame: SyncedFrame) -> int:
+        """
+        Fan a frame out to all plugins (returns after enqueueing)
+
+        The caller keeps its own reference to the frame (e.g. hands it to
+        the recorder afterwards).
+
+        Args:
+            frame: Synced frame
+
+        Returns:
+            Number of FRAME_EVENT subscribers reached
+        """
+        return self.event_bus.publish(FRAME_EVENT, frame)
+
+    def _on_result(self, worker: PluginWorker, result: Any) -> None:
+        """Publish the anomalies of analyzer plugins (worker thread)"""
+        if isinstance(worker.plugin, IAnalyzerPlugin):
+            for anomaly in result:
+                self.event_bus.publish(ANOMALY_EVENT, anomaly)
+
+    def get_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-plugin worker statistics"""
+        return {name: worker.get_statistics() for name, worker in self.workers.items()}
+
+    def __repr__(self) -> str:
+        return f"<PluginHost plugins={list(self.workers)} running={self.running}>"
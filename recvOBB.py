@@ -8,6 +8,7 @@ OBB 数据接收器 (参考 recv.py 实现)
 """
 
 import argparse
+import csv
 import json
 import queue
 import sys
@@ -16,48 +17,104 @@ import time
 import zlib
 from abc import ABC, abstractmethod
 from collections import deque
+from contextlib import contextmanager
 from typing import Dict, List, Any, Optional
 
 import bson
 import zmq
 import numpy as np
 
-# 可视化相关导入（可选）
-try:
-    import pygame
-    from pygame.math import Vector3
-    from pygame.locals import *
-    from OpenGL.GL import *
-    from OpenGL.GLU import *
+from lcps_tool.geometry import (
+    OBBBatch,
+    OBBStatistics,
+    PointCloudLOD,
+    compare_collision_status,
+    cull_obbs,
+    cull_points,
+    viewer_frustum_planes,
+)
+from lcps_tool.perf.startup import StartupTimer
+
+# 可视化相关模块（pygame / PyOpenGL / ImGui）按需导入：
+# 文本模式和离屏渲染模式不加载它们，启动更快（见 load_visualization）
+VISUALIZATION_AVAILABLE = False
+IMGUI_AVAILABLE = False
+
+
+def load_visualization() -> bool:
+    """
+    导入可视化库（首次启用可视化模式时调用）
+
+    等价于原先模块级的 ``from pygame.locals import *`` / ``from OpenGL.GL import *``
+    等导入：名称注入到本模块全局命名空间，绘制代码无需改动。
+
+    Returns:
+        pygame + PyOpenGL 是否可用
+    """
+    global VISUALIZATION_AVAILABLE, IMGUI_AVAILABLE, pygame, Vector3, imgui, PygameRenderer
+    if VISUALIZATION_AVAILABLE:
+        return True
+
+    try:
+        import pygame
+        import pygame.locals
+        from pygame.math import Vector3
+        import OpenGL.GL
+        import OpenGL.GLU
+    except ImportError:
+        print("⚠️ 可视化库未安装，将禁用可视化模式")
+        print("   安装方法: pip install pygame PyOpenGL")
+        return False
+
+    # 模拟 import *：优先 __all__，否则取所有公有名称
+    for module in (pygame.locals, OpenGL.GL, OpenGL.GLU):
+        names = getattr(module, '__all__', None) or [n for n in dir(module) if not n.startswith('_')]
+        globals().update({name: getattr(module, name) for name in names})
     VISUALIZATION_AVAILABLE = True
-except ImportError:
-    VISUALIZATION_AVAILABLE = False
-    print("⚠️ 可视化库未安装，将禁用可视化模式")
-    print("   安装方法: pip install pygame PyOpenGL")
-
-# ImGui 相关导入（可选）
-try:
-    import imgui
-    from imgui.integrations.pygame import PygameRenderer
-    IMGUI_AVAILABLE = True
-except ImportError:
-    IMGUI_AVAILABLE = False
-    print("⚠️ ImGui 未安装，HUD 功能将不可用")
-    print("   安装方法: uv add 'imgui[pygame]'")
+
+    # ImGui（可选，HUD 用）
+    try:
+        import imgui
+        from imgui.integrations.pygame import PygameRenderer
+        IMGUI_AVAILABLE = True
+    except ImportError:
+        print("⚠️ ImGui 未安装，HUD 功能将不可用")
+        print("   安装方法: uv add 'imgui[pygame]'")
+    return True
 
 
 # ===== 性能监控相关类 =====
 
+# 视图主循环的分阶段计时（按执行顺序）
+FRAME_STAGES = ('events', 'queue_pop', 'scene_update', 'upload', 'draw', 'hud', 'flip')
+
+# 导出的百分位
+PERCENTILES = (50, 95, 99)
+
+
 class PerformanceMetrics:
-    """性能指标收集器"""
-    def __init__(self):
+    """性能指标收集器
+
+    除 FPS/带宽外，记录主循环各阶段耗时（ms）、真实接收字节数和
+    消息时延（接收时间 - 发送端时间戳），并汇总为 p50/p95/p99。
+    """
+    def __init__(self, window: int = 600):
+        """
+        Args:
+            window: 每个指标保留的最近样本数（用于百分位统计）
+        """
         self._metrics = {
             'fps': deque(maxlen=60),  # 保留最近 60 帧
-            'latency': deque(maxlen=60),
+            'latency': deque(maxlen=window),  # 消息时延 (ms)
             'bandwidth': deque(maxlen=60),
+            'message_bytes': deque(maxlen=window),  # 每条消息的真实字节数
         }
+        self._stage_times = {stage: deque(maxlen=window) for stage in FRAME_STAGES}
+        self._frame_times = deque(maxlen=window)  # 各阶段之和 (ms)
+        self._current_frame_ms = 0.0
         self._frame_drops = 0
         self._total_frames = 0
+        self._total_bytes = 0
         self._last_bandwidth_check = time.time()
         self._bytes_since_last_check = 0
 
@@ -67,7 +124,13 @@ class PerformanceMetrics:
         self._total_frames += 1
 
     def update_bandwidth(self, bytes_received: int):
-        """更新带宽（每秒计算）"""
+        """更新带宽（每秒计算）
+
+        Args:
+            bytes_received: 本条消息在网络上的真实字节数
+        """
+        self._metrics['message_bytes'].append(bytes_received)
+        self._total_bytes += bytes_received
         self._bytes_since_last_check += bytes_received
         now = time.time()
         if now - self._last_bandwidth_check >= 1.0:
@@ -76,6 +139,34 @@ class PerformanceMetrics:
             self._bytes_since_last_check = 0
             self._last_bandwidth_check = now
 
+    def update_latency(self, latency_ms: float):
+        """记录消息时延（接收时间 - 发送端时间戳，单位 ms）"""
+        self._metrics['latency'].append(latency_ms)
+
+    def record_stage(self, stage: str, elapsed_ms: float):
+        """记录一个主循环阶段的耗时
+
+        Args:
+            stage: 阶段名（见 FRAME_STAGES）
+            elapsed_ms: 耗时 (ms)
+        """
+        self._stage_times[stage].append(elapsed_ms)
+        self._current_frame_ms += elapsed_ms
+
+    @contextmanager
+    def measure(self, stage: str):
+        """计时上下文: with metrics.measure('draw'): ..."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_stage(stage, (time.perf_counter() - start) * 1000.0)
+
+    def end_frame(self):
+        """结束一帧：累计各阶段耗时为整帧耗时"""
+        self._frame_times.append(self._current_frame_ms)
+        self._current_frame_ms = 0.0
+
     def record_frame_drop(self):
         """记录丢帧"""
         self._frame_drops += 1
@@ -95,10 +186,73 @@ class PerformanceMetrics:
             'fps_min': min(fps_list) if fps_list else 0,
             'fps_max': max(fps_list) if fps_list else 0,
             'bandwidth_current': bw_list[-1] if bw_list else 0,
+            'total_bytes': self._total_bytes,
             'frame_drop_rate': (self._frame_drops / self._total_frames * 100)
                                if self._total_frames > 0 else 0,
         }
 
+    @staticmethod
+    def _describe(samples) -> dict:
+        """计算样本的 count/mean/max 和 p50/p95/p99"""
+        if not samples:
+            result = {'count': 0, 'mean': 0.0, 'max': 0.0}
+            result.update({f'p{p}': 0.0 for p in PERCENTILES})
+            return result
+
+        # 先复制为 list（接收线程可能同时追加时延样本）
+        values = np.array(list(samples), dtype=np.float64)
+        result = {
+            'count': int(values.size),
+            'mean': float(values.mean()),
+            'max': float(values.max()),
+        }
+        for p, v in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+            result[f'p{p}'] = float(v)
+        return result
+
+    def get_percentiles(self) -> Dict[str, dict]:
+        """获取各阶段耗时、整帧耗时、消息时延和消息大小的百分位统计"""
+        stats = {f'stage_{stage}_ms': self._describe(times)
+                 for stage, times in self._stage_times.items()}
+        stats['frame_total_ms'] = self._describe(self._frame_times)
+        stats['latency_ms'] = self._describe(self._metrics['latency'])
+        stats['message_bytes'] = self._describe(self._metrics['message_bytes'])
+        return stats
+
+    def export(self, path: str) -> None:
+        """导出百分位统计（用于离线对比）
+
+        根据扩展名选择格式:
+        - .csv: 每个指标一行 (metric, count, mean, p50, p95, p99, max)
+        - 其它: JSON（包含摘要、百分位和原始阶段样本）
+
+        Args:
+            path: 输出文件路径
+        """
+        percentiles = self.get_percentiles()
+
+        if path.lower().endswith('.csv'):
+            columns = ['count', 'mean'] + [f'p{p}' for p in PERCENTILES] + ['max']
+            with open(path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(['metric'] + columns)
+                for metric, values in percentiles.items():
+                    writer.writerow([metric] + [values[c] for c in columns])
+            return
+
+        report = {
+            'exported_at': time.time(),
+            'summary': self.get_summary(),
+            'percentiles': percentiles,
+            'samples': {
+                'stages_ms': {stage: list(times) for stage, times in self._stage_times.items()},
+                'frame_total_ms': list(self._frame_times),
+                'latency_ms': list(self._metrics['latency']),
+            },
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
 
 class HUDWidget(ABC):
     """HUD 组件抽象基类"""
@@ -171,6 +325,65 @@ class FrameDropWidget(HUDWidget):
         imgui_module.text(f"Total Drops: {metrics._frame_drops}")
 
 
+class FrameTimeWidget(HUDWidget):
+    """帧耗时分解组件（各阶段 p50/p95/p99）"""
+    def get_name(self) -> str:
+        return "Frame Time"
+
+    def render(self, imgui_module, metrics):
+        stats = metrics.get_percentiles()
+        imgui_module.text(f"{'stage':<13}{'p50':>7}{'p95':>7}{'p99':>7}  (ms)")
+        for stage in FRAME_STAGES:
+            s = stats[f'stage_{stage}_ms']
+            imgui_module.text(f"{stage:<13}{s['p50']:7.2f}{s['p95']:7.2f}{s['p99']:7.2f}")
+        total = stats['frame_total_ms']
+        imgui_module.text(f"{'total':<13}{total['p50']:7.2f}{total['p95']:7.2f}{total['p99']:7.2f}")
+
+        latency = stats['latency_ms']
+        if latency['count'] > 0:
+            imgui_module.text(f"Latency p50/p95/p99: "
+                              f"{latency['p50']:.1f}/{latency['p95']:.1f}/{latency['p99']:.1f} ms")
+        else:
+            imgui_module.text("Latency: N/A (no sender timestamp)")
+
+        msg_bytes = stats['message_bytes']
+        imgui_module.text(f"Message size p50: {msg_bytes['p50'] / 1024:.1f} KB | "
+                          f"Total: {metrics.get_summary()['total_bytes'] / 1024:.0f} KB")
+
+
+class PointCloudWidget(HUDWidget):
+    """点云 LOD 状态组件"""
+    def __init__(self, lod: PointCloudLOD):
+        super().__init__()
+        self.lod = lod
+
+    def get_name(self) -> str:
+        return "Point Cloud LOD"
+
+    def render(self, imgui_module, metrics):
+        stats = self.lod.get_statistics()
+        voxel = f"{stats['voxel_size'] * 100:.0f} cm" if stats['voxel_size'] > 0 else "full"
+        imgui_module.text(f"Level: {stats['level']} ({voxel})")
+        imgui_module.text(f"Points: {stats['drawn_points']} / {stats['total_points']} "
+                          f"(budget {stats['point_budget']})")
+
+
+class CullingWidget(HUDWidget):
+    """视锥裁剪统计组件"""
+    def __init__(self, stats_provider):
+        super().__init__()
+        self.stats_provider = stats_provider
+
+    def get_name(self) -> str:
+        return "Frustum Culling"
+
+    def render(self, imgui_module, metrics):
+        stats = self.stats_provider()
+        imgui_module.text(f"Culling: {'ON' if stats['enabled'] else 'OFF'} (F4)")
+        imgui_module.text(f"OBBs: {stats['visible_obbs']} / {stats['total_obbs']}")
+        imgui_module.text(f"Points: {stats['visible_points']} / {stats['lod_points']}")
+
+
 class RecorderWidget(HUDWidget):
     """录制状态组件"""
     def __init__(self, recorder_manager):
@@ -374,6 +587,10 @@ class HUDManager:
 
 # ===== 可视化相关类和函数 =====
 
+# OBB 线框颜色（按碰撞状态）
+OBB_SAFE_COLOR = (0, 1, 0, 1)  # 绿色（安全）
+OBB_COLLISION_COLOR = (1, 0, 0, 1)  # 红色（碰撞）
+
 class OBB:
     """OBB 3D 对象（用于可视化）"""
     def __init__(self, type, position, rotation, size, collision):
@@ -470,6 +687,18 @@ def draw_obb(obb):
     glPopMatrix()
 
 
+def draw_points(points, color=(0.7, 0.7, 0.7)):
+    """绘制点云（顶点数组，一次 draw call）"""
+    if not VISUALIZATION_AVAILABLE or len(points) == 0:
+        return
+
+    glColor3f(*color)
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glVertexPointer(3, GL_FLOAT, 0, points)
+    glDrawArrays(GL_POINTS, 0, len(points))
+    glDisableClientState(GL_VERTEX_ARRAY)
+
+
 def draw_coordinate_system():
     """绘制坐标系"""
     if not VISUALIZATION_AVAILABLE:
@@ -491,12 +720,181 @@ def draw_coordinate_system():
     glEnd()
 
 
+def extract_sender_timestamp(data: Dict[str, Any]) -> Optional[float]:
+    """提取发送端时间戳（Unix 秒）
+
+    支持 LCPS 协议格式 (header.timestamp) 和顶层 timestamp 字段，
+    旧版 sendOBB.cpp 不带时间戳时返回 None。
+    """
+    header = data.get("header")
+    if isinstance(header, dict) and "timestamp" in header:
+        return float(header["timestamp"])
+    if "timestamp" in data:
+        return float(data["timestamp"])
+    return None
+
+
+# ===== 文本摘要输出 =====
+
+class TextSummaryReporter:
+    """文本模式的限频摘要输出
+
+    逐条打印每个 OBB 在高频率/大量 OBB 时会让终端 I/O 成为瓶颈，
+    导致接收端跟不上发送端。本类在一个时间窗口内聚合消息，
+    每个周期输出一次固定格式的摘要（终端下原地刷新）:
+    消息速率、各类型 OBB 数量、碰撞率、带宽、压缩率和时延百分位。
+    可选只输出碰撞 OBB 的详细信息（每个周期最多 max_dump 条），
+    以及用 SAT 几何相交检测交叉校验 LCPS 的 collision_status。
+    """
+
+    CLEAR_SCREEN = "\x1b[H\x1b[2J"
+
+    def __init__(self, interval: float = 1.0, dump_collisions: bool = False,
+                 refresh: Optional[bool] = None, max_dump: int = 20,
+                 check_collisions: bool = False):
+        """
+        Args:
+            interval: 摘要输出周期（秒）
+            dump_collisions: 是否输出碰撞 OBB 的详细信息
+            check_collisions: 是否用 SAT 相交检测校验 collision_status
+            refresh: 是否原地刷新（默认: stdout 为终端时刷新）
+            max_dump: 每个周期最多输出的碰撞 OBB 条数
+        """
+        self.interval = interval
+        self.dump_collisions = dump_collisions
+        self.refresh = sys.stdout.isatty() if refresh is None else refresh
+        self.max_dump = max_dump
+        self.check_collisions = check_collisions
+        self._collision_check: Dict[str, int] = {}
+
+        self.window_stats = OBBStatistics()
+        self._latencies: List[float] = []
+        self._collision_lines: List[str] = []
+        self._suppressed_collisions = 0
+        self._window_start = time.perf_counter()
+        self._last_bytes = 0
+        self._last_decompressed = 0
+        self.reports = 0
+
+    def add_message(self, msg_index: int, batch: OBBBatch,
+                    latency_ms: Optional[float] = None) -> None:
+        """聚合一条消息
+
+        Args:
+            msg_index: 消息序号
+            batch: 消息中的 OBB
+            latency_ms: 消息时延（无发送端时间戳时为 None）
+        """
+        self.window_stats.update(batch)
+        if latency_ms is not None:
+            self._latencies.append(latency_ms)
+
+        if self.check_collisions:
+            for key, value in compare_collision_status(batch).items():
+                self._collision_check[key] = self._collision_check.get(key, 0) + value
+
+        if self.dump_collisions:
+            for i in np.flatnonzero(batch.collision == 1):
+                if len(self._collision_lines) >= self.max_dump:
+                    self._suppressed_collisions += 1
+                    continue
+                p = batch.positions[i]
+                sz = batch.sizes[i]
+                self._collision_lines.append(
+                    f"  🔴 [{msg_index}] OBB {i + 1} {batch.types[i]}: "
+                    f"pos=[{p[0]:.2f}, {p[1]:.2f}, {p[2]:.2f}] size=[{sz[0]:.2f}, {sz[1]:.2f}, {sz[2]:.2f}]")
+
+    def maybe_report(self, total_bytes: int, total_decompressed: int,
+                     cumulative: OBBStatistics) -> Optional[str]:
+        """周期到达时输出摘要并开始新窗口（周期为 0 时每条消息输出一次）
+
+        Args:
+            total_bytes: 累计接收字节数
+            total_decompressed: 累计解压后字节数（非压缩模式为 0）
+            cumulative: 累计 OBB 统计
+
+        Returns:
+            输出的摘要文本（周期未到时为 None）
+        """
+        now = time.perf_counter()
+        elapsed = now - self._window_start
+        if elapsed < self.interval:
+            return None
+        if self.interval == 0 and self.window_stats.messages == 0:
+            return None  # 逐消息摘要: 没有新消息时不输出空窗口
+
+        text = self.format(elapsed, total_bytes - self._last_bytes,
+                           total_decompressed - self._last_decompressed, cumulative)
+        print((self.CLEAR_SCREEN if self.refresh else "") + text, flush=True)
+
+        # 开始新窗口
+        self.window_stats.reset()
+        self._latencies.clear()
+        self._collision_check.clear()
+        self._collision_lines.clear()
+        self._suppressed_collisions = 0
+        self._window_start = now
+        self._last_bytes = total_bytes
+        self._last_decompressed = total_decompressed
+        self.reports += 1
+        return text
+
+    def format(self, elapsed: float, window_bytes: int, window_decompressed: int,
+               cumulative: OBBStatistics) -> str:
+        """格式化一个窗口的摘要"""
+        stats = self.window_stats
+        total_obbs = stats.total_obbs
+        lines = [
+            f"=== OBB Receiver 摘要 (最近 {elapsed:.1f}s) ===",
+            f"消息: {stats.messages} ({stats.messages / elapsed:.1f} msg/s) | "
+            f"OBB: {total_obbs} ({total_obbs / elapsed:.0f} /s) | 累计消息: {cumulative.messages}",
+            f"带宽: {window_bytes / elapsed / 1024:.1f} KB/s",
+        ]
+        if window_decompressed > 0:
+            ratio = (1 - window_bytes / window_decompressed) * 100
+            lines.append(f"压缩率: {ratio:.1f}% ({window_bytes} / {window_decompressed} bytes)")
+
+        if self._latencies:
+            p50, p95, p99 = np.percentile(self._latencies, PERCENTILES)
+            lines.append(f"时延: p50 {p50:.1f} ms | p95 {p95:.1f} ms | p99 {p99:.1f} ms")
+        else:
+            lines.append("时延: N/A (无发送端时间戳)")
+
+        collision_rate = stats.collision_count / total_obbs * 100 if total_obbs else 0.0
+        lines.append(f"碰撞: {stats.collision_count}/{total_obbs} ({collision_rate:.1f}%)")
+
+        rates = stats.collision_rates
+        for name, count in sorted(stats.type_counts.items()):
+            if count:
+                lines.append(f"  {name}: {count} (碰撞率 {rates[name] * 100:.1f}%)")
+
+        if self.check_collisions and self._collision_check.get('boxes'):
+            check = self._collision_check
+            agree_pct = check['agree'] / check['boxes'] * 100
+            lines.append(f"SAT 校验: 几何相交 {check['geometric']} | 一致 {agree_pct:.1f}% | "
+                         f"LCPS 未报 {check['unreported']} | 几何未确认 {check['unconfirmed']}")
+
+        if self.dump_collisions:
+            lines.append("碰撞 OBB:" if self._collision_lines else "碰撞 OBB: 无")
+            lines.extend(self._collision_lines)
+            if self._suppressed_collisions:
+                lines.append(f"  ... 另有 {self._suppressed_collisions} 个碰撞 OBB 未显示")
+        return "\n".join(lines)
+
+
 # ===== OBB 接收器类 =====
 
 class OBBReceiver:
     """OBB 数据接收器类"""
 
-    def __init__(self, address: str, mode: str, visualize: bool = False):
+    def __init__(self, address: str, mode: str, visualize: bool = False,
+                 metrics_export: Optional[str] = None,
+                 pointcloud_address: Optional[str] = None,
+                 point_budget: int = 200_000,
+                 frustum_culling: bool = True,
+                 summary_interval: Optional[float] = None,
+                 dump_collisions: bool = False,
+                 check_collisions: bool = False):
         """
         初始化接收器
 
@@ -504,11 +902,22 @@ class OBBReceiver:
             address: ZMQ 地址 (如 "localhost:5555")
             mode: 接收模式 ("normal" 或 "compressed")
             visualize: 是否启用可视化模式
+            metrics_export: 退出时导出性能指标的文件路径 (.csv 或 .json)
+            pointcloud_address: 点云通道 ZMQ 地址 (如 "tcp://localhost:5556")，仅可视化模式
+            point_budget: 每帧绘制的最大点数（LOD 选择依据）
+            frustum_culling: 是否启用视锥裁剪（只绘制视野内的 OBB 和点）
+            summary_interval: 文本模式摘要周期（秒，0 表示每条消息输出一次）；为 None 时逐条打印每个 OBB
+            dump_collisions: 摘要模式下额外输出碰撞 OBB 的详细信息
+            check_collisions: 摘要模式下用 SAT 相交检测校验 collision_status
         """
         self.address = address
         self.mode = mode
         self.use_compression = (mode in ["compressed", "c"])
-        self.visualize = visualize and VISUALIZATION_AVAILABLE
+        self.visualize = visualize and load_visualization()
+        self.metrics_export = metrics_export
+        self.summary_reporter = (TextSummaryReporter(summary_interval, dump_collisions,
+                                                     check_collisions=check_collisions)
+                                 if summary_interval is not None else None)
 
         # 初始化 ZMQ
         self.context = zmq.Context()
@@ -521,12 +930,29 @@ class OBBReceiver:
         self.msg_count = 0
         self.total_bytes_received = 0
         self.total_bytes_decompressed = 0
-        self.type_counts = {}  # 类型统计 {type_name: count}
-        self.collision_count = 0  # 碰撞计数
-        self.safe_count = 0  # 安全计数
+        self.last_message_bytes = 0  # 最近一条消息的真实字节数
+        self.obb_stats = OBBStatistics()  # 类型/碰撞统计（类型字符串编码 + np.bincount）
+        self.last_type_counts = np.zeros(0, dtype=np.int64)  # 最近一条消息的各类型数量
 
         # 可视化相关
-        self.obbs = []  # 当前 OBB 列表
+        self.obb_batch = OBBBatch.empty()  # 当前 OBB 的 struct-of-arrays 表示
+        self.obb_model_matrices = np.empty((0, 16), dtype=np.float32)  # 列主序模型矩阵
+        self._geometry_dirty = False
+        self.display_size = (800, 600)
+
+        # 点云（LOD 层级 + 当前绘制的点）
+        self.points_lod = PointCloudLOD(point_budget=point_budget)
+        self.lod_points = np.empty((0, 3), dtype=np.float32)  # 当前 LOD 层级的点
+        self.visible_points = np.empty((0, 3), dtype=np.float32)  # 裁剪后实际绘制的点
+        self._points_version = 0
+
+        # 视锥裁剪
+        self.frustum_culling = frustum_culling
+        self.visible_obb_indices = np.empty(0, dtype=np.intp)
+        self._scene_version = 0
+        self._cull_key = None
+        self.pointcloud_address = pointcloud_address
+        self.pc_receiver = None
         self.rotation = [0.0, 0.0]  # 视角旋转
         self.scale = [1.0]  # 缩放
         self.dragging = False
@@ -557,6 +983,9 @@ class OBBReceiver:
             self.hud_manager.register_widget(FPSWidget())
             self.hud_manager.register_widget(BandwidthWidget())
             self.hud_manager.register_widget(FrameDropWidget())
+            self.hud_manager.register_widget(FrameTimeWidget())
+            self.hud_manager.register_widget(PointCloudWidget(self.points_lod))
+            self.hud_manager.register_widget(CullingWidget(self.get_culling_statistics))
 
             # 初始化录制管理器
             self.recorder_manager = RecorderManager()
@@ -564,6 +993,7 @@ class OBBReceiver:
 
             print("✅ Performance HUD initialized (Press F1 to toggle)")
             print("✅ Recorder Manager initialized (Press F2 to start/stop recording)")
+            print("✅ Frame-time metrics initialized (Press F3 to export)")
 
     def receive_normal(self) -> Dict[str, Any]:
         """
@@ -573,6 +1003,7 @@ class OBBReceiver:
             解析后的 JSON 数据字典
         """
         message = self.subscriber.recv()
+        self.last_message_bytes = len(message)
         self.total_bytes_received += len(message)
 
         try:
@@ -594,6 +1025,7 @@ class OBBReceiver:
             解析后的数据字典
         """
         compressed_data = self.subscriber.recv()
+        self.last_message_bytes = len(compressed_data)
         self.total_bytes_received += len(compressed_data)
 
         # 解压缩
@@ -627,7 +1059,7 @@ class OBBReceiver:
             return
 
         pygame.init()
-        display = (800, 600)
+        display = self.display_size
         pygame.display.set_mode(display, DOUBLEBUF | OPENGL | RESIZABLE)
         pygame.display.set_caption("OBB Receiver - Visualization Mode")
 
@@ -665,6 +1097,16 @@ class OBBReceiver:
                             self.recorder_manager.stop_recording()
                         else:
                             self.recorder_manager.start_recording()
+                elif event.key == pygame.K_F3:  # F3 导出性能指标
+                    if hasattr(self, 'metrics'):
+                        from datetime import datetime
+                        filename = f"metrics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+                        self.metrics.export(filename)
+                        print(f"📊 性能指标已导出: {filename}")
+                elif event.key == pygame.K_F4:  # F4 切换视锥裁剪
+                    self.frustum_culling = not self.frustum_culling
+                    self._cull_key = None
+                    print(f"Frustum culling {'enabled' if self.frustum_culling else 'disabled'}")
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # 左键
                     self.dragging = True
@@ -685,6 +1127,7 @@ class OBBReceiver:
                     self.rotation[1] += dx * 0.5
                     self.last_pos = new_pos
             elif event.type == VIDEORESIZE:
+                self.display_size = (event.w, event.h)
                 glViewport(0, 0, event.w, event.h)
                 glMatrixMode(GL_PROJECTION)
                 glLoadIdentity()
@@ -692,11 +1135,60 @@ class OBBReceiver:
                 glMatrixMode(GL_MODELVIEW)
         return True
 
-    def _render_scene(self) -> None:
-        """渲染 3D 场景"""
-        if not VISUALIZATION_AVAILABLE:
+    def _upload_geometry(self) -> None:
+        """准备绘制用几何数据（仅在场景变化时重建）
+
+        将每个 OBB 的平移、旋转和缩放合成为一个列主序 4x4 模型矩阵，
+        绘制时每个 OBB 只需一次 glMultMatrixf。
+        """
+        if not self._geometry_dirty:
             return
 
+        self.obb_model_matrices = self.obb_batch.model_matrices()
+        self._geometry_dirty = False
+        self._scene_version += 1
+
+    def _select_point_lod(self) -> None:
+        """按当前缩放和点数预算选择点云 LOD 层级"""
+        level = self.points_lod.select_level(self.scale[0], self.display_size[1])
+        self.lod_points = self.points_lod.get_points(level)
+
+    def _cull_scene(self) -> None:
+        """视锥裁剪（场景、LOD 层级或视角变化时才重新计算）
+
+        由当前 gluPerspective 参数和旋转/缩放状态在 CPU 端重建视锥，
+        一次性对所有 OBB 和当前 LOD 层级的点做向量化测试。
+        """
+        cull_key = (self.frustum_culling, self._scene_version, self._points_version,
+                    self.points_lod.current_level, self.scale[0], tuple(self.rotation),
+                    self.display_size)
+        if cull_key == self._cull_key:
+            return
+        self._cull_key = cull_key
+
+        if not self.frustum_culling:
+            self.visible_obb_indices = np.arange(len(self.obb_batch))
+            self.visible_points = self.lod_points
+            return
+
+        planes = viewer_frustum_planes(self.scale[0], self.rotation, *self.display_size)
+        batch = self.obb_batch
+        self.visible_obb_indices = np.flatnonzero(
+            cull_obbs(planes, batch.positions, batch.half_extents, batch.rotations))
+        self.visible_points = self.lod_points[cull_points(planes, self.lod_points)]
+
+    def get_culling_statistics(self) -> dict:
+        """获取视锥裁剪统计"""
+        return {
+            'enabled': self.frustum_culling,
+            'total_obbs': len(self.obb_batch),
+            'visible_obbs': len(self.visible_obb_indices),
+            'lod_points': len(self.lod_points),
+            'visible_points': len(self.visible_points),
+        }
+
+    def _draw_scene(self) -> None:
+        """绘制 3D 场景（坐标系 + OBB）"""
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
         glPushMatrix()
 
@@ -708,39 +1200,80 @@ class OBBReceiver:
         # 绘制坐标系
         draw_coordinate_system()
 
-        # 绘制所有 OBB
-        for obb in self.obbs:
-            draw_obb(obb)
+        # 绘制视锥内的 OBB（颜色由碰撞状态决定）
+        collision = self.obb_batch.collision
+        for i in self.visible_obb_indices:
+            glPushMatrix()
+            glMultMatrixf(self.obb_model_matrices[i])
+            draw_wire_cube(1.0, OBB_COLLISION_COLOR if collision[i] == 1 else OBB_SAFE_COLOR)
+            glPopMatrix()
+
+        # 绘制点云（当前 LOD 层级）
+        draw_points(self.visible_points)
 
         glPopMatrix()
 
+    def _render_scene(self) -> None:
+        """渲染 3D 场景（分阶段计时: upload/draw/hud/flip）"""
+        if not VISUALIZATION_AVAILABLE:
+            return
+
+        metrics = self.metrics
+
+        with metrics.measure('upload'):
+            self._upload_geometry()
+            self._select_point_lod()
+            self._cull_scene()
+
+        with metrics.measure('draw'):
+            self._draw_scene()
+
         # 渲染 HUD（在 flip 之前）
-        if hasattr(self, 'hud_manager') and self.hud_manager:
-            self.hud_manager.render()
+        with metrics.measure('hud'):
+            if hasattr(self, 'hud_manager') and self.hud_manager:
+                self.hud_manager.render()
 
-        pygame.display.flip()
+        with metrics.measure('flip'):
+            pygame.display.flip()
 
-    def _update_type_statistics(self, data: Dict[str, Any]) -> None:
-        """更新 OBB 类型和碰撞状态统计
+    def _update_type_statistics(self, batch: OBBBatch) -> None:
+        """更新 OBB 类型和碰撞状态统计（向量化聚合）
 
         Args:
-            data: 接收到的 OBB 数据字典
+            batch: 当前消息的 OBB 批量数据
         """
-        if not data or "data" not in data:
-            return
+        self.last_type_counts = self.obb_stats.update(batch)
 
-        obbs_data = data["data"]
-        for obb_dict in obbs_data:
-            # 统计类型
-            obb_type = obb_dict.get("type", "unknown")
-            self.type_counts[obb_type] = self.type_counts.get(obb_type, 0) + 1
-
-            # 统计碰撞状态
-            collision_status = obb_dict.get("collision_status", 0)
-            if collision_status == 1:
-                self.collision_count += 1
-            else:
-                self.safe_count += 1
+    def _update_type_statistics_from_dicts(self, obbs: List[Dict[str, Any]]) -> None:
+        """只读取 type/collision_status 字段更新统计（不构建 OBBBatch）
+
+        Args:
+            obbs: 当前消息的 OBB 字典列表
+        """
+        self.last_type_counts = self.obb_stats.update_dicts(obbs)
+
+    def _print_obb_statistics(self) -> None:
+        """打印累计的类型和碰撞状态统计"""
+        stats = self.obb_stats
+
+        # 显示类型统计
+        total_obbs = stats.total_obbs
+        if total_obbs > 0:
+            print("\nOBB 类型统计:")
+            collision_rates = stats.collision_rates
+            for obb_type, count in sorted(stats.type_counts.items()):
+                if count == 0:
+                    continue
+                percentage = count / total_obbs * 100
+                print(f"  {obb_type}: {count} ({percentage:.1f}%, 碰撞率 {collision_rates[obb_type] * 100:.1f}%)")
+            print(f"  总计: {total_obbs}")
+
+            # 显示碰撞状态统计
+            print("\n碰撞状态统计:")
+            safe_pct = stats.safe_count / total_obbs * 100
+            collision_pct = stats.collision_count / total_obbs * 100
+            print(f"  🟢 安全: {stats.safe_count} ({safe_pct:.1f}%)")
+            print(f"  🔴 碰撞: {stats.collision_count} ({collision_pct:.1f}%)")
 
     def _update_obbs_from_data(self, data: Dict[str, Any]) -> None:
         """从接收的数据更新 OBB 列表
@@ -751,28 +1284,42 @@ class OBBReceiver:
         if not data or "data" not in data:
             return
 
+        obbs_data = data["data"]
+        self.obb_batch = OBBBatch.from_dicts(obbs_data)
+
         # 更新类型统计
-        self._update_type_statistics(data)
+        self._update_type_statistics(self.obb_batch)
 
-        obbs_data = data["data"]
-        self.obbs = []
-
-        for obb_dict in obbs_data:
-            obb = OBB(
-                obb_dict.get("type", "unknown"),
-                obb_dict.get("position", [0, 0, 0]),
-                quaternion_to_matrix(obb_dict.get("rotation", [1, 0, 0, 0])),
-                obb_dict.get("size", [1, 1, 1]),
-                obb_dict.get("collision_status", 0)
-            )
+        self._geometry_dirty = True
+
+        # 消息内嵌点云（recv.py 压缩格式: "points" 为扁平或 Nx3 坐标列表）
+        if "points" in data:
+            self._update_points(data["points"])
 
-            # 根据碰撞状态设置颜色
-            if obb.collision == 1:
-                obb.color = (1, 0, 0, 1)  # 红色（碰撞）
-            else:
-                obb.color = (0, 1, 0, 1)  # 绿色（安全）
+    def _update_points(self, points) -> None:
+        """更新点云并重置 LOD 层级
 
-            self.obbs.append(obb)
+        Args:
+            points: 扁平或 Nx3 坐标数组/列表
+        """
+        self.points_lod.set_points(np.asarray(points, dtype=np.float32).reshape(-1, 3))
+        self._points_version += 1
+
+    def _summarize_obb_data(self, data: Dict[str, Any]) -> None:
+        """摘要模式: 只聚合统计，不逐条打印
+
+        Args:
+            data: OBB 数据字典
+        """
+        if not data or "data" not in data:
+            return
+
+        batch = OBBBatch.from_dicts(data["data"])
+        self._update_type_statistics(batch)
+
+        sender_timestamp = extract_sender_timestamp(data)
+        latency_ms = (time.time() - sender_timestamp) * 1000.0 if sender_timestamp is not None else None
+        self.summary_reporter.add_message(self.msg_count, batch, latency_ms)
 
     def display_obb_data(self, data: Dict[str, Any]) -> None:
         """
@@ -785,10 +1332,10 @@ class OBBReceiver:
             print(f"[{self.msg_count}] ❌ Invalid data format")
             return
 
-        # 更新类型统计
-        self._update_type_statistics(data)
-
         obbs = data["data"]
+
+        # 更新类型统计（文本模式不需要几何数据，直接从字典聚合）
+        self._update_type_statistics_from_dicts(obbs)
         print(f"[{self.msg_count}] Received {len(obbs)} OBB(s):")
 
         for i, obb in enumerate(obbs):
@@ -833,7 +1380,10 @@ class OBBReceiver:
                         data = self.receive_normal()
 
                     # 显示数据
-                    self.display_obb_data(data)
+                    if self.summary_reporter:
+                        self._summarize_obb_data(data)
+                    else:
+                        self.display_obb_data(data)
 
                     self.msg_count += 1
 
@@ -841,6 +1391,11 @@ class OBBReceiver:
                     # 超时但无数据，继续等待
                     pass
 
+                if self.summary_reporter:
+                    self.summary_reporter.maybe_report(self.total_bytes_received,
+                                                       self.total_bytes_decompressed,
+                                                       self.obb_stats)
+
         except KeyboardInterrupt:
             print("\n\n=== 接收统计 ===")
             print(f"Total messages: {self.msg_count}")
@@ -851,23 +1406,7 @@ class OBBReceiver:
                     compression_ratio = (1 - self.total_bytes_received / self.total_bytes_decompressed) * 100
                     print(f"Overall compression ratio: {compression_ratio:.1f}%")
 
-            # 显示类型统计
-            if self.type_counts:
-                print("\nOBB 类型统计:")
-                total_obbs = sum(self.type_counts.values())
-                for obb_type, count in sorted(self.type_counts.items()):
-                    percentage = (count / total_obbs * 100) if total_obbs > 0 else 0
-                    print(f"  {obb_type}: {count} ({percentage:.1f}%)")
-                print(f"  总计: {total_obbs}")
-
-            # 显示碰撞状态统计
-            if self.collision_count > 0 or self.safe_count > 0:
-                total_status = self.collision_count + self.safe_count
-                print("\n碰撞状态统计:")
-                safe_pct = (self.safe_count / total_status * 100) if total_status > 0 else 0
-                collision_pct = (self.collision_count / total_status * 100) if total_status > 0 else 0
-                print(f"  🟢 安全: {self.safe_count} ({safe_pct:.1f}%)")
-                print(f"  🔴 碰撞: {self.collision_count} ({collision_pct:.1f}%)")
+            self._print_obb_statistics()
 
             print("=================")
             self.cleanup()
@@ -883,19 +1422,29 @@ class OBBReceiver:
                     data = self.receive_normal()
 
                 if data:
+                    receive_time = time.time()
+                    wire_bytes = self.last_message_bytes
+
                     # 录制数据（如果启用）
                     if hasattr(self, 'recorder_manager'):
                         current_fps = self.metrics.get_current_fps() if hasattr(self, 'metrics') else 0.0
                         self.recorder_manager.record_data(data, current_fps)
 
-                    # 尝试放入队列（非阻塞）
+                    # 消息时延（接收时间 - 发送端时间戳）
+                    if hasattr(self, 'metrics'):
+                        sender_timestamp = extract_sender_timestamp(data)
+                        if sender_timestamp is not None:
+                            self.metrics.update_latency((receive_time - sender_timestamp) * 1000.0)
+
+                    # 尝试放入队列（非阻塞），附带真实字节数
+                    item = (data, wire_bytes)
                     try:
-                        self.data_queue.put_nowait(data)
+                        self.data_queue.put_nowait(item)
                     except queue.Full:
                         # 队列满，清空最旧数据，放入最新数据
                         try:
                             self.data_queue.get_nowait()  # 丢弃最旧数据
-                            self.data_queue.put_nowait(data)  # 放入最新数据
+                            self.data_queue.put_nowait(item)  # 放入最新数据
                         except queue.Empty:
                             pass  # 队列已被主线程清空
 
@@ -932,42 +1481,47 @@ class OBBReceiver:
         self.receiver_thread.start()
         print("✅ 接收线程已启动")
 
+        # 启动点云接收线程（复用 layer1 PointCloudReceiver，降采样由 LOD 完成）
+        if self.pointcloud_address:
+            from lcps_tool.layer1.receivers import PointCloudReceiver
+            self.pc_receiver = PointCloudReceiver(self.pointcloud_address, enable_downsampling=False)
+            self.pc_receiver.start()
+
         try:
             clock = pygame.time.Clock()
             running = True
 
             while running:
                 # 处理事件
-                running = self._handle_events()
+                with self.metrics.measure('events'):
+                    running = self._handle_events()
 
                 # 从队列获取数据（非阻塞）
-                try:
-                    data = self.data_queue.get_nowait()
+                with self.metrics.measure('queue_pop'):
+                    try:
+                        data, wire_bytes = self.data_queue.get_nowait()
+                    except queue.Empty:
+                        data, wire_bytes = None, 0  # 队列为空，继续渲染
+                    pc_data = self.pc_receiver.get_data() if self.pc_receiver else None
 
+                with self.metrics.measure('scene_update'):
                     if data:
                         self._update_obbs_from_data(data)
                         self.msg_count += 1
 
-                        # 更新带宽指标
-                        if hasattr(self, 'metrics'):
-                            bytes_received = len(str(data))  # 粗略估算
-                            self.metrics.update_bandwidth(bytes_received)
+                        # 更新带宽指标（真实接收字节数）
+                        self.metrics.update_bandwidth(wire_bytes)
 
                         # 打印简洁的接收信息
-                        obbs = data.get("data", [])
-                        type_summary = {}
-                        for obb in obbs:
-                            obb_type = obb.get("type", "unknown")
-                            type_summary[obb_type] = type_summary.get(obb_type, 0) + 1
+                        summary_str = self.obb_stats.format_counts(self.last_type_counts)
+                        print(f"[{self.msg_count}] Received {len(self.obb_batch)} OBB(s) - {summary_str}")
 
-                        summary_str = ", ".join([f"{t}:{c}" for t, c in sorted(type_summary.items())])
-                        print(f"[{self.msg_count}] Received {len(obbs)} OBB(s) - {summary_str}")
-
-                except queue.Empty:
-                    pass  # 队列为空，继续渲染
+                    if pc_data:
+                        self._update_points(pc_data['points'])
 
                 # 渲染场景（保持 60 FPS）
                 self._render_scene()
+                self.metrics.end_frame()
 
                 # 控制帧率
                 clock.tick(60)
@@ -981,6 +1535,10 @@ class OBBReceiver:
         except KeyboardInterrupt:
             pass
         finally:
+            # 停止点云接收线程
+            if self.pc_receiver:
+                self.pc_receiver.stop()
+
             # 停止接收线程
             print("\n🛑 正在停止接收线程...")
             self.stop_event.set()  # 设置停止信号
@@ -991,6 +1549,14 @@ class OBBReceiver:
                 else:
                     print("✅ 接收线程已停止")
 
+            # 导出性能指标（如果指定）
+            if self.metrics_export:
+                try:
+                    self.metrics.export(self.metrics_export)
+                    print(f"📊 性能指标已导出: {self.metrics_export}")
+                except OSError as e:
+                    print(f"❌ 导出性能指标失败: {e}")
+
             print("\n=== 接收统计 ===")
             print(f"Total messages: {self.msg_count}")
             print(f"Total bytes received: {self.total_bytes_received}")
@@ -1000,27 +1566,88 @@ class OBBReceiver:
                     compression_ratio = (1 - self.total_bytes_received / self.total_bytes_decompressed) * 100
                     print(f"Overall compression ratio: {compression_ratio:.1f}%")
 
-            # 显示类型统计
-            if self.type_counts:
-                print("\nOBB 类型统计:")
-                total_obbs = sum(self.type_counts.values())
-                for obb_type, count in sorted(self.type_counts.items()):
-                    percentage = (count / total_obbs * 100) if total_obbs > 0 else 0
-                    print(f"  {obb_type}: {count} ({percentage:.1f}%)")
-                print(f"  总计: {total_obbs}")
-
-            # 显示碰撞状态统计
-            if self.collision_count > 0 or self.safe_count > 0:
-                total_status = self.collision_count + self.safe_count
-                print("\n碰撞状态统计:")
-                safe_pct = (self.safe_count / total_status * 100) if total_status > 0 else 0
-                collision_pct = (self.collision_count / total_status * 100) if total_status > 0 else 0
-                print(f"  🟢 安全: {self.safe_count} ({safe_pct:.1f}%)")
-                print(f"  🔴 碰撞: {self.collision_count} ({collision_pct:.1f}%)")
+            self._print_obb_statistics()
 
             print("=================")
             self.cleanup()
 
+    def run_headless(self, output: str, replay: Optional[str] = None,
+                     size: tuple = (800, 600), fps: float = 20.0,
+                     max_frames: Optional[int] = None,
+                     view_scale: float = 1.0,
+                     view_rotation: tuple = (0.0, 0.0)) -> Dict[str, Any]:
+        """
+        无窗口离屏渲染（CI / 无显示服务器）
+
+        使用 NumPy 软件光栅化器渲染与可视化模式相同的视图，
+        由后台进程写入 PNG 序列（目录）或视频（.mp4 等，需要 ffmpeg）。
+
+        Args:
+            output: 输出目录（PNG 序列）或视频文件路径
+            replay: 回放的录制文件 (.h5 或 .jsonl)；为 None 时从 ZMQ 实时接收
+            size: 图像尺寸 (宽, 高)
+            fps: 视频帧率
+            max_frames: 最多渲染的帧数（None 表示全部 / 直到 Ctrl+C）
+            view_scale: 视图缩放
+            view_rotation: 视图旋转 [rx, ry]（度）
+
+        Returns:
+            渲染统计（帧数、渲染帧率、端到端帧率、写入器统计）
+        """
+        print("🖼️ 离屏渲染模式启动")
+        print(f"   - 数据源: {replay if replay else f'tcp://{self.address}'}")
+        print(f"   - 输出: {output} ({size[0]}x{size[1]})")
+
+        from lcps_tool.layer4 import render_sequence  # 按需导入（multiprocessing 等）
+
+        if replay:
+            frames = self._replay_frames(replay, max_frames)
+        else:
+            frames = self._live_frames(max_frames)
+
+        try:
+            stats = render_sequence(frames, output, width=size[0], height=size[1], fps=fps,
+                                    scale=view_scale, rotation=view_rotation)
+        finally:
+            self.cleanup()
+
+        writer = stats['writer']
+        print("\n=== 离屏渲染统计 ===")
+        print(f"Frames: {stats['frames']}")
+        print(f"Render throughput: {stats['render_fps']:.1f} frames/s")
+        print(f"End-to-end throughput: {stats['total_fps']:.1f} frames/s (含编码写入)")
+        print(f"Frames written: {writer['frames_written']}")
+        if writer['error']:
+            print(f"❌ Writer error: {writer['error']}")
+        print("===================")
+        return stats
+
+    def _replay_frames(self, path: str, max_frames: Optional[int]):
+        """从录制文件生成 (OBBBatch, points) 帧"""
+        from lcps_tool.layer2 import DataReplayer  # 按需导入 h5py
+        for frame in DataReplayer(path, max_frames=max_frames):
+            obbs = frame.obb_data.get('obbs', []) if frame.obb_data else []
+            points = frame.pointcloud_data.get('points') if frame.pointcloud_data else None
+            yield OBBBatch.from_dicts(obbs), points
+
+    def _live_frames(self, max_frames: Optional[int]):
+        """从 ZMQ 实时接收生成 (OBBBatch, points) 帧（Ctrl+C 结束）"""
+        count = 0
+        try:
+            while max_frames is None or count < max_frames:
+                try:
+                    data = self.receive_compressed() if self.use_compression else self.receive_normal()
+                except zmq.error.Again:
+                    continue
+                self.msg_count += 1
+                points = None
+                if "points" in data:
+                    points = np.asarray(data["points"], dtype=np.float32).reshape(-1, 3)
+                yield OBBBatch.from_dicts(data.get("data", [])), points
+                count += 1
+        except KeyboardInterrupt:
+            print("\n⏹️ 停止接收")
+
     def cleanup(self) -> None:
         """清理资源"""
         self.subscriber.close()
@@ -1030,6 +1657,7 @@ class OBBReceiver:
 
 def main():
     """主函数"""
+    startup_timer = StartupTimer()
     parser = argparse.ArgumentParser(
         description="OBB 数据接收器 (参考 recv.py 实现)",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -1041,11 +1669,32 @@ def main():
   # 压缩模式（文本输出）
   python3 recvOBB.py -a localhost:5555 -m c
 
+  # 摘要模式（每 2 秒刷新一次统计，并列出碰撞 OBB）
+  python3 recvOBB.py -a localhost:5555 --summary 2 --dump-collisions
+
+  # 摘要模式 + 用 OBB 几何相交检测校验 collision_status
+  python3 recvOBB.py -a localhost:5555 --summary --check-collisions
+
   # 可视化模式（3D 渲染）
   python3 recvOBB.py -a localhost:5555 -m n -v
 
   # 压缩模式 + 可视化
   python3 recvOBB.py -a localhost:5555 -m c --visualize
+
+  # 可视化 + 点云通道（点数预算 100k，按缩放自动选择 LOD）
+  python3 recvOBB.py -a localhost:5555 -v --pc tcp://localhost:5556 --point-budget 100000
+
+  # 可视化 + 退出时导出帧耗时统计
+  python3 recvOBB.py -a localhost:5555 -v --metrics-export metrics.csv
+
+  # 离屏渲染录制文件为视频（无显示环境，需要 ffmpeg）
+  python3 recvOBB.py --replay recording.jsonl --headless out.mp4
+
+  # 离屏渲染实时数据为 PNG 序列（前 100 帧）
+  python3 recvOBB.py -a localhost:5555 --headless frames/ --max-frames 100
+
+  # 测量启动耗时（进程启动 -> 接收就绪）后退出
+  python3 recvOBB.py -a localhost:5555 --summary --startup-time
         """
     )
 
@@ -1068,10 +1717,143 @@ def main():
         help="启用 3D 可视化模式 (需要 PyOpenGL 和 Pygame)"
     )
 
+    parser.add_argument(
+        "-s", "--summary",
+        metavar="SECONDS",
+        type=float,
+        nargs="?",
+        const=1.0,
+        default=None,
+        help="文本模式按周期输出聚合摘要而不是逐条打印 OBB (默认周期: 1 秒，0 = 每条消息输出一次)"
+    )
+
+    parser.add_argument(
+        "--dump-collisions",
+        action="store_true",
+        help="摘要模式下列出碰撞 OBB 的详细信息（未指定 --summary 时启用 1 秒摘要）"
+    )
+
+    parser.add_argument(
+        "--check-collisions",
+        action="store_true",
+        help="摘要模式下用 OBB 几何相交 (SAT) 校验 collision_status"
+    )
+
+    parser.add_argument(
+        "--pc",
+        metavar="ADDRESS",
+        default=None,
+        help="点云通道 ZMQ 地址 (如 tcp://localhost:5556，仅可视化模式)"
+    )
+
+    parser.add_argument(
+        "--point-budget",
+        type=int,
+        default=200_000,
+        help="每帧绘制的最大点数，超出时自动选择更粗的 LOD 层级 (默认: 200000)"
+    )
+
+    parser.add_argument(
+        "--no-cull",
+        action="store_true",
+        help="禁用视锥裁剪（默认启用，运行时可按 F4 切换）"
+    )
+
+    parser.add_argument(
+        "--metrics-export",
+        metavar="PATH",
+        default=None,
+        help="退出时导出帧耗时/时延百分位统计 (.csv 或 .json，仅可视化模式)"
+    )
+
+    parser.add_argument(
+        "--headless",
+        metavar="OUTPUT",
+        default=None,
+        help="离屏渲染到 PNG 序列目录或视频文件 (.mp4/.mkv/.avi/.mov)，无需显示器"
+    )
+
+    parser.add_argument(
+        "--replay",
+        metavar="PATH",
+        default=None,
+        help="离屏渲染的录制文件 (.h5 或 .jsonl)，不指定时从 -a 实时接收"
+    )
+
+    parser.add_argument(
+        "--size",
+        default="800x600",
+        help="离屏渲染图像尺寸 WxH (默认: 800x600)"
+    )
+
+    parser.add_argument(
+        "--fps",
+        type=float,
+        default=20.0,
+        help="离屏渲染视频帧率 (默认: 20)"
+    )
+
+    parser.add_argument(
+        "--max-frames",
+        type=int,
+        default=None,
+        help="离屏渲染的最大帧数 (默认: 全部)"
+    )
+
+    parser.add_argument(
+        "--view-scale",
+        type=float,
+        default=1.0,
+        help="离屏渲染视图缩放 (默认: 1.0)"
+    )
+
+    parser.add_argument(
+        "--view-rotation",
+        type=float,
+        nargs=2,
+        metavar=("RX", "RY"),
+        default=(0.0, 0.0),
+        help="离屏渲染视图旋转角度（度） (默认: 0 0)"
+    )
+
+    parser.add_argument(
+        "--startup-time",
+        action="store_true",
+        help="测量启动耗时（进程启动 -> 接收就绪，含模块导入）并退出"
+    )
+
     args = parser.parse_args()
+    startup_timer.mark('arguments')
 
     # 创建并运行接收器
-    receiver = OBBReceiver(args.address, args.mode, visualize=args.visualize)
+    receiver = OBBReceiver(args.address, args.mode,
+                           visualize=args.visualize and not args.headless,
+                           metrics_export=args.metrics_export,
+                           pointcloud_address=args.pc,
+                           point_budget=args.point_budget,
+                           frustum_culling=not args.no_cull,
+                           summary_interval=(args.summary if args.summary is not None
+                                             else 1.0 if args.dump_collisions or args.check_collisions else None),
+                           dump_collisions=args.dump_collisions,
+                           check_collisions=args.check_collisions)
+    startup_timer.mark('receiver ready')
+
+    if args.startup_time:
+        startup_timer.print_report()
+        receiver.cleanup()
+        return
+
+    if args.headless:
+        try:
+            width, height = (int(v) for v in args.size.lower().split("x"))
+        except ValueError:
+            parser.error(f"--size 格式应为 WxH (如 800x600): {args.size}")
+        receiver.run_headless(args.headless, replay=args.replay, size=(width, height),
+                              fps=args.fps, max_frames=args.max_frames,
+                              view_scale=args.view_scale,
+                              view_rotation=tuple(args.view_rotation))
+        return
+
     receiver.run()
 
 
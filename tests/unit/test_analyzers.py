@@ -0,0 +1,200 @@
+"""
+Unit tests for lcps_tool.layer3 frame analyzers
+"""
+
+import numpy as np
+import pytest
+
+from lcps_tool.data_models.synced_frame import SyncedFrame
+from lcps_tool.layer3 import (
+    ClearanceAnalyzer,
+    FalseAlarmDetector,
+    MissedAlertDetector,
+    PointMembershipAnalyzer,
+    create_anomaly_detectors,
+    detect_anomalies,
+)
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(7)
+
+
+ZONE_CONFIG = {
+    'danger_zones': [
+        {'id': 'zone_front', 'name': '前方危险区', 'type': 'box',
+         'min_x': -2.0, 'max_x': 2.0, 'min_y': 0.0, 'max_y': 5.0, 'min_z': 0.0, 'max_z': 3.0},
+    ],
+    'min_points': 50,
+}
+
+
+def _frame(frame_id, obbs=None, points=None, timestamp=None, state=None):
+    timestamp = 1000.0 + frame_id * 0.1 if timestamp is None else timestamp
+    return SyncedFrame(
+        timestamp=timestamp,
+        frame_id=frame_id,
+        obb_data={'timestamp': timestamp, 'obbs': obbs} if obbs is not None else None,
+        pointcloud_data={'timestamp': timestamp, 'points': points} if points is not None else None,
+        status_data={'timestamp': timestamp, 'state': state} if state is not None else None,
+    )
+
+
+def _box(position, size=(2.0, 2.0, 2.0), collision=0):
+    return {'type': 'car', 'position': list(position), 'rotation': [1.0, 0.0, 0.0, 0.0],
+            'size': list(size), 'collision_status': collision}
+
+
+def _cluster(rng, center, n, spread=0.5):
+    return np.asarray(center) + rng.uniform(-spread, spread, size=(n, 3))
+
+
+class TestPointMembershipAnalyzer:
+    """Points per OBB per frame"""
+
+    def test_counts_per_box(self, rng):
+        points = np.vstack([_cluster(rng, (0, 0, 0), 40), _cluster(rng, (10, 0, 0), 5)])
+        frame = _frame(0, [_box((0, 0, 0)), _box((10, 0, 0)), _box((0, 10, 0))], points)
+
+        analyzer = PointMembershipAnalyzer(return_indices=True)
+        result = analyzer.process_frame(frame)
+        assert result.counts.tolist() == [40, 5, 0]
+        assert result.empty_boxes == 1
+        assert result.indices[1].tolist() == list(range(40, 45))
+
+    def test_skips_incomplete_frames_and_batch_mode(self, rng):
+        frames = [_frame(0, [_box((0, 0, 0))]),
+                  _frame(1, [_box((0, 0, 0))], _cluster(rng, (0, 0, 0), 10))]
+        analyzer = PointMembershipAnalyzer()
+        results = list(analyzer.analyze(frames))
+        assert results[0] is None
+        assert results[1].counts.tolist() == [10]
+
+        stats = analyzer.get_statistics()
+        assert stats['frames_processed'] == 2
+        assert stats['frames_with_counts'] == 1
+        assert stats['avg_points_per_box'] == 10
+
+
+class TestClearanceAnalyzer:
+    """Spreader-to-point-cloud clearance per frame"""
+
+    def test_min_clearance_of_selected_types(self, rng):
+        spreader = dict(_box((0, 0, 5)), type='spreader')
+        points = np.vstack([_cluster(rng, (0, 0, 0), 50, spread=0.2), _cluster(rng, (0, 0, 5), 20)])
+        frame = _frame(0, [spreader, _box((0, 0, 0))], points[:50])
+
+        analyzer = ClearanceAnalyzer(max_distance=10.0)
+        result = analyzer.process_frame(frame)
+        assert list(result.box_indices) == [0]
+        assert result.min_clearance == pytest.approx(5.0 - 1.0 - points[:50, 2].max())
+
+        result = analyzer.process_frame(_frame(1, [spreader], points))
+        assert result.min_clearance == 0.0
+        stats = analyzer.get_statistics()
+        assert stats['frames_in_range'] == 2 and stats['min_clearance'] == 0.0
+
+    def test_receiver_keys_of_other_voxel_size(self, rng):
+        from lcps_tool.geometry import voxel_grid_reduce
+
+        # Read as 0.1 m cells, the 0.5 m keys would place the points ~6 m away
+        spreader = dict(_box((8, 0, 3)), type='spreader')
+        centroids, _, keys = voxel_grid_reduce(_cluster(rng, (8, 0, 0), 500, spread=1.0), 0.5)
+        frame = _frame(0, [spreader], centroids)
+        frame.pointcloud_data.update(voxel_keys=keys, voxel_size=0.5)
+
+        analyzer = ClearanceAnalyzer(voxel_size=0.1)
+        result = analyzer.process_frame(frame)
+        assert analyzer.index.mismatched_keys == 1 and analyzer.index.reused_keys == 0
+        assert result.min_clearance == pytest.approx(3.0 - 1.0 - centroids[:, 2].max())
+
+    def test_frame_without_points(self):
+        assert ClearanceAnalyzer().process_frame(_frame(0, [_box((0, 0, 0))])) is None
+
+
+class TestMissedAlertDetector:
+    """Should have alerted, but did not"""
+
+    def test_points_in_zone_without_obb(self, rng):
+        detector = MissedAlertDetector(ZONE_CONFIG)
+        anomalies = detector.process_frame(_frame(0, [], _cluster(rng, (0, 2, 1), 100), state='detecting'))
+        assert [a.type for a in anomalies] == ['missed_alert']
+        assert anomalies[0].severity == 'critical'
+        assert anomalies[0].zone_id == 'zone_front'
+
+    def test_obb_present_is_not_missed(self, rng):
+        detector = MissedAlertDetector(ZONE_CONFIG)
+        frame = _frame(0, [_box((0, 2, 1), collision=1)], _cluster(rng, (0, 2, 1), 100), state='alerting')
+        assert detector.process_frame(frame) == []
+
+    def test_obb_without_alarm_and_inactive_state(self, rng):
+        detector = MissedAlertDetector(ZONE_CONFIG)
+        frame = _frame(0, [_box((0, 2, 1))], _cluster(rng, (0, 2, 1), 100), state='idle')
+        types = sorted(a.type for a in detector.process_frame(frame))
+        assert types == ['lifecycle_error', 'missed_alarm']
+
+    def test_debounce_reports_once_per_episode(self, rng):
+        detector = MissedAlertDetector(dict(ZONE_CONFIG, min_consecutive_frames=3))
+        points = _cluster(rng, (0, 2, 1), 100)
+        reported = [len(detector.process_frame(_frame(i, [], points))) for i in range(6)]
+        assert reported == [0, 0, 1, 0, 0, 0]
+        # Episode ends, a new one is reported again after 3 frames
+        detector.process_frame(_frame(6, [], np.empty((0, 3))))
+        reported = [len(detector.process_frame(_frame(7 + i, [], points))) for i in range(3)]
+        assert reported == [0, 0, 1]
+
+
+class TestFalseAlarmDetector:
+    """Alerted, but should not have"""
+
+    def test_unsupported_obb(self, rng):
+        detector = FalseAlarmDetector({'min_support_points': 20})
+        points = _cluster(rng, (0, 0, 0), 50)
+        anomalies = detector.process_frame(_frame(0, [_box((0, 0, 0)), _box((1, 2, 0), collision=1)], points))
+        assert [(a.type, a.obb_index) for a in anomalies] == [('false_alarm', 1)]
+
+    def test_only_alerting_obbs_checked(self, rng):
+        frame = _frame(0, [_box((5, 5, 0)), _box((-5, 5, 0))], _cluster(rng, (0, 0, 0), 50))
+        assert FalseAlarmDetector().process_frame(frame) == []
+        anomalies = FalseAlarmDetector({'only_alerting': False}).process_frame(frame)
+        assert [a.obb_index for a in anomalies] == [0, 1]
+
+    def test_unsupported_reported_once_per_episode(self, rng):
+        detector = FalseAlarmDetector({'min_support_points': 20})
+        points = _cluster(rng, (0, 0, 0), 50)
+        alerting = dict(_box((5, 5, 0), collision=1), track_id=7)
+        other = dict(_box((-5, 5, 0), collision=1), track_id=8)
+
+        reported = [[a.obb_index for a in detector.process_frame(_frame(i, boxes, points))]
+                    for i, boxes in enumerate([[alerting], [alerting], [other, alerting], [other]])]
+        # Track 7 keeps its episode when it moves to index 1; track 8 starts one
+        assert reported == [[0], [], [0], []]
+
+        # Track 7 supported in between: a new episode is reported again
+        detector.process_frame(_frame(4, [dict(alerting, position=[0, 0, 0])], points))
+        assert [a.obb_index for a in detector.process_frame(_frame(5, [alerting], points))] == [0]
+
+    def test_alert_flicker_frequency(self):
+        detector = FalseAlarmDetector({'max_alert_frequency': 1.0, 'frequency_window_s': 2.0})
+        results = []
+        for i in range(40):  # 10 Hz frames, alert toggling every frame
+            frame = _frame(i, timestamp=i * 0.1, state='alerting' if i % 2 else 'detecting')
+            results.append([a.type for a in detector.process_frame(frame)])
+        flagged = [i for i, types in enumerate(results) if 'false_alarm_high_frequency' in types]
+        assert len(flagged) == 1
+
+    def test_steady_alert_is_not_high_frequency(self):
+        detector = FalseAlarmDetector({'max_alert_frequency': 1.0, 'frequency_window_s': 2.0})
+        anomalies = detect_anomalies(
+            (_frame(i, timestamp=i * 0.1, state='alerting') for i in range(50)), [detector])
+        assert anomalies == []
+
+
+def test_create_anomaly_detectors_from_config():
+    config = {'anomaly_detection': {
+        'missed_alert': ZONE_CONFIG,
+        'false_alarm': {'enabled': False},
+    }}
+    detectors = create_anomaly_detectors(config)
+    assert [type(d) for d in detectors] == [MissedAlertDetector]
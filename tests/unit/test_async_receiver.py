@@ -0,0 +1,119 @@
+"""
+Unit tests for the asyncio receiver backend (AsyncReceiver, stream(), AsyncSynchronizer)
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+import zmq
+
+from lcps_tool.layer1 import AsyncReceiver, MultiChannelReceiver
+from lcps_tool.layer1.receivers.obb_receiver import OBBReceiver
+from lcps_tool.layer2 import AsyncSynchronizer, DataSynchronizer
+from lcps_tool.perf.synthetic import encode_obb_message, make_obb_message, make_status_message
+
+
+@pytest.fixture
+def publishers():
+    """OBB and status publishers on free ports"""
+    context = zmq.Context()
+    sockets = {}
+    for channel in ('obb', 'status'):
+        socket = context.socket(zmq.PUB)
+        port = socket.bind_to_random_port('tcp://127.0.0.1')
+        sockets[channel] = (socket, f'tcp://127.0.0.1:{port}')
+    yield sockets
+    for socket, _ in sockets.values():
+        socket.close(linger=0)
+    context.term()
+
+
+async def _publish(publishers, messages):
+    """Publish until cancelled (subscribers join late)"""
+    while True:
+        for channel, message in messages.items():
+            publishers[channel][0].send(message)
+        await asyncio.sleep(0.01)
+
+
+def _run(publishers, messages, consumer, timeout=5.0):
+    """Run consumer() while publishing messages"""
+    async def main():
+        publisher = asyncio.create_task(_publish(publishers, messages))
+        try:
+            return await asyncio.wait_for(consumer(), timeout)
+        finally:
+            publisher.cancel()
+    return asyncio.run(main())
+
+
+def _obb_message(timestamp):
+    rng = np.random.default_rng(0)
+    return encode_obb_message(make_obb_message(3, rng, timestamp=timestamp), 'json')
+
+
+def test_async_iteration(publishers):
+    obb = OBBReceiver(publishers['obb'][1])
+
+    async def consume():
+        async with AsyncReceiver(obb) as receiver:
+            async for data in receiver:
+                return data, receiver.get_statistics()
+
+    data, stats = _run(publishers, {'obb': _obb_message(1.5)}, consume)
+    assert data['timestamp'] == 1.5 and len(data['obbs']) == 3
+    assert set(data['trace']) == {'receive', 'receive_wall', 'parse', 'dequeue'}
+    assert stats['is_running'] and stats['msg_count'] >= 1
+    assert obb.receiver_thread is None
+
+
+def test_parse_errors_skipped(publishers):
+    obb = OBBReceiver(publishers['obb'][1])
+
+    async def consume():
+        async with AsyncReceiver(obb, parse_in_executor=True) as receiver:
+            while True:
+                # Invalid messages until one was seen, then a valid one
+                publishers['obb'][0].send(_obb_message(2.0) if obb.error_count else b'not json')
+                try:
+                    return await asyncio.wait_for(receiver.recv(), 0.05)
+                except asyncio.TimeoutError:
+                    pass
+
+    data = asyncio.run(asyncio.wait_for(consume(), 5.0))
+    assert data['timestamp'] == 2.0
+    assert obb.error_count >= 1 and obb.msg_count >= 1
+
+
+def test_stream_and_synchronizer(publishers):
+    receiver = MultiChannelReceiver()
+    receiver.add_obb_channel(publishers['obb'][1])
+    receiver.add_status_channel(publishers['status'][1])
+    rng = np.random.default_rng(1)
+    messages = {'obb': _obb_message(10.0),
+                'status': make_status_message(rng, timestamp=10.0, frame_id=7)}
+
+    async def consume():
+        channels = set()
+        synchronizer = AsyncSynchronizer(DataSynchronizer(min_quality=0.0), trigger='status')
+        async for frame in synchronizer.frames(_recording(receiver.stream(), channels)):
+            if frame.obb_data is not None and frame.status_data is not None:
+                return frame, channels
+
+    frame, channels = _run(publishers, messages, consume)
+    assert channels == {'obb', 'status'}
+    assert frame.timestamp == pytest.approx(10.0)
+    assert frame.status_data['frame_id'] == 7
+    assert receiver.get_statistics()['obb']['msg_count'] >= 1
+
+
+async def _recording(stream, channels):
+    async for channel, data in stream:
+        channels.add(channel)
+        yield channel, data
+
+
+def test_unknown_trigger():
+    with pytest.raises(ValueError):
+        AsyncSynchronizer(DataSynchronizer(), trigger='thermal')
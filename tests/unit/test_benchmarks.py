@@ -0,0 +1,99 @@
+"""
+Unit tests for lcps_tool.perf.benchmarks
+"""
+
+import json
+
+import h5py
+import numpy as np
+import pytest
+
+from lcps_tool.data_models.synced_frame import SyncedFrame
+from lcps_tool.layer1.receivers.obb_receiver import OBBReceiver
+from lcps_tool.layer2 import DataRecorder
+from lcps_tool.perf.benchmarks import compare_results, main, run_benchmarks
+from lcps_tool.perf.synthetic import encode_obb_message, make_obb_message
+
+
+def _document(**medians):
+    return {'results': [{'key': key, 'suite': key.split('[')[0], 'median_ms': value}
+                        for key, value in medians.items()]}
+
+
+class TestCompareResults:
+    """Regression flagging against a baseline"""
+
+    def test_statuses(self):
+        baseline = _document(**{'a[n=1]': 10.0, 'a[n=2]': 10.0, 'a[n=3]': 10.0,
+                                'a[n=4]': 10.0, 'b[n=1]': 10.0})
+        current = _document(**{'a[n=1]': 12.0, 'a[n=2]': 8.0, 'a[n=3]': 10.5, 'a[n=5]': 1.0})
+        statuses = {entry['key']: entry['status']
+                    for entry in compare_results(current, baseline, threshold=0.1)}
+
+        assert statuses == {
+            'a[n=1]': 'regression',
+            'a[n=2]': 'improvement',
+            'a[n=3]': 'ok',
+            'a[n=5]': 'new',
+            'a[n=4]': 'missing',   # suite b did not run: not reported
+        }
+
+    def test_change_is_relative(self):
+        entry, = compare_results(_document(**{'a[n=1]': 15.0}), _document(**{'a[n=1]': 10.0}))
+        assert entry['change'] == pytest.approx(0.5)
+
+
+class TestRunBenchmarks:
+    """Suite execution and result document"""
+
+    def test_quick_run_is_reproducible(self):
+        document = run_benchmarks(suites=['synchronize'], quick=True, repeat=1, warmup=0, seed=3)
+        keys = [result['key'] for result in document['results']]
+        assert keys == ['synchronize[buffer_size=10]', 'synchronize[buffer_size=100]']
+        assert all(result['median_ms'] > 0 and result['throughput_per_s'] > 0
+                   for result in document['results'])
+        json.dumps(document)   # serializable
+
+    def test_unknown_suite(self):
+        with pytest.raises(ValueError):
+            run_benchmarks(suites=['nope'])
+
+    def test_cli_flags_regression(self, tmp_path):
+        baseline = run_benchmarks(suites=['obb_decode'], quick=True, repeat=1, warmup=0)
+        for result in baseline['results']:
+            result['median_ms'] /= 100.0   # baseline 100x faster than reality
+        baseline_path = tmp_path / 'baseline.json'
+        baseline_path.write_text(json.dumps(baseline))
+        output_path = tmp_path / 'current.json'
+
+        status = main(['--quick', '--repeat', '1', '--suite', 'obb_decode',
+                       '--output', str(output_path), '--compare', str(baseline_path)])
+        assert status == 1
+        assert len(json.loads(output_path.read_text())['results']) == len(baseline['results'])
+
+
+@pytest.mark.parametrize('fmt', ['zlib_bson', 'zlib_json'])
+def test_compressed_obb_decoding(fmt):
+    message = make_obb_message(3, np.random.default_rng(0), timestamp=1.5, seq_id=4)
+    receiver = OBBReceiver("tcp://localhost:0", use_compression=True)
+    decoded = receiver._parse_compressed(encode_obb_message(message, fmt))
+    assert decoded['timestamp'] == 1.5
+    assert decoded['seq_id'] == 4
+    assert decoded['obbs'] == message['payload']['obbs']
+
+
+@pytest.mark.parametrize('compression,level', [(None, 0), ('lzf', 0), ('gzip', 9)])
+def test_recorder_compression_settings(tmp_path, compression, level):
+    path = tmp_path / 'rec.h5'
+    recorder = DataRecorder(str(path), compression=compression, compression_level=level,
+                            async_write=False)
+    recorder.start_recording()
+    points = np.random.default_rng(0).normal(size=(100, 3)).astype(np.float32)
+    recorder.record_frame(SyncedFrame(timestamp=1.0, frame_id=0,
+                                      pointcloud_data={'timestamp': 1.0, 'points': points}))
+    recorder.stop_recording()
+
+    with h5py.File(path, 'r') as h5file:
+        dataset = h5file['pointcloud_data/frame_000000']
+        assert np.array_equal(dataset[()], points)
+        assert dataset.compression == compression
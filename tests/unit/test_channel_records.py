@@ -0,0 +1,109 @@
+"""
+Unit tests for lcps_tool.data_models.channel_records and SyncedFramePool
+"""
+
+import json
+
+import h5py
+import numpy as np
+import pytest
+
+from lcps_tool.data_models import OBBRecord, PointCloudRecord, StatusRecord, SyncedFrame, SyncedFramePool
+from lcps_tool.layer1.receivers.obb_receiver import OBBReceiver
+from lcps_tool.layer1.receivers.status_receiver import StatusReceiver
+from lcps_tool.layer2 import DataRecorder, DataSynchronizer
+from lcps_tool.perf.benchmarks import run_benchmarks
+
+
+class TestChannelRecord:
+    """Mapping compatibility of slotted records"""
+
+    def test_mapping_access(self):
+        record = OBBRecord(timestamp=1.5, obbs=[{'type': 'container'}], custom='x')
+        assert not hasattr(record, '__dict__')
+        assert record['timestamp'] == 1.5
+        assert record.get('obbs') == [{'type': 'container'}]
+        assert 'custom' in record and record['custom'] == 'x'
+        assert dict(record) == {'timestamp': 1.5, 'obbs': [{'type': 'container'}], 'custom': 'x'}
+        assert record == {'timestamp': 1.5, 'obbs': [{'type': 'container'}], 'custom': 'x'}
+        assert len(record) == 3
+
+    def test_absent_fields(self):
+        record = OBBRecord(obbs=[])
+        assert 'timestamp' not in record
+        assert record.get('seq_id', -1) == -1
+        with pytest.raises(KeyError):
+            record['timestamp']
+        record['trace'] = {'parse': 1.0}
+        del record['trace']
+        assert 'trace' not in record
+        with pytest.raises(KeyError):
+            del record['trace']
+
+    def test_copy_is_independent(self):
+        record = PointCloudRecord(timestamp=1.0, points=np.zeros((2, 3)), note='a')
+        copy = record.copy()
+        copy['timestamp'] = 2.0
+        copy['note'] = 'b'
+        assert type(copy) is PointCloudRecord
+        assert (record['timestamp'], record['note']) == (1.0, 'a')
+        assert copy['points'] is record['points']
+
+    def test_receivers_emit_records(self):
+        obb = OBBReceiver("tcp://localhost:0")._parse_normal(json.dumps(
+            {'header': {'timestamp': 3.0, 'seq_id': 7}, 'payload': {'obbs': []}}).encode())
+        assert isinstance(obb, OBBRecord)
+        assert (obb['timestamp'], obb['seq_id'], obb['source']) == (3.0, 7, 'unknown')
+
+        legacy = OBBReceiver("tcp://localhost:0")._parse_normal(b'[]')
+        assert 'timestamp' not in legacy and legacy['obbs'] == []
+
+        receiver = StatusReceiver("tcp://localhost:0")
+        receiver.socket = object()
+        receiver._recv_message = lambda: json.dumps({'state': 'bogus', 'timestamp': 4.0}).encode()
+        status = receiver._receive_data()
+        assert isinstance(status, StatusRecord)
+        assert (status['state_raw'], status['timestamp'], status['metrics']) == ('bogus', 4.0, {})
+
+
+class TestSyncedFramePool:
+    """Frame recycling"""
+
+    def test_acquire_release(self):
+        pool = SyncedFramePool(max_size=1)
+        frame = pool.acquire(1.0, 1, obb_data={'timestamp': 1.0})
+        frame.sync_offset_ms['obb'] = 3.0
+        frame.trace['synchronize'] = 0.5
+        pool.release(frame)
+        assert frame.obb_data is None and frame.sync_offset_ms == {} and frame.trace == {}
+
+        again = pool.acquire(2.0, 2)
+        assert again is frame
+        assert (again.timestamp, again.frame_id) == (2.0, 2)
+
+        pool.release(again)
+        pool.release(SyncedFrame(3.0, 3))  # Beyond max_size: not kept
+        assert pool.get_statistics() == {'created': 1, 'reused': 1, 'released': 3, 'idle': 1}
+
+    def test_synchronizer_and_recorder(self, tmp_path):
+        pool = SyncedFramePool()
+        synchronizer = DataSynchronizer(min_quality=0.0, frame_pool=pool)
+        synchronizer.add_data('status', StatusRecord(timestamp=5.0, state='idle', frame_id=1))
+        recorder = DataRecorder(str(tmp_path / 'pool.h5'), async_write=False, frame_pool=pool)
+        recorder.start_recording()
+        for _ in range(3):
+            frame = synchronizer.synchronize(5.0)
+            assert frame.sync_offset_ms == {'status': 0.0} and 'synchronize' in frame.trace
+            recorder.record_frame(frame)
+        recorder.stop_recording()
+
+        assert pool.get_statistics()['created'] == 1
+        with h5py.File(tmp_path / 'pool.h5', 'r') as h5file:
+            assert json.loads(h5file['status_data/frame_000002'].attrs['status'])['state'] == 'idle'
+
+
+def test_allocation_benchmark():
+    document = run_benchmarks(suites=['allocations'], quick=True, repeat=1, warmup=0)
+    results = {result['params']['variant']: result for result in document['results']}
+    assert results['record']['sample_bytes'] < results['dict']['sample_bytes']
+    assert results['record']['frames_allocated'] == 1
@@ -0,0 +1,74 @@
+"""
+Unit tests for lcps_tool.layer2.channel_synchronizer
+"""
+
+import numpy as np
+import pytest
+
+from lcps_tool.layer2 import ChannelSpec, ChannelSynchronizer, DataSynchronizer
+
+
+def _fill(sync, channels, count=20, period=0.1, start=100.0):
+    for k in range(count):
+        for name, delay in channels.items():
+            sync.add_data(name, {'timestamp': start + k * period + delay, 'k': k})
+
+
+class TestChannelSynchronizer:
+    """Generic N-channel synchronization"""
+
+    def test_per_channel_windows_and_optional_channels(self):
+        sync = ChannelSynchronizer([
+            ChannelSpec('lidar_front', window_ms=50),
+            ChannelSpec('lidar_rear', window_ms=50),
+            ChannelSpec('camera', window_ms=5, required=False),
+        ], reference='lidar_front')
+        _fill(sync, {'lidar_front': 0.0, 'lidar_rear': 0.02, 'camera': 0.01})
+
+        frame = sync.synchronize()
+        assert frame.timestamp == pytest.approx(100.0 + 19 * 0.1)
+        assert frame.channel_names == ['lidar_front', 'lidar_rear']
+        assert frame['lidar_rear']['k'] == 19
+        assert frame.sync_offset_ms['lidar_rear'] == pytest.approx(20.0)
+        assert frame.sync_quality == pytest.approx(0.6)
+
+        sync.add_channel(ChannelSpec('radar', window_ms=50))
+        assert sync.synchronize() is None   # required channel without data
+        assert sync.get_statistics()['sync_fail_count'] == 1
+
+    def test_batch_matches_single(self):
+        channels = [ChannelSpec('a', 30), ChannelSpec('b', 30), ChannelSpec('c', 30, required=False)]
+        single, batch = ChannelSynchronizer(channels), ChannelSynchronizer(channels)
+        for sync in (single, batch):
+            _fill(sync, {'a': 0.0, 'b': 0.013, 'c': 0.045}, count=150)
+
+        targets = 100.0 + np.arange(60, 150) * 0.1 + 0.004
+        expected = [single.synchronize(t) for t in targets]
+        frames = batch.synchronize_batch(targets)
+        assert [f.timestamp for f in frames] == [f.timestamp for f in expected if f is not None]
+        for got, want in zip(frames, [f for f in expected if f is not None]):
+            assert got.channel_names == want.channel_names
+            assert got.sync_offset_ms == pytest.approx(want.sync_offset_ms)
+
+    def test_ring_buffer_and_legacy_frame(self):
+        sync = ChannelSynchronizer([ChannelSpec('obb', buffer_size=5),
+                                    ChannelSpec('pointcloud', buffer_size=5)])
+        _fill(sync, {'obb': 0.0, 'pointcloud': 0.01}, count=12)
+        assert sync.get_buffer_status() == {'obb': 5, 'pointcloud': 5}
+        assert sync.synchronize(100.0) is None   # evicted
+
+        synced = sync.synchronize(100.0 + 11 * 0.1).to_synced_frame()
+        assert synced.has_obb() and synced.has_pointcloud() and not synced.has_status()
+        assert synced.sync_offset_ms['pointcloud'] == pytest.approx(10.0)
+
+        legacy = DataSynchronizer(sync_window_ms=50.0, min_quality=0.0)
+        _fill(legacy, {'obb': 0.0, 'pointcloud': 0.01}, count=12)
+        assert legacy.synchronize(100.0 + 11 * 0.1).sync_offset_ms == \
+            pytest.approx(synced.sync_offset_ms)
+
+    def test_unknown_channel(self):
+        sync = ChannelSynchronizer([ChannelSpec('obb')])
+        with pytest.raises(ValueError):
+            sync.add_data('camera', {'timestamp': 0.0})
+        with pytest.raises(ValueError):
+            sync.add_channel(ChannelSpec('obb'))
@@ -0,0 +1,135 @@
+"""
+Unit tests for lcps_tool.layer2.data_synchronizer
+"""
+
+import numpy as np
+import pytest
+
+from lcps_tool.geometry.interpolation import slerp_quaternions
+from lcps_tool.layer2.clock_offset import ClockOffsetEstimator
+from lcps_tool.layer2.data_synchronizer import DataSynchronizer
+from lcps_tool.layer2.obb_tracker import OBBTracker
+
+
+def _quat_z(angle):
+    return [np.cos(angle / 2), 0.0, 0.0, np.sin(angle / 2)]
+
+
+def _obb_message(timestamp, x, angle=0.0, track_ids=None):
+    obbs = []
+    for i in range(3):
+        obb = {'type': 'car', 'position': [x + 10.0 * i, 0.0, 0.0], 'rotation': _quat_z(angle),
+               'size': [2.0, 1.0, 1.0], 'collision_status': i % 2}
+        if track_ids is not None:
+            obb['track_id'] = track_ids[i]
+        obbs.append(obb)
+    return {'timestamp': timestamp, 'obbs': obbs}
+
+
+class TestSlerp:
+    """Quaternion slerp"""
+
+    def test_halfway_rotation_about_z(self):
+        q = slerp_quaternions([_quat_z(0.0)], [_quat_z(np.pi / 2)], 0.5)
+        assert np.allclose(q[0], _quat_z(np.pi / 4))
+
+    def test_shortest_arc_and_identity(self):
+        q0 = np.array([_quat_z(0.1)])
+        assert np.allclose(slerp_quaternions(q0, -q0, 0.3), q0)
+        assert np.allclose(slerp_quaternions(q0, q0, 0.7), q0)
+
+
+class TestOBBInterpolation:
+    """Pose interpolation in DataSynchronizer"""
+
+    def test_interpolates_between_bracketing_samples(self):
+        sync = DataSynchronizer(sync_window_ms=50.0, interpolate_obbs=True)
+        sync.add_data('obb', _obb_message(10.00, 0.0, 0.0))
+        sync.add_data('obb', _obb_message(10.04, 4.0, np.pi / 2))
+        sync.add_data('pointcloud', {'timestamp': 10.01, 'points': np.zeros((1, 3))})
+
+        frame = sync.synchronize(10.01)
+        assert frame.obb_data['interpolated']
+        assert frame.obb_data['source_timestamps'] == [10.00, 10.04]
+        assert frame.sync_offset_ms['obb'] == 0.0
+        positions = [obb['position'][0] for obb in frame.obb_data['obbs']]
+        assert positions == pytest.approx([1.0, 11.0, 21.0])
+        assert np.allclose(frame.obb_data['obbs'][0]['rotation'], _quat_z(np.pi / 8))
+        assert [obb['collision_status'] for obb in frame.obb_data['obbs']] == [0, 1, 0]
+        assert sync.get_statistics()['interpolated_count'] == 1
+
+    def test_matches_by_track_id(self):
+        sync = DataSynchronizer(interpolate_obbs=True)
+        sync.add_data('obb', _obb_message(1.00, 0.0, track_ids=[5, 6, 7]))
+        later = _obb_message(1.02, 2.0, track_ids=[7, 5, 9])
+        sync.add_data('obb', later)
+
+        obbs = sync.synchronize(1.015).obb_data['obbs']
+        by_track = {obb['track_id']: obb['position'][0] for obb in obbs}
+        # Track 5: 0.0 -> 12.0, track 7: 20.0 -> 2.0, track 9 only in the later sample
+        assert by_track[5] == pytest.approx(9.0)
+        assert by_track[7] == pytest.approx(6.5)
+        assert by_track[9] == pytest.approx(22.0)
+
+    def test_tracker_matches_reordered_boxes(self):
+        sync = DataSynchronizer(interpolate_obbs=True, obb_tracker=OBBTracker(gate_distance=3.0))
+        sync.add_data('obb', _obb_message(1.00, 0.0))
+        later = _obb_message(1.02, 2.0)
+        later['obbs'].reverse()  # Publisher emits the boxes in another order
+        sync.add_data('obb', later)
+
+        obbs = sync.synchronize(1.01).obb_data['obbs']
+        # Every box moved +2 m: halfway is +1 m, not a blend of unrelated boxes
+        assert sorted(obb['position'][0] for obb in obbs) == pytest.approx([1.0, 11.0, 21.0])
+        assert sorted(obb['track_id'] for obb in obbs) == [0, 1, 2]
+        assert all('track_id' in obb for obb in sync.buffers['obb'][0]['obbs'])
+
+    def test_falls_back_to_closest_sample(self):
+        sync = DataSynchronizer(sync_window_ms=50.0, interpolate_obbs=True)
+        sync.add_data('obb', _obb_message(1.00, 0.0))
+        sync.add_data('obb', _obb_message(1.20, 5.0))
+
+        frame = sync.synchronize(1.02)
+        assert 'interpolated' not in frame.obb_data
+        assert frame.obb_data['obbs'][0]['position'][0] == 0.0
+
+        disabled = DataSynchronizer(interpolate_obbs=False)
+        disabled.add_data('obb', _obb_message(1.00, 0.0))
+        disabled.add_data('obb', _obb_message(1.04, 4.0))
+        assert disabled.synchronize(1.01).obb_data['obbs'][0]['position'][0] == 0.0
+
+
+class TestClockOffsetEstimation:
+    """Online clock offset / drift correction"""
+
+    def test_estimates_offset_and_drift(self):
+        rng = np.random.default_rng(3)
+        estimator = ClockOffsetEstimator(reference='pointcloud')
+        for k in range(300):
+            t = 1000.0 + k * 0.1
+            estimator.observe('pointcloud', t + rng.normal(0, 0.0001))
+            # OBB clock runs 30 ms ahead and 50 ppm fast, with jitter and outliers
+            jitter = 0.2 if k % 37 == 0 else rng.normal(0, 0.0002)
+            estimator.observe('obb', t + 0.030 + 50e-6 * (t - 1000.0) + jitter)
+
+        estimate = estimator.get_estimates()['obb']
+        assert estimate['offset_ms'] == pytest.approx(30.0, abs=1.0)
+        assert estimate['drift_ppm'] == pytest.approx(50.0, abs=10.0)
+        assert estimator.correct('obb', 1020.0 + 0.030 + 50e-6 * 20.0) == pytest.approx(1020.0, abs=0.002)
+
+    def test_synchronizer_removes_skew(self):
+        plain = DataSynchronizer(sync_window_ms=50.0)
+        corrected = DataSynchronizer(sync_window_ms=50.0, clock_reference='pointcloud')
+        for sync in (plain, corrected):
+            for k in range(50):
+                t = 10.0 + k * 0.1
+                sync.add_data('pointcloud', {'timestamp': t, 'points': np.zeros((1, 3))})
+                sync.add_data('obb', {'timestamp': t + 0.030, 'obbs': []})
+
+        target = 10.0 + 45 * 0.1
+        # A steady 30 ms skew alone drops sync quality below min_quality
+        assert plain.synchronize(target) is None
+        frame = corrected.synchronize(target)
+        assert frame.sync_offset_ms['obb'] == pytest.approx(0.0, abs=0.5)
+        assert frame.obb_data['raw_timestamp'] == pytest.approx(target + 0.030)
+        assert corrected.get_statistics()['clock_offsets']['obb']['offset_ms'] == pytest.approx(30.0)
@@ -0,0 +1,139 @@
+"""
+Unit tests for lcps_tool.layer1.fanout_relay
+"""
+
+import json
+import time
+
+import numpy as np
+import pytest
+import zmq
+
+from lcps_tool.layer1.fanout_relay import FanoutRelay, RelayMessage
+from lcps_tool.layer1.receivers.obb_receiver import OBBReceiver
+from lcps_tool.perf.synthetic import make_pointcloud_message
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.time() + timeout
+    while not predicate() and time.time() < deadline:
+        time.sleep(0.02)
+    return predicate()
+
+
+@pytest.fixture
+def upstream():
+    """Upstream OBB and point cloud publishers on free ports"""
+    context = zmq.Context()
+    sockets = {}
+    for channel in ('obb', 'pointcloud'):
+        socket = context.socket(zmq.PUB)
+        port = socket.bind_to_random_port('tcp://127.0.0.1')
+        sockets[channel] = (socket, f'tcp://127.0.0.1:{port}')
+    yield sockets
+    for socket, _ in sockets.values():
+        socket.close(linger=0)
+    context.term()
+
+
+def test_relay_tiers(upstream):
+    relay = FanoutRelay(upstream['obb'][1], upstream['pointcloud'][1],
+                        binds={'obb': 'tcp://127.0.0.1:*',
+                               'pointcloud_full': 'tcp://127.0.0.1:*',
+                               'pointcloud_decimated': 'tcp://127.0.0.1:*'},
+                        voxel_size=0.5)
+    relay.start()
+    context = zmq.Context()
+    try:
+        # Two OBB-only viewers and one decimated viewer; nobody on the full stream
+        viewers = []
+        for stream in ('obb', 'obb', 'pointcloud_decimated'):
+            socket = context.socket(zmq.SUB)
+            socket.setsockopt(zmq.SUBSCRIBE, b'')
+            socket.setsockopt(zmq.RCVTIMEO, 100)
+            socket.connect(relay.bound_addresses[stream])
+            viewers.append(socket)
+        assert _wait_for(lambda: relay.subscribers['obb'] == 2
+                         and relay.subscribers['pointcloud_decimated'] == 1)
+        assert relay.pc_receiver.decimate
+
+        obb_message = b'{"data": [{"type": "container"}]}'
+        points = np.random.default_rng(0).uniform(0.0, 2.0, (2000, 3))
+        pc_message = make_pointcloud_message(points, timestamp=12.5, frame_id=3)
+
+        def received(socket):
+            try:
+                return socket.recv()
+            except zmq.Again:
+                return None
+
+        # Publish until every viewer got a message (upstream slow joiner)
+        results = [None] * len(viewers)
+        deadline = time.time() + 5.0
+        while None in results and time.time() < deadline:
+            upstream['obb'][0].send(obb_message)
+            upstream['pointcloud'][0].send(pc_message)
+            for i, socket in enumerate(viewers):
+                if results[i] is None:
+                    results[i] = received(socket)
+
+        assert results[0] == obb_message and results[1] == obb_message
+        decimated = json.loads(results[2])
+        assert decimated['frame_id'] == 3 and decimated['original_count'] == 2000
+        assert 0 < len(decimated['points']) < 2000
+
+        # The full stream has no viewers: nothing sent, upstream decoded once
+        stats = relay.get_statistics()
+        assert stats['streams']['pointcloud_full']['sent'] == 0
+        assert stats['streams']['pointcloud_full']['skipped'] > 0
+        assert stats['streams']['obb']['subscribers'] == 2
+
+        # Last decimated viewer leaves: point clouds are no longer decoded
+        viewers.pop().close(linger=0)
+        assert _wait_for(lambda: relay.subscribers['pointcloud_decimated'] == 0)
+        assert not relay.pc_receiver.decimate
+        for socket in viewers:
+            socket.close(linger=0)
+    finally:
+        relay.stop()
+        context.term()
+
+
+def test_point_cloud_burst_does_not_evict_obbs(upstream):
+    relay = FanoutRelay(upstream['obb'][1], upstream['pointcloud'][1], queue_size=4)
+    obb_queue, pc_queue = relay.obb_receiver.data_queue, relay.pc_receiver.data_queue
+    assert obb_queue is not pc_queue
+
+    obb_queue.put_nowait(RelayMessage('obb', b'obb'))
+    for _ in range(4):
+        pc_queue.put_nowait(RelayMessage('pointcloud', b'pc'))
+    assert relay._data_ready.is_set()
+
+    # Round-robin: one message per channel per round
+    assert relay._forward_queued({})
+    assert obb_queue.qsize() == 0 and pc_queue.qsize() == 3
+    while relay._forward_queued({}):
+        pass
+    assert pc_queue.qsize() == 0
+
+
+def test_receiver_counts_evictions(upstream):
+    socket, address = upstream['obb']
+    receiver = OBBReceiver(address, queue_size=2)
+    receiver.start()
+    try:
+        deadline = time.time() + 5.0
+        while receiver.msg_count < 6 and time.time() < deadline:
+            socket.send(b'{"data": []}')
+            time.sleep(0.01)
+    finally:
+        receiver.stop()
+    stats = receiver.get_statistics()
+    assert stats['dropped_count'] == stats['msg_count'] - 2 > 0
+
+
+def test_requires_upstream():
+    with pytest.raises(ValueError):
+        FanoutRelay(None, None)
+    with pytest.raises(ValueError):
+        FanoutRelay('tcp://127.0.0.1:1', None, binds={'thermal': 'tcp://*:7000'})
@@ -0,0 +1,389 @@
+"""
+Unit tests for lcps_tool.geometry vectorized kernels
+
+Each kernel is checked against a straightforward reference implementation
+on small random inputs.
+"""
+
+import numpy as np
+import pytest
+
+from lcps_tool.geometry import (
+    OBBBatch,
+    OBBStatistics,
+    PointCloudIndex,
+    PointCloudLOD,
+    broad_phase_pairs,
+    compare_collision_status,
+    compute_voxel_keys,
+    cull_obbs,
+    cull_points,
+    obb_aabbs,
+    obb_collision_pairs,
+    pack_voxel_keys,
+    perspective_matrix,
+    points_in_obbs,
+    unpack_voxel_keys,
+    viewer_frustum_planes,
+    viewer_modelview_matrix,
+    voxel_grid_downsample,
+    voxel_grid_reduce,
+)
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(42)
+
+
+# =============================================================================
+# Voxel grid
+# =============================================================================
+
+class TestVoxelGrid:
+    """Voxel keys and voxel grid downsampling"""
+
+    def test_pack_unpack_roundtrip(self, rng):
+        indices = rng.integers(-(1 << 20), (1 << 20) - 1, size=(1000, 3))
+        assert np.array_equal(unpack_voxel_keys(pack_voxel_keys(indices)), indices)
+
+    def test_downsample_matches_reference(self, rng):
+        points = rng.uniform(-5, 5, size=(2000, 3)).astype(np.float32)
+        voxel_size = 0.5
+
+        # Reference: dict grouping (original PointCloudReceiver algorithm)
+        groups = {}
+        for p in points:
+            groups.setdefault(tuple(np.floor(p / voxel_size).astype(int)), []).append(p)
+        expected = {k: np.mean(v, axis=0) for k, v in groups.items()}
+
+        result = voxel_grid_downsample(points, voxel_size)
+        assert len(result) == len(expected)
+        keys = compute_voxel_keys(result, voxel_size)
+        for key, centroid in zip(unpack_voxel_keys(keys), result):
+            assert np.allclose(centroid, expected[tuple(key)], atol=1e-5)
+
+    def test_weighted_reduce_is_exact(self, rng):
+        points = rng.uniform(0, 10, size=(5000, 3))
+        fine, counts, _ = voxel_grid_reduce(points, 0.25)
+        coarse_from_fine, coarse_counts, _ = voxel_grid_reduce(fine, 1.0, weights=counts)
+        coarse_direct, direct_counts, _ = voxel_grid_reduce(points, 1.0)
+        assert np.array_equal(coarse_counts, direct_counts)
+        assert np.allclose(coarse_from_fine, coarse_direct, atol=1e-4)
+
+    def test_empty_input(self):
+        assert len(voxel_grid_downsample(np.empty((0, 3), dtype=np.float32), 0.1)) == 0
+
+
+# =============================================================================
+# Point cloud LOD
+# =============================================================================
+
+class TestPointCloudLOD:
+    """LOD hierarchy and level selection"""
+
+    def test_level_counts_decrease(self, rng):
+        lod = PointCloudLOD(base_voxel_size=0.05, num_levels=5)
+        lod.set_points(rng.uniform(-10, 10, size=(20000, 3)))
+        counts = [lod.get_point_count(level) for level in range(6)]
+        assert counts[0] == 20000
+        assert all(a >= b for a, b in zip(counts, counts[1:]))
+
+    def test_select_level_respects_budget(self, rng):
+        lod = PointCloudLOD(base_voxel_size=0.05, num_levels=6, point_budget=1000)
+        lod.set_points(rng.uniform(-10, 10, size=(20000, 3)))
+        level = lod.select_level(scale=1.0, viewport_height=600)
+        assert level > 0
+        assert lod.get_point_count(level) <= 1000 or level == lod.num_levels
+
+    def test_zoom_out_selects_coarser_level(self, rng):
+        lod = PointCloudLOD(base_voxel_size=0.05, num_levels=6, point_budget=10 ** 9)
+        lod.set_points(rng.uniform(-10, 10, size=(5000, 3)))
+        near = lod.select_level(scale=1.0, viewport_height=600)
+        far = lod.select_level(scale=0.01, viewport_height=600)
+        assert near == 0
+        assert far > near
+
+
+# =============================================================================
+# OBB batch
+# =============================================================================
+
+def _random_obb_dicts(rng, n, spread=10.0):
+    quats = rng.normal(size=(n, 4))
+    quats /= np.linalg.norm(quats, axis=1, keepdims=True)
+    return [
+        {
+            "type": ["car", "person", "spreader"][i % 3],
+            "position": rng.uniform(-spread, spread, 3).tolist(),
+            "rotation": quats[i].tolist(),
+            "size": rng.uniform(0.5, 3.0, 3).tolist(),
+            "collision_status": int(i % 4 == 0),
+        }
+        for i in range(n)
+    ]
+
+
+class TestOBBBatch:
+    """Struct-of-arrays OBB batch"""
+
+    def test_rotations_are_orthonormal(self, rng):
+        batch = OBBBatch.from_dicts(_random_obb_dicts(rng, 50))
+        r = batch.rotations
+        assert np.allclose(np.einsum('nij,nkj->nik', r, r), np.eye(3), atol=1e-9)
+
+    def test_model_matrices_map_unit_cube_to_corners(self, rng):
+        batch = OBBBatch.from_dicts(_random_obb_dicts(rng, 20))
+        matrices = batch.model_matrices().reshape(-1, 4, 4).transpose(0, 2, 1)
+        signs = np.array([[sx, sy, sz, 2.0]
+                          for sx in (-1, 1) for sy in (-1, 1) for sz in (-1, 1)]) * 0.5
+        corners = np.einsum('nij,kj->nki', matrices, signs)[:, :, :3]
+        assert np.allclose(corners, batch.corners(), atol=1e-4)
+
+    def test_roundtrip_dicts(self, rng):
+        dicts = _random_obb_dicts(rng, 5)
+        batch = OBBBatch.from_dicts(dicts)
+        assert [d["type"] for d in batch.to_dicts()] == [d["type"] for d in dicts]
+        assert len(OBBBatch.from_dicts([])) == 0
+
+
+class TestOBBStatistics:
+    """Vectorized type / collision aggregation"""
+
+    def test_matches_python_loop(self, rng):
+        stats = OBBStatistics()
+        expected_counts, expected_collisions = {}, {}
+        for n in (7, 0, 12):
+            dicts = _random_obb_dicts(rng, n)
+            message_counts = stats.update(OBBBatch.from_dicts(dicts))
+            assert message_counts.sum() == n
+            for obb in dicts:
+                expected_counts[obb["type"]] = expected_counts.get(obb["type"], 0) + 1
+                expected_collisions[obb["type"]] = (expected_collisions.get(obb["type"], 0)
+                                                    + (obb["collision_status"] == 1))
+
+        assert stats.type_counts == expected_counts
+        assert stats.collision_count == sum(expected_collisions.values())
+        assert stats.safe_count == stats.total_obbs - stats.collision_count
+        for name, rate in stats.collision_rates.items():
+            assert rate == pytest.approx(expected_collisions[name] / expected_counts[name])
+
+    def test_update_dicts_matches_batch(self, rng):
+        from_batch, from_dicts = OBBStatistics(), OBBStatistics()
+        for n in (9, 0, 4):
+            dicts = _random_obb_dicts(rng, n) + [{"collision_status": 1}]
+            assert np.array_equal(from_dicts.update_dicts(dicts),
+                                  from_batch.update(OBBBatch.from_dicts(dicts)))
+        assert from_dicts.type_counts == from_batch.type_counts
+        assert from_dicts.collision_rates == from_batch.collision_rates
+        assert from_dicts.messages == 3
+
+    def test_format_counts_sorted_by_name(self):
+        stats = OBBStatistics()
+        counts = stats.update(OBBBatch.from_dicts([{"type": "person"}, {"type": "car"}, {"type": "car"}]))
+        assert stats.format_counts(counts) == "car:2, person:1"
+
+
+# =============================================================================
+# Frustum culling
+# =============================================================================
+
+class TestFrustumCulling:
+    """CPU frustum planes and culling"""
+
+    @staticmethod
+    def _clip_inside(points, scale, rotation, width, height):
+        mvp = perspective_matrix(45.0, width / height, 0.1, 50.0) @ viewer_modelview_matrix(scale, rotation)
+        clip = np.c_[points, np.ones(len(points))] @ mvp.T
+        w = clip[:, 3:4]
+        return np.all(np.abs(clip[:, :3]) <= w, axis=1) & (w[:, 0] > 0)
+
+    def test_points_match_clip_space(self, rng):
+        points = rng.uniform(-30, 30, size=(5000, 3))
+        for scale, rotation in [(1.0, (0, 0)), (3.0, (30, -45)), (0.2, (90, 10))]:
+            planes = viewer_frustum_planes(scale, rotation, 800, 600)
+            expected = self._clip_inside(points, scale, rotation, 800, 600)
+            assert np.array_equal(cull_points(planes, points), expected)
+
+    def test_obbs_conservative(self, rng):
+        batch = OBBBatch.from_dicts(_random_obb_dicts(rng, 300, spread=20.0))
+        scale, rotation = 2.0, (20, 35)
+        planes = viewer_frustum_planes(scale, rotation, 800, 600)
+        visible = cull_obbs(planes, batch.positions, batch.half_extents, batch.rotations)
+
+        corners = batch.corners()
+        corner_inside = self._clip_inside(corners.reshape(-1, 3), scale, rotation, 800, 600)
+        any_corner_inside = corner_inside.reshape(len(batch), 8).any(axis=1)
+        # Every box with a visible corner must be kept
+        assert np.all(visible[any_corner_inside])
+        # Boxes far behind the camera are culled
+        assert not visible.all()
+
+
+# =============================================================================
+# Point-in-OBB
+# =============================================================================
+
+class TestPointsInOBBs:
+    """Voxel-hash pre-filtered point membership"""
+
+    @staticmethod
+    def _reference(points, batch, margin=0.0):
+        local = np.einsum('pi,nij->npj', points, batch.rotations) - \
+            np.einsum('ni,nij->nj', batch.positions, batch.rotations)[:, None, :]
+        return np.all(np.abs(local) <= (batch.half_extents + margin)[:, None, :], axis=2)
+
+    def test_counts_match_brute_force(self, rng):
+        batch = OBBBatch.from_dicts(_random_obb_dicts(rng, 60, spread=5.0))
+        points = rng.uniform(-6, 6, size=(20000, 3))
+        for margin, voxel_size in [(0.0, None), (0.3, None), (0.0, 0.2)]:
+            expected = self._reference(points, batch, margin)
+            counts = points_in_obbs(points, batch, margin=margin, voxel_size=voxel_size)
+            assert np.array_equal(counts, expected.sum(axis=1))
+
+    def test_indices_per_box(self, rng):
+        batch = OBBBatch.from_dicts(_random_obb_dicts(rng, 10, spread=3.0))
+        points = rng.uniform(-4, 4, size=(5000, 3))
+        counts, indices = points_in_obbs(points, batch, return_indices=True)
+        expected = self._reference(points, batch)
+        assert len(indices) == len(batch)
+        for box, idx in enumerate(indices):
+            assert len(idx) == counts[box]
+            assert np.array_equal(idx, np.flatnonzero(expected[box]))
+
+    def test_empty_inputs(self, rng):
+        batch = OBBBatch.from_dicts(_random_obb_dicts(rng, 3))
+        assert np.array_equal(points_in_obbs(np.empty((0, 3)), batch), [0, 0, 0])
+        assert len(points_in_obbs(rng.uniform(size=(10, 3)), OBBBatch.empty())) == 0
+
+
+# =============================================================================
+# Spatial index
+# =============================================================================
+
+class TestPointCloudIndex:
+    """Voxel-hash nearest / radius / OBB clearance queries"""
+
+    def test_nearest_matches_brute_force(self, rng):
+        points = rng.uniform(-5, 5, size=(3000, 3))
+        queries = rng.uniform(-7, 7, size=(200, 3))
+        index = PointCloudIndex(0.3, points)
+        dist, idx = index.nearest(queries)
+        expected = np.linalg.norm(queries[:, None, :] - points[None, :, :], axis=2)
+        assert np.allclose(dist, expected.min(axis=1))
+        assert np.allclose(np.linalg.norm(points[idx] - queries, axis=1), dist)
+
+        dist, idx = index.nearest(queries, max_distance=0.5)
+        in_range = expected.min(axis=1) <= 0.5
+        assert np.allclose(dist[in_range], expected.min(axis=1)[in_range])
+        assert np.all(np.isinf(dist[~in_range])) and np.all(idx[~in_range] == -1)
+
+    def test_radius_query_matches_brute_force(self, rng):
+        points = rng.uniform(-3, 3, size=(2000, 3))
+        queries = rng.uniform(-3, 3, size=(50, 3))
+        q, p, d = PointCloudIndex(0.25, points).radius_query(queries, 0.6)
+        expected = np.linalg.norm(queries[:, None, :] - points[None, :, :], axis=2) <= 0.6
+        eq, ep = np.nonzero(expected)
+        assert np.array_equal(q, eq) and np.array_equal(p, ep)
+        assert np.allclose(d, np.linalg.norm(points[p] - queries[q], axis=1))
+
+    def test_reuses_downsampling_keys(self, rng):
+        centroids, _, keys = voxel_grid_reduce(rng.uniform(-4, 4, size=(20000, 3)), 0.2)
+        index = PointCloudIndex(0.2)
+        index.rebuild(centroids, keys)
+        assert index.reused_keys == 1
+        queries = rng.uniform(-4, 4, size=(100, 3))
+        dist, _ = index.nearest(queries)
+        fresh, _ = PointCloudIndex(0.2, centroids).nearest(queries)
+        assert np.allclose(dist, fresh)
+
+        # Keys of another voxel size are recomputed, not trusted
+        index = PointCloudIndex(0.5, centroids, keys, keys_voxel_size=0.2)
+        assert index.mismatched_keys == 1 and index.reused_keys == 0
+        assert np.allclose(index.nearest(queries)[0], fresh)
+
+    def test_obb_clearance(self, rng):
+        batch = OBBBatch.from_dicts(_random_obb_dicts(rng, 8, spread=4.0))
+        points = rng.uniform(-6, 6, size=(4000, 3))
+        clearance, nearest = PointCloudIndex(0.2, points).obb_clearance(batch, max_distance=10.0)
+
+        local = np.einsum('pi,nij->npj', points, batch.rotations) - \
+            np.einsum('ni,nij->nj', batch.positions, batch.rotations)[:, None, :]
+        outside = np.maximum(np.abs(local) - batch.half_extents[:, None, :], 0.0)
+        expected = np.linalg.norm(outside, axis=2)
+        assert np.allclose(clearance, expected.min(axis=1))
+        assert np.allclose(expected[np.arange(len(batch)), nearest], clearance)
+
+        far = OBBBatch.from_dicts([{"position": [50.0, 0.0, 0.0]}])
+        clearance, nearest = PointCloudIndex(0.2, points).obb_clearance(far, max_distance=1.0)
+        assert np.isinf(clearance[0]) and nearest[0] == -1
+
+
+# =============================================================================
+# OBB collision
+# =============================================================================
+
+def _reference_pairs(batch):
+    """All-pairs SAT by projecting the 8 corners onto each of the 15 axes"""
+    corners = batch.corners()
+    rot = batch.rotations
+    pairs = []
+    for i in range(len(batch)):
+        for j in range(i + 1, len(batch)):
+            axes = [rot[i][:, k] for k in range(3)] + [rot[j][:, k] for k in range(3)]
+            axes += [np.cross(rot[i][:, a], rot[j][:, b]) for a in range(3) for b in range(3)]
+            separated = False
+            for axis in axes:
+                if np.linalg.norm(axis) < 1e-9:
+                    continue
+                pi, pj = corners[i] @ axis, corners[j] @ axis
+                if pi.max() < pj.min() or pj.max() < pi.min():
+                    separated = True
+                    break
+            if not separated:
+                pairs.append((i, j))
+    return pairs
+
+
+class TestOBBCollision:
+    """Sweep-and-prune broad phase + SAT narrow phase"""
+
+    def test_matches_corner_projection_reference(self, rng):
+        batch = OBBBatch.from_dicts(_random_obb_dicts(rng, 120, spread=6.0))
+        pairs = obb_collision_pairs(batch)
+        assert len(pairs) > 0
+        assert [tuple(p) for p in pairs] == _reference_pairs(batch)
+
+    def test_broad_phase_is_conservative(self, rng):
+        batch = OBBBatch.from_dicts(_random_obb_dicts(rng, 200, spread=8.0))
+        mins, maxs = obb_aabbs(batch.positions, batch.half_extents, batch.rotations)
+        candidates = {tuple(p) for p in broad_phase_pairs(mins, maxs)}
+        expected = {(i, j) for i in range(len(batch)) for j in range(i + 1, len(batch))
+                    if np.all((mins[i] <= maxs[j]) & (mins[j] <= maxs[i]))}
+        assert candidates == expected
+
+    def test_rotated_boxes_near_miss(self):
+        # Two unit cubes rotated 45 deg about z, offset diagonally: their AABBs
+        # overlap, but they are separated along the shared face normal
+        q = [np.cos(np.pi / 8), 0.0, 0.0, np.sin(np.pi / 8)]
+        dicts = [
+            {"position": [0.0, 0.0, 0.0], "rotation": q, "size": [1.0, 1.0, 1.0]},
+            {"position": [0.75, 0.75, 0.0], "rotation": q, "size": [1.0, 1.0, 1.0]},
+        ]
+        batch = OBBBatch.from_dicts(dicts)
+        mins, maxs = obb_aabbs(batch.positions, batch.half_extents, batch.rotations)
+        assert len(broad_phase_pairs(mins, maxs)) == 1
+        assert len(obb_collision_pairs(batch)) == 0
+
+        dicts[1]["position"] = [0.65, 0.65, 0.0]
+        assert len(obb_collision_pairs(OBBBatch.from_dicts(dicts))) == 1
+
+    def test_compare_collision_status(self):
+        dicts = [
+            {"position": [0.0, 0.0, 0.0], "collision_status": 1},
+            {"position": [0.5, 0.0, 0.0], "collision_status": 0},
+            {"position": [9.0, 0.0, 0.0], "collision_status": 1},
+        ]
+        result = compare_collision_status(OBBBatch.from_dicts(dicts))
+        assert result == {"boxes": 3, "reported": 2, "geometric": 2, "agree": 1,
+                          "unreported": 1, "unconfirmed": 1}
@@ -0,0 +1,141 @@
+"""
+Unit tests for offscreen rendering and recording replay
+"""
+
+import json
+import struct
+import zlib
+
+import numpy as np
+import pytest
+
+from lcps_tool.geometry import OBBBatch
+from lcps_tool.layer2 import DataRecorder, DataReplayer
+from lcps_tool.layer4 import FrameWriter, SoftwareRasterizer, encode_png, render_sequence
+
+
+def _obb(position, collision=0):
+    return {
+        "type": "car",
+        "position": position,
+        "rotation": [1.0, 0.0, 0.0, 0.0],
+        "size": [1.0, 1.0, 1.0],
+        "collision_status": collision,
+    }
+
+
+def _decode_png(data):
+    """Minimal decoder for the encoder's output (8-bit RGB, filter 0)"""
+    assert data[:8] == b'\x89PNG\r\n\x1a\n'
+    pos, idat, size = 8, b'', None
+    while pos < len(data):
+        length, tag = struct.unpack('>I4s', data[pos:pos + 8])
+        body = data[pos + 8:pos + 8 + length]
+        if tag == b'IHDR':
+            size = struct.unpack('>II', body[:8])
+        elif tag == b'IDAT':
+            idat += body
+        pos += 12 + length
+    width, height = size
+    raw = np.frombuffer(zlib.decompress(idat), dtype=np.uint8).reshape(height, width * 3 + 1)
+    return raw[:, 1:].reshape(height, width, 3)
+
+
+class TestSoftwareRasterizer:
+    """NumPy wireframe rasterizer"""
+
+    def test_collision_colors(self):
+        rasterizer = SoftwareRasterizer(160, 120)
+        safe = rasterizer.render(OBBBatch.from_dicts([_obb([0.0, 0.0, 0.0])]))
+        hit = rasterizer.render(OBBBatch.from_dicts([_obb([0.0, 0.0, 0.0], collision=1)]))
+
+        assert safe.shape == (120, 160, 3)
+        # Box edges dominate the axes: more green pixels for safe, red for collision
+        green = np.all(safe == (0, 255, 0), axis=2).sum()
+        red = np.all(hit == (255, 0, 0), axis=2).sum()
+        assert green > 50 and red > 50
+
+    def test_box_behind_camera_not_drawn(self):
+        rasterizer = SoftwareRasterizer(160, 120)
+        empty = rasterizer.render()
+        behind = rasterizer.render(OBBBatch.from_dicts([_obb([0.0, 0.0, 20.0], collision=1)]))
+        assert np.array_equal(empty, behind)
+
+    def test_points_drawn(self):
+        rasterizer = SoftwareRasterizer(160, 120)
+        image = rasterizer.render(points=np.array([[0.5, 0.5, 0.5]]))
+        assert np.all(image == SoftwareRasterizer.POINT_COLOR, axis=2).sum() == 1
+
+    def test_png_roundtrip(self):
+        image = np.random.default_rng(0).integers(0, 256, size=(7, 5, 3), dtype=np.uint8)
+        assert np.array_equal(_decode_png(encode_png(image)), image)
+
+
+class TestDataReplayer:
+    """Recording replay"""
+
+    def test_jsonl_replay(self, tmp_path):
+        path = tmp_path / "session.jsonl"
+        with open(path, "w") as f:
+            for i in range(5):
+                record = {"timestamp": 100.0 + i, "data": {"data": [_obb([i, 0, 0])]},
+                          "metadata": {"frame": i}}
+                f.write(json.dumps(record) + "\n")
+
+        replayer = DataReplayer(str(path), start_frame=1, max_frames=3)
+        frames = list(replayer)
+        assert replayer.get_frame_count() == 5
+        assert [f.frame_id for f in frames] == [1, 2, 3]
+        assert frames[0].obb_data["obbs"][0]["position"] == [1, 0, 0]
+
+    def test_hdf5_replay(self, tmp_path):
+        from lcps_tool.data_models.synced_frame import SyncedFrame
+
+        path = tmp_path / "recording.h5"
+        recorder = DataRecorder(str(path))
+        recorder.start_recording()
+        for i in range(3):
+            recorder.record_frame(SyncedFrame(
+                timestamp=200.0 + i,
+                frame_id=i,
+                obb_data={"timestamp": 200.0 + i, "obbs": [_obb([0, i, 0])]},
+            ))
+        recorder.stop_recording()
+
+        frames = list(DataReplayer(str(path)))
+        assert len(frames) == 3
+        assert frames[2].obb_data["obbs"][0]["position"] == [0, 2, 0]
+
+    def test_unsupported_format(self, tmp_path):
+        path = tmp_path / "recording.txt"
+        path.write_text("")
+        with pytest.raises(ValueError):
+            DataReplayer(str(path))
+
+
+def test_render_sequence_writes_png_frames(tmp_path):
+    batch = OBBBatch.from_dicts([_obb([0.0, 0.0, 0.0], collision=1)])
+    output = tmp_path / "frames"
+    stats = render_sequence(((batch, None) for _ in range(4)), str(output), width=64, height=48)
+
+    assert stats["frames"] == 4
+    assert stats["writer"]["frames_written"] == 4
+    assert stats["writer"]["error"] is None
+    files = sorted(output.glob("frame_*.png"))
+    assert len(files) == 4
+    assert _decode_png(files[0].read_bytes()).shape == (48, 64, 3)
+
+
+def test_writer_error_raised_instead_of_blocking(tmp_path):
+    # PNG output path is an existing file: the writer process fails at once
+    output = tmp_path / "not_a_directory"
+    output.write_text("")
+    writer = FrameWriter(str(output), queue_size=2)
+    frame = np.zeros((8, 8, 3), dtype=np.uint8)
+
+    with pytest.raises(RuntimeError, match="Frame writer stopped"):
+        for _ in range(100):
+            writer.write(frame)
+    stats = writer.close()
+    assert stats["frames_written"] == 0
+    assert "exists" in stats["error"]
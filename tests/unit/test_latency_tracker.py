@@ -0,0 +1,107 @@
+"""
+Unit tests for lcps_tool.layer2.latency_tracker
+"""
+
+import json
+import math
+
+import h5py
+import numpy as np
+import pytest
+
+from lcps_tool.data_models.synced_frame import SyncedFrame
+from lcps_tool.layer1.receivers.status_receiver import StatusReceiver
+from lcps_tool.layer2 import DataRecorder, DataSynchronizer, LatencyHistogram, LatencyTracker
+from lcps_tool.layer2.latency_tracker import LATENCY_COLUMNS, frame_latencies
+
+
+def _traced(timestamp, receive, parse, dequeue):
+    return {'timestamp': timestamp,
+            'trace': {'receive': receive, 'receive_wall': timestamp + 0.004,
+                      'parse': parse, 'dequeue': dequeue}}
+
+
+class TestLatencyHistogram:
+    """Bucketed histogram"""
+
+    def test_summary(self):
+        histogram = LatencyHistogram()
+        for value in np.linspace(1.0, 100.0, 100):
+            histogram.observe(value)
+
+        stats = histogram.to_dict()
+        assert stats['count'] == 100
+        assert stats['mean_ms'] == pytest.approx(50.5)
+        assert (stats['min_ms'], stats['max_ms']) == (1.0, 100.0)
+        assert 25.0 <= stats['p50_ms'] <= 100.0
+        assert stats['p50_ms'] <= stats['p95_ms'] <= stats['p99_ms'] <= 100.0
+
+    def test_cumulative_buckets(self):
+        histogram = LatencyHistogram(buckets_ms=(1.0, 10.0))
+        for value in (0.5, 1.0, 5.0, 50.0):
+            histogram.observe(value)
+        assert histogram.cumulative_buckets() == [(1.0, 2), (10.0, 3), (math.inf, 4)]
+
+    def test_single_sample_percentile(self):
+        histogram = LatencyHistogram()
+        histogram.observe(3.0)
+        assert histogram.percentile(50) == pytest.approx(3.0)
+
+
+class TestFrameLatencies:
+    """Stage latencies from pipeline stamps"""
+
+    def test_stages(self):
+        frame = SyncedFrame(
+            timestamp=100.0, frame_id=1,
+            pointcloud_data=_traced(100.0, receive=10.000, parse=10.020, dequeue=10.021),
+            trace={'synchronize': 10.031, 'record': 10.041},
+        )
+        latencies = frame_latencies(frame)
+        assert set(latencies) == {'pointcloud_network', 'pointcloud_parse', 'pointcloud_queue',
+                                  'pointcloud_sync', 'record'}
+        assert latencies['pointcloud_network'] == pytest.approx(4.0)
+        assert latencies['pointcloud_parse'] == pytest.approx(20.0)
+        assert latencies['pointcloud_queue'] == pytest.approx(1.0)
+        assert latencies['pointcloud_sync'] == pytest.approx(10.0)
+        assert latencies['record'] == pytest.approx(10.0)
+
+    def test_tracker_skips_record_by_default(self):
+        frame = SyncedFrame(timestamp=1.0, frame_id=1,
+                            obb_data=_traced(1.0, 0.0, 0.001, 0.002),
+                            trace={'synchronize': 0.003, 'record': 0.004})
+        tracker = LatencyTracker()
+        tracker.observe_frame(frame)
+        assert 'record' not in tracker.get_statistics()
+        assert list(tracker.get_statistics()) == ['obb_network', 'obb_parse', 'obb_queue', 'obb_sync']
+
+
+def test_pipeline_stamps(tmp_path):
+    """Receiver dequeue stamp, synchronizer stamp and recorded latency columns"""
+    receiver = StatusReceiver("tcp://localhost:0")
+    receiver.data_queue.put_nowait(_traced(5.0, receive=1.0, parse=1.001, dequeue=None))
+    status = receiver.get_data()
+    assert status['trace']['dequeue'] > 0
+
+    synchronizer = DataSynchronizer(min_quality=0.0)
+    synchronizer.add_data('status', status)
+    frame = synchronizer.synchronize(5.0)
+    assert 'synchronize' in frame.trace
+
+    tracker = LatencyTracker()
+    path = tmp_path / 'latency.h5'
+    recorder = DataRecorder(str(path), async_write=False, latency_tracker=tracker)
+    recorder.start_recording()
+    recorder.record_frame(frame)
+    recorder.stop_recording()
+
+    assert tracker.get_statistics()['record']['count'] == 1
+    with h5py.File(path, 'r') as h5file:
+        latency = h5file['latency_ms']
+        columns = json.loads(latency.attrs['columns'])
+        assert columns == list(LATENCY_COLUMNS)
+        row = dict(zip(columns, latency[0]))
+        assert row['status_parse'] == pytest.approx(1.0, abs=1e-3)
+        assert row['record'] >= 0
+        assert np.isnan(row['obb_parse'])
+        assert 'trace' not in json.loads(h5file['status_data/frame_000000'].attrs['status'])
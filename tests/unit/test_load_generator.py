@@ -0,0 +1,99 @@
+"""
+Unit tests for lcps_tool.perf.load_generator
+"""
+
+import socket
+import time
+
+import numpy as np
+import pytest
+import zmq
+
+from lcps_tool.layer1.receivers.obb_receiver import OBBReceiver
+from lcps_tool.layer1.receivers.pointcloud_receiver import PointCloudReceiver
+from lcps_tool.layer1.receivers.status_receiver import LCPSState, StatusReceiver
+from lcps_tool.perf.load_generator import LoadGenerator, StreamConfig, SyntheticStream
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+class TestSyntheticStream:
+    """Messages decode with the receivers"""
+
+    @pytest.mark.parametrize('fmt', ['json', 'zlib_bson', 'zlib_json'])
+    def test_obb_formats(self, fmt):
+        stream = SyntheticStream(StreamConfig('obb', 'tcp://*:0', obb_format=fmt, objects=5),
+                                 np.random.default_rng(1))
+        receiver = OBBReceiver("tcp://localhost:0", use_compression=fmt != 'json')
+        parse = receiver._parse_normal if fmt == 'json' else receiver._parse_compressed
+
+        data = parse(stream.message(7, 123.5))
+        assert data['timestamp'] == 123.5
+        assert data['seq_id'] == 7
+        assert len(data['obbs']) == 5
+
+    def test_pointcloud_and_status(self):
+        pc_stream = SyntheticStream(StreamConfig('pointcloud', 'tcp://*:0', points=500),
+                                    np.random.default_rng(1))
+        pc = PointCloudReceiver("tcp://localhost:0", enable_downsampling=False)._parse_message(
+            pc_stream.message(3, 10.25))
+        assert pc['points'].shape == (500, 3)
+        assert (pc['timestamp'], pc['frame_id']) == (10.25, 3)
+
+        status_stream = SyntheticStream(StreamConfig('status', 'tcp://*:0'), np.random.default_rng(1))
+        receiver = StatusReceiver("tcp://localhost:0")
+        receiver.socket = _OneShotSocket(status_stream.message(2, 5.0))
+        status = receiver._receive_data()
+        assert status['state'] in (LCPSState.IDLE, LCPSState.DETECTING, LCPSState.ALERTING)
+        assert status['timestamp'] == 5.0
+
+    def test_seeded_payloads_are_reproducible(self):
+        config = StreamConfig('obb', 'tcp://*:0', objects=3)
+        first = SyntheticStream(config, np.random.default_rng([5, 0])).message(0, 1.0)
+        second = SyntheticStream(config, np.random.default_rng([5, 0])).message(0, 1.0)
+        assert first == second
+
+    def test_invalid_channel(self):
+        with pytest.raises(ValueError):
+            SyntheticStream(StreamConfig('camera', 'tcp://*:0'), np.random.default_rng())
+
+
+class _OneShotSocket:
+    def __init__(self, message):
+        self.message = message
+
+    def recv(self):
+        return self.message
+
+
+def test_publishes_configured_count():
+    address = f"tcp://127.0.0.1:{_free_port()}"
+    generator = LoadGenerator([StreamConfig('obb', address, rate_hz=0, count=20, objects=2)],
+                              seed=1, warmup_s=0.3)
+
+    context = zmq.Context()
+    subscriber = context.socket(zmq.SUB)
+    subscriber.setsockopt_string(zmq.SUBSCRIBE, "")
+    subscriber.setsockopt(zmq.RCVTIMEO, 2000)
+    try:
+        generator.start()
+        subscriber.connect(address)
+        received = [subscriber.recv() for _ in range(20)]
+        assert generator.wait(timeout=5.0)
+    finally:
+        generator.stop()
+        subscriber.close()
+        context.term()
+
+    receiver = OBBReceiver(address)
+    seq_ids = [receiver._parse_normal(message)['seq_id'] for message in received]
+    assert seq_ids == list(range(20))
+    assert abs(receiver._parse_normal(received[-1])['timestamp'] - time.time()) < 10.0
+
+    stats, = generator.get_statistics().values()
+    assert stats['sent'] == 20
+    assert stats['bytes'] == sum(len(message) for message in received)
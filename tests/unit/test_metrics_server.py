@@ -0,0 +1,84 @@
+"""
+Unit tests for lcps_tool.perf.metrics_server
+"""
+
+import urllib.error
+import urllib.request
+
+import pytest
+
+from lcps_tool.layer1.multi_channel_receiver import MultiChannelReceiver
+from lcps_tool.layer2 import DataRecorder, DataSynchronizer, LatencyTracker
+from lcps_tool.perf.metrics_server import (
+    CONTENT_TYPE, LCPSMetricsCollector, MetricFamily, MetricsServer, render_metrics,
+)
+
+
+def _collector(tmp_path):
+    receiver = MultiChannelReceiver()
+    receiver.add_obb_channel("tcp://localhost:0")
+    receiver.add_pointcloud_channel("tcp://localhost:0")
+    receiver.channels['obb'].msg_count = 7
+
+    synchronizer = DataSynchronizer(min_quality=0.0)
+    synchronizer.add_data('obb', {'timestamp': 1.0, 'obbs': []})
+    synchronizer.synchronize(1.0)
+
+    tracker = LatencyTracker()
+    tracker.observe('obb_parse', 0.3)
+    tracker.observe('obb_parse', 30.0)
+    tracker.observe('record', 2.0)
+
+    recorder = DataRecorder(str(tmp_path / 'metrics.h5'), async_write=False)
+    return LCPSMetricsCollector(receiver, synchronizer, recorder, tracker, frame_counter=lambda: 3)
+
+
+def test_render_format():
+    family = MetricFamily('lcps_test_total', 'counter', 'A "quoted" help')
+    family.add(2, channel='a"b')
+    empty = MetricFamily('lcps_empty', 'gauge', 'No samples')
+    text = render_metrics([family, empty])
+    assert text == ('# HELP lcps_test_total A \\"quoted\\" help\n'
+                    '# TYPE lcps_test_total counter\n'
+                    'lcps_test_total{channel="a\\"b"} 2.0\n')
+
+
+def test_collector(tmp_path):
+    text = _collector(tmp_path).render()
+    lines = text.splitlines()
+
+    assert 'lcps_synced_frames_total 3.0' in lines
+    assert 'lcps_receiver_messages_total{channel="obb"} 7.0' in lines
+    assert 'lcps_receiver_running{channel="pointcloud"} 0.0' in lines
+    assert 'lcps_pointcloud_points_total{channel="pointcloud",stage="received"} 0.0' in lines
+    assert 'lcps_sync_success_total 1.0' in lines
+    assert 'lcps_sync_buffer_size{channel="obb"} 1.0' in lines
+    assert 'lcps_recorder_recording 0.0' in lines
+    assert 'lcps_recorder_dropped_frames_total 0.0' in lines
+
+    # Histogram: cumulative buckets in seconds, _count equal to the +Inf bucket
+    assert '# TYPE lcps_stage_latency_seconds histogram' in lines
+    assert 'lcps_stage_latency_seconds_bucket{channel="obb",stage="parse",le="0.0005"} 1.0' in lines
+    assert 'lcps_stage_latency_seconds_bucket{channel="obb",stage="parse",le="+Inf"} 2.0' in lines
+    assert 'lcps_stage_latency_seconds_count{channel="obb",stage="parse"} 2.0' in lines
+    assert 'lcps_stage_latency_seconds_count{channel="frame",stage="record"} 1.0' in lines
+    assert not any('stage="network"' in line for line in lines)
+
+
+def test_http_scrape(tmp_path):
+    server = MetricsServer(_collector(tmp_path).render, port=0)
+    server.start()
+    try:
+        url = f"http://127.0.0.1:{server.port}"
+        with urllib.request.urlopen(f"{url}/metrics", timeout=5) as response:
+            assert response.headers['Content-Type'] == CONTENT_TYPE
+            body = response.read().decode('utf-8')
+        assert 'lcps_receiver_messages_total{channel="obb"} 7.0' in body
+        assert server.scrape_count == 1
+
+        with pytest.raises(urllib.error.HTTPError) as excinfo:
+            urllib.request.urlopen(f"{url}/other", timeout=5)
+        assert excinfo.value.code == 404
+    finally:
+        server.stop()
+    assert server.server_thread is None
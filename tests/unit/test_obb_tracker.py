@@ -0,0 +1,80 @@
+"""
+Unit tests for lcps_tool.layer2.OBBTracker
+"""
+
+import numpy as np
+import pytest
+
+from lcps_tool.data_models.synced_frame import SyncedFrame
+from lcps_tool.geometry import OBBBatch
+from lcps_tool.layer2 import OBBTracker
+from lcps_tool.layer2.obb_tracker import mutual_nearest_assignment
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(3)
+
+
+def _batch(positions, types=None):
+    positions = np.asarray(positions, dtype=np.float64)
+    n = len(positions)
+    return OBBBatch(positions, np.tile([1.0, 0.0, 0.0, 0.0], (n, 1)), np.ones((n, 3)),
+                    types=list(types) if types is not None else ['car'] * n)
+
+
+def test_ids_persist_under_shuffle_and_motion(rng):
+    tracker = OBBTracker(gate_distance=1.0)
+    positions = rng.uniform(-100, 100, size=(2000, 3))
+    velocities = rng.uniform(-5, 5, size=(2000, 3))
+    first = tracker.update(_batch(positions), timestamp=0.0)
+
+    ids_by_object = first.copy()
+    for step in range(1, 6):
+        positions = positions + velocities * 0.1
+        perm = rng.permutation(len(positions))
+        ids = tracker.update(_batch(positions[perm]), timestamp=step * 0.1)
+        assert np.array_equal(ids, ids_by_object[perm])
+
+    assert tracker.active_tracks == 2000
+    assert tracker.get_statistics()['tracks_created'] == 2000
+
+
+def test_new_and_lost_tracks():
+    tracker = OBBTracker(gate_distance=1.0, max_missed=1)
+    ids = tracker.update(_batch([[0, 0, 0], [10, 0, 0]]), timestamp=0.0)
+    assert ids.tolist() == [0, 1]
+
+    # Box 1 disappears, a new box appears far away
+    ids = tracker.update(_batch([[0.1, 0, 0], [50, 0, 0]]), timestamp=0.1)
+    assert ids.tolist() == [0, 2]
+
+    # Box 1 has been missed for too long: a box at its place gets a new id
+    tracker.update(_batch([[0.2, 0, 0]]), timestamp=0.2)
+    ids = tracker.update(_batch([[0.3, 0, 0], [10, 0, 0]]), timestamp=0.3)
+    assert ids.tolist() == [0, 3]
+
+
+def test_types_are_not_mixed():
+    tracker = OBBTracker(gate_distance=1.0)
+    tracker.update(_batch([[0, 0, 0]], types=['car']), timestamp=0.0)
+    ids = tracker.update(_batch([[0.1, 0, 0]], types=['person']), timestamp=0.1)
+    assert ids.tolist() == [1]
+
+
+def test_assignment_prefers_globally_nearest():
+    # Detection 0 is close to both tracks; track 0 is better used by detection 1
+    rows = np.array([0, 0, 1])
+    cols = np.array([0, 1, 0])
+    cost = np.array([0.5, 0.6, 0.1])
+    assigned_rows, assigned_cols = mutual_nearest_assignment(rows, cols, cost)
+    assert dict(zip(assigned_rows.tolist(), assigned_cols.tolist())) == {0: 1, 1: 0}
+
+
+def test_process_frame_writes_track_ids():
+    tracker = OBBTracker()
+    obbs = [{'type': 'car', 'position': [0, 0, 0]}, {'type': 'car', 'position': [5, 0, 0]}]
+    frame = SyncedFrame(timestamp=1.0, frame_id=0, obb_data={'timestamp': 1.0, 'obbs': obbs})
+    tracker.process_frame(frame)
+    assert [obb['track_id'] for obb in obbs] == [0, 1]
+    assert OBBBatch.from_dicts(obbs).track_ids.tolist() == [0, 1]
@@ -0,0 +1,113 @@
+"""
+Unit tests for lcps_tool.layer2.offline_synchronizer
+"""
+
+import h5py
+import numpy as np
+import pytest
+
+from lcps_tool.data_models.synced_frame import SyncedFrame
+from lcps_tool.layer2 import DataRecorder, OfflineSynchronizer
+from lcps_tool.layer2.offline_synchronizer import (
+    list_sync_indexes,
+    load_channel_timestamps,
+    match_timestamps,
+    read_sync_index,
+)
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(11)
+
+
+class TestMatchTimestamps:
+    """Vectorized nearest matching"""
+
+    def test_matches_brute_force(self, rng):
+        reference = np.sort(rng.uniform(0, 100, 2000))
+        timestamps = rng.uniform(0, 100, 1500)   # unsorted on purpose
+        indices, offsets = match_timestamps(reference, timestamps, 0.02)
+
+        distance = np.abs(timestamps[None, :] - reference[:, None])
+        nearest = distance.argmin(axis=1)
+        matched = distance.min(axis=1) <= 0.02
+        assert np.array_equal(indices >= 0, matched)
+        assert np.array_equal(indices[matched], nearest[matched])
+        assert np.allclose(offsets[matched], timestamps[nearest[matched]] - reference[matched])
+        assert np.all(np.isnan(offsets[~matched]))
+
+
+class TestOfflineSynchronizer:
+    """Re-synchronization of recordings"""
+
+    def test_raw_channel_recording(self, rng, tmp_path):
+        path = tmp_path / "raw.h5"
+        n = 200_000
+        lidar = np.arange(n) * 0.1
+        with h5py.File(path, 'w') as h5file:
+            h5file.create_dataset('channels/pointcloud/timestamps', data=lidar)
+            h5file.create_dataset('channels/obb/timestamps', data=lidar + 0.02 + rng.normal(0, 0.003, n))
+            h5file.create_dataset('channels/status/timestamps', data=np.arange(n // 2) * 0.2 + 0.07)
+
+        sync = OfflineSynchronizer(reference='pointcloud', windows_ms={'obb': 40, 'status': 60},
+                                   required=['pointcloud', 'obb'])
+        table = sync.resync_recording(path, name='w40')
+        assert len(table) == n
+        assert table.match_rates()['obb'] > 0.99
+        assert table.match_rates()['status'] == pytest.approx(0.5, abs=0.01)
+        assert np.all(table.indices['pointcloud'] == np.arange(n))
+        assert np.nanmedian(table.offsets_ms['obb']) == pytest.approx(20.0, abs=0.5)
+
+        # A narrower window re-synchronizes the same recording differently
+        narrow = OfflineSynchronizer(reference='pointcloud', windows_ms={'obb': 15}).resync_recording(
+            path, name='w15')
+        assert narrow.valid_count < table.valid_count
+
+        assert list_sync_indexes(path) == ['w15', 'w40']
+        stored = read_sync_index(path, 'w40')
+        assert np.array_equal(stored.indices['obb'], table.indices['obb'])
+        assert np.array_equal(stored.valid, table.valid)
+        assert stored.windows_ms == {'pointcloud': 50.0, 'obb': 40, 'status': 60}
+
+    @staticmethod
+    def _record(path):
+        recorder = DataRecorder(str(path), async_write=False)
+        recorder.start_recording()
+        for k in range(20):
+            t = 10.0 + k * 0.1
+            recorder.record_frame(SyncedFrame(
+                timestamp=t, frame_id=k,
+                obb_data={'timestamp': t + 0.01, 'obbs': []},
+                pointcloud_data={'timestamp': t, 'points': np.zeros((2, 3), dtype=np.float32)},
+                status_data={'timestamp': t - 0.03, 'state': 'ok'} if k % 2 == 0 else None,
+            ))
+        recorder.stop_recording()
+
+    def test_data_recorder_recording(self, tmp_path):
+        path = tmp_path / "recording.h5"
+        self._record(path)
+        with h5py.File(path, 'r') as h5file:
+            assert h5file['channel_timestamps'].shape == (20, 3)
+
+        channels = load_channel_timestamps(path)
+        assert sorted(channels) == ['obb', 'pointcloud', 'status']
+        assert np.sum(np.isfinite(channels['status'])) == 10
+
+        table = OfflineSynchronizer(reference='pointcloud', windows_ms={'status': 40},
+                                    required=['obb']).resync_recording(path)
+        assert table.valid_count == 20
+        assert np.array_equal(table.indices['status'] >= 0, np.arange(20) % 2 == 0)
+        assert np.allclose(table.offsets_ms['obb'], 10.0)
+
+    def test_recording_without_channel_timestamps(self, tmp_path):
+        path = tmp_path / "recording.h5"
+        self._record(path)
+        expected = load_channel_timestamps(path)
+        with h5py.File(path, 'a') as h5file:
+            del h5file['channel_timestamps']   # recorded before the dataset existed
+
+        channels = load_channel_timestamps(path)
+        assert sorted(channels) == sorted(expected)
+        for channel, timestamps in expected.items():
+            assert np.array_equal(channels[channel], timestamps)
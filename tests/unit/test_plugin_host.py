@@ -0,0 +1,205 @@
+"""
+Unit tests for lcps_tool.plugins (EventBus, PluginHost)
+"""
+
+import threading
+import time
+
+import pytest
+
+from lcps_tool.data_models import SyncedFrame, SyncedFramePool
+from lcps_tool.layer3.anomaly_detectors import Anomaly
+from lcps_tool.perf.metrics_server import LCPSMetricsCollector
+from lcps_tool.plugins import (
+    ANOMALY_EVENT,
+    EventBus,
+    IAnalyzerPlugin,
+    IExporterPlugin,
+    PluginHost,
+)
+
+
+class GatedPlugin(IExporterPlugin):
+    """Exporter that blocks on a gate and records the frames it saw"""
+
+    def __init__(self):
+        self.gate = threading.Event()
+        self.frames = []
+        self.events = []
+
+    def get_metadata(self):
+        return {'name': 'gated'}
+
+    def on_init(self, config):
+        self.events.append(('init', config))
+
+    def on_destroy(self):
+        self.events.append(('destroy', len(self.frames)))
+
+    def export_frame(self, frame):
+        self.gate.wait(5.0)
+        self.frames.append((frame.frame_id, frame.obb_data is not None))
+
+    def get_supported_formats(self):
+        return ['memory']
+
+
+class OddFrameDetector(IAnalyzerPlugin):
+    """Reports an anomaly for every odd frame id"""
+
+    def get_metadata(self):
+        return {'name': 'odd'}
+
+    def analyze(self, frame):
+        if frame.frame_id % 2 == 0:
+            return []
+        return [Anomaly('odd_frame', 'high', frame.timestamp, frame.frame_id, 'odd')]
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.time() + timeout
+    while not predicate() and time.time() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+class TestEventBus:
+    """Publish / subscribe"""
+
+    def test_error_isolation(self):
+        bus = EventBus()
+        received = []
+
+        def failing(data):
+            raise ValueError("boom")
+
+        bus.subscribe('event', failing)
+        bus.subscribe('event', received.append)
+        assert bus.publish('event', 1) == 1
+        assert received == [1] and bus.error_count == 1
+
+        bus.unsubscribe('event', failing)
+        bus.unsubscribe('event', received.append)
+        assert bus.subscriber_count('event') == 0
+        assert bus.publish('event', 2) == 0
+
+    def test_concurrent_publish_counts(self):
+        class YieldingDict(dict):
+            """Switches threads between reading and writing a counter"""
+
+            def get(self, key, default=None):
+                value = super().get(key, default)
+                time.sleep(0)
+                return value
+
+        bus = EventBus()
+        bus.published_count = YieldingDict()
+        bus.subscribe(ANOMALY_EVENT, lambda data: None)
+        start = threading.Barrier(4)
+
+        def publish():
+            start.wait()
+            for i in range(500):
+                bus.publish(ANOMALY_EVENT, i)
+
+        threads = [threading.Thread(target=publish) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert bus.get_statistics()['published'] == {ANOMALY_EVENT: 2000}
+
+
+class TestPluginHost:
+    """Fan-out to plugin workers"""
+
+    def test_slow_plugin_drops_without_blocking(self):
+        pool = SyncedFramePool()
+        host = PluginHost(frame_pool=pool)
+        slow = GatedPlugin()
+        host.add_plugin(slow, config={'path': 'x'}, queue_size=2, drop_policy='drop_oldest')
+        host.start()
+
+        start = time.perf_counter()
+        for frame_id in range(10):
+            frame = pool.acquire(float(frame_id), frame_id, obb_data={'obbs': []})
+            host.publish_frame(frame)
+            pool.release(frame)  # Publisher's own reference (e.g. recorder done)
+        assert time.perf_counter() - start < 1.0
+
+        slow.gate.set()
+        host.stop()
+
+        stats = host.get_statistics()['gated']
+        assert stats['received'] == 10
+        assert stats['processed'] + stats['dropped'] == 10
+        assert stats['dropped'] >= 7
+        # Frames stay intact while queued; the latest frame is never dropped
+        assert all(has_obb for _, has_obb in slow.frames)
+        assert slow.frames[-1][0] == 9
+        assert slow.events == [('init', {'path': 'x'}), ('destroy', stats['processed'])]
+        # Every frame was recycled exactly once
+        assert pool.get_statistics()['released'] == 10
+
+    def test_drop_newest(self):
+        host = PluginHost()
+        slow = GatedPlugin()
+        host.add_plugin(slow, queue_size=1, drop_policy='drop_newest')
+        host.start()
+        for frame_id in range(5):
+            host.publish_frame(SyncedFrame(float(frame_id), frame_id))
+        slow.gate.set()
+        host.stop()
+        assert slow.frames[0][0] == 0
+        assert host.get_statistics()['gated']['dropped'] >= 3
+
+    def test_anomalies_published(self):
+        host = PluginHost()
+        anomalies = []
+        host.event_bus.subscribe(ANOMALY_EVENT, anomalies.append)
+        host.add_plugin(OddFrameDetector(), drop_policy='block')
+        host.add_plugin(OddFrameDetector(), drop_policy='block')
+        host.start()
+        for frame_id in range(4):
+            host.publish_frame(SyncedFrame(float(frame_id), frame_id))
+        host.stop()
+
+        assert list(host.workers) == ['odd', 'odd-2']
+        assert sorted(anomaly.frame_id for anomaly in anomalies) == [1, 1, 3, 3]
+
+        families = {family.name: family for family in
+                    LCPSMetricsCollector(plugin_host=host).collect()}
+        processed = [value for suffix, labels, value in families['lcps_plugin_frames_total'].samples
+                     if labels['outcome'] == 'processed']
+        assert processed == [4, 4]
+
+    def test_invalid_options(self):
+        host = PluginHost()
+        with pytest.raises(ValueError):
+            host.add_plugin(OddFrameDetector(), drop_policy='drop_all')
+        with pytest.raises(ValueError):
+            host.load_config({'plugins': {'analyzers': [
+                {'name': 'gated', 'module': __name__, 'class': 'GatedPlugin', 'enabled': True}]}})
+
+    def test_process_executor(self):
+        pool = SyncedFramePool()
+        host = PluginHost(frame_pool=pool)
+        anomalies = []
+        host.event_bus.subscribe(ANOMALY_EVENT, anomalies.append)
+        host.load_config({'plugins': {'analyzers': [
+            {'name': 'odd', 'module': __name__, 'class': 'OddFrameDetector', 'enabled': True,
+             'executor': 'process', 'drop_policy': 'block'},
+            {'name': 'disabled', 'module': __name__, 'class': 'OddFrameDetector'},
+        ]}})
+        host.start()
+        for frame_id in range(3):
+            frame = pool.acquire(float(frame_id), frame_id)
+            host.publish_frame(frame)
+            pool.release(frame)
+        assert _wait_for(lambda: len(anomalies) == 1)
+        host.stop()
+
+        assert list(host.workers) == ['odd']
+        assert anomalies[0].frame_id == 1
+        assert host.get_statistics()['odd']['processed'] == 3
+        assert pool.get_statistics()['released'] == 3
@@ -0,0 +1,82 @@
+"""
+Unit tests for lcps_tool.perf.sampling_profiler
+"""
+
+import threading
+import time
+
+import pytest
+
+from lcps_tool.layer2 import LatencyTracker
+from lcps_tool.perf.sampling_profiler import LatencySpikeProfiler, SamplingProfiler
+
+
+def _busy_worker(stop_event):
+    while not stop_event.is_set():
+        sum(range(1000))
+
+
+@pytest.fixture
+def worker():
+    stop_event = threading.Event()
+    thread = threading.Thread(target=_busy_worker, args=(stop_event,), name="Busy-Worker", daemon=True)
+    thread.start()
+    yield thread
+    stop_event.set()
+    thread.join()
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_samples_named_threads(worker, tmp_path):
+    profiler = SamplingProfiler(interval_s=0.002)
+    profiler.start()
+    assert _wait_for(lambda: profiler.sample_count >= 20)
+    profiler.stop()
+    assert not profiler.is_running
+
+    worker_stacks = [stack for stack in profiler.counts if stack.startswith("Busy-Worker;")]
+    assert worker_stacks and all('_busy_worker (test_sampling_profiler.py:' in stack for stack in worker_stacks)
+    assert not any(stack.startswith(SamplingProfiler.THREAD_NAME) for stack in profiler.counts)
+    assert profiler.get_statistics()['sample_count'] == profiler.sample_count
+
+    path = tmp_path / 'out' / 'run.folded'
+    assert profiler.write_collapsed(str(path)) == len(profiler.counts)
+    for line in path.read_text().splitlines():
+        stack, count = line.rsplit(' ', 1)
+        assert ';' in stack and int(count) > 0
+
+
+def test_window():
+    profiler = SamplingProfiler(history_s=10.0)
+    profiler.history.extend([(1.0, 'a;x'), (2.0, 'a;y'), (3.0, 'a;y')])
+    assert profiler.window(1.5, 3.0) == {'a;y': 2}
+    assert SamplingProfiler().window(0.0, 10.0) == {}
+    with pytest.raises(ValueError):
+        SamplingProfiler(interval_s=0)
+
+
+def test_spike_capture(worker, tmp_path):
+    tracker = LatencyTracker()
+    tracker.observe('record', 500.0)  # Before start: not a new spike
+    profiler = LatencySpikeProfiler(tracker, str(tmp_path), threshold_ms=100.0,
+                                    pre_s=0.1, post_s=0.1, cooldown_s=0.0, interval_s=0.002)
+    profiler.start()
+    try:
+        time.sleep(0.2)
+        assert profiler.captures == []
+        tracker.observe('pointcloud_parse', 50.0)   # Below threshold
+        tracker.observe('pointcloud_parse', 300.0)
+        assert _wait_for(lambda: len(profiler.captures) == 1)
+    finally:
+        profiler.stop()
+
+    path = profiler.captures[0]
+    assert 'pointcloud_parse' in path
+    content = open(path).read()
+    assert "Busy-Worker;" in content
@@ -0,0 +1,52 @@
+"""
+Unit tests for lcps_tool.perf.startup and the lazy imports it guards
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import lcps_tool.layer2
+from lcps_tool.perf.startup import HEAVY_MODULES, StartupTimer
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _loaded_heavy_modules(statement):
+    code = f"import sys; {statement}; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, '-c', code], cwd=REPO_ROOT, capture_output=True,
+                            text=True, timeout=60, check=True)
+    return result.stdout.strip().splitlines()[-1] if result.stdout.strip() else ''
+
+
+@pytest.mark.parametrize('statement', [
+    'import lcps_tool.main',
+    'import recvOBB',
+    'from lcps_tool.layer2 import DataSynchronizer, OfflineSynchronizer',
+])
+def test_no_heavy_imports(statement):
+    assert _loaded_heavy_modules(statement) == ''
+
+
+def test_lazy_layer2_exports():
+    assert 'DataRecorder' in dir(lcps_tool.layer2)
+    from lcps_tool.layer2 import DataRecorder
+    from lcps_tool.layer2.data_recorder import DataRecorder as direct
+    assert DataRecorder is direct
+    with pytest.raises(AttributeError):
+        lcps_tool.layer2.NoSuchClass
+
+
+def test_timer_report():
+    timer = StartupTimer()
+    timer.mark('a')
+    timer.mark('b')
+    report = timer.report()
+    names = [name for name, _ in report['phases']]
+    assert names[-2:] == ['a', 'b']
+    assert all(ms >= 0 for _, ms in report['phases'])
+    assert report['total_ms'] == pytest.approx(sum(ms for _, ms in report['phases']))
+    if report['from_process_start']:
+        assert names[0] == 'interpreter + imports'